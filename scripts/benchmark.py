@@ -0,0 +1,523 @@
+#!/usr/bin/env python3
+"""
+Okuyucu, tutanak yazıcıları, mezuniyet aktarımı ve toplu TCKN doğrulaması için
+performans ölçümleri.
+
+Her boyut için sentetik ``coklu_girdi.xlsx`` ve ``mezuniyet_bilgileri.xlsx``
+dosyaları üretilir; her ölçüm ayrı bir süreçte çalıştırılarak süre, tepe RSS
+ve ``tracemalloc`` tepe değeri kaydedilir. Sonuçlar JSON olarak yazılır ve
+verilirse saklanan bir taban çizgisiyle karşılaştırılır.
+
+Kullanımı:
+$ python -m scripts.benchmark
+$ python -m scripts.benchmark --boyutlar 10 1000 --cikti sonuc.json
+$ python -m scripts.benchmark --taban scripts/benchmark_baseline.json
+$ python -m scripts.benchmark --boyutlar 10 1000 --taban-kaydet
+$ python -m scripts.benchmark --acilis
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+import openpyxl
+
+PROJE_KOKU = Path(__file__).resolve().parent.parent
+VARSAYILAN_TABAN = Path(__file__).resolve().parent / "benchmark_baseline.json"
+VARSAYILAN_BOYUTLAR = (10, 1_000, 10_000)
+
+#: Eğitim satırları boş şablon; mezuniyet aktarımı kayıtları gerçekten yazar.
+_BOS_SABLON = PROJE_KOKU / "docs" / "cikti_taslagi.xlsx"
+
+#: Taban süresi bunun altındaki ölçümler gürültü nedeniyle karşılaştırılmaz.
+_MIN_KARSILASTIRMA_SURESI = 0.05
+
+_AD_HAVUZU = ("Ayşe", "Mehmet", "Fatma", "Ali", "Zeynep", "Mustafa", "Elif", "Can")
+_SOYAD_HAVUZU = ("YILMAZ", "KAYA", "DEMİR", "ŞAHİN", "ÇELİK", "ÖZTÜRK", "KOŞUK")
+_BIRIM_HAVUZU = ("C123", "Z923", "Marmara Enstitüsü", "Bilgem", "Uzay Teknolojileri")
+_PROGRAM_HAVUZU = (
+    "BİLGİSAYAR MÜHENDİSLİĞİ - ÖRGÜN ÖĞRETİM",
+    "ELEKTRİK-ELEKTRONİK MÜHENDİSLİĞİ (İNGİLİZCE) - ÖRGÜN ÖĞRETİM",
+    "FİZİK (YL) - ÖRGÜN ÖĞRETİM",
+    "BİLGİSAYAR MÜHENDİSLİĞİ TEZSİZ YÜKSEK LİSANS - İKİNCİ ÖĞRETİM",
+    "FİZİK (İNGİLİZCE) (DR) - ÖRGÜN ÖĞRETİM",
+)
+_UNIVERSITE_HAVUZU = (
+    "İSTANBUL TEKNİK ÜNİVERSİTESİ",
+    "BOĞAZİÇİ ÜNİVERSİTESİ",
+    "ORTA DOĞU TEKNİK ÜNİVERSİTESİ",
+)
+
+
+@dataclass(frozen=True)
+class Girdiler:
+    """Tek bir boyut için üretilmiş sentetik girdi dosyaları."""
+
+    boyut: int
+    personel_dosyasi: Path
+    mezuniyet_dosyasi: Path
+
+
+@dataclass(frozen=True)
+class Gerileme:
+    """Taban çizgisine göre eşiği aşan bir ölçüm."""
+
+    olcum: str
+    metrik: str
+    taban: float
+    simdi: float
+
+    @property
+    def oran(self) -> float:
+        return self.simdi / self.taban - 1
+
+
+# ---------------------------------------------------------------------------
+# Sentetik girdiler
+# ---------------------------------------------------------------------------
+
+
+def sentetik_tckn(sira: int) -> str:
+    """``sira`` değerinden türetilmiş, kontrol haneleri geçerli bir TCKN üretir."""
+    ilk_dokuz = [int(hane) for hane in str(100_000_000 + sira)[:9]]
+    onuncu = (sum(ilk_dokuz[0:9:2]) * 7 - sum(ilk_dokuz[1:8:2])) % 10
+    on_birinci = (sum(ilk_dokuz) + onuncu) % 10
+    return "".join(map(str, ilk_dokuz)) + f"{onuncu}{on_birinci}"
+
+
+def personel_girdisi_olustur(yol: Path, adet: int, tohum: int = 0) -> list[str]:
+    """``coklu_girdi.xlsx`` biçiminde personel listesi yazar.
+
+    Satırların yaklaşık %2'si geçersiz TCKN, %1'i boş satırdır; böylece
+    okuyucunun red yolu da ölçülür.
+
+    :returns: Geçerli personellerin TCKN listesi.
+    """
+    rastgele = random.Random(tohum)
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet("2026 işe başlayanlar")
+    ws.append(["SIRA", "TCKN", "SİCİL", "AD SOYAD", "BİRİMİ", "NOTLAR"])
+
+    gecerli: list[str] = []
+    for sira in range(adet):
+        zar = rastgele.random()
+        if zar < 0.01:
+            ws.append([None] * 6)
+            continue
+        tckn = sentetik_tckn(sira)
+        if zar < 0.03:
+            tckn = tckn[:-1] + str((int(tckn[-1]) + 1) % 10)
+        else:
+            gecerli.append(tckn)
+        ad_soyad = (
+            f"{rastgele.choice(_AD_HAVUZU)} {rastgele.choice(_SOYAD_HAVUZU)} {sira}"
+        )
+        ws.append(
+            [
+                sira + 1,
+                int(tckn),
+                10_000 + sira,
+                ad_soyad,
+                rastgele.choice(_BIRIM_HAVUZU),
+                None,
+            ]
+        )
+    wb.save(yol)
+    return gecerli
+
+
+def mezuniyet_girdisi_olustur(
+    yol: Path, tckn_listesi: list[str], tohum: int = 0
+) -> None:
+    """``mezuniyet_bilgileri.xlsx`` biçiminde kişi başına 1-3 kayıt yazar."""
+    rastgele = random.Random(tohum)
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet("Toplu Sorgulama")
+    ws.append(
+        [
+            "TC KIMLIK NO",
+            "AD",
+            "SOYAD",
+            "MEZUNIYET TARIHI",
+            "UNIVERSITE",
+            "ENSMYOFAK",
+            "PROGRAM",
+            "NOTU",
+            "DURUMU",
+        ]
+    )
+    for tckn in tckn_listesi:
+        if rastgele.random() < 0.05:
+            ws.append([int(tckn), "Mezun Kaydı Bulunamadı !!!"] + [None] * 7)
+            continue
+        for program in rastgele.sample(_PROGRAM_HAVUZU, rastgele.randint(1, 3)):
+            ws.append(
+                [
+                    int(tckn),
+                    rastgele.choice(_AD_HAVUZU).upper(),
+                    rastgele.choice(_SOYAD_HAVUZU),
+                    f"{rastgele.randint(1, 28):02d}/{rastgele.randint(1, 12):02d}/"
+                    f"{rastgele.randint(2000, 2025)}",
+                    rastgele.choice(_UNIVERSITE_HAVUZU),
+                    "FEN BİLİMLERİ ENSTİTÜSÜ",
+                    program,
+                    "3.10 / 4.0",
+                    "MEZUN",
+                ]
+            )
+    wb.save(yol)
+
+
+def girdileri_olustur(dizin: Path, boyut: int) -> Girdiler:
+    """Bir boyut için sentetik girdi dosyalarını ``dizin`` altına üretir."""
+    dizin.mkdir(parents=True, exist_ok=True)
+    girdiler = Girdiler(
+        boyut=boyut,
+        personel_dosyasi=dizin / "coklu_girdi.xlsx",
+        mezuniyet_dosyasi=dizin / "mezuniyet_bilgileri.xlsx",
+    )
+    tckn_listesi = personel_girdisi_olustur(girdiler.personel_dosyasi, boyut)
+    mezuniyet_girdisi_olustur(girdiler.mezuniyet_dosyasi, tckn_listesi)
+    return girdiler
+
+
+# ---------------------------------------------------------------------------
+# Ölçümler
+# ---------------------------------------------------------------------------
+#
+# Her ölçüm, hazırlığı yapıp süresi ölçülecek parametresiz fonksiyonu döndürür.
+# Hazırlık (girdi okuma, hedef klasör üretimi) ölçüme dahil edilmez.
+
+
+def _okuyucu(girdiler: Girdiler, dizin: Path) -> Callable[[], object]:
+    from src.core.excel_reader import oku_personel_listesi_raporlu
+
+    return lambda: oku_personel_listesi_raporlu(girdiler.personel_dosyasi)
+
+
+def _personeller(girdiler: Girdiler) -> list:
+    from src.core.excel_reader import oku_personel_listesi_raporlu
+
+    return oku_personel_listesi_raporlu(girdiler.personel_dosyasi).personeller
+
+
+def _klasor_yazici(girdiler: Girdiler, dizin: Path) -> Callable[[], object]:
+    from src.core.excel_writer import olustur_dk_klasoru_raporlu
+
+    personeller = _personeller(girdiler)
+    return lambda: olustur_dk_klasoru_raporlu(personeller, dizin / "klasor")
+
+
+def _dosya_yazici(girdiler: Girdiler, dizin: Path) -> Callable[[], object]:
+    from src.core.excel_writer import olustur_dk_dosyasi_raporlu
+
+    personeller = _personeller(girdiler)
+    return lambda: olustur_dk_dosyasi_raporlu(personeller, dizin / "dosya")
+
+
+def _mezuniyet_aktarimi(girdiler: Girdiler, dizin: Path) -> Callable[[], object]:
+    from src.core.education_importer import EducationImporter
+    from src.core.excel_writer import olustur_dk_klasoru_raporlu
+
+    hedef = dizin / "mezuniyet_hedef"
+    olustur_dk_klasoru_raporlu(
+        _personeller(girdiler), hedef, template_path=_BOS_SABLON, hizli_klon=True
+    )
+    return lambda: EducationImporter().import_education(
+        girdiler.mezuniyet_dosyasi, hedef
+    )
+
+
+#: ``tckn_dogrulama`` ölçümünde boyut başına doğrulanan aday sayısı; 1000
+#: boyutunda bir milyon TCKN doğrulanır.
+_TCKN_CARPANI = 1_000
+
+#: Daha büyük boyutlarda aday sayısı bir milyonda sabitlenir; 10000 boyutunda
+#: on milyon aday birkaç GB bellek gerektirir.
+_TCKN_UST_SINIRI = 1_000_000
+
+
+def _tckn_dogrulama(girdiler: Girdiler, dizin: Path) -> Callable[[], object]:
+    from src.core.validators import validate_tckn_batch
+
+    adet = min(girdiler.boyut * _TCKN_CARPANI, _TCKN_UST_SINIRI)
+    # Her on adaydan biri geçerli; kalanlar kontrol hanesinde elenir.
+    adaylar = [
+        sentetik_tckn(sira) if sira % 10 == 0 else str(10**10 + sira)
+        for sira in range(adet)
+    ]
+    return lambda: validate_tckn_batch(adaylar)
+
+
+OLCUMLER: dict[str, Callable[[Girdiler, Path], Callable[[], object]]] = {
+    "okuyucu": _okuyucu,
+    "klasor_yazici": _klasor_yazici,
+    "dosya_yazici": _dosya_yazici,
+    "mezuniyet_aktarimi": _mezuniyet_aktarimi,
+    "tckn_dogrulama": _tckn_dogrulama,
+}
+
+
+# ---------------------------------------------------------------------------
+# Ana menü açılışı
+# ---------------------------------------------------------------------------
+
+#: Ana menünün içe aktarılıp ilk kez çizilmesi için izin verilen süre (sn).
+#: Ölçüm ~0.25 sn; pandas/openpyxl yeniden açılışa taşınırsa ~0.9 sn olur.
+ACILIS_BUTCESI_SN = 0.6
+
+_ACILIS_OLCUMU = """
+import time
+baslangic = time.perf_counter()
+from PyQt6.QtWidgets import QApplication
+from src.gui.main_menu_window import MainMenuWindow
+app = QApplication([])
+window = MainMenuWindow()
+window.show()
+app.processEvents()
+print(time.perf_counter() - baslangic)
+"""
+
+
+def ana_menu_acilis_suresi(tekrar: int = 3) -> float:
+    """Ana menünün açılış süresini temiz süreçlerde ölçer; en kısa süreyi döndürür."""
+    sureler = []
+    for _ in range(tekrar):
+        cikti = subprocess.run(
+            [sys.executable, "-c", _ACILIS_OLCUMU],
+            cwd=PROJE_KOKU,
+            env={**os.environ, "QT_QPA_PLATFORM": "offscreen"},
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        sureler.append(float(cikti.stdout.strip().splitlines()[-1]))
+    return min(sureler)
+
+
+def _tepe_rss_mb() -> float | None:
+    """Sürecin tepe RSS değerini MB olarak döndürür (Windows'ta ``None``)."""
+    if resource is None:
+        return None
+    tepe = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux KB, macOS bayt döndürür.
+    bolen = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(tepe / bolen, 1)
+
+
+def _olcumu_calistir(
+    olcum: str, girdiler: Girdiler, izle: bool
+) -> dict[str, float | None]:
+    """Alt süreçte tek bir ölçümü hazırlayıp çalıştırır."""
+    with tempfile.TemporaryDirectory(prefix="dk_benchmark_") as gecici:
+        calistir = OLCUMLER[olcum](girdiler, Path(gecici))
+        if izle:
+            tracemalloc.start()
+        baslangic = time.perf_counter()
+        calistir()
+        sure = time.perf_counter() - baslangic
+        if not izle:
+            return {"sure_sn": round(sure, 4), "rss_tepe_mb": _tepe_rss_mb()}
+        _, tepe = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return {"tracemalloc_tepe_mb": round(tepe / (1024 * 1024), 1)}
+
+
+def _alt_surecte(olcum: str, girdiler: Girdiler, izle: bool) -> dict:
+    """Ölçümü temiz bir süreçte çalıştırır; RSS tepesi önceki ölçümlerden etkilenmez."""
+    baglam = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=baglam) as havuz:
+        return havuz.submit(_olcumu_calistir, olcum, girdiler, izle).result()
+
+
+def calistir(
+    boyutlar: list[int],
+    olcumler: list[str] | None = None,
+    tekrar: int = 1,
+    tracemalloc_olc: bool = True,
+    calisma_dizini: Path | None = None,
+) -> dict:
+    """Ölçümleri çalıştırıp JSON'a yazılabilir sonuç sözlüğü döndürür.
+
+    :param boyutlar: Sentetik personel sayıları.
+    :param olcumler: Çalıştırılacak ölçüm adları; ``None`` ise tümü.
+    :param tekrar: Süre ölçümünün tekrar sayısı; en kısa süre ve o
+        çalıştırmanın RSS değeri kaydedilir.
+    :param tracemalloc_olc: ``False`` ise tracemalloc ölçümü atlanır
+        (tracemalloc çalıştırmayı belirgin biçimde yavaşlattığından ayrı
+        bir süreçte yapılır).
+    :param calisma_dizini: Girdilerin üretileceği dizin; ``None`` ise geçici.
+    """
+    olcumler = list(olcumler or OLCUMLER)
+    sonuclar: dict[str, dict] = {}
+    with tempfile.TemporaryDirectory(prefix="dk_benchmark_girdi_") as gecici:
+        kok = calisma_dizini or Path(gecici)
+        for boyut in boyutlar:
+            girdiler = girdileri_olustur(kok / str(boyut), boyut)
+            for olcum in olcumler:
+                denemeler = [
+                    _alt_surecte(olcum, girdiler, izle=False) for _ in range(tekrar)
+                ]
+                sonuc = dict(min(denemeler, key=lambda d: d["sure_sn"]))
+                if tracemalloc_olc:
+                    sonuc.update(_alt_surecte(olcum, girdiler, izle=True))
+                sonuclar[f"{olcum}/{boyut}"] = sonuc
+                print(f"{olcum}/{boyut}: {sonuc}", flush=True)
+
+    return {
+        "tarih": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "sonuclar": sonuclar,
+    }
+
+
+def karsilastir(
+    sonuclar: dict,
+    taban: dict,
+    sure_esigi: float = 0.2,
+    bellek_esigi: float = 0.2,
+) -> list[Gerileme]:
+    """Ortak ölçümlerde taban çizgisine göre eşiği aşan artışları döndürür.
+
+    :param sure_esigi: Süre için izin verilen göreli artış (0.2 = %20).
+    :param bellek_esigi: RSS ve tracemalloc tepeleri için göreli artış.
+    """
+    esikler = {
+        "sure_sn": sure_esigi,
+        "rss_tepe_mb": bellek_esigi,
+        "tracemalloc_tepe_mb": bellek_esigi,
+    }
+    gerilemeler: list[Gerileme] = []
+    for olcum, degerler in sonuclar["sonuclar"].items():
+        taban_degerleri = taban["sonuclar"].get(olcum)
+        if taban_degerleri is None:
+            continue
+        for metrik, esik in esikler.items():
+            simdi = degerler.get(metrik)
+            eski = taban_degerleri.get(metrik)
+            if simdi is None or not eski:
+                continue
+            if metrik == "sure_sn" and eski < _MIN_KARSILASTIRMA_SURESI:
+                continue
+            if simdi > eski * (1 + esik):
+                gerilemeler.append(Gerileme(olcum, metrik, eski, simdi))
+    return gerilemeler
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Komut satırı giriş noktası; gerileme varsa 1 döndürür."""
+    parser = argparse.ArgumentParser(
+        description="Okuyucu, yazıcı ve mezuniyet aktarımı performans ölçümleri."
+    )
+    parser.add_argument(
+        "--boyutlar",
+        type=int,
+        nargs="+",
+        default=list(VARSAYILAN_BOYUTLAR),
+        help="Sentetik personel sayıları (varsayılan: 10 1000 10000)",
+    )
+    parser.add_argument(
+        "--olcumler",
+        nargs="+",
+        choices=sorted(OLCUMLER),
+        help="Yalnızca bu ölçümleri çalıştır",
+    )
+    parser.add_argument("--tekrar", type=int, default=1, help="Süre tekrar sayısı")
+    parser.add_argument(
+        "--tracemalloc-yok",
+        action="store_true",
+        help="tracemalloc tepe ölçümünü atla",
+    )
+    parser.add_argument("--cikti", type=Path, help="Sonuç JSON dosyası")
+    parser.add_argument(
+        "--taban",
+        type=Path,
+        default=VARSAYILAN_TABAN,
+        help="Karşılaştırılacak taban çizgisi JSON dosyası",
+    )
+    parser.add_argument(
+        "--taban-kaydet",
+        action="store_true",
+        help="Sonuçları taban çizgisi olarak kaydet (karşılaştırma yapılmaz)",
+    )
+    parser.add_argument(
+        "--sure-esigi",
+        type=float,
+        default=0.2,
+        help="Süre için izin verilen göreli artış (varsayılan: 0.2)",
+    )
+    parser.add_argument(
+        "--bellek-esigi",
+        type=float,
+        default=0.2,
+        help="Bellek için izin verilen göreli artış (varsayılan: 0.2)",
+    )
+    parser.add_argument(
+        "--acilis",
+        action="store_true",
+        help=(
+            "Yalnızca ana menü açılış süresini ölçüp "
+            f"{ACILIS_BUTCESI_SN} sn bütçesiyle karşılaştır"
+        ),
+    )
+    args = parser.parse_args(argv)
+
+    if args.acilis:
+        sure = ana_menu_acilis_suresi(max(args.tekrar, 3))
+        print(f"Ana menü açılışı: {sure:.2f} sn (bütçe {ACILIS_BUTCESI_SN:.2f} sn)")
+        return 1 if sure > ACILIS_BUTCESI_SN else 0
+
+    sonuclar = calistir(
+        args.boyutlar,
+        olcumler=args.olcumler,
+        tekrar=args.tekrar,
+        tracemalloc_olc=not args.tracemalloc_yok,
+    )
+    metin = json.dumps(sonuclar, ensure_ascii=False, indent=2) + "\n"
+    if args.cikti:
+        args.cikti.write_text(metin, encoding="utf-8")
+    if args.taban_kaydet:
+        args.taban.write_text(metin, encoding="utf-8")
+        print(f"Taban çizgisi kaydedildi: {args.taban}")
+        return 0
+    if not args.taban.is_file():
+        print(f"Taban çizgisi bulunamadı, karşılaştırma atlandı: {args.taban}")
+        return 0
+
+    taban = json.loads(args.taban.read_text(encoding="utf-8"))
+    gerilemeler = karsilastir(
+        sonuclar, taban, sure_esigi=args.sure_esigi, bellek_esigi=args.bellek_esigi
+    )
+    for gerileme in gerilemeler:
+        print(
+            f"GERİLEME {gerileme.olcum} {gerileme.metrik}: "
+            f"{gerileme.taban} -> {gerileme.simdi} (+{gerileme.oran:.0%})"
+        )
+    if not gerilemeler:
+        print("Taban çizgisine göre gerileme yok.")
+    return 1 if gerilemeler else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
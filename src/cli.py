@@ -0,0 +1,230 @@
+"""
+GUI'siz toplu çalıştırma komutları (``dk-tutanak batch``).
+
+Zamanlanmış sunucu işleri için tutanak üretimini ve mezuniyet aktarımını
+Qt içe aktarmadan çalıştırır. Her olay standart çıktıya tek satırlık bir
+JSON nesnesi olarak yazılır::
+
+    {"olay": "personel", "sira": 1, "toplam": 3, "durum": "olusturuldu", ...}
+    {"olay": "dosya", "sira": 1, "toplam": 2, "eklenen_kayit": 1, ...}
+    {"olay": "ozet", "rapor": {...}}
+
+``personel`` (tutanak) ve ``dosya`` (mezuniyet) satırları her öğe bittiği
+anda yazılır; mezuniyet uyarıları ilgili ``dosya`` satırının hemen ardından
+gelir. ``ozet`` satırındaki ``rapor`` alanı
+:class:`TutanakOlusturmaRaporu` ya da :class:`EducationImportResult`
+alanlarının aynısıdır. Hata durumunda bir
+``hata`` satırı yazılır ve çıkış kodu 1 olur.
+
+pandas ve openpyxl yalnızca komut çalışırken yüklenir; ``--help`` ve
+argüman hataları ağır içe aktarmalar beklenmeden döner.
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import json
+import sys
+from collections import Counter
+from pathlib import Path
+from typing import Sequence
+
+from src.config.constants import DEFAULT_VERSION, SUPPORTED_VERSIONS
+
+
+def _olay_yaz(olay: str, **alanlar: object) -> None:
+    """Tek bir olayı JSON satırı olarak standart çıktıya yazar."""
+    satir = json.dumps({"olay": olay, **alanlar}, ensure_ascii=False, default=str)
+    print(satir, flush=True)
+
+
+def _rapor_sozlugu(rapor: object) -> dict[str, object]:
+    """Rapor dataclass'ını JSON'a yazılabilir sözlüğe çevirir."""
+    return dataclasses.asdict(rapor)
+
+
+def _tutanak_calistir(args: argparse.Namespace) -> int:
+    """Personel listesinden klasör modunda tutanak üretir."""
+    from src.core.excel_reader import oku_personel_listesi_raporlu
+    from src.core.excel_writer import olustur_dk_klasoru_raporlu
+    from src.core.zamanlama import zamanlama_olc
+
+    okuma = oku_personel_listesi_raporlu(args.girdi)
+    for red in okuma.reddedilen_satirlar:
+        _olay_yaz("red", satir=red.excel_satir_no, mesaj=red.log_mesaji)
+
+    personeller = okuma.personeller
+    if not personeller:
+        _olay_yaz("hata", mesaj="İşlenecek geçerli personel kaydı bulunamadı.")
+        return 1
+
+    sira = 0
+
+    def ilerleme(personel: object, cikti_yolu: Path, durum: str) -> None:
+        nonlocal sira
+        sira += 1
+        _olay_yaz(
+            "personel",
+            sira=sira,
+            toplam=len(personeller),
+            tckn=personel.tckn,
+            ad_soyad=personel.ad_soyad,
+            dosya=cikti_yolu,
+            durum=durum,
+        )
+
+    with zamanlama_olc(False, args.iz_dosyasi):
+        rapor = olustur_dk_klasoru_raporlu(
+            personeller,
+            args.cikti,
+            template_path=args.sablon,
+            version=args.versiyon,
+            jobs=args.jobs,
+            hizli_klon=args.hizli_klon,
+            artimli=not args.tam,
+            boru_hatti=args.boru_hatti,
+            zamanlama=args.zamanlama,
+            ilerleme=ilerleme,
+        )
+
+    _olay_yaz(
+        "ozet",
+        gecerli_personel=len(personeller),
+        reddedilen_satir=len(okuma.reddedilen_satirlar),
+        rapor=_rapor_sozlugu(rapor),
+    )
+    return 0
+
+
+def _mezuniyet_calistir(args: argparse.Namespace) -> int:
+    """Mezuniyet kaynak dosyasını hedef klasördeki tutanaklara aktarır."""
+    from src.core.education_importer import (
+        EducationImporter,
+        EducationImportProgress,
+    )
+    from src.core.zamanlama import zamanlama_olc
+
+    importer = EducationImporter()
+    yazilan_uyarilar: Counter[str] = Counter()
+
+    def ilerleme(bildirim: EducationImportProgress) -> None:
+        _olay_yaz(
+            "dosya",
+            sira=bildirim.index,
+            toplam=bildirim.total,
+            dosya=bildirim.target_path,
+            eslesen_sayfa=bildirim.matched_sheet_count,
+            eklenen_kayit=bildirim.appended_record_count,
+            atlanan_kayit=bildirim.skipped_record_count,
+            guncellendi=bildirim.backup_path is not None,
+        )
+        for uyari in bildirim.warning_messages:
+            _olay_yaz("uyari", mesaj=uyari)
+        yazilan_uyarilar.update(bildirim.warning_messages)
+
+    try:
+        with zamanlama_olc(False, args.iz_dosyasi):
+            sonuc = importer.import_education(
+                args.kaynak,
+                args.hedef,
+                timing=args.zamanlama,
+                jobs=args.jobs,
+                progress=ilerleme,
+            )
+    finally:
+        # Dosya bildirimleriyle yazılmamış kaynak ve eşleşme uyarıları.
+        for uyari in importer.last_warning_messages():
+            if yazilan_uyarilar[uyari] > 0:
+                yazilan_uyarilar[uyari] -= 1
+                continue
+            _olay_yaz("uyari", mesaj=uyari)
+
+    _olay_yaz("ozet", rapor=_rapor_sozlugu(sonuc))
+    return 0
+
+
+def _parser_olustur() -> argparse.ArgumentParser:
+    """``batch`` alt komutlarının argüman ayrıştırıcısını kurar."""
+    parser = argparse.ArgumentParser(
+        prog="dk-tutanak batch",
+        description="Tutanak üretimini ve mezuniyet aktarımını GUI'siz çalıştırır.",
+    )
+    komutlar = parser.add_subparsers(dest="komut", required=True)
+
+    tutanak = komutlar.add_parser(
+        "tutanak", help="Personel listesinden kişi başına tutanak üretir."
+    )
+    tutanak.add_argument("--girdi", required=True, help="Personel listesi (xlsx).")
+    tutanak.add_argument("--cikti", required=True, help="Çıktı klasörü.")
+    tutanak.add_argument("--sablon", help="Çıktı şablonu (varsayılan: paketteki).")
+    tutanak.add_argument(
+        "--versiyon", choices=sorted(SUPPORTED_VERSIONS), default=DEFAULT_VERSION
+    )
+    tutanak.add_argument(
+        "--jobs", type=int, default=1, help="Eşzamanlı süreç sayısı (varsayılan 1)."
+    )
+    tutanak.add_argument(
+        "--hizli-klon",
+        action="store_true",
+        help="Yeni dosyaları prototipin zip kopyasıyla yazar.",
+    )
+    tutanak.add_argument(
+        "--boru-hatti",
+        action="store_true",
+        help="Seri üretimde oluşturma ve disk yazımını örtüştürür.",
+    )
+    tutanak.add_argument(
+        "--tam",
+        action="store_true",
+        help="Üretim manifestosunu yok sayar; güncel dosyalar da işlenir.",
+    )
+    tutanak.set_defaults(calistir=_tutanak_calistir)
+
+    mezuniyet = komutlar.add_parser(
+        "mezuniyet", help="Mezuniyet bilgilerini mevcut tutanaklara aktarır."
+    )
+    mezuniyet.add_argument(
+        "--kaynak", required=True, help="Mezuniyet kaynak dosyası (xlsx)."
+    )
+    mezuniyet.add_argument("--hedef", required=True, help="Tutanak klasörü.")
+    mezuniyet.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Hedef dosyaları işleyen süreç sayısı (varsayılan 1).",
+    )
+    mezuniyet.set_defaults(calistir=_mezuniyet_calistir)
+
+    for alt in (tutanak, mezuniyet):
+        alt.add_argument(
+            "--zamanlama",
+            action="store_true",
+            help="Aşama sürelerini özet raporuna ekler.",
+        )
+        alt.add_argument(
+            "--iz-dosyasi", type=Path, help="Aşama kayıtlarının ekleneceği JSONL."
+        )
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """``dk-tutanak batch`` komutunu çalıştırır ve çıkış kodunu döndürür.
+
+    :param argv: ``batch`` sonrasındaki argümanlar (varsayılan
+        ``sys.argv[1:]``).
+    :returns: Başarıda 0, hata durumunda 1.
+    """
+    args = _parser_olustur().parse_args(argv)
+    if getattr(args, "jobs", 1) < 1:
+        _olay_yaz("hata", mesaj=f"jobs en az 1 olmalıdır: {args.jobs}")
+        return 1
+    try:
+        return args.calistir(args)
+    except (OSError, ValueError) as exc:
+        _olay_yaz("hata", mesaj=str(exc))
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
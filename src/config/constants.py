@@ -41,6 +41,12 @@ COL_BIRIM: str = "BİRİMİ"
 #: Çıktı Excel dosyasının varsayılan adı
 OUTPUT_FILENAME: str = "DK_cikti.xlsx"
 
+#: Artımlı üretim manifestosunun çıktı klasöründeki dosya adı
+MANIFEST_FILENAME: str = ".dk_tutanak_manifest.json"
+
+#: Mezuniyet aktarımında hedef klasörün sayfa adı önbelleğinin dosya adı
+TARGET_INDEX_FILENAME: str = ".dk_tutanak_hedef_dizini.json"
+
 #: Excel sayfa adı için maksimum uzunluk sınırı
 MAX_SHEET_NAME_LEN: int = 31
 
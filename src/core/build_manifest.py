@@ -0,0 +1,200 @@
+"""
+Tutanak klasörü için artımlı üretim manifestosu.
+
+Çıktı klasöründeki gizli bir JSON dosyasında, üretilen her tutanak dosyası
+için personel alanlarının özeti, şablon dosyasının özeti, strateji
+versiyonu ve çıktı biçimi sürümü saklanır. Sonraki çalıştırmalar bu kayıtlara
+bakarak değişmemiş personelleri hiçbir xlsx dosyası açmadan atlar; yalnızca
+personel verisi, şablon, versiyon ya da çıktı biçimi değişmiş dosyalar yeniden
+üretilir.
+
+Kaydedilen boyut ve değiştirilme zamanı, dosyanın üretimden sonra başka bir
+araçla (ör. mezuniyet aktarımı ya da Excel) değiştirilip değiştirilmediğini
+anlamak için kullanılır. Değiştirilmiş dosyalar kullanıcı verisini korumak
+için hiçbir zaman yeniden üretilmez.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from dataclasses import asdict, dataclass
+from enum import Enum
+from pathlib import Path
+
+from src.config.constants import MANIFEST_FILENAME
+from src.core.excel_reader import Personel
+
+_MANIFEST_SURUMU = 1
+
+#: Yazıcıların aynı girdiler için ürettiği içeriğin sürümü. Yazım stratejileri
+#: ya da ``excel_writer`` dosyaya yazılan içeriği değiştirdiğinde artırılmalı;
+#: önceki sürümle üretilmiş ve değiştirilmemiş dosyalar yeniden üretilir.
+#:
+#: 2: Birleşik workbook'larda ortak brüt ücret tablosu ve formüllerin
+#: hesaplanmış değerlerinin önbelleğe yazılması.
+CIKTI_BICIMI_SURUMU = 2
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class UretimKarari(Enum):
+    """Bir personel dosyası için manifestoya göre verilen karar."""
+
+    YENI = "yeni"
+    """Dosya henüz yok; oluşturulmalı."""
+
+    GUNCEL = "guncel"
+    """Dosya aynı veri, şablon ve versiyonla üretilmiş; atlanabilir."""
+
+    ESKIMIS = "eskimis"
+    """Dosya değiştirilmeden duruyor ama girdileri değişmiş; yeniden üretilmeli."""
+
+    DENETLENEMEZ = "denetlenemez"
+    """Kayıt yok ya da dosya üretimden sonra değişmiş; mevcut dosya akışı
+    (openpyxl ile açıp sayfa kontrolü) kullanılmalı."""
+
+
+@dataclass(frozen=True)
+class _ManifestKaydi:
+    """Manifestodaki tek bir dosyanın üretim bilgisini taşır."""
+
+    personel: str
+    sablon: str
+    versiyon: str
+    mtime_ns: int
+    boyut: int
+    # Alanın eklenmesinden önce yazılmış kayıtlar ilk çıktı biçimine aittir.
+    cikti_bicimi: int = 1
+
+
+class UretimManifestosu:
+    """Çıktı klasöründeki artımlı üretim manifestosunu yönetir.
+
+    :param klasor: Tutanak dosyalarının bulunduğu çıktı klasörü.
+    :param sablon_ozeti: Bu çalıştırmada kullanılan şablon dosyasının özeti.
+    :param versiyon: Bu çalıştırmada kullanılan strateji versiyonu.
+    """
+
+    def __init__(self, klasor: Path, sablon_ozeti: str, versiyon: str) -> None:
+        self._klasor = Path(klasor)
+        self._sablon_ozeti = sablon_ozeti
+        self._versiyon = versiyon
+        self._kayitlar: dict[str, _ManifestKaydi] = {}
+
+    @classmethod
+    def yukle(
+        cls,
+        klasor: str | Path,
+        template_path: str | Path,
+        versiyon: str,
+    ) -> UretimManifestosu:
+        """Klasördeki manifestoyu okur; yoksa ya da bozuksa boş başlar.
+
+        :param klasor: Çıktı klasörü.
+        :param template_path: Çözümlenmiş şablon dosyası yolu.
+        :param versiyon: Strateji versiyonu (ör. ``"v1"``).
+        """
+        manifesto = cls(Path(klasor), dosya_ozeti(template_path), versiyon)
+        try:
+            veri = json.loads(manifesto.yol.read_text(encoding="utf-8"))
+            if veri.get("surum") == _MANIFEST_SURUMU:
+                manifesto._kayitlar = {
+                    ad: _ManifestKaydi(**kayit)
+                    for ad, kayit in veri.get("dosyalar", {}).items()
+                }
+        except (OSError, ValueError, TypeError, AttributeError):
+            manifesto._kayitlar = {}
+        return manifesto
+
+    @property
+    def yol(self) -> Path:
+        """Manifesto dosyasının yolu."""
+        return self._klasor / MANIFEST_FILENAME
+
+    def karar_ver(self, personel: Personel, cikti_yolu: Path) -> UretimKarari:
+        """Personel dosyasının oluşturulması, atlanması ya da yenilenmesine karar verir.
+
+        Yalnızca ``stat`` çağrısı yapılır; xlsx dosyası açılmaz.
+        """
+        try:
+            durum = cikti_yolu.stat()
+        except FileNotFoundError:
+            return UretimKarari.YENI
+
+        kayit = self._kayitlar.get(cikti_yolu.name)
+        if (
+            kayit is None
+            or kayit.mtime_ns != durum.st_mtime_ns
+            or kayit.boyut != durum.st_size
+        ):
+            return UretimKarari.DENETLENEMEZ
+
+        if (
+            kayit.personel == personel_ozeti(personel)
+            and kayit.sablon == self._sablon_ozeti
+            and kayit.versiyon == self._versiyon
+            and kayit.cikti_bicimi == CIKTI_BICIMI_SURUMU
+        ):
+            return UretimKarari.GUNCEL
+        return UretimKarari.ESKIMIS
+
+    def dosyayi_kaydet(self, personel: Personel, cikti_yolu: Path) -> None:
+        """Az önce üretilmiş dosyanın girdilerini ve disk durumunu kaydeder."""
+        durum = cikti_yolu.stat()
+        self._kayitlar[cikti_yolu.name] = _ManifestKaydi(
+            personel=personel_ozeti(personel),
+            sablon=self._sablon_ozeti,
+            versiyon=self._versiyon,
+            mtime_ns=durum.st_mtime_ns,
+            boyut=durum.st_size,
+            cikti_bicimi=CIKTI_BICIMI_SURUMU,
+        )
+
+    def kaydet(self) -> None:
+        """Manifestoyu geçici dosya üzerinden atomik olarak diske yazar.
+
+        Yazılamayan manifesto (ör. salt okunur ya da kilitli klasör) üretimi
+        engellemez; hata günlüğe yazılır ve sonraki çalıştırma ilgili
+        dosyaları mevcut dosya akışıyla denetler.
+        """
+        veri = {
+            "surum": _MANIFEST_SURUMU,
+            "dosyalar": {
+                ad: asdict(kayit) for ad, kayit in sorted(self._kayitlar.items())
+            },
+        }
+        try:
+            tanimlayici, gecici_yol = tempfile.mkstemp(
+                dir=self._klasor, prefix=f"{MANIFEST_FILENAME}-", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(tanimlayici, "w", encoding="utf-8") as dosya:
+                    json.dump(veri, dosya, ensure_ascii=False, indent=1)
+                os.replace(gecici_yol, self.yol)
+            except BaseException:
+                Path(gecici_yol).unlink(missing_ok=True)
+                raise
+        except OSError as exc:
+            _LOGGER.warning("Üretim manifestosu kaydedilemedi: %s (%s)", self.yol, exc)
+
+    def __len__(self) -> int:
+        return len(self._kayitlar)
+
+
+def personel_ozeti(personel: Personel) -> str:
+    """Personel alanlarının kararlı bir SHA-256 özetini döndürür."""
+    metin = json.dumps(asdict(personel), sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(metin.encode("utf-8")).hexdigest()
+
+
+def dosya_ozeti(yol: str | Path) -> str:
+    """Dosya içeriğinin SHA-256 özetini döndürür."""
+    ozet = hashlib.sha256()
+    with open(yol, "rb") as dosya:
+        for blok in iter(lambda: dosya.read(1 << 16), b""):
+            ozet.update(blok)
+    return ozet.hexdigest()
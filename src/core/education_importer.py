@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import re
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from shutil import copy2
+from typing import Callable, Iterator, Mapping, Sequence
 
+import numpy as np
 import openpyxl
-import openpyxl.worksheet.worksheet
 import pandas as pd
 
 from src.config.constants import (
@@ -17,7 +20,19 @@ from src.config.constants import (
     OGRENIM_TEZLI_YL,
     OGRENIM_TEZSIZ_YL,
 )
-from src.core.validators import normalize_tckn, validate_tckn
+from src.core.excel_stream_reader import XlsxSutunOkuyucu
+from src.core.target_index import HedefSayfaDizini
+from src.core.validators import (
+    normalize_tckn_batch,
+    validate_tckn_batch,
+)
+from src.core.zamanlama import (
+    AsamaKaydi,
+    AsamaOzeti,
+    aktif_zamanlayici,
+    asama,
+    zamanlama_olc,
+)
 
 _SOURCE_COL_TCKN = "TC KIMLIK NO"
 _SOURCE_COL_AD = "AD"
@@ -25,10 +40,39 @@ _SOURCE_COL_MEZUNIYET_TARIHI = "MEZUNIYET TARIHI"
 _SOURCE_COL_UNIVERSITE = "UNIVERSITE"
 _SOURCE_COL_FAKULTE = "ENSMYOFAK"
 _SOURCE_COL_PROGRAM = "PROGRAM"
+_SOURCE_COLUMNS = (
+    _SOURCE_COL_TCKN,
+    _SOURCE_COL_AD,
+    _SOURCE_COL_MEZUNIYET_TARIHI,
+    _SOURCE_COL_UNIVERSITE,
+    _SOURCE_COL_FAKULTE,
+    _SOURCE_COL_PROGRAM,
+)
 _MISSING_RECORD_MARKER = "MEZUN KAYDI BULUNAMADI"
+# Kaynak satır red nedenleri, denetim sırasıyla. Geçersiz TCKN ve sonrasındaki
+# nedenlerin uyarılarında TCKN normalize edilmiş haliyle yazılır.
+_SOURCE_REJECTION_REASONS = (
+    "TC KIMLIK NO boş",
+    "AD alanı boş",
+    "Kayıtta mezun kaydı bulunamadı ibaresi var",
+    "Geçersiz TCKN",
+    "Okul bilgisi üretilemedi",
+)
+_INVALID_TCKN_REASON = _SOURCE_REJECTION_REASONS.index("Geçersiz TCKN")
+# Tutanak sayfa adlarında TCKN'den önceki ayraç: ``{Ad Soyad} - {TCKN}``.
+_SHEET_TCKN_SEPARATOR = " - "
 _BACKUP_DIR_NAME = "eski"
 
 _DEFAULT_EDUCATION_ROWS = [6, 7, 8, 9, 10]
+# Eğitim bloğu başlıklarının aranacağı son satır ve okunan sütunlar.
+_EDUCATION_SCAN_MAX_ROW = 40
+_EDUCATION_SCAN_COLUMNS = "BCDE"
+# Program ve fakülte metninde aranan ibareler; ilk eşleşen seviye seçilir.
+_EDUCATION_LEVEL_KEYWORDS = (
+    (OGRENIM_DOKTORA, ("DOKTORA", "SANATTA YETERLİK", "(DR)")),
+    (OGRENIM_TEZSIZ_YL, ("TEZSİZ YÜKSEK LİSANS", "TEZSIZ YUKSEK LISANS")),
+    (OGRENIM_TEZLI_YL, ("YÜKSEK LİSANS", "YUKSEK LISANS", "MASTER", "(YL)")),
+)
 _EDUCATION_LEVEL_PRIORITY = {
     OGRENIM_LISANS: 0,
     OGRENIM_TEZSIZ_YL: 1,
@@ -70,6 +114,7 @@ class EducationImportResult:
     skipped_record_count: int = 0
     unmatched_tckns: list[str] = field(default_factory=list)
     warning_messages: list[str] = field(default_factory=list)
+    phase_timings: list[AsamaOzeti] = field(default_factory=list)
 
     @property
     def backup_path(self) -> Path | None:
@@ -79,6 +124,34 @@ class EducationImportResult:
         return self.backup_paths[0]
 
 
+@dataclass(frozen=True)
+class EducationImportProgress:
+    """Birleştirilen tek bir hedef dosyanın ilerleme bildirimi.
+
+    :param target_path: İşlenen hedef dosya.
+    :param index: Dosyanın işlenen adaylar içindeki sırası (1'den başlar).
+    :param total: Dizin taramasından geçen aday dosya sayısı.
+    :param matched_sheet_count: Dosyada eşleşen sayfa sayısı.
+    :param appended_record_count: Dosyaya eklenen kayıt sayısı.
+    :param skipped_record_count: Dosyada atlanan kayıt sayısı.
+    :param backup_path: Dosya güncellendiyse alınan yedeğin yolu.
+    :param warning_messages: Bu dosyaya ait uyarılar.
+    """
+
+    target_path: Path
+    index: int
+    total: int
+    matched_sheet_count: int
+    appended_record_count: int
+    skipped_record_count: int
+    backup_path: Path | None
+    warning_messages: tuple[str, ...]
+
+
+#: Her hedef dosya toplam sonuca birleştirildiğinde çağrılan bildirim.
+EducationImportProgressCallback = Callable[[EducationImportProgress], None]
+
+
 @dataclass(frozen=True)
 class _TargetFileProcessResult:
     """Tek bir hedef workbook işleme sonucunu taşır."""
@@ -89,6 +162,18 @@ class _TargetFileProcessResult:
     appended_record_count: int
     skipped_record_count: int
     backup_path: Path | None = None
+    warning_messages: list[str] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class _SheetPlan:
+    """Eşleşen bir sayfaya hangi kayıtların hangi satırlara yazılacağını taşır."""
+
+    sheet_title: str
+    tckn: str
+    placements: list[tuple[int, EducationRecord]]
+    skipped_record_count: int
+    warning_messages: list[str]
 
 
 class EducationImporter:
@@ -101,24 +186,75 @@ class EducationImporter:
         self,
         source_path: str | Path,
         target_dir: str | Path,
+        timing: bool = False,
+        jobs: int = 1,
+        progress: EducationImportProgressCallback | None = None,
     ) -> EducationImportResult:
-        """Kaynak mezuniyet dosyasını hedef tutanak klasöründeki dosyalara aktarır."""
+        """Kaynak mezuniyet dosyasını hedef tutanak klasöründeki dosyalara aktarır.
+
+        :param timing: ``True`` ise kaynak okuma, hedef yükleme, kayıt işleme,
+            yedekleme ve kaydetme süreleri ölçülüp ``phase_timings`` alanına
+            yazılır.
+        :param jobs: Hedef dosyaları işleyecek süreç sayısı. ``1`` dosyaları
+            sırayla işler; daha büyük değerlerde her dosya ayrı bir görev olarak
+            süreç havuzuna dağıtılır. Sonuç ve uyarılar her iki durumda da
+            dosya sırasıyla birleştirilir.
+        :param progress: Verilirse her aday hedef dosya sonuca birleştirildiği
+            anda :class:`EducationImportProgress` ile çağrılır.
+        :raises ValueError: ``jobs`` 1'den küçükse.
+        """
+        if jobs < 1:
+            raise ValueError(f"jobs en az 1 olmalıdır: {jobs}")
         source_path = Path(source_path)
         target_dir = Path(target_dir)
         self._last_warning_messages = []
 
-        records_by_tckn = self._load_records_or_raise(source_path)
-        target_files = self._resolve_target_files(target_dir)
-
-        result = EducationImportResult()
-        matched_tckns: set[str] = set()
+        with zamanlama_olc(timing) as timer:
+            with asama("mezuniyet.kaynak_oku"):
+                records_by_tckn = self._load_records_or_raise(source_path)
+            target_files = self._resolve_target_files(target_dir)
+            target_index = HedefSayfaDizini.yukle(target_dir)
+
+            result = EducationImportResult()
+            matched_tckns: set[str] = set()
+
+            with asama("mezuniyet.hedef_dizini"):
+                candidate_files = [
+                    target_path
+                    for target_path in target_files
+                    if self._target_may_match(
+                        target_path, target_index, records_by_tckn
+                    )
+                ]
+
+            for index, (target_path, file_result) in enumerate(
+                self._process_target_files(candidate_files, records_by_tckn, jobs),
+                start=1,
+            ):
+                self._merge_target_result(result, matched_tckns, file_result)
+                self._last_warning_messages.extend(file_result.warning_messages)
+                if file_result.backup_path is not None:
+                    target_index.dosyayi_yenile(target_path)
+                if progress is not None:
+                    progress(
+                        EducationImportProgress(
+                            target_path=target_path,
+                            index=index,
+                            total=len(candidate_files),
+                            matched_sheet_count=file_result.matched_sheet_count,
+                            appended_record_count=file_result.appended_record_count,
+                            skipped_record_count=file_result.skipped_record_count,
+                            backup_path=file_result.backup_path,
+                            warning_messages=tuple(file_result.warning_messages),
+                        )
+                    )
 
-        for target_path in target_files:
-            file_result = self._process_target_file(target_path, records_by_tckn)
-            self._merge_target_result(result, matched_tckns, file_result)
+            target_index.kaydet()
 
-        self._finalize_result(result, records_by_tckn, matched_tckns)
+            self._finalize_result(result, records_by_tckn, matched_tckns)
 
+        if timer is not None:
+            result.phase_timings = timer.ozet()
         return result
 
     def _load_records_or_raise(
@@ -132,55 +268,145 @@ class EducationImporter:
 
         raise ValueError("Kaynak dosyada işlenecek geçerli mezuniyet kaydı bulunamadı.")
 
+    def _target_may_match(
+        self,
+        target_path: Path,
+        target_index: HedefSayfaDizini,
+        records_by_tckn: dict[str, list[EducationRecord]],
+    ) -> bool:
+        """Hedef dosyanın kaynak kayıtlarla eşleşebilecek bir sayfa içerip içermediği.
+
+        ``{Ad Soyad} - {TCKN}.xlsx`` adlı kişi dosyalarında TCKN dosya adından
+        okunur. Diğer dosyalarda sayfa adları workbook açılmadan önbellekten
+        ya da ``workbook.xml`` içinden okunur; okunamazsa dosya işlenir.
+        """
+        if self._tckn_from_sheet_title(target_path.stem) is not None:
+            sheet_titles = [target_path.stem]
+        else:
+            sheet_titles = target_index.sayfa_adlari(target_path)
+            if sheet_titles is None:
+                return True
+        return any(
+            self._match_tckn(sheet_title, records_by_tckn) is not None
+            for sheet_title in sheet_titles
+        )
+
+    def _process_target_files(
+        self,
+        target_files: list[Path],
+        records_by_tckn: dict[str, list[EducationRecord]],
+        jobs: int,
+    ) -> Iterator[tuple[Path, _TargetFileProcessResult]]:
+        """Hedef dosyaları işler; sonuçları dosya sırasıyla üretir."""
+        if jobs > 1 and len(target_files) > 1:
+            yield from _process_target_files_in_parallel(
+                target_files, records_by_tckn, jobs
+            )
+            return
+
+        for target_path in target_files:
+            yield target_path, self._process_target_file(target_path, records_by_tckn)
+
     def _process_target_file(
         self,
         target_path: Path,
         records_by_tckn: dict[str, list[EducationRecord]],
     ) -> _TargetFileProcessResult:
-        """Tek bir hedef workbook'u işler ve sayısal özet döndürür."""
-        workbook = openpyxl.load_workbook(target_path)
-        matched_tckns: set[str] = set()
-        matched_sheet_count = 0
-        updated_sheet_count = 0
-        appended_record_count = 0
-        skipped_record_count = 0
+        """Tek bir hedef workbook'u işler ve sayısal özet döndürür.
 
+        Eşleşen sayfaların eğitim blokları önce salt okunur modda taranır.
+        Workbook yalnızca en az bir kayıt yazılacaksa yazma için yüklenir;
+        tüm kayıtları zaten bulunan dosyalara dokunulmaz.
+        """
+        with asama("mezuniyet.hedef_tara"):
+            education_blocks = self._read_education_blocks(target_path, records_by_tckn)
+
+        plans: list[_SheetPlan] = []
+        for sheet_title, tckn, cells in education_blocks:
+            with asama("mezuniyet.kayit_isle"):
+                plans.append(
+                    self._plan_sheet_records(
+                        sheet_title, tckn, cells, records_by_tckn[tckn]
+                    )
+                )
+
+        appended_record_count = sum(len(plan.placements) for plan in plans)
+        backup_path = None
+        if appended_record_count:
+            backup_path = self._write_sheet_plans(target_path, plans)
+
+        return _TargetFileProcessResult(
+            matched_tckns={plan.tckn for plan in plans},
+            matched_sheet_count=len(plans),
+            updated_sheet_count=sum(1 for plan in plans if plan.placements),
+            appended_record_count=appended_record_count,
+            skipped_record_count=sum(plan.skipped_record_count for plan in plans),
+            backup_path=backup_path,
+            warning_messages=[
+                message for plan in plans for message in plan.warning_messages
+            ],
+        )
+
+    def _read_education_blocks(
+        self,
+        target_path: Path,
+        records_by_tckn: dict[str, list[EducationRecord]],
+    ) -> list[tuple[str, str, dict[str, object]]]:
+        """Eşleşen sayfaların eğitim bloğu hücrelerini salt okunur modda okur.
+
+        :returns: Workbook sırasıyla ``(sayfa adı, TCKN, hücre değerleri)``
+            üçlüleri. Hücre değerleri ``"C5"`` gibi koordinatlarla anahtarlanır.
+        """
+        workbook = openpyxl.load_workbook(target_path, read_only=True)
         try:
+            education_blocks = []
             for worksheet in workbook.worksheets:
                 tckn = self._match_tckn(worksheet.title, records_by_tckn)
                 if tckn is None:
                     continue
+                # Bazı üreticiler hatalı boyut bilgisi yazar; satırlar okunarak bulunur.
+                worksheet.reset_dimensions()
+                rows = worksheet.iter_rows(
+                    max_row=_EDUCATION_SCAN_MAX_ROW,
+                    min_col=2,
+                    max_col=1 + len(_EDUCATION_SCAN_COLUMNS),
+                    values_only=True,
+                )
+                cells = {
+                    f"{column}{row_no}": value
+                    for row_no, values in enumerate(rows, start=1)
+                    for column, value in zip(_EDUCATION_SCAN_COLUMNS, values)
+                    if value is not None
+                }
+                education_blocks.append((worksheet.title, tckn, cells))
+            return education_blocks
+        finally:
+            workbook.close()
 
-                matched_tckns.add(tckn)
-                matched_sheet_count += 1
+    def _write_sheet_plans(self, target_path: Path, plans: list[_SheetPlan]) -> Path:
+        """Planlanan kayıtları workbook'a yazar; yedek alıp dosyayı kaydeder.
 
-                appended_count, skipped_count, warning_messages = (
-                    self._apply_records_to_sheet(
-                        worksheet,
-                        records_by_tckn[tckn],
-                    )
-                )
-                appended_record_count += appended_count
-                skipped_record_count += skipped_count
-                self._last_warning_messages.extend(warning_messages)
-                if appended_count:
-                    updated_sheet_count += 1
-
-            backup_path = None
-            if appended_record_count:
+        :returns: Alınan yedeğin yolu.
+        """
+        with asama("mezuniyet.hedef_yukle"):
+            workbook = openpyxl.load_workbook(target_path)
+        try:
+            for plan in plans:
+                worksheet = workbook[plan.sheet_title]
+                for row, record in plan.placements:
+                    worksheet[f"B{row}"] = record.level
+                    worksheet[f"C{row}"] = record.school_text
+                    worksheet[f"E{row}"] = record.department_text
+                    if record.graduation_date:
+                        worksheet[f"I{row}"] = record.graduation_date
+
+            with asama("mezuniyet.yedek"):
                 backup_path = self._create_backup(target_path)
+            with asama("mezuniyet.kaydet"):
                 self._save_workbook(workbook, target_path)
         finally:
             workbook.close()
-
-        return _TargetFileProcessResult(
-            matched_tckns=matched_tckns,
-            matched_sheet_count=matched_sheet_count,
-            updated_sheet_count=updated_sheet_count,
-            appended_record_count=appended_record_count,
-            skipped_record_count=skipped_record_count,
-            backup_path=backup_path,
-        )
+        return backup_path
 
     @staticmethod
     def _merge_target_result(
@@ -250,16 +476,16 @@ class EducationImporter:
                 f"Kaynak mezuniyet dosyası bulunamadı: {source_path}"
             )
 
-        dataframe = pd.read_excel(source_path, dtype=str)
-        self._validate_source_columns(dataframe)
+        # Yalnızca kullanılan sütunlar, dosya satır satır ayrıştırılarak okunur.
+        with XlsxSutunOkuyucu(source_path) as reader:
+            self._validate_source_columns(reader.basliklar)
+            rows = list(reader.satirlar(_SOURCE_COLUMNS))
+
+        records, warning_messages = self._parse_source_rows(rows)
+        self._last_warning_messages.extend(warning_messages)
 
         records_by_tckn: dict[str, list[EducationRecord]] = {}
-        for index, row in dataframe.iterrows():
-            record, warning_message = self._row_to_record(row, int(index) + 2)
-            if record is None:
-                if warning_message:
-                    self._last_warning_messages.append(warning_message)
-                continue
+        for record in records:
             records_by_tckn.setdefault(record.tckn, []).append(record)
 
         for tckn, records in records_by_tckn.items():
@@ -271,105 +497,98 @@ class EducationImporter:
         return records_by_tckn
 
     @staticmethod
-    def _validate_source_columns(dataframe: pd.DataFrame) -> None:
+    def _validate_source_columns(columns: list[str]) -> None:
         """Kaynak dosyada zorunlu sütunların bulunduğunu doğrular."""
-        required_columns = {
-            _SOURCE_COL_TCKN,
-            _SOURCE_COL_AD,
-            _SOURCE_COL_MEZUNIYET_TARIHI,
-            _SOURCE_COL_UNIVERSITE,
-            _SOURCE_COL_FAKULTE,
-            _SOURCE_COL_PROGRAM,
-        }
-        missing_columns = required_columns - set(dataframe.columns)
+        missing_columns = set(_SOURCE_COLUMNS) - set(columns)
         if missing_columns:
             raise ValueError(
                 f"Kaynak mezuniyet dosyasında zorunlu sütunlar eksik: {sorted(missing_columns)}"
             )
 
-    def _row_to_record(
+    def _parse_source_rows(
         self,
-        row: pd.Series,
-        excel_row_no: int,
-    ) -> tuple[EducationRecord | None, str | None]:
-        """Tek bir kaynak satırını işleyip geçerliyse EducationRecord döndürür."""
-        raw_tckn = self._clean_text(row.get(_SOURCE_COL_TCKN))
-        raw_name = self._clean_text(row.get(_SOURCE_COL_AD))
-        university = self._clean_text(row.get(_SOURCE_COL_UNIVERSITE))
-        faculty = self._clean_text(row.get(_SOURCE_COL_FAKULTE))
-        program = self._clean_text(row.get(_SOURCE_COL_PROGRAM))
-        raw_graduation_date = self._clean_text(row.get(_SOURCE_COL_MEZUNIYET_TARIHI))
-
-        if not any(
-            [raw_tckn, raw_name, university, faculty, program, raw_graduation_date]
-        ):
-            return None, None
-
-        if not raw_tckn:
-            return None, self._build_source_warning_message(
-                excel_row_no,
-                "TC KIMLIK NO boş",
-                raw_tckn=raw_tckn,
-                raw_name=raw_name,
-                university=university,
-                program=program,
-            )
-
-        if not raw_name:
-            return None, self._build_source_warning_message(
-                excel_row_no,
-                "AD alanı boş",
-                raw_tckn=raw_tckn,
-                raw_name=raw_name,
-                university=university,
-                program=program,
-            )
+        rows: Sequence[tuple[int, tuple[str | None, ...]]],
+    ) -> tuple[list[EducationRecord], list[str]]:
+        """Kaynak satırları sütun bazında işleyip kayıtları ve uyarıları döndürür.
 
-        if _MISSING_RECORD_MARKER in raw_name.upper():
-            return None, self._build_source_warning_message(
-                excel_row_no,
-                "Kayıtta mezun kaydı bulunamadı ibaresi var",
-                raw_tckn=raw_tckn,
-                raw_name=raw_name,
-                university=university,
-                program=program,
-            )
+        Metinler sütun başına tek seferde temizlenir; red kuralları maskelerle
+        uygulanır ve her satır için ilk sağlanmayan kural uyarıya yazılır.
+        Tamamen boş satırlar uyarısız atlanır. Kayıtlar ve uyarılar kaynak
+        satır sırasıyla döner.
 
-        tckn = normalize_tckn(raw_tckn)
-        if not validate_tckn(tckn):
-            return None, self._build_source_warning_message(
-                excel_row_no,
-                f"Geçersiz TCKN: {tckn}",
-                raw_tckn=tckn,
-                raw_name=raw_name,
-                university=university,
-                program=program,
-            )
+        :param rows: ``(Excel satır no, _SOURCE_COLUMNS sırasıyla değerler)``
+            çiftleri.
+        """
+        frame = pd.DataFrame(
+            [values for _, values in rows],
+            columns=list(_SOURCE_COLUMNS),
+            dtype=object,
+        ).apply(self._clean_text_column)
+        raw_tckns = frame[_SOURCE_COL_TCKN]
+        raw_names = frame[_SOURCE_COL_AD]
+        universities = frame[_SOURCE_COL_UNIVERSITE]
+        programs = frame[_SOURCE_COL_PROGRAM]
+
+        tckns = normalize_tckn_batch(raw_tckns.tolist())
+        tckn_valid, _ = validate_tckn_batch(tckns)
+        blank_row = (frame == "").all(axis=1).to_numpy()
+        # 0: kabul; n: _SOURCE_REJECTION_REASONS[n - 1].
+        rejection_codes = np.select(
+            [
+                (raw_tckns == "").to_numpy(),
+                (raw_names == "").to_numpy(),
+                raw_names.str.upper()
+                .str.contains(_MISSING_RECORD_MARKER, regex=False)
+                .to_numpy(dtype=bool),
+                ~tckn_valid,
+                (universities == "").to_numpy(),
+            ],
+            range(1, len(_SOURCE_REJECTION_REASONS) + 1),
+            default=0,
+        )
 
-        graduation_date = self._format_date(row.get(_SOURCE_COL_MEZUNIYET_TARIHI))
-
-        school_text = university
-        department_text = self._build_department_text(program)
-        if not school_text:
-            return None, self._build_source_warning_message(
-                excel_row_no,
-                "Okul bilgisi üretilemedi",
-                raw_tckn=tckn,
-                raw_name=raw_name,
-                university=university,
-                program=program,
+        warning_messages = []
+        for index in np.flatnonzero((rejection_codes > 0) & ~blank_row):
+            reason_index = rejection_codes[index] - 1
+            reason = _SOURCE_REJECTION_REASONS[reason_index]
+            raw_tckn = raw_tckns.iat[index]
+            if reason_index >= _INVALID_TCKN_REASON:
+                raw_tckn = tckns[index]
+            if reason_index == _INVALID_TCKN_REASON:
+                reason = f"{reason}: {raw_tckn}"
+            warning_messages.append(
+                self._build_source_warning_message(
+                    rows[index][0],
+                    reason,
+                    raw_tckn=raw_tckn,
+                    raw_name=raw_names.iat[index],
+                    university=universities.iat[index],
+                    program=programs.iat[index],
+                )
             )
 
-        return (
+        accepted = np.flatnonzero(rejection_codes == 0)
+        accepted_frame = frame.iloc[accepted]
+        accepted_programs = accepted_frame[_SOURCE_COL_PROGRAM]
+        records = [
             EducationRecord(
                 tckn=tckn,
-                level=self._infer_level(program, faculty),
+                level=level,
                 school_text=school_text,
                 department_text=department_text,
                 graduation_date=graduation_date,
-            ),
-            None,
-        )
+            )
+            for tckn, level, school_text, department_text, graduation_date in zip(
+                tckns[accepted],
+                self._infer_levels(
+                    accepted_programs, accepted_frame[_SOURCE_COL_FAKULTE]
+                ),
+                accepted_frame[_SOURCE_COL_UNIVERSITE],
+                self._build_department_texts(accepted_programs),
+                self._format_dates(accepted_frame[_SOURCE_COL_MEZUNIYET_TARIHI]),
+            )
+        ]
+        return records, warning_messages
 
     @staticmethod
     def _record_sort_key(record: EducationRecord) -> tuple[int, str, str]:
@@ -387,55 +606,75 @@ class EducationImporter:
             return ""
         return " ".join(str(value).strip().split())
 
-    def _format_date(self, value: object) -> str:
-        """Mezuniyet tarihini ``dd.mm.YYYY`` biçimine çevirir."""
-        text = self._clean_text(value)
-        if not text:
-            return ""
+    @staticmethod
+    def _clean_text_column(column: pd.Series) -> pd.Series:
+        """Bir kaynak sütununu :meth:`_clean_text` ile aynı kurallarla temizler."""
+        return (
+            column.fillna("")
+            .astype(object)
+            .str.replace(r"\s+", " ", regex=True)
+            .str.strip()
+        )
 
-        parsed = pd.to_datetime(text, dayfirst=True, errors="coerce")
-        if pd.isna(parsed):
-            return text
-        return parsed.strftime("%d.%m.%Y")
+    @staticmethod
+    def _format_dates(values: pd.Series) -> np.ndarray:
+        """Mezuniyet tarihlerini ``dd.mm.YYYY`` biçimine çevirir.
+
+        Her farklı metin bir kez, tüm sütun için tek bir ``pd.to_datetime``
+        çağrısıyla çözümlenir. ``format="mixed"`` her metni ayrı ayrı
+        yorumlar; böylece sütunda farklı tarih biçimleri bir arada
+        bulunabilir. Tarih olarak okunamayan metinler olduğu gibi kalır.
+        """
+        codes, uniques = pd.factorize(values.to_numpy(dtype=object))
+        parsed = pd.to_datetime(
+            pd.Series(uniques, dtype=object),
+            dayfirst=True,
+            errors="coerce",
+            format="mixed",
+        )
+        formatted = np.where(
+            parsed.isna().to_numpy(),
+            uniques,
+            parsed.dt.strftime("%d.%m.%Y").to_numpy(dtype=object),
+        )
+        return formatted[codes]
 
     @staticmethod
-    def _build_department_text(program: str) -> str:
-        """Bölüm hücresine yazılacak metni üretir.
+    def _build_department_texts(programs: pd.Series) -> pd.Series:
+        """Bölüm hücresine yazılacak metinleri üretir.
 
         Program adında " - " varsa yalnızca önceki kısım alınır;
         bu sayede "ÖRGÜN ÖĞRETİM" gibi ekler kırpılır.
         Ayrıca (YL) ve (DR) gibi ibareler temizlenir.
         """
-        text = program
-        if " - " in text:
-            text = text.split(" - ")[0].strip()
-
-        text = text.replace("(YL)", "").replace("(DR)", "").strip()
-        return text
+        return (
+            programs.str.split(" - ", n=1)
+            .str[0]
+            .str.strip()
+            .str.replace("(YL)", "", regex=False)
+            .str.replace("(DR)", "", regex=False)
+            .str.strip()
+        )
 
     @staticmethod
-    def _infer_level(program: str, faculty: str) -> str:
-        """Program metninden şablondaki öğrenim seviyesini tahmin eder."""
-        search_text = f"{program} {faculty}".upper()
-        if (
-            "DOKTORA" in search_text
-            or "SANATTA YETERLİK" in search_text
-            or "(DR)" in search_text
-        ):
-            return OGRENIM_DOKTORA
-        if (
-            "TEZSİZ YÜKSEK LİSANS" in search_text
-            or "TEZSIZ YUKSEK LISANS" in search_text
-        ):
-            return OGRENIM_TEZSIZ_YL
-        if (
-            "YÜKSEK LİSANS" in search_text
-            or "YUKSEK LISANS" in search_text
-            or "MASTER" in search_text
-            or "(YL)" in search_text
-        ):
-            return OGRENIM_TEZLI_YL
-        return OGRENIM_LISANS
+    def _infer_levels(programs: pd.Series, faculties: pd.Series) -> np.ndarray:
+        """Program ve fakülte metinlerinden şablondaki öğrenim seviyelerini tahmin eder.
+
+        Seviyeler ``_EDUCATION_LEVEL_KEYWORDS`` sırasıyla denenir; hiçbir
+        ibare geçmiyorsa lisans kabul edilir.
+        """
+        search_texts = (programs + " " + faculties).str.upper()
+        masks = [
+            search_texts.str.contains(
+                "|".join(re.escape(keyword) for keyword in keywords)
+            ).to_numpy(dtype=bool)
+            for _, keywords in _EDUCATION_LEVEL_KEYWORDS
+        ]
+        return np.select(
+            masks,
+            [level for level, _ in _EDUCATION_LEVEL_KEYWORDS],
+            default=OGRENIM_LISANS,
+        ).astype(object)
 
     @staticmethod
     def _create_backup(target_path: Path) -> Path:
@@ -456,26 +695,52 @@ class EducationImporter:
         sheet_title: str,
         records_by_tckn: dict[str, list[EducationRecord]],
     ) -> str | None:
-        """Sayfa adı içinde geçen TCKN'yi bulur."""
+        """Sayfa adı içinde geçen TCKN'yi bulur.
+
+        Tutanak sayfa adları ``{Ad Soyad} - {TCKN}`` ya da yalnızca TCKN
+        biçimindedir; bu adlarda TCKN sondan okunup sözlükte aranır. Diğer
+        adlar için her kaynak TCKN'si sayfa adında aranır.
+        """
+        tckn = EducationImporter._tckn_from_sheet_title(sheet_title)
+        if tckn is not None:
+            return tckn if tckn in records_by_tckn else None
         for tckn in records_by_tckn:
-            if tckn == sheet_title or tckn in sheet_title:
+            if tckn in sheet_title:
                 return tckn
         return None
 
-    def _apply_records_to_sheet(
+    @staticmethod
+    def _tckn_from_sheet_title(sheet_title: str) -> str | None:
+        """Tutanak adlandırma kuralına uyan sayfa adındaki TCKN'yi döndürür."""
+        tckn = sheet_title[-11:]
+        if len(tckn) != 11 or not tckn.isascii() or not tckn.isdigit():
+            return None
+        if len(sheet_title) == 11 or sheet_title[:-11].endswith(_SHEET_TCKN_SEPARATOR):
+            return tckn
+        return None
+
+    def _plan_sheet_records(
         self,
-        worksheet: openpyxl.worksheet.worksheet.Worksheet,
+        sheet_title: str,
+        tckn: str,
+        cells: Mapping[str, object],
         records: list[EducationRecord],
-    ) -> tuple[int, int, list[str]]:
-        """Kayıtları ilk boş eğitim satırlarına yazar."""
-        education_rows = self._locate_education_rows(worksheet)
+    ) -> _SheetPlan:
+        """Kayıtları sayfanın ilk boş eğitim satırlarına yerleştirir.
+
+        Sayfada aynısı bulunan ya da boş satır kalmadığı için yazılamayan
+        kayıtlar atlanır ve uyarı üretilir.
+
+        :param cells: Eğitim bloğu hücre değerleri (``"C5"`` → değer).
+        """
+        education_rows = self._locate_education_rows(cells)
         empty_rows: list[int] = []
         existing_fingerprints: set[tuple[str, str, str]] = set()
 
         for row in education_rows:
-            level = self._clean_text(worksheet[f"B{row}"].value)
-            school = self._clean_text(worksheet[f"C{row}"].value)
-            department = self._clean_text(worksheet[f"E{row}"].value)
+            level = self._clean_text(cells.get(f"B{row}"))
+            school = self._clean_text(cells.get(f"C{row}"))
+            department = self._clean_text(cells.get(f"E{row}"))
 
             if school:
                 # Normalize existing school cell by stripping any appended
@@ -496,7 +761,7 @@ class EducationImporter:
 
             empty_rows.append(row)
 
-        appended_count = 0
+        placements: list[tuple[int, EducationRecord]] = []
         skipped_count = 0
         warning_messages: list[str] = []
         for record in records:
@@ -504,7 +769,7 @@ class EducationImporter:
                 skipped_count += 1
                 warning_messages.append(
                     self._build_sheet_skip_message(
-                        worksheet.title,
+                        sheet_title,
                         record,
                         "Hedef sayfada aynı eğitim kaydı zaten var",
                     )
@@ -515,34 +780,32 @@ class EducationImporter:
                 skipped_count += 1
                 warning_messages.append(
                     self._build_sheet_skip_message(
-                        worksheet.title,
+                        sheet_title,
                         record,
                         "Boş eğitim satırı kalmadı",
                     )
                 )
                 continue
 
-            row = empty_rows.pop(0)
-            worksheet[f"B{row}"] = record.level
-            worksheet[f"C{row}"] = record.school_text
-            worksheet[f"E{row}"] = record.department_text
-            if record.graduation_date:
-                worksheet[f"I{row}"] = record.graduation_date
+            placements.append((empty_rows.pop(0), record))
             existing_fingerprints.add(record.fingerprint)
-            appended_count += 1
 
-        return appended_count, skipped_count, warning_messages
+        return _SheetPlan(
+            sheet_title=sheet_title,
+            tckn=tckn,
+            placements=placements,
+            skipped_record_count=skipped_count,
+            warning_messages=warning_messages,
+        )
 
-    def _locate_education_rows(
-        self, worksheet: openpyxl.worksheet.worksheet.Worksheet
-    ) -> list[int]:
+    def _locate_education_rows(self, cells: Mapping[str, object]) -> list[int]:
         """Şablondaki eğitim satırlarını dinamik olarak bulur."""
         school_header_row = None
         experience_header_row = None
 
-        for row in range(1, min(worksheet.max_row, 40) + 1):
-            school_value = self._clean_text(worksheet[f"C{row}"].value).upper()
-            left_value = self._clean_text(worksheet[f"B{row}"].value).upper()
+        for row in range(1, _EDUCATION_SCAN_MAX_ROW + 1):
+            school_value = self._clean_text(cells.get(f"C{row}")).upper()
+            left_value = self._clean_text(cells.get(f"B{row}")).upper()
 
             if school_header_row is None and school_value == "OKUL":
                 school_header_row = row
@@ -615,3 +878,65 @@ class EducationImporter:
                 f"({len(records_by_tckn.get(tckn, []))} kayıt)"
             )
         return messages
+
+
+# ---------------------------------------------------------------------------
+# Süreç havuzu ile paralel aktarım
+# ---------------------------------------------------------------------------
+
+# Her işçi süreçte bir kez doldurulur: kaynak kayıtlar ve ölçüm tercihi.
+_WORKER_STATE: dict[str, object] = {}
+
+
+def _process_target_files_in_parallel(
+    target_files: list[Path],
+    records_by_tckn: dict[str, list[EducationRecord]],
+    jobs: int,
+) -> Iterator[tuple[Path, _TargetFileProcessResult]]:
+    """Hedef dosyaları süreç havuzuna dağıtır; sonuçları dosya sırasıyla üretir.
+
+    Kaynak kayıtlar her işçiye başlatılırken bir kez gönderilir; görevler
+    yalnızca dosya yolunu taşır. Her dosya tek bir görevde işlendiğinden iki
+    süreç aynı dosyaya yazmaz. Üretici erken bırakılırsa ya da bir dosyada
+    hata oluşursa henüz başlamamış görevler iptal edilir.
+    """
+    timer = aktif_zamanlayici()
+    pool = ProcessPoolExecutor(
+        max_workers=min(jobs, len(target_files)),
+        initializer=_worker_init,
+        initargs=(records_by_tckn, timer is not None),
+    )
+    try:
+        file_results = pool.map(_worker_process_target_file, target_files)
+        for target_path, (file_result, phase_records) in zip(
+            target_files, file_results
+        ):
+            if timer is not None:
+                timer.ekle(phase_records)
+            yield target_path, file_result
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+
+def _worker_init(
+    records_by_tckn: dict[str, list[EducationRecord]],
+    timing: bool,
+) -> None:
+    """İşçi süreçte kaynak kayıtları ve ölçüm tercihini saklar."""
+    _WORKER_STATE["records_by_tckn"] = records_by_tckn
+    _WORKER_STATE["timing"] = timing
+
+
+def _worker_process_target_file(
+    target_path: Path,
+) -> tuple[_TargetFileProcessResult, list[AsamaKaydi]]:
+    """İşçi süreçte tek bir hedef dosyayı işler.
+
+    Ölçüm istendiyse bu görevin aşama kayıtları da döndürülür; ana süreç
+    bunları kendi zamanlayıcısına ekler.
+    """
+    with zamanlama_olc(_WORKER_STATE["timing"]) as timer:
+        file_result = EducationImporter()._process_target_file(
+            target_path, _WORKER_STATE["records_by_tckn"]
+        )
+    return file_result, timer.kayitlar if timer is not None else []
@@ -12,10 +12,12 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import List
 
-import pandas as pd
+import numpy as np
 
 from src.config.constants import COL_TCKN, COL_AD_SOYAD, COL_BIRIM
-from src.core.validators import normalize_tckn, validate_tckn, validate_ad_soyad
+from src.core.excel_stream_reader import XlsxSutunOkuyucu
+from src.core.validators import validate_tckn_batch
+from src.core.zamanlama import asama
 
 # ---------------------------------------------------------------------------
 # Veri sınıfı
@@ -85,24 +87,13 @@ def oku_personel_listesi_raporlu(dosya_yolu: str | Path) -> PersonelOkumaRaporu:
     if not dosya_yolu.exists():
         raise FileNotFoundError(f"Kaynak dosya bulunamadı: {dosya_yolu}")
 
-    df = pd.read_excel(dosya_yolu, dtype=str)
+    with asama("okuyucu.oku"):
+        with XlsxSutunOkuyucu(dosya_yolu) as okuyucu:
+            _zorunlu_sutunları_dogrula(okuyucu.basliklar)
+            satirlar = list(okuyucu.satirlar((COL_TCKN, COL_AD_SOYAD, COL_BIRIM)))
 
-    _zorunlu_sutunları_dogrula(df)
-
-    personeller: List[Personel] = []
-    reddedilen_satirlar: List[SatirReddi] = []
-    for index, satir in df.iterrows():
-        excel_satir_no = int(index) + 2
-        personel, red_nedeni = _satiri_isle(satir, excel_satir_no)
-        if personel is not None:
-            personeller.append(personel)
-        if red_nedeni is not None:
-            reddedilen_satirlar.append(red_nedeni)
-
-    return PersonelOkumaRaporu(
-        personeller=personeller,
-        reddedilen_satirlar=reddedilen_satirlar,
-    )
+    with asama("okuyucu.satirlar"):
+        return _satirlari_isle(satirlar)
 
 
 # ---------------------------------------------------------------------------
@@ -110,56 +101,85 @@ def oku_personel_listesi_raporlu(dosya_yolu: str | Path) -> PersonelOkumaRaporu:
 # ---------------------------------------------------------------------------
 
 
-def _zorunlu_sutunları_dogrula(df: pd.DataFrame) -> None:
+def _zorunlu_sutunları_dogrula(sutunlar: list[str]) -> None:
     """
-    DataFrame'in zorunlu sütunları içerip içermediğini denetler.
+    Başlık satırının zorunlu sütunları içerip içermediğini denetler.
 
-    :param df: Okunan veri çerçevesi.
+    :param sutunlar: Başlık satırındaki sütun adları.
     :raises ValueError: Eksik sütun varsa.
     """
     zorunlu = {COL_TCKN, COL_AD_SOYAD, COL_BIRIM}
-    eksik = zorunlu - set(df.columns)
+    eksik = zorunlu - set(sutunlar)
     if eksik:
         raise ValueError(f"Kaynak dosyada zorunlu sütunlar eksik: {eksik}")
 
 
-def _satiri_isle(
-    satir: pd.Series,
-    excel_satir_no: int,
-) -> tuple[Personel | None, SatirReddi | None]:
+def _satirlari_isle(
+    satirlar: list[tuple[int, tuple[str | None, ...]]],
+) -> PersonelOkumaRaporu:
     """
-    Tek bir DataFrame satırını işler ve geçerliyse :class:`Personel` döner.
+    Tüm satırları sütun bazında doğrular ve rapor nesnelerini en sonda üretir.
 
-    Geçersiz ya da eksik veri içeren satırlar için red nedeni üretir.
+    Boş TCKN, geçersiz TCKN ve boş AD SOYAD kuralları maskelerle uygulanır;
+    red nedenleri satır başına ``"; "`` ile birleştirilir.
 
-    :param satir: İşlenecek satır.
-    :param excel_satir_no: Excel içindeki gerçek satır numarası.
-    :returns: ``(Personel | None, SatirReddi | None)``.
+    :param satirlar: ``(Excel satır no, (TCKN, AD SOYAD, BİRİMİ))`` çiftleri.
+    :returns: Geçerli kayıtlar ve reddedilen satırlar.
     """
-    ham_tckn = satir.get(COL_TCKN)
-    ham_ad_soyad = satir.get(COL_AD_SOYAD)
-    ham_birim = satir.get(COL_BIRIM)
-
-    tckn = normalize_tckn(str(ham_tckn).strip()) if not pd.isna(ham_tckn) else ""
-    ad_soyad = "" if pd.isna(ham_ad_soyad) else str(ham_ad_soyad).strip()
-    birim = "" if pd.isna(ham_birim) else str(ham_birim).strip()
-
-    hata_nedenleri: list[str] = []
-    if not tckn:
-        hata_nedenleri.append("TCKN boş")
-    elif not validate_tckn(tckn):
-        hata_nedenleri.append(f"Geçersiz TCKN: {tckn}")
-
-    if not validate_ad_soyad(ad_soyad):
-        hata_nedenleri.append("AD SOYAD boş")
-
-    if hata_nedenleri:
-        return None, SatirReddi(
-            excel_satir_no=excel_satir_no,
-            sebep="; ".join(hata_nedenleri),
-            tckn=tckn,
-            ad_soyad=ad_soyad,
-            birim=birim,
+    excel_satir_nolari = [satir_no for satir_no, _ in satirlar]
+    ham_tcknler, ham_ad_soyadlar, ham_birimler = (
+        zip(*(degerler for _, degerler in satirlar)) if satirlar else ((), (), ())
+    )
+
+    tckn_bos = np.fromiter(
+        (deger is None for deger in ham_tcknler), dtype=bool, count=len(satirlar)
+    )
+    # normalize_tckn ile aynı: kırp ve 11 haneye sıfırla tamamla.
+    tckn_listesi = [
+        "" if deger is None else deger.strip().zfill(11) for deger in ham_tcknler
+    ]
+    ad_soyad_listesi = [
+        "" if deger is None else deger.strip() for deger in ham_ad_soyadlar
+    ]
+    birim_listesi = ["" if deger is None else deger.strip() for deger in ham_birimler]
+
+    tckn_gecerli, _ = validate_tckn_batch(tckn_listesi)
+    tckn_gecersiz = ~tckn_bos & ~tckn_gecerli
+    ad_soyad_bos = np.fromiter(
+        (not deger for deger in ad_soyad_listesi), dtype=bool, count=len(satirlar)
+    )
+    reddedilen = tckn_bos | tckn_gecersiz | ad_soyad_bos
+
+    personeller = [
+        Personel(
+            tckn=tckn_listesi[index],
+            ad_soyad=ad_soyad_listesi[index],
+            birim=birim_listesi[index],
+        )
+        for index in np.flatnonzero(~reddedilen)
+    ]
+
+    reddedilen_satirlar = []
+    for index in np.flatnonzero(reddedilen):
+        tckn = tckn_listesi[index]
+        hata_nedenleri: list[str] = []
+        if tckn_bos[index]:
+            hata_nedenleri.append("TCKN boş")
+        elif tckn_gecersiz[index]:
+            hata_nedenleri.append(f"Geçersiz TCKN: {tckn}")
+        if ad_soyad_bos[index]:
+            hata_nedenleri.append("AD SOYAD boş")
+        reddedilen_satirlar.append(
+            SatirReddi(
+                excel_satir_no=excel_satir_nolari[index],
+                sebep="; ".join(hata_nedenleri),
+                tckn=tckn,
+                ad_soyad=ad_soyad_listesi[index],
+                birim=birim_listesi[index],
+            )
         )
 
-    return Personel(tckn=tckn, ad_soyad=ad_soyad, birim=birim), None
+    return PersonelOkumaRaporu(
+        personeller=personeller,
+        reddedilen_satirlar=reddedilen_satirlar,
+    )
@@ -0,0 +1,141 @@
+"""
+Kaynak xlsx dosyalarını akış halinde, yalnızca gereken sütunlarla okuyan modül.
+
+openpyxl ``read_only`` modunda satırlar dosyadan ayrıştırıldıkça işlenir;
+bellekte tüm sayfa değil, yalnızca o anki satır tutulur. Hücre değerleri
+``pandas.read_excel(..., dtype=str)`` ile aynı metinlere çevrilir; böylece
+okuyucular pandas'a ihtiyaç duymadan aynı doğrulama kurallarını uygular.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterator, Sequence
+
+import openpyxl
+
+#: pandas'ın varsayılan olarak boş (NaN) kabul ettiği metinler.
+_BOS_METINLER = frozenset(
+    {
+        "",
+        "#N/A",
+        "#N/A N/A",
+        "#NA",
+        "-1.#IND",
+        "-1.#QNAN",
+        "-NaN",
+        "-nan",
+        "1.#IND",
+        "1.#QNAN",
+        "<NA>",
+        "N/A",
+        "NA",
+        "NULL",
+        "NaN",
+        "None",
+        "n/a",
+        "nan",
+        "null",
+    }
+)
+
+
+def hucre_metni(deger: object) -> str | None:
+    """
+    Hücre değerini ``dtype=str`` ile okunmuş pandas değerine çevirir.
+
+    Tam sayı değerli ondalıklar tam sayı olarak yazılır; boş hücreler ve
+    pandas'ın boş saydığı metinler ``None`` olur.
+
+    :param deger: openpyxl hücre değeri.
+    :returns: Hücre metni ya da ``None``.
+    """
+    if deger is None:
+        return None
+    if isinstance(deger, str):
+        return None if deger in _BOS_METINLER else deger
+    if isinstance(deger, float) and deger.is_integer():
+        return str(int(deger))
+    return str(deger)
+
+
+def _bos_satir(degerler: tuple[object, ...]) -> bool:
+    """Satırdaki tüm hücreler boşsa ``True`` döner."""
+    return all(deger is None or deger == "" for deger in degerler)
+
+
+class XlsxSutunOkuyucu:
+    """
+    İlk sayfanın başlık satırını bulur ve istenen sütunları satır satır verir.
+
+    Başlık satırı, sayfadaki ilk boş olmayan satırdır. Veri satırları Excel
+    satır numarasıyla birlikte üretilir. Aradaki boş satırlar korunur (boş
+    değerlerle), sondaki boş satırlar atlanır.
+
+    Bağlam yöneticisi olarak kullanılır::
+
+        with XlsxSutunOkuyucu(yol) as okuyucu:
+            for satir_no, (tckn, ad) in okuyucu.satirlar(("TCKN", "AD")):
+                ...
+
+    :param dosya_yolu: Okunacak xlsx dosyası.
+    """
+
+    def __init__(self, dosya_yolu: str | Path) -> None:
+        self._wb = openpyxl.load_workbook(dosya_yolu, read_only=True, data_only=True)
+        self.basliklar: list[str] = []
+        self.baslik_satir_no = 0
+        try:
+            sayfa = self._wb.worksheets[0]
+            # Bazı üreticiler hatalı boyut bilgisi yazar; satırlar sonuna kadar okunur.
+            sayfa.reset_dimensions()
+            self._satir_akisi = enumerate(sayfa.iter_rows(values_only=True), start=1)
+            for satir_no, degerler in self._satir_akisi:
+                if not _bos_satir(degerler):
+                    self.baslik_satir_no = satir_no
+                    self.basliklar = [
+                        "" if deger is None else str(deger) for deger in degerler
+                    ]
+                    break
+        except BaseException:
+            # Bağlam yöneticisine girilmeden hata oluşursa dosya açık kalmamalı.
+            self._wb.close()
+            raise
+
+    def __enter__(self) -> XlsxSutunOkuyucu:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.kapat()
+
+    def kapat(self) -> None:
+        """Dosyayı kapatır."""
+        self._wb.close()
+
+    def satirlar(
+        self, sutunlar: Sequence[str]
+    ) -> Iterator[tuple[int, tuple[str | None, ...]]]:
+        """
+        Başlık satırından sonraki satırları istenen sütunlarla üretir.
+
+        Aynı adı taşıyan birden fazla sütun varsa ilki kullanılır.
+
+        :param sutunlar: Okunacak sütun adları.
+        :returns: ``(Excel satır no, sütun değerleri)`` çiftleri.
+        :raises ValueError: Başlıkta olmayan bir sütun istenirse.
+        """
+        konumlar = [self.basliklar.index(sutun) for sutun in sutunlar]
+        bekleyen_bos_satirlar: list[int] = []
+        bos_degerler = (None,) * len(konumlar)
+
+        for satir_no, degerler in self._satir_akisi:
+            if _bos_satir(degerler):
+                bekleyen_bos_satirlar.append(satir_no)
+                continue
+            for bos_satir_no in bekleyen_bos_satirlar:
+                yield bos_satir_no, bos_degerler
+            bekleyen_bos_satirlar.clear()
+            yield satir_no, tuple(
+                hucre_metni(degerler[konum]) if konum < len(degerler) else None
+                for konum in konumlar
+            )
@@ -17,8 +17,16 @@ class ExcelWriteStrategy(ABC):
 
     Her çıktı versiyonu bu sınıfı miras alarak ``sayfa_doldur``
     metodunu implemente etmelidir.
+
+    :param ortak_tablolar: ``True`` ise sayfaların kullandığı arama
+        tabloları her sayfaya yazılmaz; birleşik workbook'a bir kez
+        :meth:`ortak_sayfalari_ekle` ile eklenen gizli sayfadan okunur.
+        Tek sayfalık personel dosyaları için ``False`` kalmalıdır.
     """
 
+    def __init__(self, ortak_tablolar: bool = False) -> None:
+        self.ortak_tablolar = ortak_tablolar
+
     @abstractmethod
     def sayfa_doldur(
         self, ws: "openpyxl.worksheet.worksheet.Worksheet", personel: Personel
@@ -29,3 +37,27 @@ class ExcelWriteStrategy(ABC):
         :param personel: Doldurulacak personel verisi.
         """
         ...
+
+    def ortak_sayfalari_ekle(self, wb: "openpyxl.Workbook") -> None:
+        """Birleşik workbook'a sayfaların paylaştığı yardımcı sayfaları ekler.
+
+        Yalnızca :attr:`ortak_tablolar` açıkken çağrılır ve daha önce
+        eklenmiş sayfaları yeniden eklememelidir. Varsayılan uygulama
+        paylaşılan tablo kullanmayan stratejiler için hiçbir şey yapmaz.
+
+        :param wb: Personel sayfalarının bulunduğu workbook.
+        """
+
+    def hesaplanan_degerler(
+        self, ws: "openpyxl.worksheet.worksheet.Worksheet"
+    ) -> dict[str, object]:
+        """Doldurulmuş sayfadaki formüllerin Python'da hesaplanan sonuçlarını döndürür.
+
+        Dönen değerler kaydedilen dosyaya formül önbelleği olarak yazılır.
+        Sonucu kesin olarak bilinemeyen hücreler sözlüğe eklenmemelidir.
+        Varsayılan uygulama hiçbir formülü hesaplamaz.
+
+        :param ws: :meth:`sayfa_doldur` ile doldurulmuş çalışma sayfası.
+        :returns: Hücre adresi → hesaplanmış değer eşlemesi.
+        """
+        return {}
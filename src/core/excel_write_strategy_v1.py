@@ -8,12 +8,22 @@ Mevcut ``excel_writer.py`` içindeki iç fonksiyonlardan birebir taşınmıştı
 
 from __future__ import annotations
 
-from copy import copy
+from functools import lru_cache
+from typing import Callable
 
 import openpyxl
 import openpyxl.worksheet.worksheet
+from openpyxl.utils import coordinate_to_tuple, quote_sheetname
+from openpyxl.workbook.defined_name import DefinedName
 
 from src.config.constants import (
+    COL_ALANDA_PRIM,
+    COL_ALANINDA,
+    COL_BASLANGIC_TARIHI,
+    COL_BITIS_TARIHI,
+    COL_EKSIK_GUN,
+    COL_TOPLAM_PRIM,
+    OGRENIM_SEVIYELERI,
     TECRUBE_BASLANGIC_SATIR,
     TECRUBE_BITIS_SATIR,
 )
@@ -36,6 +46,26 @@ from src.core.formula_builder import (
     toplam_prim_formulu,
     unvan_formulu,
 )
+from src.core.formula_evaluator import (
+    BILINMEYEN,
+    HesaplanamazHatasi,
+    alanda_prim_hesapla,
+    brut_ucret_hesapla,
+    derece_kademe_hesapla,
+    en_yuksek_ogrenim_hesapla,
+    hizmet_grubu_hesapla,
+    kademe_baslangic_hesapla,
+    kademe_bitis_hesapla,
+    kademe_hesapla,
+    prim_gunu_hesapla,
+    tecrube_360_ay_hesapla,
+    tecrube_360_gun_hesapla,
+    tecrube_360_yil_hesapla,
+    toplam_alanda_prim_hesapla,
+    toplam_prim_hesapla,
+    unvan_hesapla,
+)
+from src.core.sheet_plan import DogrulamaPlani, SayfaPlani
 
 # ---------------------------------------------------------------------------
 # V1 şablonuna ait sabitler – hücre adresleri
@@ -51,6 +81,9 @@ _HUCRE_BRUT_UCRET = "G3"
 _UCRET_TABLO_ANAHTAR_SUTUNU = "AA"
 _UCRET_TABLO_DEGER_SUTUNU = "AB"
 _UCRET_TABLO_BASLANGIC_SATIR = 1
+# Ortak tablo kipinde birleşik workbook'a bir kez eklenen gizli sayfa
+_UCRET_TABLO_SAYFASI = "_BrutUcretTablosu"
+_UCRET_TABLO_ADI = "BRUT_UCRET_TABLOSU"
 _HUCRE_HIZMET_GRUBU_BASLIK = "M2"
 _HUCRE_HIZMET_GRUBU_TURU = "M3"
 _HUCRE_HIZMET_GRUBU_BASLIK_STIL_KAYNAGI = "H2"
@@ -62,6 +95,7 @@ _HUCRE_EKSIK_GUN_BASLIK_STIL_KAYNAGI = "L12"
 _HUCRE_EKSIK_GUN_STIL_KAYNAGI = "L13"
 _HUCRE_EKSIK_GUN_BASLIK_METNI = "Eksik Gün Sayısı"
 _EKSIK_GUN_SUTUNU = "M"
+_EKSIK_GUN_GENISLIK_KAYNAGI = "L"
 
 # Toplam / hesap satırları
 _SATIR_TOPLAM_PRIM = TECRUBE_BITIS_SATIR + 1  # 28
@@ -88,7 +122,12 @@ class ExcelWriteStrategyV1(ExcelWriteStrategy):
     """V1 (Standart DK Taslağı) için Excel yazma stratejisi.
 
     ``cikti_taslagi.xlsx`` / ``cikti_taslagi_dolu.xlsx`` şablonlarına
-    uygun olarak sayfayı doldurur.
+    uygun olarak sayfayı doldurur. Formüller, stil kopyaları ve doğrulamalar
+    şablon düzeni başına bir kez :class:`SayfaPlani` olarak derlenir; her
+    sayfada yalnızca derlenmiş plan uygulanır.
+
+    Ortak tablo kipinde brüt ücret tablosu gizli AA/AB sütunlarına yazılmaz;
+    G3 formülü workbook düzeyindeki ``BRUT_UCRET_TABLOSU`` adını kullanır.
     """
 
     # V1 sabitlerini dışarıya da açıyoruz (test vb. için)
@@ -98,212 +137,308 @@ class ExcelWriteStrategyV1(ExcelWriteStrategy):
         self, ws: openpyxl.worksheet.worksheet.Worksheet, personel: Personel
     ) -> None:
         """V1 şablonuna göre çalışma sayfasını doldurur."""
-        self._doldur_otomatik(ws, personel)
-        self._ekle_veri_dogrulama(ws)
-        self._yaz_tecrube_satirlari(ws)
-        self._yaz_hesap_satirlari(ws)
-
-    # ------------------------------------------------------------------
-    # İç yardımcılar
-    # ------------------------------------------------------------------
-
-    @staticmethod
-    def _doldur_otomatik(
-        ws: openpyxl.worksheet.worksheet.Worksheet, personel: Personel
-    ) -> None:
-        """Otomatik (o) alanları personel verisinden doldurur."""
-        ws[_HUCRE_AD_SOYAD] = personel.ad_soyad
-        ws[_HUCRE_TCKN] = personel.tckn
-        ws[_HUCRE_BIRIM] = personel.birim
-        ws[_HUCRE_HIZMET_GRUBU_BASLIK] = "HİZMET GRUBU TÜRÜ"
-        ws[_HUCRE_HIZMET_GRUBU_TURU] = "AG"
-        ExcelWriteStrategyV1._kopyala_hucre_bicimi(
-            ws,
-            _HUCRE_HIZMET_GRUBU_BASLIK_STIL_KAYNAGI,
-            _HUCRE_HIZMET_GRUBU_BASLIK,
-        )
-        ExcelWriteStrategyV1._kopyala_hucre_bicimi(
-            ws,
-            _HUCRE_HIZMET_GRUBU_TURU_STIL_KAYNAGI,
-            _HUCRE_HIZMET_GRUBU_TURU,
-        )
-        ExcelWriteStrategyV1._ayarla_hizmet_grubu_sutun_genisligi(ws)
-
-    @staticmethod
-    def _yaz_tecrube_satirlari(ws: openpyxl.worksheet.worksheet.Worksheet) -> None:
-        """Her mesleki tecrübe satırı için Excel formüllerini yazar."""
-        ws[_HUCRE_EKSIK_GUN_BASLIK] = _HUCRE_EKSIK_GUN_BASLIK_METNI
-        ExcelWriteStrategyV1._kopyala_hucre_bicimi(
-            ws,
-            _HUCRE_EKSIK_GUN_BASLIK_STIL_KAYNAGI,
-            _HUCRE_EKSIK_GUN_BASLIK,
+        self.sayfa_plani(ws).uygula(ws, personel)
+
+    def sayfa_plani(self, ws: openpyxl.worksheet.worksheet.Worksheet) -> SayfaPlani:
+        """Sayfanın şablon düzenine ait derlenmiş planı döndürür.
+
+        Plan yalnızca L ve M sütunlarının şablondaki genişliğine ve ortak
+        tablo kipine bağlıdır; aynı düzendeki tüm sayfalar önbellekteki tek
+        planı paylaşır.
+
+        :param ws: Şablon içeriği kopyalanmış çalışma sayfası.
+        :return: Değişmez sayfa planı.
+        """
+        return _derle_sayfa_plani(
+            _sutun_genisligi(ws, _EKSIK_GUN_GENISLIK_KAYNAGI),
+            _sutun_genisligi(ws, _HIZMET_GRUBU_SUTUNU),
+            self.ortak_tablolar,
         )
-        ExcelWriteStrategyV1._ayarla_eksik_gun_sutun_genisligi(ws)
-
-        for satir in range(TECRUBE_BASLANGIC_SATIR, TECRUBE_BITIS_SATIR + 1):
-            ws.cell(row=satir, column=11).value = prim_gunu_formulu(satir)
-            ws.cell(row=satir, column=12).value = alanda_prim_formulu(satir)
-            ExcelWriteStrategyV1._kopyala_hucre_bicimi(
-                ws,
-                _HUCRE_EKSIK_GUN_STIL_KAYNAGI,
-                f"{_EKSIK_GUN_SUTUNU}{satir}",
-            )
 
-    @staticmethod
-    def _yaz_hesap_satirlari(ws: openpyxl.worksheet.worksheet.Worksheet) -> None:
-        """Toplam, tecrübe yılı, ünvan, hizmet grubu ve kademe satırlarını yazar."""
-        # Toplam Prim Günü (K19) ve Alanda Toplam Prim Günü (L19)
-        ws.cell(row=_SATIR_TOPLAM_PRIM, column=11).value = toplam_prim_formulu()
-        ws.cell(row=_SATIR_ALANDA_PRIM, column=12).value = toplam_alanda_prim_formulu()
+    def hesaplanan_degerler(
+        self, ws: openpyxl.worksheet.worksheet.Worksheet
+    ) -> dict[str, object]:
+        """V1 formüllerinin sonuçlarını sayfadaki girdilerden hesaplar.
 
-        ExcelWriteStrategyV1._yaz_360_yil_ay_gun(ws)
+        Hesaplama sırası formül bağımlılıklarını izler: tecrübe satırları,
+        toplamlar, yıl/ay/gün, öğrenim, hizmet grubu, kademe, ünvan ve
+        ücret. Bir girdinin değeri bilinmiyorsa yalnızca ona bağlı hücreler
+        atlanır.
 
-        # Z sütununa gizli formülleri yazalım.
+        :param ws: :meth:`sayfa_doldur` ile doldurulmuş çalışma sayfası.
+        :returns: Hücre adresi → hesaplanmış değer eşlemesi.
+        """
+        degerler: dict[str, object] = {}
+
+        def oku(hucre: str) -> object:
+            if hucre in degerler:
+                return degerler[hucre]
+            return _girdi_degeri(ws, hucre)
+
+        def hesapla(hucre: str, islem: Callable[..., object], *girdiler) -> None:
+            try:
+                degerler[hucre] = islem(*girdiler)
+            except HesaplanamazHatasi:
+                degerler[hucre] = BILINMEYEN
+
+        tecrube_satirlari = range(TECRUBE_BASLANGIC_SATIR, TECRUBE_BITIS_SATIR + 1)
+        for satir in tecrube_satirlari:
+            hesapla(
+                f"{COL_TOPLAM_PRIM}{satir}",
+                prim_gunu_hesapla,
+                oku(f"{COL_BASLANGIC_TARIHI}{satir}"),
+                oku(f"{COL_BITIS_TARIHI}{satir}"),
+            )
+            hesapla(
+                f"{COL_ALANDA_PRIM}{satir}",
+                alanda_prim_hesapla,
+                oku(f"{COL_ALANINDA}{satir}"),
+                oku(f"{COL_TOPLAM_PRIM}{satir}"),
+            )
+
+        toplam_hucre = f"{COL_TOPLAM_PRIM}{_SATIR_TOPLAM_PRIM}"
+        alanda_hucre = f"{COL_ALANDA_PRIM}{_SATIR_ALANDA_PRIM}"
+        hesapla(
+            toplam_hucre,
+            toplam_prim_hesapla,
+            [oku(f"{COL_TOPLAM_PRIM}{satir}") for satir in tecrube_satirlari],
+        )
+        hesapla(
+            alanda_hucre,
+            toplam_alanda_prim_hesapla,
+            [oku(f"{COL_ALANDA_PRIM}{satir}") for satir in tecrube_satirlari],
+            [oku(f"{COL_EKSIK_GUN}{satir}") for satir in tecrube_satirlari],
+        )
+        hesapla(_TECRUBE_YILI_HUCRE, tecrube_360_yil_hesapla, oku(alanda_hucre))
+        hesapla(f"K{_SATIR_YIL_AY_GUN}", tecrube_360_ay_hesapla, oku(alanda_hucre))
+        hesapla(f"L{_SATIR_YIL_AY_GUN}", tecrube_360_gun_hesapla, oku(alanda_hucre))
 
-        # Z4 = En yüksek alanında öğrenim
-        ws[_EN_YUKSEK_OGRENIM_HUCRE] = en_yuksek_ogrenim_formulu(
-            baslangic_satir=_OGRENIM_BAS_SATIR,
-            bitis_satir=_OGRENIM_BIT_SATIR,
-            ad_sutun=_OGRENIM_AD_SUTUN,
-            okul_sutun=_OGRENIM_OKUL_SUTUN,
-            alaninda_sutun=_OGRENIM_ALANINDA_SUTUN,
+        hesapla(
+            _EN_YUKSEK_OGRENIM_HUCRE,
+            en_yuksek_ogrenim_hesapla,
+            [
+                (
+                    oku(f"{_OGRENIM_AD_SUTUN}{satir}"),
+                    oku(f"{_OGRENIM_OKUL_SUTUN}{satir}"),
+                    oku(f"{_OGRENIM_ALANINDA_SUTUN}{satir}"),
+                )
+                for satir in range(_OGRENIM_BAS_SATIR, _OGRENIM_BIT_SATIR + 1)
+            ],
         )
+        tecrube_yili = oku(_TECRUBE_YILI_HUCRE)
+        ogrenim = oku(_EN_YUKSEK_OGRENIM_HUCRE)
+        hizmet_grubu_turu = oku(_HUCRE_HIZMET_GRUBU_TURU)
+        hesapla("Z2", hizmet_grubu_hesapla, tecrube_yili, hizmet_grubu_turu)
+        hesapla("Z3", kademe_hesapla, tecrube_yili, ogrenim)
+        hesapla(_HUCRE_UNVAN, unvan_hesapla, tecrube_yili, hizmet_grubu_turu)
+        hesapla(_HUCRE_KADEME, derece_kademe_hesapla, oku("Z2"), oku("Z3"))
+        derece_kademe = oku(_HUCRE_KADEME)
+        hesapla(_HUCRE_BRUT_UCRET, brut_ucret_hesapla, derece_kademe)
+        hesapla("K30", kademe_baslangic_hesapla, tecrube_yili, ogrenim, derece_kademe)
+        hesapla("L30", kademe_bitis_hesapla, tecrube_yili, ogrenim, derece_kademe)
+
+        return {
+            hucre: deger for hucre, deger in degerler.items() if deger is not BILINMEYEN
+        }
+
+    def ortak_sayfalari_ekle(self, wb: openpyxl.Workbook) -> None:
+        """Brüt ücret tablosunu gizli sayfaya yazıp workbook adı tanımlar.
+
+        Ad zaten tanımlıysa (ör. mevcut birleşik dosyaya ekleme yapılırken)
+        workbook değiştirilmez.
+
+        :param wb: Personel sayfalarının bulunduğu birleşik workbook.
+        """
+        if not self.ortak_tablolar or _UCRET_TABLO_ADI in wb.defined_names:
+            return
+
+        if _UCRET_TABLO_SAYFASI in wb.sheetnames:
+            ws = wb[_UCRET_TABLO_SAYFASI]
+        else:
+            ws = wb.create_sheet(_UCRET_TABLO_SAYFASI)
+        ws.sheet_state = "hidden"
+        for satir, (anahtar, deger) in enumerate(
+            BRUT_UCRET_HARITASI.items(), start=_UCRET_TABLO_BASLANGIC_SATIR
+        ):
+            ws.cell(row=satir, column=1, value=anahtar)
+            ws.cell(row=satir, column=2, value=deger)
 
-        # Z2 = Hizmet Grubu
-        ws["Z2"] = hizmet_grubu_formulu(
-            _TECRUBE_YILI_HUCRE,
-            _HUCRE_HIZMET_GRUBU_TURU,
+        son_satir = _UCRET_TABLO_BASLANGIC_SATIR + len(BRUT_UCRET_HARITASI) - 1
+        wb.defined_names[_UCRET_TABLO_ADI] = DefinedName(
+            _UCRET_TABLO_ADI,
+            attr_text=(
+                f"{quote_sheetname(_UCRET_TABLO_SAYFASI)}"
+                f"!$A${_UCRET_TABLO_BASLANGIC_SATIR}:$B${son_satir}"
+            ),
         )
 
-        # Z3 = Kademe
-        ws["Z3"] = kademe_formulu(_TECRUBE_YILI_HUCRE, _EN_YUKSEK_OGRENIM_HUCRE)
 
-        # E3: Ünvan
-        ws[_HUCRE_UNVAN] = unvan_formulu(
-            _TECRUBE_YILI_HUCRE,
-            _HUCRE_HIZMET_GRUBU_TURU,
+def _girdi_degeri(ws: openpyxl.worksheet.worksheet.Worksheet, hucre: str) -> object:
+    """Hücre değerini, olmayan hücreyi oluşturmadan okur.
+
+    Formül ya da hata değeri içeren hücrelerin sonucu bilinmediği için
+    :data:`BILINMEYEN` döner.
+    """
+    satir, sutun = coordinate_to_tuple(hucre)
+    bulunan = ws._cells.get((satir, sutun))
+    if bulunan is None:
+        return None
+    if bulunan.data_type in ("f", "e"):
+        return BILINMEYEN
+    return bulunan.value
+
+
+def _sutun_genisligi(
+    ws: openpyxl.worksheet.worksheet.Worksheet, sutun: str
+) -> float | None:
+    """Sütunun şablondaki genişliğini, boyut kaydı oluşturmadan okur."""
+    boyut = ws.column_dimensions.get(sutun)
+    return boyut.width if boyut is not None else None
+
+
+@lru_cache(maxsize=None)
+def _derle_sayfa_plani(
+    eksik_gun_kaynak_genisligi: float | None,
+    hizmet_grubu_genisligi: float | None,
+    ortak_tablolar: bool = False,
+) -> SayfaPlani:
+    """V1 şablonu için sayfa planını derler.
+
+    :param eksik_gun_kaynak_genisligi: Şablondaki L sütunu genişliği.
+    :param hizmet_grubu_genisligi: Şablondaki M sütunu genişliği.
+    :param ortak_tablolar: ``True`` ise brüt ücret tablosu sayfaya yazılmaz,
+        G3 workbook düzeyindeki tablo adına bakar.
+    :return: Derlenmiş sayfa planı.
+    """
+    degerler: list[tuple[str, object]] = [
+        (_HUCRE_HIZMET_GRUBU_BASLIK, "HİZMET GRUBU TÜRÜ"),
+        (_HUCRE_HIZMET_GRUBU_TURU, "AG"),
+        (_HUCRE_EKSIK_GUN_BASLIK, _HUCRE_EKSIK_GUN_BASLIK_METNI),
+    ]
+    stil_kopyalari = [
+        (_HUCRE_HIZMET_GRUBU_BASLIK_STIL_KAYNAGI, _HUCRE_HIZMET_GRUBU_BASLIK),
+        (_HUCRE_HIZMET_GRUBU_TURU_STIL_KAYNAGI, _HUCRE_HIZMET_GRUBU_TURU),
+        (_HUCRE_EKSIK_GUN_BASLIK_STIL_KAYNAGI, _HUCRE_EKSIK_GUN_BASLIK),
+    ]
+
+    # Mesleki tecrübe satırları
+    for satir in range(TECRUBE_BASLANGIC_SATIR, TECRUBE_BITIS_SATIR + 1):
+        degerler.append((f"K{satir}", prim_gunu_formulu(satir)))
+        degerler.append((f"L{satir}", alanda_prim_formulu(satir)))
+        stil_kopyalari.append(
+            (_HUCRE_EKSIK_GUN_STIL_KAYNAGI, f"{_EKSIK_GUN_SUTUNU}{satir}")
         )
 
-        # F3: Derece/Kademe
-        ws[_HUCRE_KADEME] = '=IF(Z3="", Z2, Z2 & "/" & Z3)'
+    # Toplam Prim Günü ve Alanda Toplam Prim Günü
+    degerler.append((f"K{_SATIR_TOPLAM_PRIM}", toplam_prim_formulu()))
+    degerler.append((f"L{_SATIR_ALANDA_PRIM}", toplam_alanda_prim_formulu()))
 
-        ExcelWriteStrategyV1._yaz_brut_ucret_tablosu(ws)
+    # J29/K29/L29: 30/360 bazlı toplam yıl/ay/gün
+    degerler.append((f"J{_SATIR_YIL_AY_GUN}", tecrube_360_yil_formulu()))
+    degerler.append((f"K{_SATIR_YIL_AY_GUN}", tecrube_360_ay_formulu()))
+    degerler.append((f"L{_SATIR_YIL_AY_GUN}", tecrube_360_gun_formulu()))
 
-        # G3: Brüt Ücret (F3 değeri -> ücret tablosu)
+    # Z sütunundaki gizli hesaplamalar, ünvan ve derece/kademe
+    degerler.append(
+        (
+            _EN_YUKSEK_OGRENIM_HUCRE,
+            en_yuksek_ogrenim_formulu(
+                baslangic_satir=_OGRENIM_BAS_SATIR,
+                bitis_satir=_OGRENIM_BIT_SATIR,
+                ad_sutun=_OGRENIM_AD_SUTUN,
+                okul_sutun=_OGRENIM_OKUL_SUTUN,
+                alaninda_sutun=_OGRENIM_ALANINDA_SUTUN,
+            ),
+        )
+    )
+    degerler.append(
+        ("Z2", hizmet_grubu_formulu(_TECRUBE_YILI_HUCRE, _HUCRE_HIZMET_GRUBU_TURU))
+    )
+    degerler.append(
+        ("Z3", kademe_formulu(_TECRUBE_YILI_HUCRE, _EN_YUKSEK_OGRENIM_HUCRE))
+    )
+    degerler.append(
+        (_HUCRE_UNVAN, unvan_formulu(_TECRUBE_YILI_HUCRE, _HUCRE_HIZMET_GRUBU_TURU))
+    )
+    degerler.append((_HUCRE_KADEME, '=IF(Z3="", Z2, Z2 & "/" & Z3)'))
+
+    # G3: Brüt Ücret (F3 değeri -> ücret tablosu)
+    if ortak_tablolar:
+        tablo_araligi = _UCRET_TABLO_ADI
+        gizli_sutunlar: tuple[str, ...] = ()
+    else:
+        # Brüt ücret eşleme tablosu (gizli AA/AB sütunları)
+        for satir, (anahtar, deger) in enumerate(
+            BRUT_UCRET_HARITASI.items(), start=_UCRET_TABLO_BASLANGIC_SATIR
+        ):
+            degerler.append((f"{_UCRET_TABLO_ANAHTAR_SUTUNU}{satir}", anahtar))
+            degerler.append((f"{_UCRET_TABLO_DEGER_SUTUNU}{satir}", deger))
         ilk_satir = _UCRET_TABLO_BASLANGIC_SATIR
         son_satir = _UCRET_TABLO_BASLANGIC_SATIR + len(BRUT_UCRET_HARITASI) - 1
         tablo_araligi = (
             f"${_UCRET_TABLO_ANAHTAR_SUTUNU}${ilk_satir}:"
             f"${_UCRET_TABLO_DEGER_SUTUNU}${son_satir}"
         )
-        ws[_HUCRE_BRUT_UCRET] = brut_ucret_formulu(_HUCRE_KADEME, tablo_araligi)
-
-        # K30: Kademe Başlangıcı
-        k30_hucre = ws["K30"]
-        k30_hucre.value = kademe_baslangic_formulu(
-            _TECRUBE_YILI_HUCRE,
-            _EN_YUKSEK_OGRENIM_HUCRE,
-            _HUCRE_KADEME,
-        )
-
-        # L30: Kademe Bitişi
-        l30_hucre = ws["L30"]
-        l30_hucre.value = kademe_bitis_formulu(
-            _TECRUBE_YILI_HUCRE,
-            _EN_YUKSEK_OGRENIM_HUCRE,
-            _HUCRE_KADEME,
-        )
-
-        # K30 ve L30'a tam sayı formatı uygula
-        ExcelWriteStrategyV1._uygula_tam_sayi_formati(k30_hucre, l30_hucre)
-
-    @staticmethod
-    def _yaz_360_yil_ay_gun(ws: openpyxl.worksheet.worksheet.Worksheet) -> None:
-        """J29/K29/L29: 30/360 bazlı toplam yıl/ay/gün formüllerini yazar."""
-        yil_hucre = ws.cell(row=_SATIR_YIL_AY_GUN, column=10)
-        ay_hucre = ws.cell(row=_SATIR_YIL_AY_GUN, column=11)
-        gun_hucre = ws.cell(row=_SATIR_YIL_AY_GUN, column=12)
-        yil_hucre.value = tecrube_360_yil_formulu()
-        ay_hucre.value = tecrube_360_ay_formulu()
-        gun_hucre.value = tecrube_360_gun_formulu()
-        ExcelWriteStrategyV1._uygula_tam_sayi_formati(yil_hucre, ay_hucre, gun_hucre)
-
-    @staticmethod
-    def _uygula_tam_sayi_formati(*hucreler: openpyxl.cell.cell.Cell) -> None:
-        """Verilen hücrelere tam sayı formatı (0) uygular.
-
-        Virgülden sonraki kısımları göstermez (1.00 yerine 1 gösterir).
-        """
-        for hucre in hucreler:
-            hucre.number_format = "0"
-
-    @staticmethod
-    def _kopyala_hucre_bicimi(
-        ws: openpyxl.worksheet.worksheet.Worksheet, kaynak_hucre: str, hedef_hucre: str
-    ) -> None:
-        """Hedef hücreye kaynak hücrenin biçimini uygular."""
-        ws[hedef_hucre]._style = copy(ws[kaynak_hucre]._style)
-
-    @staticmethod
-    def _ayarla_hizmet_grubu_sutun_genisligi(
-        ws: openpyxl.worksheet.worksheet.Worksheet,
-    ) -> None:
-        """Başlık metninin görünmesi için hizmet grubu sütununu genişletir."""
-        sutun = ws.column_dimensions[_HIZMET_GRUBU_SUTUNU]
-        mevcut = sutun.width or 0
-        sutun.width = max(mevcut, _HIZMET_GRUBU_MIN_SUTUN_GENISLIGI)
-
-    @staticmethod
-    def _ayarla_eksik_gun_sutun_genisligi(
-        ws: openpyxl.worksheet.worksheet.Worksheet,
-    ) -> None:
-        """Eksik gün başlığının görünmesi için M sütununu genişletir."""
-        kaynak = ws.column_dimensions["L"]
-        hedef = ws.column_dimensions[_EKSIK_GUN_SUTUNU]
-        if kaynak.width and (hedef.width is None or hedef.width < kaynak.width):
-            hedef.width = kaynak.width
-
-    @staticmethod
-    def _yaz_brut_ucret_tablosu(ws: openpyxl.worksheet.worksheet.Worksheet) -> None:
-        """Brut ucret esleme tablosunu gizli yardimci sutunlara yazar."""
-        satir = _UCRET_TABLO_BASLANGIC_SATIR
-        for anahtar, deger in BRUT_UCRET_HARITASI.items():
-            ws[f"{_UCRET_TABLO_ANAHTAR_SUTUNU}{satir}"] = anahtar
-            ws[f"{_UCRET_TABLO_DEGER_SUTUNU}{satir}"] = deger
-            satir += 1
-
-        ws.column_dimensions[_UCRET_TABLO_ANAHTAR_SUTUNU].hidden = True
-        ws.column_dimensions[_UCRET_TABLO_DEGER_SUTUNU].hidden = True
-
-    @staticmethod
-    def _ekle_veri_dogrulama(ws: openpyxl.worksheet.worksheet.Worksheet) -> None:
-        """Öğrenim ve hizmet grubu türü hücreleri için açılır listeleri ekler."""
-        from openpyxl.worksheet.datavalidation import DataValidation
-        from src.config.constants import OGRENIM_SEVIYELERI
-
-        # Şablondan M3 için gelen eski doğrulamayı temizleyip yeni A/AG listesini ekleriz.
-        if hasattr(ws, "data_validations") and hasattr(
-            ws.data_validations, "dataValidation"
-        ):
-            ws.data_validations.dataValidation = [
-                dv
-                for dv in ws.data_validations.dataValidation
-                if str(dv.sqref) != _HUCRE_HIZMET_GRUBU_TURU
-            ]
-
-        ogrenim_dv = DataValidation(
-            type="list",
-            formula1=f'"{",".join(OGRENIM_SEVIYELERI)}"',
-            allow_blank=True,
+        gizli_sutunlar = (_UCRET_TABLO_ANAHTAR_SUTUNU, _UCRET_TABLO_DEGER_SUTUNU)
+    degerler.append(
+        (_HUCRE_BRUT_UCRET, brut_ucret_formulu(_HUCRE_KADEME, tablo_araligi))
+    )
+
+    # K30 / L30: Kademe başlangıcı ve bitişi
+    degerler.append(
+        (
+            "K30",
+            kademe_baslangic_formulu(
+                _TECRUBE_YILI_HUCRE, _EN_YUKSEK_OGRENIM_HUCRE, _HUCRE_KADEME
+            ),
         )
-        ws.add_data_validation(ogrenim_dv)
-        for row in range(6, 11):  # 6, 7, 8, 9, 10
-            ogrenim_dv.add(f"B{row}")
-
-        hizmet_grubu_dv = DataValidation(
-            type="list",
-            formula1='"A,AG"',
-            allow_blank=True,
+    )
+    degerler.append(
+        (
+            "L30",
+            kademe_bitis_formulu(
+                _TECRUBE_YILI_HUCRE, _EN_YUKSEK_OGRENIM_HUCRE, _HUCRE_KADEME
+            ),
         )
-        ws.add_data_validation(hizmet_grubu_dv)
-        hizmet_grubu_dv.add(_HUCRE_HIZMET_GRUBU_TURU)
+    )
+
+    # Hizmet grubu başlığının ve eksik gün başlığının görünmesi için M sütunu
+    # önce en az sabit genişliğe, ardından L sütunu kadar genişletilir.
+    m_genisligi = max(hizmet_grubu_genisligi or 0, _HIZMET_GRUBU_MIN_SUTUN_GENISLIGI)
+    if eksik_gun_kaynak_genisligi and m_genisligi < eksik_gun_kaynak_genisligi:
+        m_genisligi = eksik_gun_kaynak_genisligi
+
+    return SayfaPlani(
+        personel_hucreleri=(
+            (_HUCRE_AD_SOYAD, "ad_soyad"),
+            (_HUCRE_TCKN, "tckn"),
+            (_HUCRE_BIRIM, "birim"),
+        ),
+        degerler=tuple(degerler),
+        stil_kopyalari=tuple(stil_kopyalari),
+        # Virgülden sonraki kısımları göstermez (1.00 yerine 1 gösterir).
+        sayi_bicimleri=tuple(
+            (hucre, "0")
+            for hucre in (
+                f"J{_SATIR_YIL_AY_GUN}",
+                f"K{_SATIR_YIL_AY_GUN}",
+                f"L{_SATIR_YIL_AY_GUN}",
+                "K30",
+                "L30",
+            )
+        ),
+        sutun_genislikleri=((_HIZMET_GRUBU_SUTUNU, m_genisligi),),
+        gizli_sutunlar=gizli_sutunlar,
+        # Şablondan M3 için gelen eski doğrulama yeni A/AG listesiyle değişir.
+        kaldirilan_dogrulamalar=(_HUCRE_HIZMET_GRUBU_TURU,),
+        dogrulamalar=(
+            DogrulamaPlani(
+                formul=f'"{",".join(OGRENIM_SEVIYELERI)}"',
+                hucreler=tuple(
+                    f"{_OGRENIM_AD_SUTUN}{satir}"
+                    for satir in range(_OGRENIM_BAS_SATIR, _OGRENIM_BIT_SATIR + 1)
+                ),
+            ),
+            DogrulamaPlani(formul='"A,AG"', hucreler=(_HUCRE_HIZMET_GRUBU_TURU,)),
+        ),
+    )
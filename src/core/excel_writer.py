@@ -11,29 +11,63 @@ sınıflar olarak tanımlanır ve ``ExcelWriterFactory`` aracılığıyla yarat
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from io import BytesIO
 from pathlib import Path
-from typing import List
+from typing import Callable, Iterable, Iterator, List
 from copy import copy
 
 import openpyxl
 import openpyxl.worksheet.worksheet
 from openpyxl import Workbook
+from openpyxl.styles.cell_style import StyleArray
+from openpyxl.workbook.child import avoid_duplicate_name
+from openpyxl.styles.numbers import (
+    BUILTIN_FORMATS,
+    BUILTIN_FORMATS_MAX_SIZE,
+    BUILTIN_FORMATS_REVERSE,
+)
 
 from src.config.constants import (
     DEFAULT_VERSION,
     MAX_SHEET_NAME_LEN,
     OUTPUT_FILENAME,
-    TEMPLATE_PATH,
 )
+from src.core.build_manifest import UretimKarari, UretimManifestosu
 from src.core.excel_reader import Personel
 from src.core.excel_write_strategy import ExcelWriteStrategy
 from src.core.excel_writer_factory import ExcelWriterFactory
+from src.core.excel_zip_writer import (
+    ZipKlonYazici,
+    hesaplanan_degerleri_ekle,
+    sayfa_adlarini_oku,
+)
+from src.core.template_cache import SablonOnbellegi, _template_yolunu_coz
+from src.core.zamanlama import (
+    AsamaKaydi,
+    AsamaOzeti,
+    Zamanlayici,
+    aktif_zamanlayici,
+    asama,
+    zamanlama_olc,
+)
 
 # ---------------------------------------------------------------------------
 # Ana yazma fonksiyonları
 # ---------------------------------------------------------------------------
 
+#: Klasör modunda her personel işlendiğinde çağrılır:
+#: ``(personel, çıktı dosyası, durum)``. Durum değerleri için bkz.
+#: :class:`PersonelTutanakSonucu`.
+IlerlemeBildirimi = Callable[[Personel, Path, str], None]
+
+#: Dosyaya sayfa yazılmadığını belirten durumlar.
+_YAZILMAYAN_DURUMLAR = frozenset({"guncel", "atlandi"})
+
 
 @dataclass(frozen=True)
 class TutanakOlusturmaRaporu:
@@ -44,6 +78,10 @@ class TutanakOlusturmaRaporu:
     skipped_existing_file_count: int = 0
     generated_files: list[Path] = field(default_factory=list)
     warning_messages: list[str] = field(default_factory=list)
+    new_file_count: int = 0
+    rebuilt_file_count: int = 0
+    up_to_date_file_count: int = 0
+    phase_timings: list[AsamaOzeti] = field(default_factory=list)
 
     @property
     def added_sheet_count(self) -> int:
@@ -56,6 +94,32 @@ class TutanakOlusturmaRaporu:
         return self.skipped_existing_file_count
 
 
+@dataclass(frozen=True)
+class PersonelTutanakSonucu:
+    """Klasör modunda tek bir personelin üretim sonucu.
+
+    :param personel: İşlenen personel.
+    :param output_path: Personelin tutanak dosyası.
+    :param durum: ``"olusturuldu"`` (yeni dosya), ``"yeniden_olusturuldu"``
+        (eskimiş dosya baştan üretildi), ``"eklendi"`` (mevcut dosyaya sayfa
+        eklendi), ``"guncel"`` (manifestoya göre değişmemiş) ya da
+        ``"atlandi"`` (sayfa dosyada zaten var).
+    :param warning_messages: Bu personel için üretilen uyarılar.
+    :param sure_sn: Dosyanın yazımı için geçen süre; ``"guncel"`` için 0.
+    """
+
+    personel: Personel
+    output_path: Path
+    durum: str
+    warning_messages: list[str] = field(default_factory=list)
+    sure_sn: float = 0.0
+
+    @property
+    def dosyaya_yazildi(self) -> bool:
+        """Dosyaya bu personel için sayfa yazıldı mı."""
+        return self.durum not in _YAZILMAYAN_DURUMLAR
+
+
 @dataclass(frozen=True)
 class _PersonelDosyaYazimSonucu:
     """Tek personel için dosyaya yazım sonucunu taşır."""
@@ -64,6 +128,18 @@ class _PersonelDosyaYazimSonucu:
     dosyaya_yazildi: bool
     skipped_existing_count: int = 0
     warning_messages: list[str] = field(default_factory=list)
+    yeni_dosya: bool = False
+    yeniden_olusturuldu: bool = False
+    sure_sn: float = 0.0
+
+    @property
+    def durum(self) -> str:
+        """:attr:`PersonelTutanakSonucu.durum` karşılığı."""
+        if self.yeni_dosya:
+            return "olusturuldu"
+        if self.yeniden_olusturuldu:
+            return "yeniden_olusturuldu"
+        return "eklendi" if self.dosyaya_yazildi else "atlandi"
 
 
 def olustur_dk_klasoru_raporlu(
@@ -71,42 +147,588 @@ def olustur_dk_klasoru_raporlu(
     cikti_klasoru: str | Path,
     template_path: str | Path | None = None,
     version: str = DEFAULT_VERSION,
+    jobs: int = 1,
+    sablon_onbellegi: SablonOnbellegi | None = None,
+    hizli_klon: bool = False,
+    artimli: bool = False,
+    boru_hatti: bool = False,
+    zamanlama: bool = False,
+    ilerleme: IlerlemeBildirimi | None = None,
 ) -> TutanakOlusturmaRaporu:
     """Her personel için ayrı bir tutanak dosyası üretir.
 
+    :func:`iter_dk_tutanaklari` sonuçlarını tek bir rapora toplar; üretim
+    parametreleri için oraya bakın.
+
+    :param zamanlama: ``True`` ise şablon yükleme, sayfa kopyalama, strateji
+        ve kaydetme gibi aşamaların süreleri ölçülür ve raporun
+        ``phase_timings`` alanına toplam süreye göre sıralı yazılır.
+        ``jobs > 1`` ise işçi süreçlerin ölçümleri de eklenir.
+    :param ilerleme: Her personelin sonucu üretildikçe girdi sırasıyla
+        çağrılır (bkz. :data:`IlerlemeBildirimi`).
+    :raises ValueError: ``jobs`` 1'den küçükse.
+    """
+    sonuclar = iter_dk_tutanaklari(
+        personeller,
+        cikti_klasoru,
+        template_path=template_path,
+        version=version,
+        jobs=jobs,
+        sablon_onbellegi=sablon_onbellegi,
+        hizli_klon=hizli_klon,
+        artimli=artimli,
+        boru_hatti=boru_hatti,
+    )
+    with zamanlama_olc(zamanlama) as zamanlayici:
+        rapor = _klasor_raporu_olustur(Path(cikti_klasoru), sonuclar, ilerleme)
+    return _asama_surelerini_ekle(rapor, zamanlayici)
+
+
+def iter_dk_tutanaklari(
+    personeller: Iterable[Personel],
+    cikti_klasoru: str | Path,
+    template_path: str | Path | None = None,
+    version: str = DEFAULT_VERSION,
+    jobs: int = 1,
+    sablon_onbellegi: SablonOnbellegi | None = None,
+    hizli_klon: bool = False,
+    artimli: bool = False,
+    boru_hatti: bool = False,
+) -> Iterator[PersonelTutanakSonucu]:
+    """Her personel için ayrı bir tutanak dosyası üretir ve sonuçları akıtır.
+
     Dosya adı üretiminde sayfa adı kuralları kullanılır; yani
-    ``{Ad Soyad} - {TCKN}.xlsx`` formatı uygulanır.
+    ``{Ad Soyad} - {TCKN}.xlsx`` formatı uygulanır. Sonuçlar girdi
+    sırasıyla, her personelin dosyası yazıldıkça üretilir; üretici
+    erken bırakılırsa kalan personeller işlenmez. Artımlı modda manifesto
+    o ana kadar yazılan dosyalarla kaydedilir.
+
+    :param jobs: Eşzamanlı çalışacak süreç sayısı. ``1`` seri üretim yapar;
+        daha büyük değerlerde personeller bir süreç havuzuna dağıtılır ve
+        her süreç şablonu yalnızca bir kez yükler. Sonuç sırası her iki
+        modda da girdi sırasıyla aynıdır.
+    :param sablon_onbellegi: Çalıştırmalar arasında paylaşılacak şablon
+        önbelleği. Verilmezse şablon bu çalıştırma için bir kez ayrıştırılır.
+    :param hizli_klon: ``True`` ise yeni dosyalar, strateji ile bir kez
+        üretilen prototip dosyanın zip seviyesinde kopyalanmasıyla yazılır
+        (bkz. :class:`ZipKlonYazici`). Var olan dosyalara ekleme her zaman
+        openpyxl ile yapılır.
+    :param artimli: ``True`` ise çıktı klasöründeki üretim manifestosu
+        (bkz. :class:`UretimManifestosu`) kullanılır: değişmemiş personeller
+        dosya açılmadan atlanır, personel verisi, şablon ya da versiyon
+        değişmiş dosyalar yeniden üretilir. Üretimden sonra değiştirilmiş
+        ya da manifestoda olmayan dosyalar için mevcut akış kullanılır.
+    :param boru_hatti: ``True`` ise seri üretim üç aşamalı bir boru hattıyla
+        yapılır: workbook'lar bu iş parçacığında oluşturulur, ayrı bir iş
+        parçacığı bunları bellekteki tamponlara kaydeder, bir diğeri de
+        tamponları diske yazar. Yavaş disk (ör. ağ klasörü) bir sonraki
+        personelin üretimiyle örtüşür; aşamalar arasındaki kuyruklar
+        sınırlı olduğundan bellek kullanımı sabit kalır. Sonuç, dosya diske
+        yazma kuyruğuna alındığında üretilir; yazma hatası en geç son
+        sonuçtan sonra yükseltilir. ``jobs > 1`` ise yok sayılır.
+    :raises ValueError: ``jobs`` 1'den küçükse.
+    """
+    if jobs < 1:
+        raise ValueError(f"jobs en az 1 olmalıdır: {jobs}")
+    return _dk_tutanaklari_uret(
+        list(personeller),
+        cikti_klasoru,
+        template_path=template_path,
+        version=version,
+        jobs=jobs,
+        sablon_onbellegi=sablon_onbellegi,
+        hizli_klon=hizli_klon,
+        artimli=artimli,
+        boru_hatti=boru_hatti,
+    )
+
+
+def _dk_tutanaklari_uret(
+    personeller: List[Personel],
+    cikti_klasoru: str | Path,
+    *,
+    template_path: str | Path | None,
+    version: str,
+    jobs: int,
+    sablon_onbellegi: SablonOnbellegi | None,
+    hizli_klon: bool,
+    artimli: bool,
+    boru_hatti: bool,
+) -> Iterator[PersonelTutanakSonucu]:
+    """:func:`iter_dk_tutanaklari` gövdesi.
+
+    Önce her personel için manifesto kararı verilir (dosya açılmaz); güncel
+    olmayanlar seçilen yazım moduna gönderilir ve sonuçlar güncel olanlarla
+    girdi sırasında birleştirilir. Boru hattında dosyalar sonuçtan sonra
+    diske yazıldığından manifesto kayıtları yazım bitince işlenir.
     """
     strategy = ExcelWriterFactory.create(version)
     cikti_klasoru = _hazirla_cikti_klasoru(cikti_klasoru)
+    manifesto = None
+    if artimli:
+        with asama("manifesto.yukle"):
+            manifesto = UretimManifestosu.yukle(
+                cikti_klasoru, _template_yolunu_coz(template_path), version
+            )
+
+    plan: list[tuple[Personel, Path, UretimKarari | None]] = []
+    planlanan_yollar: set[Path] = set()
+    for personel in personeller:
+        cikti_yolu = _personel_cikti_dosya_yolu(personel, cikti_klasoru)
+        karar = None
+        if manifesto is not None and cikti_yolu not in planlanan_yollar:
+            karar = manifesto.karar_ver(personel, cikti_yolu)
+        planlanan_yollar.add(cikti_yolu)
+        plan.append((personel, cikti_yolu, karar))
+
+    isler = [
+        (personel, karar is UretimKarari.ESKIMIS)
+        for personel, _, karar in plan
+        if karar is not UretimKarari.GUNCEL
+    ]
+    yazimlar = _yazim_sonuclari_uret(
+        isler,
+        cikti_klasoru=cikti_klasoru,
+        strategy=strategy,
+        template_path=template_path,
+        version=version,
+        jobs=jobs,
+        sablon_onbellegi=sablon_onbellegi,
+        hizli_klon=hizli_klon,
+        boru_hatti=boru_hatti,
+    )
 
-    added_file_count = 0
-    skipped_existing_file_count = 0
-    warning_messages: list[str] = []
-    generated_files: list[Path] = []
+    kaydedilecekler: list[tuple[Personel, Path]] = []
+    manifesto_kaydedilsin = False
+    try:
+        for personel, cikti_yolu, karar in plan:
+            if karar is UretimKarari.GUNCEL:
+                yield PersonelTutanakSonucu(
+                    personel=personel,
+                    output_path=cikti_yolu,
+                    durum="guncel",
+                    warning_messages=[
+                        _build_skip_message(personel, _sayfa_adi_olustur(personel))
+                    ],
+                )
+                continue
 
-    for personel in personeller:
-        personel_sonucu = _personel_dosyasina_yaz(
-            personel=personel,
+            yazim = next(yazimlar)
+            if yazim.yeni_dosya or yazim.yeniden_olusturuldu:
+                kaydedilecekler.append((personel, yazim.output_path))
+            yield PersonelTutanakSonucu(
+                personel=personel,
+                output_path=yazim.output_path,
+                durum=yazim.durum,
+                warning_messages=yazim.warning_messages,
+                sure_sn=yazim.sure_sn,
+            )
+        # Boru hattındaki yazma hataları üretici tükenince yükseltilir.
+        for _ in yazimlar:
+            pass
+        manifesto_kaydedilsin = True
+    except GeneratorExit:
+        manifesto_kaydedilsin = True
+        raise
+    finally:
+        yazimlar.close()
+        if manifesto is not None and manifesto_kaydedilsin:
+            for personel, cikti_yolu in kaydedilecekler:
+                if cikti_yolu.exists():
+                    manifesto.dosyayi_kaydet(personel, cikti_yolu)
+            with asama("manifesto.kaydet"):
+                manifesto.kaydet()
+
+
+def _yazim_sonuclari_uret(
+    isler: List[tuple[Personel, bool]],
+    *,
+    cikti_klasoru: Path,
+    strategy: ExcelWriteStrategy,
+    template_path: str | Path | None,
+    version: str,
+    jobs: int,
+    sablon_onbellegi: SablonOnbellegi | None,
+    hizli_klon: bool,
+    boru_hatti: bool,
+) -> Iterator[_PersonelDosyaYazimSonucu]:
+    """İşleri seçilen yazım moduyla yazar; sonuçları girdi sırasıyla üretir.
+
+    ``isler`` her personel için ``(personel, yeniden_olustur)`` çiftleridir.
+    Şablon ve hızlı klon prototipi ilk sonuç istendiğinde hazırlanır.
+    """
+    if jobs > 1 and len(isler) > 1:
+        yield from _personel_dosyalarini_paralel_yaz(
+            isler=isler,
             cikti_klasoru=cikti_klasoru,
-            strategy=strategy,
             template_path=template_path,
+            version=version,
+            jobs=jobs,
+            hizli_klon=hizli_klon,
         )
-        if personel_sonucu.dosyaya_yazildi:
-            added_file_count += 1
-            generated_files.append(personel_sonucu.output_path)
-        skipped_existing_file_count += personel_sonucu.skipped_existing_count
-        warning_messages.extend(personel_sonucu.warning_messages)
+        return
+
+    yerel_onbellek = sablon_onbellegi is None
+    onbellek = SablonOnbellegi() if yerel_onbellek else sablon_onbellegi
+    try:
+        klon = None
+        if hizli_klon and isler:
+            klon = _hizli_klon_hazirla(strategy, template_path, onbellek)
+        if boru_hatti:
+            yield from _personel_dosyalarini_boru_hattiyla_yaz(
+                isler=isler,
+                cikti_klasoru=cikti_klasoru,
+                strategy=strategy,
+                template_path=template_path,
+                sablon_onbellegi=onbellek,
+                hizli_klon=klon,
+            )
+        else:
+            for personel, yeniden_olustur in isler:
+                yield _personel_dosyasina_yaz(
+                    personel=personel,
+                    cikti_klasoru=cikti_klasoru,
+                    strategy=strategy,
+                    template_path=template_path,
+                    sablon_onbellegi=onbellek,
+                    hizli_klon=klon,
+                    yeniden_olustur=yeniden_olustur,
+                )
+    finally:
+        if yerel_onbellek:
+            onbellek.temizle()
+
+
+def _klasor_raporu_olustur(
+    cikti_klasoru: Path,
+    sonuclar: Iterable[PersonelTutanakSonucu],
+    ilerleme: IlerlemeBildirimi | None = None,
+) -> TutanakOlusturmaRaporu:
+    """Personel bazlı sonuçları girdi sırasıyla tek rapora birleştirir.
+
+    Sonuçlar tek geçişte tüketilir; ``ilerleme`` verilirse her sonuç için
+    çağrılır.
+    """
+    generated_files: list[Path] = []
+    warning_messages: list[str] = []
+    sayaclar = dict.fromkeys(
+        ("olusturuldu", "yeniden_olusturuldu", "eklendi", "guncel", "atlandi"), 0
+    )
+
+    for sonuc in sonuclar:
+        if ilerleme is not None:
+            ilerleme(sonuc.personel, sonuc.output_path, sonuc.durum)
+        sayaclar[sonuc.durum] += 1
+        if sonuc.dosyaya_yazildi:
+            generated_files.append(sonuc.output_path)
+        warning_messages.extend(sonuc.warning_messages)
 
     return TutanakOlusturmaRaporu(
         output_path=cikti_klasoru,
-        added_file_count=added_file_count,
-        skipped_existing_file_count=skipped_existing_file_count,
+        added_file_count=len(generated_files),
+        skipped_existing_file_count=sayaclar["guncel"] + sayaclar["atlandi"],
         generated_files=generated_files,
         warning_messages=warning_messages,
+        new_file_count=sayaclar["olusturuldu"],
+        rebuilt_file_count=sayaclar["yeniden_olusturuldu"],
+        up_to_date_file_count=sayaclar["guncel"],
     )
 
 
+def _asama_surelerini_ekle(
+    rapor: TutanakOlusturmaRaporu, zamanlayici: Zamanlayici | None
+) -> TutanakOlusturmaRaporu:
+    """Ölçüm yapıldıysa aşama özetini rapora ekler."""
+    if zamanlayici is None:
+        return rapor
+    return replace(rapor, phase_timings=zamanlayici.ozet())
+
+
+# ---------------------------------------------------------------------------
+# Süreç havuzu ile paralel üretim
+# ---------------------------------------------------------------------------
+
+# Her işçi süreçte bir kez doldurulur: strateji ve şablon önbelleği.
+_ISCI_DURUMU: dict[str, object] = {}
+
+
+def _personel_dosyalarini_paralel_yaz(
+    *,
+    isler: List[tuple[Personel, bool]],
+    cikti_klasoru: Path,
+    template_path: str | Path | None,
+    version: str,
+    jobs: int,
+    hizli_klon: bool = False,
+) -> Iterator[_PersonelDosyaYazimSonucu]:
+    """Personelleri süreç havuzuna dağıtır ve sonuçları girdi sırasıyla üretir.
+
+    ``isler`` her personel için ``(personel, yeniden_olustur)`` çiftleridir.
+
+    Aynı çıktı dosyasına düşen personeller (ör. tekrarlanan kayıtlar) tek bir
+    görevde sırayla işlenir; böylece iki süreç aynı dosyaya yarışarak yazmaz
+    ve seri moddaki "zaten mevcut" atlama davranışı korunur. Hızlı klon
+    istenirse prototip ana süreçte bir kez üretilip işçilere gönderilir.
+    Üretici erken bırakılırsa henüz başlamamış görevler iptal edilir.
+    """
+    cozulmus_template = _template_yolunu_coz(template_path)
+    klon = None
+    if hizli_klon:
+        onbellek = SablonOnbellegi()
+        try:
+            klon = _hizli_klon_hazirla(
+                ExcelWriterFactory.create(version), cozulmus_template, onbellek
+            )
+        finally:
+            onbellek.temizle()
+
+    gruplar: dict[Path, list[int]] = {}
+    for index, (personel, _) in enumerate(isler):
+        cikti_yolu = _personel_cikti_dosya_yolu(personel, cikti_klasoru)
+        gruplar.setdefault(cikti_yolu, []).append(index)
+
+    gorevler = [[isler[index] for index in indeksler] for indeksler in gruplar.values()]
+    hazir_sonuclar: dict[int, _PersonelDosyaYazimSonucu] = {}
+    siradaki = 0
+    zamanlayici = aktif_zamanlayici()
+
+    havuz = ProcessPoolExecutor(
+        max_workers=min(jobs, len(gorevler)),
+        initializer=_isci_baslat,
+        initargs=(str(cozulmus_template), version, klon, zamanlayici is not None),
+    )
+    try:
+        grup_sonuclari = havuz.map(
+            _isci_personel_grubunu_yaz,
+            gorevler,
+            [cikti_klasoru] * len(gorevler),
+        )
+        for indeksler, (grup_sonucu, asama_kayitlari) in zip(
+            gruplar.values(), grup_sonuclari
+        ):
+            hazir_sonuclar.update(zip(indeksler, grup_sonucu))
+            if zamanlayici is not None:
+                zamanlayici.ekle(asama_kayitlari)
+            # Gruplar ilk personelin sırasıyla dizili olduğundan sıradaki
+            # sonuç en geç kendi grubu tamamlanınca hazırdır.
+            while siradaki in hazir_sonuclar:
+                yield hazir_sonuclar.pop(siradaki)
+                siradaki += 1
+    finally:
+        havuz.shutdown(cancel_futures=True)
+
+
+def _isci_baslat(
+    template_path: str,
+    version: str,
+    hizli_klon: _HizliKlon | None = None,
+    zamanlama: bool = False,
+) -> None:
+    """İşçi süreçte stratejiyi oluşturur ve şablonu bir kez yükler."""
+    sablon_onbellegi = SablonOnbellegi()
+    if hizli_klon is None:
+        sablon_onbellegi.sablon_sayfasi(template_path)
+    _ISCI_DURUMU["strategy"] = ExcelWriterFactory.create(version)
+    _ISCI_DURUMU["template_path"] = template_path
+    _ISCI_DURUMU["sablon_onbellegi"] = sablon_onbellegi
+    _ISCI_DURUMU["hizli_klon"] = hizli_klon
+    _ISCI_DURUMU["zamanlama"] = zamanlama
+
+
+def _isci_personel_grubunu_yaz(
+    isler: List[tuple[Personel, bool]],
+    cikti_klasoru: Path,
+) -> tuple[List[_PersonelDosyaYazimSonucu], list[AsamaKaydi]]:
+    """İşçi süreçte aynı dosyaya ait personelleri sırayla yazar.
+
+    Ölçüm istendiyse bu görevin aşama kayıtları da döndürülür; ana süreç
+    bunları kendi zamanlayıcısına ekler.
+    """
+    with zamanlama_olc(_ISCI_DURUMU["zamanlama"]) as zamanlayici:
+        sonuclar = [
+            _personel_dosyasina_yaz(
+                personel=personel,
+                cikti_klasoru=cikti_klasoru,
+                strategy=_ISCI_DURUMU["strategy"],
+                template_path=_ISCI_DURUMU["template_path"],
+                sablon_onbellegi=_ISCI_DURUMU["sablon_onbellegi"],
+                hizli_klon=_ISCI_DURUMU["hizli_klon"],
+                yeniden_olustur=yeniden_olustur,
+            )
+            for personel, yeniden_olustur in isler
+        ]
+    return sonuclar, zamanlayici.kayitlar if zamanlayici is not None else []
+
+
+# ---------------------------------------------------------------------------
+# Boru hattı ile üretim (oluştur → belleğe kaydet → diske yaz)
+# ---------------------------------------------------------------------------
+
+#: Aşamalar arasındaki kuyrukların kapasitesi. Bellekte aynı anda en fazla
+#: yaklaşık iki kuyruk dolusu workbook/tampon bulunur.
+_BORU_HATTI_KUYRUK_BOYUTU = 4
+
+#: Kuyruk sonunu bildiren işaret.
+_BORU_HATTI_SONU = object()
+
+
+class _BoruHattiAsamasi(threading.Thread):
+    """Giriş kuyruğundaki öğeleri işleyip çıkış kuyruğuna aktaran aşama.
+
+    Hata oluşursa ilk hata saklanır ve aşama, üreticinin dolu kuyrukta
+    beklemede kalmaması için girişi boşaltmaya devam eder. Sonlandırma
+    işareti her durumda bir sonraki aşamaya iletilir.
+    """
+
+    def __init__(
+        self,
+        ad: str,
+        islem: Callable[[object], object],
+        giris: queue.Queue,
+        cikis: queue.Queue | None = None,
+    ) -> None:
+        super().__init__(name=ad, daemon=True)
+        self._islem = islem
+        self._giris = giris
+        self._cikis = cikis
+        self.hata: BaseException | None = None
+
+    def run(self) -> None:  # noqa: D102
+        while True:
+            oge = self._giris.get()
+            if oge is _BORU_HATTI_SONU:
+                break
+            if self.hata is not None:
+                continue
+            try:
+                sonuc = self._islem(oge)
+                if self._cikis is not None:
+                    self._cikis.put(sonuc)
+            except BaseException as exc:  # noqa: BLE001
+                self.hata = exc
+        if self._cikis is not None:
+            self._cikis.put(_BORU_HATTI_SONU)
+
+
+def _personel_dosyalarini_boru_hattiyla_yaz(
+    *,
+    isler: List[tuple[Personel, bool]],
+    cikti_klasoru: Path,
+    strategy: ExcelWriteStrategy,
+    template_path: str | Path | None,
+    sablon_onbellegi: SablonOnbellegi,
+    hizli_klon: _HizliKlon | None = None,
+    kuyruk_boyutu: int = _BORU_HATTI_KUYRUK_BOYUTU,
+) -> Iterator[_PersonelDosyaYazimSonucu]:
+    """Yeni dosyaları oluşturma, belleğe kaydetme ve diske yazma aşamalarına böler.
+
+    Sonuçlar seri yolla aynıdır ve girdi sırasıyla üretilir. Var olan
+    dosyalara ekleme bu iş parçacığında yapılır. Bu çalıştırmada zaten
+    kuyruğa alınmış bir dosyaya düşen tekrar kayıtlar, dosya diske
+    yazılmayı beklerken açılmaya çalışılmaz; doğrudan atlanır. Aşama
+    hataları kuyruktaki işler bittikten sonra yükseltilir.
+    """
+    kayit_kuyrugu: queue.Queue = queue.Queue(maxsize=kuyruk_boyutu)
+    yazma_kuyrugu: queue.Queue = queue.Queue(maxsize=kuyruk_boyutu)
+
+    def bellege_kaydet(oge: tuple[Path, object]) -> tuple[Path, bytes]:
+        cikti_yolu, kaynak = oge
+        tampon = BytesIO()
+        if isinstance(kaynak, Personel):
+            with asama("yazici.klon_yaz"):
+                hizli_klon.yazici.dosya_yaz(
+                    tampon,
+                    _sayfa_adi_olustur(kaynak),
+                    hizli_klon.hucre_degerleri(kaynak),
+                )
+        else:
+            wb, hesaplanan_degerler = kaynak
+            _workbook_kaydet(wb, tampon, hesaplanan_degerler)
+            wb.close()
+        return cikti_yolu, tampon.getvalue()
+
+    def diske_yaz(oge: tuple[Path, bytes]) -> None:
+        cikti_yolu, veri = oge
+        with asama("yazici.diske_yaz"):
+            cikti_yolu.write_bytes(veri)
+
+    asamalar = [
+        _BoruHattiAsamasi(
+            "tutanak-kaydet", bellege_kaydet, kayit_kuyrugu, yazma_kuyrugu
+        ),
+        _BoruHattiAsamasi("tutanak-yaz", diske_yaz, yazma_kuyrugu),
+    ]
+    for adim in asamalar:
+        adim.start()
+
+    kuyruktaki_yollar: set[Path] = set()
+
+    try:
+        for personel, yeniden_olustur in isler:
+            if any(adim.hata is not None for adim in asamalar):
+                break
+            baslangic = time.perf_counter()
+            cikti_yolu = _personel_cikti_dosya_yolu(personel, cikti_klasoru)
+            if cikti_yolu in kuyruktaki_yollar:
+                sayfa_adi = _sayfa_adi_olustur(personel)
+                yield _PersonelDosyaYazimSonucu(
+                    output_path=cikti_yolu,
+                    dosyaya_yazildi=False,
+                    skipped_existing_count=1,
+                    warning_messages=[_build_skip_message(personel, sayfa_adi)],
+                )
+                continue
+
+            dosya_vardi = cikti_yolu.exists()
+            if dosya_vardi and not yeniden_olustur:
+                sonuc = _mevcut_dosyaya_personel_yaz(
+                    cikti_yolu=cikti_yolu,
+                    personel=personel,
+                    strategy=strategy,
+                    template_path=template_path,
+                    sablon_onbellegi=sablon_onbellegi,
+                )
+                yield replace(sonuc, sure_sn=time.perf_counter() - baslangic)
+                continue
+
+            if hizli_klon is not None:
+                kayit_kuyrugu.put((cikti_yolu, personel))
+                sonuc = _PersonelDosyaYazimSonucu(
+                    output_path=cikti_yolu, dosyaya_yazildi=True
+                )
+            else:
+                hesaplanan_degerler: dict[str, dict[str, object]] = {}
+                wb, added_count, skipped_count, warning_messages = _workbook_olustur(
+                    [personel],
+                    strategy,
+                    template_path,
+                    sablon_onbellegi=sablon_onbellegi,
+                    hesaplanan_degerler=hesaplanan_degerler,
+                )
+                kayit_kuyrugu.put((cikti_yolu, (wb, hesaplanan_degerler)))
+                sonuc = _PersonelDosyaYazimSonucu(
+                    output_path=cikti_yolu,
+                    dosyaya_yazildi=bool(added_count),
+                    skipped_existing_count=skipped_count,
+                    warning_messages=warning_messages,
+                )
+            kuyruktaki_yollar.add(cikti_yolu)
+            yield replace(
+                sonuc,
+                yeni_dosya=sonuc.dosyaya_yazildi and not dosya_vardi,
+                yeniden_olusturuldu=sonuc.dosyaya_yazildi and dosya_vardi,
+                sure_sn=time.perf_counter() - baslangic,
+            )
+    finally:
+        kayit_kuyrugu.put(_BORU_HATTI_SONU)
+        for adim in asamalar:
+            adim.join()
+
+    for adim in asamalar:
+        if adim.hata is not None:
+            raise adim.hata
+
+
 def _hazirla_cikti_klasoru(cikti_klasoru: str | Path) -> Path:
     """Klasörü Path'e çevirir ve yoksa oluşturur."""
     klasor = Path(cikti_klasoru)
@@ -120,23 +742,47 @@ def _personel_dosyasina_yaz(
     cikti_klasoru: Path,
     strategy: ExcelWriteStrategy,
     template_path: str | Path | None,
+    sablon_onbellegi: SablonOnbellegi | None = None,
+    hizli_klon: _HizliKlon | None = None,
+    yeniden_olustur: bool = False,
 ) -> _PersonelDosyaYazimSonucu:
-    """Tek personel için hedef dosyaya yazım akışını yürütür."""
+    """Tek personel için hedef dosyaya yazım akışını yürütür.
+
+    ``sablon_onbellegi`` verilirse şablon diskten yeniden okunmaz.
+    ``hizli_klon`` verilirse yeni dosyalar zip seviyesinde klonlanır.
+    ``yeniden_olustur`` verilirse mevcut dosya açılmadan baştan üretilir.
+    """
+    baslangic = time.perf_counter()
     cikti_yolu = _personel_cikti_dosya_yolu(personel, cikti_klasoru)
+    dosya_vardi = cikti_yolu.exists()
 
-    if cikti_yolu.exists():
-        return _mevcut_dosyaya_personel_yaz(
+    if dosya_vardi and not yeniden_olustur:
+        sonuc = _mevcut_dosyaya_personel_yaz(
             cikti_yolu=cikti_yolu,
             personel=personel,
             strategy=strategy,
             template_path=template_path,
+            sablon_onbellegi=sablon_onbellegi,
         )
+        return replace(sonuc, sure_sn=time.perf_counter() - baslangic)
 
-    return _yeni_personel_dosyasi_olustur(
-        cikti_yolu=cikti_yolu,
-        personel=personel,
-        strategy=strategy,
-        template_path=template_path,
+    if hizli_klon is not None:
+        with asama("yazici.klon_yaz"):
+            hizli_klon.personel_dosyasi_yaz(personel, cikti_yolu)
+        sonuc = _PersonelDosyaYazimSonucu(output_path=cikti_yolu, dosyaya_yazildi=True)
+    else:
+        sonuc = _yeni_personel_dosyasi_olustur(
+            cikti_yolu=cikti_yolu,
+            personel=personel,
+            strategy=strategy,
+            template_path=template_path,
+            sablon_onbellegi=sablon_onbellegi,
+        )
+    return replace(
+        sonuc,
+        yeni_dosya=sonuc.dosyaya_yazildi and not dosya_vardi,
+        yeniden_olusturuldu=sonuc.dosyaya_yazildi and dosya_vardi,
+        sure_sn=time.perf_counter() - baslangic,
     )
 
 
@@ -152,16 +798,21 @@ def _mevcut_dosyaya_personel_yaz(
     personel: Personel,
     strategy: ExcelWriteStrategy,
     template_path: str | Path | None,
+    sablon_onbellegi: SablonOnbellegi | None = None,
 ) -> _PersonelDosyaYazimSonucu:
     """Mevcut workbook'a personel sayfası ekler."""
-    wb = openpyxl.load_workbook(cikti_yolu)
+    with asama("yazici.mevcut_dosya_yukle"):
+        wb = openpyxl.load_workbook(cikti_yolu)
+    hesaplanan_degerler: dict[str, dict[str, object]] = {}
     added_count, skipped_count, warning_messages = _personelleri_workbooka_ekle(
         wb,
         [personel],
         strategy,
         template_path,
+        sablon_onbellegi=sablon_onbellegi,
+        hesaplanan_degerler=hesaplanan_degerler,
     )
-    wb.save(cikti_yolu)
+    _workbook_kaydet(wb, cikti_yolu, hesaplanan_degerler)
     wb.close()
 
     return _PersonelDosyaYazimSonucu(
@@ -178,14 +829,18 @@ def _yeni_personel_dosyasi_olustur(
     personel: Personel,
     strategy: ExcelWriteStrategy,
     template_path: str | Path | None,
+    sablon_onbellegi: SablonOnbellegi | None = None,
 ) -> _PersonelDosyaYazimSonucu:
     """Yeni workbook oluşturur ve personel sayfasını kaydeder."""
+    hesaplanan_degerler: dict[str, dict[str, object]] = {}
     wb, added_count, skipped_count, warning_messages = _workbook_olustur(
         [personel],
         strategy,
         template_path,
+        sablon_onbellegi=sablon_onbellegi,
+        hesaplanan_degerler=hesaplanan_degerler,
     )
-    wb.save(cikti_yolu)
+    _workbook_kaydet(wb, cikti_yolu, hesaplanan_degerler)
     wb.close()
 
     return _PersonelDosyaYazimSonucu(
@@ -196,12 +851,112 @@ def _yeni_personel_dosyasi_olustur(
     )
 
 
+# ---------------------------------------------------------------------------
+# Zip seviyesinde hızlı klon
+# ---------------------------------------------------------------------------
+
+#: Prototip sayfasının adı. Boşluk içerdiği için openpyxl tanımlı adlarda
+#: (yazdırma alanı) tırnaklı biçimi kullanır; gerçek adlar da öyle yazılır.
+_KLON_YER_TUTUCU_SAYFA = "Yer Tutucu - 00000000000"
+
+#: Prototipte personel alanlarının yerini bulmak için kullanılan işaretler.
+_KLON_ISARETLERI: dict[str, str] = {
+    "tckn": "\u241fTCKN\u241f",
+    "ad_soyad": "\u241fAD_SOYAD\u241f",
+    "birim": "\u241fBIRIM\u241f",
+}
+
+
+@dataclass(frozen=True)
+class _HizliKlon:
+    """Prototip yazıcıyı ve personel alanlarının hücre eşlemesini taşır."""
+
+    yazici: ZipKlonYazici
+    hucre_alanlari: dict[str, str]
+
+    def personel_dosyasi_yaz(self, personel: Personel, cikti_yolu: Path) -> None:
+        """Personel için prototipten yeni bir xlsx dosyası üretir."""
+        self.yazici.dosya_yaz(
+            cikti_yolu,
+            _sayfa_adi_olustur(personel),
+            self.hucre_degerleri(personel),
+        )
+
+    def hucre_degerleri(self, personel: Personel) -> dict[str, str]:
+        """Personel alanlarını prototipteki hücre adreslerine eşler."""
+        return {
+            hucre: getattr(personel, alan)
+            for hucre, alan in self.hucre_alanlari.items()
+        }
+
+
+def _hizli_klon_hazirla(
+    strategy: ExcelWriteStrategy,
+    template_path: str | Path | None,
+    sablon_onbellegi: SablonOnbellegi,
+) -> _HizliKlon:
+    """Strateji ile işaretli bir prototip üretir ve klon yazıcısını kurar.
+
+    Prototip, normal yazım yoluyla birebir aynı adımlarla oluşturulur;
+    yalnızca personel alanları yerine işaret metinleri yazılır. Bu
+    işaretlerin bulunduğu hücreler daha sonra kişi başına doldurulur.
+
+    :raises ValueError: Strateji personel alanlarını formül ya da birleşik
+        metin içinde kullanıyorsa (hızlı klon bu durumu desteklemez).
+    """
+    with asama("yazici.prototip_hazirla"):
+        return _hizli_klon_prototipi_olustur(strategy, template_path, sablon_onbellegi)
+
+
+def _hizli_klon_prototipi_olustur(
+    strategy: ExcelWriteStrategy,
+    template_path: str | Path | None,
+    sablon_onbellegi: SablonOnbellegi,
+) -> _HizliKlon:
+    """:func:`_hizli_klon_hazirla` gövdesi."""
+    template_ws = sablon_onbellegi.sablon_sayfasi(template_path)
+    wb = Workbook()
+    ws = wb.active
+    ws.title = _KLON_YER_TUTUCU_SAYFA
+    _sayfa_icerigini_kopyala(template_ws, ws)
+    strategy.sayfa_doldur(ws, Personel(**_KLON_ISARETLERI))
+
+    alan_adlari = {isaret: alan for alan, isaret in _KLON_ISARETLERI.items()}
+    hucre_alanlari: dict[str, str] = {}
+    for hucre in ws._cells.values():
+        deger = hucre.value
+        if not isinstance(deger, str):
+            continue
+        if deger in alan_adlari:
+            hucre_alanlari[hucre.coordinate] = alan_adlari[deger]
+            hucre.value = ""
+        elif any(isaret in deger for isaret in alan_adlari):
+            raise ValueError(
+                "Hızlı klon desteklenmiyor: strateji personel verisini "
+                f"'{hucre.coordinate}' hücresinde başka içerikle birleştiriyor."
+            )
+
+    tampon = BytesIO()
+    _workbook_kaydet(wb, tampon, {ws.title: strategy.hesaplanan_degerler(ws)})
+    wb.close()
+    return _HizliKlon(
+        yazici=ZipKlonYazici(
+            tampon.getvalue(), _KLON_YER_TUTUCU_SAYFA, list(hucre_alanlari)
+        ),
+        hucre_alanlari=hucre_alanlari,
+    )
+
+
 def olustur_dk_dosyasi_raporlu(
     personeller: List[Personel],
     cikti_dizini: str | Path = ".",
     dosya_adi: str = OUTPUT_FILENAME,
     template_path: str | Path | None = None,
     version: str = DEFAULT_VERSION,
+    sablon_onbellegi: SablonOnbellegi | None = None,
+    akisli: bool = False,
+    ortak_tablolar: bool = False,
+    zamanlama: bool = False,
 ) -> TutanakOlusturmaRaporu:
     """
     Personel listesinden DK Tutanağı üretip ayrıntılı işlem raporu döner.
@@ -211,24 +966,91 @@ def olustur_dk_dosyasi_raporlu(
     :param dosya_adi: Çıktı dosya adı.
     :param template_path: Özel çıktı şablonu yolu (opsiyonel).
     :param version: Çıktı versiyonu (ör. ``"v1"``).
+    :param sablon_onbellegi: Çalıştırmalar arasında paylaşılacak şablon
+        önbelleği (opsiyonel).
+    :param akisli: ``True`` ise yeni dosya sabit bellekle yazılır: her
+        personelin sayfası prototipten üretilip zip'e yazılır ve bırakılır;
+        tüm sayfalar aynı anda bellekte tutulmaz. Dosya zaten varsa yeni
+        sayfalar eski sayfalar ayrıştırılmadan zip'e eklenir. Mevcut dosyanın
+        stil tablosu prototiple uyumsuzsa (ör. Excel'de yeniden
+        kaydedilmişse) ekleme openpyxl ile yapılır.
+    :param ortak_tablolar: ``True`` ise brüt ücret gibi arama tabloları her
+        sayfaya yazılmaz; workbook'a bir kez gizli bir sayfa ve tanımlı ad
+        olarak eklenir, sayfa formülleri bu ada başvurur. Akışlı yazım
+        sayfaları prototipten kopyaladığından ``akisli`` ile üretilen
+        sayfalar kendi tablolarını taşımaya devam eder.
+    :param zamanlama: ``True`` ise aşama süreleri ölçülür ve raporun
+        ``phase_timings`` alanına yazılır.
     :returns: Oluşturma özeti.
     """
-    strategy = ExcelWriterFactory.create(version)
+    with zamanlama_olc(zamanlama) as zamanlayici:
+        rapor = _dk_dosyasi_olustur(
+            personeller,
+            cikti_dizini,
+            dosya_adi,
+            template_path=template_path,
+            version=version,
+            sablon_onbellegi=sablon_onbellegi,
+            akisli=akisli,
+            ortak_tablolar=ortak_tablolar,
+        )
+    return _asama_surelerini_ekle(rapor, zamanlayici)
+
+
+def _dk_dosyasi_olustur(
+    personeller: List[Personel],
+    cikti_dizini: str | Path,
+    dosya_adi: str,
+    *,
+    template_path: str | Path | None,
+    version: str,
+    sablon_onbellegi: SablonOnbellegi | None,
+    akisli: bool,
+    ortak_tablolar: bool,
+) -> TutanakOlusturmaRaporu:
+    """:func:`olustur_dk_dosyasi_raporlu` gövdesi."""
+    strategy = ExcelWriterFactory.create(version, ortak_tablolar=ortak_tablolar)
     cikti_dizini = Path(cikti_dizini)
     cikti_dizini.mkdir(parents=True, exist_ok=True)
     cikti_yolu = cikti_dizini / dosya_adi
 
+    if akisli and personeller:
+        rapor = _birlesik_dosyayi_akisla_yaz(
+            personeller,
+            cikti_yolu,
+            ExcelWriterFactory.create(version),
+            template_path,
+            sablon_onbellegi=sablon_onbellegi,
+        )
+        if rapor is not None:
+            return rapor
+
+    hesaplanan_degerler: dict[str, dict[str, object]] = {}
     if cikti_yolu.exists():
-        wb = openpyxl.load_workbook(cikti_yolu)
+        with asama("yazici.mevcut_dosya_yukle"):
+            wb = openpyxl.load_workbook(cikti_yolu)
         added_sheet_count, skipped_existing_count, warning_messages = (
-            _personelleri_workbooka_ekle(wb, personeller, strategy, template_path)
+            _personelleri_workbooka_ekle(
+                wb,
+                personeller,
+                strategy,
+                template_path,
+                sablon_onbellegi=sablon_onbellegi,
+                hesaplanan_degerler=hesaplanan_degerler,
+            )
         )
     else:
         wb, added_sheet_count, skipped_existing_count, warning_messages = (
-            _workbook_olustur(personeller, strategy, template_path)
+            _workbook_olustur(
+                personeller,
+                strategy,
+                template_path,
+                sablon_onbellegi=sablon_onbellegi,
+                hesaplanan_degerler=hesaplanan_degerler,
+            )
         )
 
-    wb.save(cikti_yolu)
+    _workbook_kaydet(wb, cikti_yolu, hesaplanan_degerler)
     wb.close()
     return TutanakOlusturmaRaporu(
         output_path=cikti_yolu,
@@ -244,15 +1066,100 @@ def olustur_dk_dosyasi_raporlu(
 # ---------------------------------------------------------------------------
 
 
+def _birlesik_dosyayi_akisla_yaz(
+    personeller: List[Personel],
+    cikti_yolu: Path,
+    strategy: ExcelWriteStrategy,
+    template_path: str | Path | None = None,
+    sablon_onbellegi: SablonOnbellegi | None = None,
+) -> TutanakOlusturmaRaporu | None:
+    """Birleşik dosyayı sayfa sayfa, sabit bellekle yazar ya da genişletir.
+
+    Sayfa adları, atlama kuralları ve sayfa içerikleri openpyxl yoluyla
+    aynıdır; yalnızca sayfalar tek bir workbook nesnesinde biriktirilmez.
+    Dosya varsa yalnızca ``workbook.xml`` okunarak mevcut sayfa adları
+    alınır ve yeni sayfalar zip'e eklenir.
+
+    :returns: Oluşturma özeti; mevcut dosya zip seviyesinde eklemeye
+        uygun değilse ``None`` (çağıran openpyxl yoluna döner).
+    """
+    yerel_onbellek = sablon_onbellegi is None
+    onbellek = SablonOnbellegi() if yerel_onbellek else sablon_onbellegi
+    try:
+        klon = _hizli_klon_hazirla(strategy, template_path, onbellek)
+    finally:
+        if yerel_onbellek:
+            onbellek.temizle()
+
+    warning_messages: list[str] = []
+    if cikti_yolu.exists():
+        if not klon.yazici.ekleme_uyumlu_mu(cikti_yolu):
+            return None
+        sayfalar = _akis_sayfalari(
+            personeller, klon, sayfa_adlarini_oku(cikti_yolu), warning_messages
+        )
+        with asama("yazici.akisla_yaz"):
+            added_sheet_count = klon.yazici.mevcut_dosyaya_ekle(cikti_yolu, sayfalar)
+    else:
+        sayfalar = _akis_sayfalari(personeller, klon, [], warning_messages)
+        with asama("yazici.akisla_yaz"):
+            added_sheet_count = klon.yazici.birlesik_dosya_yaz(cikti_yolu, sayfalar)
+
+    return TutanakOlusturmaRaporu(
+        output_path=cikti_yolu,
+        added_file_count=added_sheet_count,
+        skipped_existing_file_count=len(warning_messages),
+        generated_files=[cikti_yolu],
+        warning_messages=warning_messages,
+    )
+
+
+def _akis_sayfalari(
+    personeller: List[Personel],
+    klon: _HizliKlon,
+    mevcut_adlar: list[str],
+    atlama_mesajlari: list[str],
+) -> Iterator[tuple[str, dict[str, str]]]:
+    """Eklenecek personel sayfalarını ``(sayfa adı, hücre değerleri)`` olarak üretir.
+
+    Workbook'ta aynı adla bulunan personeller atlanır ve mesajları
+    ``atlama_mesajlari`` listesine eklenir. Yalnızca büyük/küçük harf
+    farkıyla çakışan adlara openpyxl gibi sayı eklenir.
+    """
+    adlar = list(mevcut_adlar)
+    tam_adlar = set(adlar)
+    kucuk_harfli_adlar = {ad.lower() for ad in adlar}
+    for personel in personeller:
+        sayfa_adi = _sayfa_adi_olustur(personel)
+        if sayfa_adi in tam_adlar:
+            atlama_mesajlari.append(_build_skip_message(personel, sayfa_adi))
+            continue
+        if sayfa_adi.lower() in kucuk_harfli_adlar:
+            sayfa_adi = avoid_duplicate_name(adlar, sayfa_adi)
+        adlar.append(sayfa_adi)
+        tam_adlar.add(sayfa_adi)
+        kucuk_harfli_adlar.add(sayfa_adi.lower())
+        yield sayfa_adi, klon.hucre_degerleri(personel)
+
+
 def _workbook_olustur(
     personeller: List[Personel],
     strategy: ExcelWriteStrategy,
     template_path: str | Path | None = None,
+    sablon_onbellegi: SablonOnbellegi | None = None,
+    hesaplanan_degerler: dict[str, dict[str, object]] | None = None,
 ) -> tuple[Workbook, int, int, list[str]]:
     """Her personel için şablon sayfasından kopyalanmış Workbook oluşturur."""
     wb = Workbook()
     added_sheet_count, skipped_existing_count, warning_messages = (
-        _personelleri_workbooka_ekle(wb, personeller, strategy, template_path)
+        _personelleri_workbooka_ekle(
+            wb,
+            personeller,
+            strategy,
+            template_path,
+            sablon_onbellegi=sablon_onbellegi,
+            hesaplanan_degerler=hesaplanan_degerler,
+        )
     )
 
     # openpyxl en az 1 sayfa olmadan kaydedemez;
@@ -277,10 +1184,22 @@ def _personelleri_workbooka_ekle(
     personeller: List[Personel],
     strategy: ExcelWriteStrategy,
     template_path: str | Path | None = None,
+    sablon_onbellegi: SablonOnbellegi | None = None,
+    hesaplanan_degerler: dict[str, dict[str, object]] | None = None,
 ) -> tuple[int, int, list[str]]:
-    """Workbook'a yalnızca eksik personel sayfalarını sona ekler."""
-    template_wb = None
+    """Workbook'a yalnızca eksik personel sayfalarını sona ekler.
+
+    ``sablon_onbellegi`` verilirse şablon oradan alınır ve önbellekte kalır;
+    verilmezse bu çağrıya özel bir önbellek kullanılıp iş bitince kapatılır.
+    Her iki durumda da şablon en fazla bir kez ayrıştırılır.
+
+    ``hesaplanan_degerler`` verilirse eklenen her sayfanın formül sonuçları
+    sayfa adıyla bu sözlüğe yazılır (bkz. :func:`_workbook_kaydet`).
+    """
+    yerel_onbellek = sablon_onbellegi is None
+    onbellek = SablonOnbellegi() if yerel_onbellek else sablon_onbellegi
     template_ws = None
+    stil_eslestirici = None
     added_sheet_count = 0
     skipped_existing_count = 0
     warning_messages: list[str] = []
@@ -294,12 +1213,8 @@ def _personelleri_workbooka_ekle(
                 continue
 
             if template_ws is None:
-                template_wb = openpyxl.load_workbook(
-                    _template_yolunu_coz(template_path)
-                )
-                if not template_wb.sheetnames:
-                    raise ValueError("Şablon workbook içinde hiç sayfa yok.")
-                template_ws = template_wb.active
+                template_ws = onbellek.sablon_sayfasi(template_path)
+                stil_eslestirici = _StilEslestirici(template_ws.parent, wb)
 
             # Reuse the default active sheet for the first generated page to
             # preserve workbook-level defaults (openpyxl's default style).
@@ -312,28 +1227,50 @@ def _personelleri_workbooka_ekle(
                 ws.title = sayfa_adi
             else:
                 ws = wb.create_sheet(title=sayfa_adi)
-            _sayfa_icerigini_kopyala(template_ws, ws)
-            strategy.sayfa_doldur(ws, personel)
+            with asama("yazici.sayfa_kopyala"):
+                _sayfa_icerigini_kopyala(template_ws, ws, stil_eslestirici)
+            with asama("strateji.sayfa_doldur"):
+                strategy.sayfa_doldur(ws, personel)
+            if hesaplanan_degerler is not None:
+                with asama("strateji.formul_hesapla"):
+                    hesaplanan_degerler[ws.title] = strategy.hesaplanan_degerler(ws)
             added_sheet_count += 1
+
+        if added_sheet_count and strategy.ortak_tablolar:
+            strategy.ortak_sayfalari_ekle(wb)
     finally:
-        if template_wb is not None:
-            template_wb.close()
+        if yerel_onbellek:
+            onbellek.temizle()
 
     return added_sheet_count, skipped_existing_count, warning_messages
 
 
-def _template_yolunu_coz(template_path: str | Path | None = None) -> Path:
-    """Şablon dosya yolunu çözümler ve dosyanın varlığını doğrular."""
-    if template_path is None:
-        project_root = Path(__file__).resolve().parent.parent.parent
-        t_path = project_root / TEMPLATE_PATH
-    else:
-        t_path = Path(template_path)
+def _workbook_kaydet(
+    wb: Workbook,
+    hedef: Path | BytesIO,
+    hesaplanan_degerler: dict[str, dict[str, object]],
+) -> None:
+    """Workbook'u kaydeder ve hesaplanan formül sonuçlarını önbelleğe yazar.
 
-    if not t_path.exists():
-        raise FileNotFoundError(f"Excel şablonu bulunamadı: {t_path}")
+    openpyxl formül önbelleği yazmadığından dosya önce belleğe kaydedilir,
+    ardından sayfa XML'lerindeki boş ``<v/>`` öğeleri doldurulur.
 
-    return t_path
+    :param hesaplanan_degerler: Sayfa adı → (hücre adresi → değer).
+    """
+    if not any(hesaplanan_degerler.values()):
+        with asama("yazici.kaydet"):
+            wb.save(hedef)
+        return
+
+    tampon = BytesIO()
+    with asama("yazici.kaydet"):
+        wb.save(tampon)
+    with asama("yazici.formul_onbellegi"):
+        veri = hesaplanan_degerleri_ekle(tampon.getvalue(), hesaplanan_degerler)
+    if isinstance(hedef, Path):
+        hedef.write_bytes(veri)
+    else:
+        hedef.write(veri)
 
 
 def _boyut_ozelliklerini_kopyala(kaynak_boyut: object, hedef_boyut: object) -> None:
@@ -362,23 +1299,84 @@ def _boyut_ozelliklerini_kopyala(kaynak_boyut: object, hedef_boyut: object) -> N
                 continue
 
 
+class _StilEslestirici:
+    """Şablon workbook'unun stil kimliklerini hedef workbook'a eşler.
+
+    openpyxl'de her hücre, workbook düzeyindeki font/dolgu/kenarlık/...
+    tablolarına indeks tutan bir ``StyleArray`` taşır. Eşleştirici her farklı
+    kaynak stil dizisini hedef tablolara yalnızca bir kez ekler; sonraki
+    hücreler ve sayfalar hazır hedef diziyi doğrudan alır. Böylece birleşik
+    workbook'ta tekrarlanan sayfalar aynı stil kayıtlarını paylaşır.
+
+    Eşleme, önceki nitelik bazlı kopyalamayla aynı sonucu üretir: adlandırılmış
+    stil, ``pivotButton`` ve ``quotePrefix`` taşınmaz.
+    """
+
+    def __init__(self, kaynak_wb: Workbook, hedef_wb: Workbook) -> None:
+        self._kaynak_wb = kaynak_wb
+        self._hedef_wb = hedef_wb
+        self._eslesmeler: dict[tuple[int, ...], StyleArray] = {}
+
+    def esle(self, kaynak_stil: StyleArray) -> StyleArray:
+        """Kaynak stil dizisinin hedef workbook'taki karşılığını döndürür.
+
+        Dönen dizi hücreye özeldir; openpyxl stil atamaları diziyi yerinde
+        değiştirdiği için ortak kayıt paylaştırılmaz.
+        """
+        anahtar = tuple(kaynak_stil)
+        hedef_stil = self._eslesmeler.get(anahtar)
+        if hedef_stil is None:
+            hedef_stil = self._hedef_stil_olustur(kaynak_stil)
+            self._eslesmeler[anahtar] = hedef_stil
+        return copy(hedef_stil)
+
+    def _hedef_stil_olustur(self, kaynak_stil: StyleArray) -> StyleArray:
+        kaynak = self._kaynak_wb
+        hedef = self._hedef_wb
+        hedef_stil = StyleArray()
+        hedef_stil.fontId = hedef._fonts.add(copy(kaynak._fonts[kaynak_stil.fontId]))
+        hedef_stil.fillId = hedef._fills.add(copy(kaynak._fills[kaynak_stil.fillId]))
+        hedef_stil.borderId = hedef._borders.add(
+            copy(kaynak._borders[kaynak_stil.borderId])
+        )
+        hedef_stil.alignmentId = hedef._alignments.add(
+            copy(kaynak._alignments[kaynak_stil.alignmentId])
+        )
+        hedef_stil.protectionId = hedef._protections.add(
+            copy(kaynak._protections[kaynak_stil.protectionId])
+        )
+        hedef_stil.numFmtId = self._sayi_bicimi_kimligi(kaynak_stil.numFmtId)
+        return hedef_stil
+
+    def _sayi_bicimi_kimligi(self, kaynak_kimlik: int) -> int:
+        """openpyxl'in ``number_format`` okuma/yazma kuralıyla kimliği eşler."""
+        if kaynak_kimlik < BUILTIN_FORMATS_MAX_SIZE:
+            bicim = BUILTIN_FORMATS.get(kaynak_kimlik, "General")
+        else:
+            bicim = self._kaynak_wb._number_formats[
+                kaynak_kimlik - BUILTIN_FORMATS_MAX_SIZE
+            ]
+        if bicim in BUILTIN_FORMATS_REVERSE:
+            return BUILTIN_FORMATS_REVERSE[bicim]
+        return self._hedef_wb._number_formats.add(bicim) + BUILTIN_FORMATS_MAX_SIZE
+
+
 def _kopyala_hucreler(
     kaynak_ws: openpyxl.worksheet.worksheet.Worksheet,
     hedef_ws: openpyxl.worksheet.worksheet.Worksheet,
+    stil_eslestirici: _StilEslestirici | None = None,
 ) -> None:
     """Hücre değerlerini, stillerini ve ek açıklamalarını kopyalar."""
+    if stil_eslestirici is None:
+        stil_eslestirici = _StilEslestirici(kaynak_ws.parent, hedef_ws.parent)
+
     for (satir, sutun), kaynak_hucre in kaynak_ws._cells.items():
         hedef_hucre = hedef_ws.cell(row=satir, column=sutun)
         hedef_hucre._value = kaynak_hucre._value
         hedef_hucre.data_type = kaynak_hucre.data_type
 
         if kaynak_hucre.has_style:
-            hedef_hucre.font = copy(kaynak_hucre.font)
-            hedef_hucre.fill = copy(kaynak_hucre.fill)
-            hedef_hucre.border = copy(kaynak_hucre.border)
-            hedef_hucre.alignment = copy(kaynak_hucre.alignment)
-            hedef_hucre.number_format = kaynak_hucre.number_format
-            hedef_hucre.protection = copy(kaynak_hucre.protection)
+            hedef_hucre._style = stil_eslestirici.esle(kaynak_hucre._style)
 
         if kaynak_hucre.hyperlink:
             hedef_hucre._hyperlink = copy(kaynak_hucre.hyperlink)
@@ -488,9 +1486,14 @@ def _kopyala_yazdirma_alani(
 def _sayfa_icerigini_kopyala(
     kaynak_ws: openpyxl.worksheet.worksheet.Worksheet,
     hedef_ws: openpyxl.worksheet.worksheet.Worksheet,
+    stil_eslestirici: _StilEslestirici | None = None,
 ) -> None:
-    """Harici workbook'taki şablon sayfasını hedef workbook'a klonlar."""
-    _kopyala_hucreler(kaynak_ws, hedef_ws)
+    """Harici workbook'taki şablon sayfasını hedef workbook'a klonlar.
+
+    Aynı hedef workbook'a birden çok sayfa kopyalanıyorsa ortak bir
+    ``stil_eslestirici`` verilerek stil eşlemesi bir kez yapılır.
+    """
+    _kopyala_hucreler(kaynak_ws, hedef_ws, stil_eslestirici)
     _kopyala_satir_boyutlari(kaynak_ws, hedef_ws)
     _kopyala_sutun_boyutlari(kaynak_ws, hedef_ws)
     _kopyala_sayfa_ozellikleri(kaynak_ws, hedef_ws)
@@ -21,10 +21,12 @@ class ExcelWriterFactory:
     """Versiyon bazlı Excel yazma stratejisi fabrikası."""
 
     @staticmethod
-    def create(version: str) -> ExcelWriteStrategy:
+    def create(version: str, ortak_tablolar: bool = False) -> ExcelWriteStrategy:
         """Belirtilen versiyona uygun strateji nesnesini oluşturur.
 
         :param version: Versiyon tanımlayıcısı (ör. ``"v1"``).
+        :param ortak_tablolar: Arama tablolarının birleşik workbook'ta tek
+            gizli sayfada paylaşılıp paylaşılmayacağı.
         :returns: İlgili :class:`ExcelWriteStrategy` alt sınıfı örneği.
         :raises ValueError: Desteklenmeyen versiyon verilirse.
         """
@@ -35,4 +37,4 @@ class ExcelWriterFactory:
                 f"Desteklenmeyen çıktı versiyonu: '{version}'. "
                 f"Desteklenen versiyonlar: {desteklenen}"
             )
-        return strategy_cls()
+        return strategy_cls(ortak_tablolar=ortak_tablolar)
@@ -0,0 +1,707 @@
+"""
+Zip seviyesinde hızlı klonlama ile tutanak dosyası üreten yazıcı.
+
+Bir kez openpyxl ile üretilmiş *prototip* workbook'un zip parçaları
+bellekte tutulur. Her personel için parçalar değiştirilmeden yeni bir zip
+dosyasına kopyalanır; yalnızca sayfa XML'indeki personel hücreleri ve
+``workbook.xml`` içindeki sayfa adı yeniden yazılır. Böylece openpyxl'in
+tam yükle/kopyala/kaydet döngüsü kişi başına tekrarlanmaz.
+
+Aynı prototip, birleşik (çok sayfalı) bir workbook'u akış halinde yazmak
+için de kullanılır: her sayfanın XML'i üretilip zip'e yazıldıktan sonra
+bırakılır, yalnızca sayfa adları bellekte tutulur. Var olan birleşik
+dosyaya ekleme yapılırken eski sayfaların XML'i ayrıştırılmaz; yalnızca
+``workbook.xml``, ilişkiler ve içerik türleri güncellenir.
+
+openpyxl metinleri ``inlineStr`` olarak yazdığı için ``sharedStrings``
+parçasının güncellenmesi gerekmez.
+"""
+
+from __future__ import annotations
+
+import itertools
+import os
+import re
+import shutil
+import tempfile
+import zipfile
+from io import BytesIO
+from pathlib import Path
+from typing import Iterable, Mapping
+from xml.etree import ElementTree
+from xml.sax.saxutils import escape
+
+_SAYFA_PARCASI = "xl/worksheets/sheet1.xml"
+_WORKBOOK_PARCASI = "xl/workbook.xml"
+_WORKBOOK_ILISKI_PARCASI = "xl/_rels/workbook.xml.rels"
+_ICERIK_TURLERI_PARCASI = "[Content_Types].xml"
+_STIL_PARCASI = "xl/styles.xml"
+_ANA_AD_ALANI = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_ILISKI_AD_ALANI = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_PAKET_ILISKI_AD_ALANI = "http://schemas.openxmlformats.org/package/2006/relationships"
+_ATTR_KACIS = {'"': "&quot;"}
+_BIRLESIK_TURETILEN_PARCALAR = (
+    _WORKBOOK_PARCASI,
+    _WORKBOOK_ILISKI_PARCASI,
+    _ICERIK_TURLERI_PARCASI,
+)
+
+_SAYFA_OGESI = re.compile(r"<sheet [^>]*/>")
+_BOS_FORMUL_HUCRESI = re.compile(
+    r'<c r="(?P<hucre>[A-Z]+[0-9]+)"(?P<attrs>[^>]*)>'
+    r"(?P<formul><f>[^<]*</f>)<v\s*/></c>"
+)
+_YEREL_TANIMLI_AD = re.compile(
+    r'<definedName [^>]*localSheetId="0"[^>]*>.*?</definedName>', re.DOTALL
+)
+_ILISKI_OGESI = re.compile(r"<Relationship [^>]*/>")
+_SAYFA_ILISKISI = re.compile(
+    r'<Relationship [^>]*Target="/xl/worksheets/sheet1\.xml"[^>]*/>'
+)
+_SAYFA_ICERIK_TURU = re.compile(
+    r'<Override PartName="/xl/worksheets/sheet1\.xml"[^>]*/>'
+)
+
+
+class ZipKlonYazici:
+    """Prototip xlsx'i zip seviyesinde kopyalayarak yeni dosyalar üretir.
+
+    :param prototip: openpyxl ile kaydedilmiş prototip xlsx baytları.
+    :param yer_tutucu_sayfa_adi: Prototipteki sayfanın adı. Boşluk
+        içermelidir ki openpyxl tanımlı adlarda tırnaklı biçimi kullansın.
+    :param hucreler: Kişiye özel değer yazılacak hücre adresleri
+        (ör. ``["B3", "C3", "D3"]``). Prototipte bu hücreler boş metin
+        olarak bulunmalıdır.
+    :raises ValueError: Prototip beklenen parçaları ya da hücreleri
+        içermiyorsa.
+    """
+
+    def __init__(
+        self,
+        prototip: bytes,
+        yer_tutucu_sayfa_adi: str,
+        hucreler: list[str],
+    ) -> None:
+        with zipfile.ZipFile(BytesIO(prototip)) as kaynak:
+            self._parcalar: list[tuple[str, tuple[int, ...], bytes]] = [
+                (bilgi.filename, bilgi.date_time, kaynak.read(bilgi.filename))
+                for bilgi in kaynak.infolist()
+            ]
+
+        parca_adlari = {ad for ad, _, _ in self._parcalar}
+        for gerekli in (_SAYFA_PARCASI, _WORKBOOK_PARCASI):
+            if gerekli not in parca_adlari:
+                raise ValueError(f"Prototip xlsx içinde '{gerekli}' parçası yok.")
+
+        self._sayfa_parcalari = self._sayfa_xml_parcala(
+            self._parca(_SAYFA_PARCASI).decode("utf-8"), hucreler
+        )
+        self._yer_tutucu = yer_tutucu_sayfa_adi
+        workbook_xml = self._parca(_WORKBOOK_PARCASI).decode("utf-8")
+        self._workbook_parcalari = self._workbook_xml_parcala(
+            workbook_xml, yer_tutucu_sayfa_adi
+        )
+        sayfa_ogesi = _SAYFA_OGESI.search(workbook_xml)
+        self._sayfa_ogesi_sablonu = sayfa_ogesi.group() if sayfa_ogesi else ""
+        yerel_adlar = list(_YEREL_TANIMLI_AD.finditer(workbook_xml))
+        self._yerel_ad_blogu = (
+            workbook_xml[yerel_adlar[0].start() : yerel_adlar[-1].end()]
+            if yerel_adlar
+            else ""
+        )
+
+    def dosya_yaz(
+        self,
+        cikti_yolu: str | Path,
+        sayfa_adi: str,
+        hucre_degerleri: dict[str, str],
+    ) -> None:
+        """Prototipi kopyalayıp verilen sayfa adı ve hücre değerleriyle yazar.
+
+        :param cikti_yolu: Oluşturulacak xlsx dosyasının yolu.
+        :param sayfa_adi: Tek sayfanın yeni adı.
+        :param hucre_degerleri: Hücre adresi → metin değeri eşlemesi.
+        """
+        sayfa_xml = self._sayfa_xml_olustur(hucre_degerleri).encode("utf-8")
+        workbook_xml = self._workbook_xml_olustur(sayfa_adi).encode("utf-8")
+
+        with zipfile.ZipFile(cikti_yolu, "w", zipfile.ZIP_DEFLATED) as hedef:
+            for ad, tarih, veri in self._parcalar:
+                if ad == _SAYFA_PARCASI:
+                    veri = sayfa_xml
+                elif ad == _WORKBOOK_PARCASI:
+                    veri = workbook_xml
+                _parca_yaz(hedef, ad, tarih, veri)
+
+    def birlesik_dosya_yaz(
+        self,
+        cikti_yolu: str | Path,
+        sayfalar: Iterable[tuple[str, dict[str, str]]],
+    ) -> int:
+        """Her sayfası prototipten üretilen çok sayfalı bir xlsx'i akışla yazar.
+
+        Sayfalar sırayla tüketilir; her sayfanın XML'i zip'e yazıldıktan
+        sonra bırakılır. Workbook, ilişki ve içerik türü parçaları en sonda
+        yalnızca sayfa adlarından üretilir. Sonuç, aynı sayfaların openpyxl
+        ile tek workbook'a eklenip kaydedilmesiyle aynı parçaları içerir.
+
+        :param cikti_yolu: Oluşturulacak xlsx dosyasının yolu.
+        :param sayfalar: ``(sayfa adı, hücre değerleri)`` çiftleri. Adlar
+            benzersiz ve Excel'e uygun olmalıdır.
+        :returns: Yazılan sayfa sayısı.
+        :raises ValueError: Hiç sayfa verilmemişse.
+        """
+        sayfa_adlari: list[str] = []
+        bekleyenler: list[tuple[str, tuple[int, ...], bytes]] = []
+        with zipfile.ZipFile(cikti_yolu, "w", zipfile.ZIP_DEFLATED) as hedef:
+            for ad, tarih, veri in self._parcalar:
+                if ad in _BIRLESIK_TURETILEN_PARCALAR and not sayfa_adlari:
+                    # Sayfa adlarına bağlı parçalar sayfalardan sonra yazılır.
+                    bekleyenler.append((ad, tarih, veri))
+                    continue
+                if ad == _SAYFA_PARCASI:
+                    for sayfa_adi, hucre_degerleri in sayfalar:
+                        sayfa_adlari.append(sayfa_adi)
+                        _parca_yaz(
+                            hedef,
+                            f"xl/worksheets/sheet{len(sayfa_adlari)}.xml",
+                            tarih,
+                            self._sayfa_xml_olustur(hucre_degerleri).encode("utf-8"),
+                        )
+                    if not sayfa_adlari:
+                        raise ValueError(
+                            "Birleşik workbook için en az bir sayfa gerekir."
+                        )
+                    continue
+                veri = self._birlesik_parca(ad, veri, sayfa_adlari)
+                _parca_yaz(hedef, ad, tarih, veri)
+
+            for ad, tarih, veri in bekleyenler:
+                veri = self._birlesik_parca(ad, veri, sayfa_adlari)
+                _parca_yaz(hedef, ad, tarih, veri)
+
+        return len(sayfa_adlari)
+
+    def ekleme_uyumlu_mu(self, xlsx_yolu: str | Path) -> bool:
+        """Prototip sayfalarının mevcut dosyaya eklenip eklenemeyeceğini döndürür.
+
+        Yeni sayfalar prototipin stil kimliklerini kullandığından mevcut
+        dosyanın stil tablosu prototipinkiyle birebir aynı olmalıdır. Bu,
+        dosya aynı şablon ve stratejiyle üretilmişse sağlanır; Excel'de
+        yeniden kaydedilmiş dosyalar genellikle uyumsuzdur.
+        """
+        try:
+            with zipfile.ZipFile(xlsx_yolu) as kaynak:
+                parca_adlari = set(kaynak.namelist())
+                if (
+                    not {
+                        *_BIRLESIK_TURETILEN_PARCALAR,
+                        _STIL_PARCASI,
+                    }
+                    <= parca_adlari
+                ):
+                    return False
+                if kaynak.read(_STIL_PARCASI) != self._parca(_STIL_PARCASI):
+                    return False
+                workbook_xml = kaynak.read(_WORKBOOK_PARCASI).decode("utf-8")
+        except (OSError, zipfile.BadZipFile, KeyError, UnicodeDecodeError):
+            return False
+
+        if "</sheets>" not in workbook_xml or _iliski_oneki(workbook_xml) is None:
+            return False
+        # Tanımlı adlar bloğu yoksa ``</sheets>`` ardına eklenir; araya
+        # şema gereği önce gelmesi gereken başka öğeler girmemelidir.
+        return "</definedNames>" in workbook_xml or not re.search(
+            r"<(functionGroups|externalReferences)\b", workbook_xml
+        )
+
+    def mevcut_dosyaya_ekle(
+        self,
+        xlsx_yolu: str | Path,
+        sayfalar: Iterable[tuple[str, dict[str, str]]],
+    ) -> int:
+        """Prototipten üretilen sayfaları var olan birleşik dosyanın sonuna ekler.
+
+        Eski sayfa parçaları ayrıştırılmadan kopyalanır; yalnızca
+        ``workbook.xml``, workbook ilişkileri ve içerik türleri yeni
+        sayfalarla genişletilir. Dosya geçici bir kopyaya yazılıp sonra
+        yerine taşınır. Hiç sayfa verilmezse dosyaya dokunulmaz.
+
+        Çağıran taraf önce :meth:`ekleme_uyumlu_mu` ile uyumluluğu
+        doğrulamalıdır.
+
+        :param xlsx_yolu: Güncellenecek xlsx dosyasının yolu.
+        :param sayfalar: ``(sayfa adı, hücre değerleri)`` çiftleri. Adlar
+            mevcut sayfalarla çakışmamalıdır.
+        :returns: Eklenen sayfa sayısı.
+        """
+        sayfa_akisi = iter(sayfalar)
+        ilk_sayfa = next(sayfa_akisi, None)
+        if ilk_sayfa is None:
+            return 0
+
+        xlsx_yolu = Path(xlsx_yolu)
+        tanimlayici, gecici_yol = tempfile.mkstemp(
+            dir=xlsx_yolu.parent, prefix=f".{xlsx_yolu.stem}-", suffix=".tmp"
+        )
+        os.close(tanimlayici)
+        try:
+            with (
+                zipfile.ZipFile(xlsx_yolu) as kaynak,
+                zipfile.ZipFile(gecici_yol, "w", zipfile.ZIP_DEFLATED) as hedef,
+            ):
+                eklenen = self._mevcut_zipe_ekle(
+                    kaynak, hedef, itertools.chain([ilk_sayfa], sayfa_akisi)
+                )
+            os.replace(gecici_yol, xlsx_yolu)
+        except BaseException:
+            Path(gecici_yol).unlink(missing_ok=True)
+            raise
+        return eklenen
+
+    # ------------------------------------------------------------------
+    # İç yardımcılar
+    # ------------------------------------------------------------------
+
+    def _mevcut_zipe_ekle(
+        self,
+        kaynak: zipfile.ZipFile,
+        hedef: zipfile.ZipFile,
+        sayfalar: Iterable[tuple[str, dict[str, str]]],
+    ) -> int:
+        """Mevcut parçaları kopyalar, yeni sayfaları yazar ve dizinleri günceller."""
+        workbook_xml = kaynak.read(_WORKBOOK_PARCASI).decode("utf-8")
+        iliskiler_xml = kaynak.read(_WORKBOOK_ILISKI_PARCASI).decode("utf-8")
+        icerik_turleri_xml = kaynak.read(_ICERIK_TURLERI_PARCASI).decode("utf-8")
+
+        for bilgi in kaynak.infolist():
+            if bilgi.filename in _BIRLESIK_TURETILEN_PARCALAR:
+                continue
+            yeni_bilgi = zipfile.ZipInfo(bilgi.filename, date_time=bilgi.date_time)
+            yeni_bilgi.compress_type = bilgi.compress_type
+            yeni_bilgi.external_attr = bilgi.external_attr
+            with kaynak.open(bilgi) as okuyucu:
+                with hedef.open(yeni_bilgi, "w") as yazici:
+                    shutil.copyfileobj(okuyucu, yazici)
+
+        sayfa_ogeleri = ElementTree.fromstring(workbook_xml).iter(
+            f"{{{_ANA_AD_ALANI}}}sheet"
+        )
+        sayfa_kimlikleri = [int(oge.get("sheetId", 0)) for oge in sayfa_ogeleri]
+        sayfa_sirasi = len(sayfa_kimlikleri)
+        sayfa_kimligi = max(sayfa_kimlikleri, default=0)
+        kullanilan_parcalar = set(kaynak.namelist())
+        kullanilan_iliskiler = set(re.findall(r'\bId="([^"]*)"', iliskiler_xml))
+        iliski_oneki = _iliski_oneki(workbook_xml) or "r"
+        iliski_sablonu = _SAYFA_ILISKISI.search(
+            self._parca(_WORKBOOK_ILISKI_PARCASI).decode("utf-8")
+        )
+        icerik_turu_sablonu = _SAYFA_ICERIK_TURU.search(
+            self._parca(_ICERIK_TURLERI_PARCASI).decode("utf-8")
+        )
+        if iliski_sablonu is None or icerik_turu_sablonu is None:
+            raise ValueError("Prototip içinde sayfa ilişkisi bulunamadı.")
+
+        sayfa_tarihi = next(
+            tarih for ad, tarih, _ in self._parcalar if ad == _SAYFA_PARCASI
+        )
+        yeni_sayfalar: list[str] = []
+        yeni_adlar: list[str] = []
+        yeni_iliskiler: list[str] = []
+        yeni_icerik_turleri: list[str] = []
+        parca_no = sayfa_sirasi
+        iliski_no = len(kullanilan_iliskiler)
+        for sayfa_adi, hucre_degerleri in sayfalar:
+            parca_no += 1
+            while f"xl/worksheets/sheet{parca_no}.xml" in kullanilan_parcalar:
+                parca_no += 1
+            iliski_no += 1
+            while f"rId{iliski_no}" in kullanilan_iliskiler:
+                iliski_no += 1
+            parca_adi = f"xl/worksheets/sheet{parca_no}.xml"
+            iliski_kimligi = f"rId{iliski_no}"
+            sayfa_kimligi += 1
+
+            _parca_yaz(
+                hedef,
+                parca_adi,
+                sayfa_tarihi,
+                self._sayfa_xml_olustur(hucre_degerleri).encode("utf-8"),
+            )
+            yeni_sayfalar.append(
+                self._sayfa_ogesi(
+                    sayfa_adi, sayfa_kimligi, iliski_kimligi, iliski_oneki
+                )
+            )
+            yeni_adlar.append(self._yerel_tanimli_adlar(sayfa_adi, sayfa_sirasi))
+            yeni_iliskiler.append(
+                iliski_sablonu.group()
+                .replace("/xl/worksheets/sheet1.xml", f"/{parca_adi}")
+                .replace('Id="rId1"', f'Id="{iliski_kimligi}"')
+            )
+            yeni_icerik_turleri.append(
+                icerik_turu_sablonu.group().replace(
+                    "/xl/worksheets/sheet1.xml", f"/{parca_adi}"
+                )
+            )
+            sayfa_sirasi += 1
+
+        workbook_xml = _oncesine_ekle(workbook_xml, "</sheets>", "".join(yeni_sayfalar))
+        tanimli_adlar = "".join(yeni_adlar)
+        if tanimli_adlar and "</definedNames>" in workbook_xml:
+            workbook_xml = _oncesine_ekle(
+                workbook_xml, "</definedNames>", tanimli_adlar
+            )
+        elif tanimli_adlar:
+            workbook_xml = workbook_xml.replace(
+                "</sheets>",
+                f"</sheets><definedNames>{tanimli_adlar}</definedNames>",
+                1,
+            )
+        iliskiler_xml = _oncesine_ekle(
+            iliskiler_xml, "</Relationships>", "".join(yeni_iliskiler)
+        )
+        icerik_turleri_xml = _oncesine_ekle(
+            icerik_turleri_xml, "</Types>", "".join(yeni_icerik_turleri)
+        )
+
+        for ad, veri in (
+            (_WORKBOOK_PARCASI, workbook_xml),
+            (_WORKBOOK_ILISKI_PARCASI, iliskiler_xml),
+            (_ICERIK_TURLERI_PARCASI, icerik_turleri_xml),
+        ):
+            bilgi = kaynak.getinfo(ad)
+            _parca_yaz(hedef, ad, bilgi.date_time, veri.encode("utf-8"))
+        return len(yeni_sayfalar)
+
+    def _parca(self, ad: str) -> bytes:
+        for parca_adi, _, veri in self._parcalar:
+            if parca_adi == ad:
+                return veri
+        raise KeyError(ad)
+
+    @staticmethod
+    def _sayfa_xml_parcala(
+        sayfa_xml: str, hucreler: list[str]
+    ) -> list[tuple[str, str, str]]:
+        """Sayfa XML'ini (önceki metin, hücre adresi, öznitelikler) dilimlerine böler.
+
+        Son dilimin hücre adresi boştur ve yalnızca kalan metni taşır.
+        """
+        eslesmeler = []
+        for hucre in hucreler:
+            desen = re.compile(
+                rf'<c r="{hucre}"(?P<attrs>[^>]*?)\s*(?:/>|>.*?</c>)', re.DOTALL
+            )
+            eslesme = desen.search(sayfa_xml)
+            if eslesme is None:
+                raise ValueError(f"Prototip sayfasında '{hucre}' hücresi bulunamadı.")
+            eslesmeler.append((eslesme, hucre))
+        eslesmeler.sort(key=lambda item: item[0].start())
+
+        dilimler: list[tuple[str, str, str]] = []
+        konum = 0
+        for eslesme, hucre in eslesmeler:
+            attrs = re.sub(r'\s+t="[^"]*"', "", eslesme.group("attrs"))
+            dilimler.append((sayfa_xml[konum : eslesme.start()], hucre, attrs))
+            konum = eslesme.end()
+        dilimler.append((sayfa_xml[konum:], "", ""))
+        return dilimler
+
+    def _sayfa_xml_olustur(self, hucre_degerleri: dict[str, str]) -> str:
+        parcalar: list[str] = []
+        for onceki, hucre, attrs in self._sayfa_parcalari:
+            parcalar.append(onceki)
+            if hucre:
+                deger = hucre_degerleri.get(hucre, "")
+                parcalar.append(_satir_ici_metin_hucresi(hucre, attrs, deger))
+        return "".join(parcalar)
+
+    @staticmethod
+    def _workbook_xml_parcala(
+        workbook_xml: str, yer_tutucu: str
+    ) -> list[tuple[str, str]]:
+        """workbook.xml'i sayfa adının geçtiği yerlerden böler.
+
+        Her dilim ``(önceki metin, ad biçimi)`` çiftidir. Ad biçimi
+        ``"oznitelik"`` (``<sheet name="...">``), ``"tanimli"`` (tanımlı
+        adlardaki ``'...'!`` öneki) ya da son dilim için boş metindir.
+        """
+        bicimler = {
+            _sayfa_adi_ozniteligi(yer_tutucu): "oznitelik",
+            _sayfa_adi_tanimli_oneki(yer_tutucu): "tanimli",
+        }
+        if _sayfa_adi_ozniteligi(yer_tutucu) not in workbook_xml:
+            raise ValueError("Prototip workbook.xml içinde sayfa adı bulunamadı.")
+
+        desen = "(" + "|".join(re.escape(anahtar) for anahtar in bicimler) + ")"
+        bolumler = re.split(desen, workbook_xml)
+        dilimler = [
+            (bolumler[index], bicimler[bolumler[index + 1]])
+            for index in range(0, len(bolumler) - 1, 2)
+        ]
+        dilimler.append((bolumler[-1], ""))
+        return dilimler
+
+    def _birlesik_parca(self, ad: str, veri: bytes, sayfa_adlari: list[str]) -> bytes:
+        """Sayfa listesine bağlı parçaları birleşik workbook için yeniden üretir."""
+        if ad == _WORKBOOK_PARCASI:
+            return self._birlesik_workbook_xml(sayfa_adlari)
+        if ad == _WORKBOOK_ILISKI_PARCASI:
+            return _birlesik_iliskiler_xml(veri, len(sayfa_adlari))
+        if ad == _ICERIK_TURLERI_PARCASI:
+            return _birlesik_icerik_turleri_xml(veri, len(sayfa_adlari))
+        return veri
+
+    def _birlesik_workbook_xml(self, sayfa_adlari: list[str]) -> bytes:
+        """Sayfa öğesini ve yerel tanımlı adları her sayfa için çoğaltır."""
+        workbook_xml = self._parca(_WORKBOOK_PARCASI).decode("utf-8")
+        sayfa_ogesi = _SAYFA_OGESI.search(workbook_xml)
+        if sayfa_ogesi is None:
+            raise ValueError("Prototip workbook.xml içinde sayfa öğesi bulunamadı.")
+
+        sayfa_ogeleri = "".join(
+            self._sayfa_ogesi(sayfa_adi, index, f"rId{index}")
+            for index, sayfa_adi in enumerate(sayfa_adlari, start=1)
+        )
+        parcalar = [
+            workbook_xml[: sayfa_ogesi.start()],
+            sayfa_ogeleri,
+        ]
+        kalan = workbook_xml[sayfa_ogesi.end() :]
+
+        yerel_adlar = list(_YEREL_TANIMLI_AD.finditer(kalan))
+        if yerel_adlar:
+            parcalar.append(kalan[: yerel_adlar[0].start()])
+            parcalar.extend(
+                self._yerel_tanimli_adlar(sayfa_adi, index)
+                for index, sayfa_adi in enumerate(sayfa_adlari)
+            )
+            kalan = kalan[yerel_adlar[-1].end() :]
+        parcalar.append(kalan)
+        return "".join(parcalar).encode("utf-8")
+
+    def _sayfa_ogesi(
+        self,
+        sayfa_adi: str,
+        sayfa_kimligi: int,
+        iliski_kimligi: str,
+        iliski_oneki: str = "r",
+    ) -> str:
+        """Prototipteki ``<sheet>`` öğesini yeni ad ve kimliklerle üretir."""
+        if 'r:id="rId1"' not in self._sayfa_ogesi_sablonu:
+            raise ValueError("Prototip workbook.xml içinde sayfa öğesi bulunamadı.")
+        return (
+            self._sayfa_ogesi_sablonu.replace(
+                _sayfa_adi_ozniteligi(self._yer_tutucu),
+                _sayfa_adi_ozniteligi(sayfa_adi),
+            )
+            .replace('sheetId="1"', f'sheetId="{sayfa_kimligi}"')
+            .replace('r:id="rId1"', f'{iliski_oneki}:id="{escape(iliski_kimligi)}"')
+        )
+
+    def _yerel_tanimli_adlar(self, sayfa_adi: str, sayfa_sirasi: int) -> str:
+        """Prototip sayfasına ait tanımlı adları (ör. yazdırma alanı) üretir."""
+        return self._yerel_ad_blogu.replace(
+            'localSheetId="0"', f'localSheetId="{sayfa_sirasi}"'
+        ).replace(
+            _sayfa_adi_tanimli_oneki(self._yer_tutucu),
+            _sayfa_adi_tanimli_oneki(sayfa_adi),
+        )
+
+    def _workbook_xml_olustur(self, sayfa_adi: str) -> str:
+        yerine = {
+            "oznitelik": _sayfa_adi_ozniteligi(sayfa_adi),
+            "tanimli": _sayfa_adi_tanimli_oneki(sayfa_adi),
+            "": "",
+        }
+        return "".join(
+            onceki + yerine[bicim] for onceki, bicim in self._workbook_parcalari
+        )
+
+
+def _parca_yaz(
+    hedef: zipfile.ZipFile, ad: str, tarih: tuple[int, ...], veri: bytes
+) -> None:
+    """Tek bir parçayı prototipteki tarih bilgisiyle sıkıştırarak yazar."""
+    bilgi = zipfile.ZipInfo(ad, date_time=tarih)
+    bilgi.compress_type = zipfile.ZIP_DEFLATED
+    hedef.writestr(bilgi, veri)
+
+
+def hesaplanan_degerleri_ekle(
+    xlsx: bytes, sayfa_degerleri: Mapping[str, Mapping[str, object]]
+) -> bytes:
+    """Kaydedilmiş xlsx'teki formül hücrelerine önbellek değerlerini yazar.
+
+    openpyxl formülleri boş ``<v/>`` ile kaydeder. Bu fonksiyon verilen
+    sayfalarda değeri bilinen formül hücrelerinin ``<v>`` öğesini doldurur;
+    diğer parçalar ve hücreler değiştirilmeden kopyalanır.
+
+    :param xlsx: openpyxl ile kaydedilmiş xlsx baytları.
+    :param sayfa_degerleri: Sayfa adı → (hücre adresi → değer) eşlemesi.
+    :returns: Önbellek değerleri eklenmiş xlsx baytları.
+    """
+    hedef_tampon = BytesIO()
+    with (
+        zipfile.ZipFile(BytesIO(xlsx)) as kaynak,
+        zipfile.ZipFile(hedef_tampon, "w", zipfile.ZIP_DEFLATED) as hedef,
+    ):
+        parca_degerleri = {
+            parca: sayfa_degerleri[ad]
+            for ad, parca in _sayfa_parcalari(kaynak).items()
+            if sayfa_degerleri.get(ad)
+        }
+        for bilgi in kaynak.infolist():
+            veri = kaynak.read(bilgi.filename)
+            degerler = parca_degerleri.get(bilgi.filename)
+            if degerler:
+                sayfa_xml = formul_onbellegini_yaz(veri.decode("utf-8"), degerler)
+                veri = sayfa_xml.encode("utf-8")
+            _parca_yaz(hedef, bilgi.filename, bilgi.date_time, veri)
+    return hedef_tampon.getvalue()
+
+
+def formul_onbellegini_yaz(sayfa_xml: str, degerler: Mapping[str, object]) -> str:
+    """Sayfa XML'indeki boş formül önbelleklerini verilen değerlerle doldurur.
+
+    Metinler ``t="str"``, mantıksal değerler ``t="b"`` olarak yazılır.
+    ``degerler`` içinde bulunmayan ya da zaten önbelleği olan hücrelere
+    dokunulmaz.
+
+    :param sayfa_xml: openpyxl'in ürettiği sayfa XML'i.
+    :param degerler: Hücre adresi → hesaplanmış değer.
+    :returns: Güncellenmiş sayfa XML'i.
+    """
+
+    def doldur(eslesme: re.Match[str]) -> str:
+        hucre = eslesme.group("hucre")
+        if hucre not in degerler:
+            return eslesme.group()
+        deger = degerler[hucre]
+        if isinstance(deger, bool):
+            tur, metin = ' t="b"', "1" if deger else "0"
+        elif isinstance(deger, (int, float)):
+            if isinstance(deger, float) and deger.is_integer():
+                deger = int(deger)
+            tur, metin = "", repr(deger)
+        else:
+            tur, metin = ' t="str"', escape(str(deger))
+        return (
+            f'<c r="{hucre}"{eslesme.group("attrs")}{tur}>'
+            f'{eslesme.group("formul")}<v>{metin}</v></c>'
+        )
+
+    return _BOS_FORMUL_HUCRESI.sub(doldur, sayfa_xml)
+
+
+def _sayfa_parcalari(kaynak: zipfile.ZipFile) -> dict[str, str]:
+    """Sayfa adlarını zip içindeki sayfa parçası yollarına eşler."""
+    kok = ElementTree.fromstring(kaynak.read(_WORKBOOK_PARCASI))
+    iliskiler = ElementTree.fromstring(kaynak.read(_WORKBOOK_ILISKI_PARCASI))
+    hedefler = {
+        oge.get("Id"): oge.get("Target", "")
+        for oge in iliskiler.iter(f"{{{_PAKET_ILISKI_AD_ALANI}}}Relationship")
+    }
+    parcalar: dict[str, str] = {}
+    for oge in kok.iter(f"{{{_ANA_AD_ALANI}}}sheet"):
+        hedef = hedefler.get(oge.get(f"{{{_ILISKI_AD_ALANI}}}id"), "")
+        if not hedef:
+            continue
+        parcalar[oge.get("name", "")] = (
+            hedef.lstrip("/") if hedef.startswith("/") else f"xl/{hedef}"
+        )
+    return parcalar
+
+
+def sayfa_adlarini_oku(xlsx_yolu: str | Path) -> list[str]:
+    """Yalnızca ``workbook.xml`` parçasını okuyarak sayfa adlarını döndürür.
+
+    Sayfa içerikleri açılmadığından dosya boyutundan bağımsız olarak hızlıdır.
+
+    :param xlsx_yolu: Okunacak xlsx dosyasının yolu.
+    :returns: Workbook'taki sırasıyla sayfa adları.
+    """
+    with zipfile.ZipFile(xlsx_yolu) as kaynak:
+        kok = ElementTree.fromstring(kaynak.read(_WORKBOOK_PARCASI))
+    return [oge.get("name", "") for oge in kok.iter(f"{{{_ANA_AD_ALANI}}}sheet")]
+
+
+def _iliski_oneki(workbook_xml: str) -> str | None:
+    """workbook.xml'de ilişki ad alanına bağlı öneki (genellikle ``r``) bulur."""
+    eslesme = re.search(rf'xmlns:(\w+)="{re.escape(_ILISKI_AD_ALANI)}"', workbook_xml)
+    return eslesme.group(1) if eslesme else None
+
+
+def _oncesine_ekle(metin: str, etiket: str, eklenecek: str) -> str:
+    """``eklenecek`` metnini ``etiket``in son geçtiği yerin önüne ekler."""
+    konum = metin.rindex(etiket)
+    return metin[:konum] + eklenecek + metin[konum:]
+
+
+def _birlesik_iliskiler_xml(iliskiler: bytes, sayfa_sayisi: int) -> bytes:
+    """Workbook ilişkilerini önce sayfalar (``rId1..rIdN``), sonra diğerleri olarak yazar.
+
+    openpyxl de çok sayfalı workbook'larda aynı numaralandırmayı kullanır;
+    ``workbook.xml`` sayfa dışındaki ilişkilere kimlikle başvurmaz.
+    """
+    metin = iliskiler.decode("utf-8")
+    ogeler = list(_ILISKI_OGESI.finditer(metin))
+    sayfa_iliskileri = [
+        oge.group()
+        for oge in ogeler
+        if 'Target="/xl/worksheets/sheet1.xml"' in oge.group()
+    ]
+    if len(sayfa_iliskileri) != 1 or 'Id="rId1"' not in sayfa_iliskileri[0]:
+        raise ValueError("Prototip ilişkilerinde sayfa ilişkisi bulunamadı.")
+
+    yeni_ogeler = [
+        sayfa_iliskileri[0]
+        .replace("/xl/worksheets/sheet1.xml", f"/xl/worksheets/sheet{index}.xml")
+        .replace('Id="rId1"', f'Id="rId{index}"')
+        for index in range(1, sayfa_sayisi + 1)
+    ]
+    diger_ogeler = [oge.group() for oge in ogeler if oge.group() != sayfa_iliskileri[0]]
+    yeni_ogeler.extend(
+        re.sub(r'Id="rId\d+"', f'Id="rId{sayfa_sayisi + index}"', oge)
+        for index, oge in enumerate(diger_ogeler, start=1)
+    )
+    return (
+        metin[: ogeler[0].start()] + "".join(yeni_ogeler) + metin[ogeler[-1].end() :]
+    ).encode("utf-8")
+
+
+def _birlesik_icerik_turleri_xml(icerik_turleri: bytes, sayfa_sayisi: int) -> bytes:
+    """Sayfa içerik türü kaydını her sayfa parçası için çoğaltır."""
+    metin = icerik_turleri.decode("utf-8")
+    eslesme = _SAYFA_ICERIK_TURU.search(metin)
+    if eslesme is None:
+        raise ValueError("Prototip içerik türlerinde sayfa kaydı bulunamadı.")
+    kayitlar = "".join(
+        eslesme.group().replace("sheet1.xml", f"sheet{index}.xml")
+        for index in range(1, sayfa_sayisi + 1)
+    )
+    return (metin[: eslesme.start()] + kayitlar + metin[eslesme.end() :]).encode(
+        "utf-8"
+    )
+
+
+def _sayfa_adi_ozniteligi(sayfa_adi: str) -> str:
+    """``<sheet>`` öğesindeki ``name`` özniteliğini üretir."""
+    return f'name="{escape(sayfa_adi, _ATTR_KACIS)}"'
+
+
+def _sayfa_adi_tanimli_oneki(sayfa_adi: str) -> str:
+    """Tanımlı adlarda (ör. yazdırma alanı) kullanılan tırnaklı öneki üretir."""
+    return "'" + escape(sayfa_adi.replace("'", "''")) + "'!"
+
+
+def _satir_ici_metin_hucresi(hucre: str, attrs: str, deger: str) -> str:
+    """openpyxl'in ``inlineStr`` hücre biçimini üretir."""
+    if not deger:
+        return f'<c r="{hucre}"{attrs} t="inlineStr" />'
+    bosluk = ' xml:space="preserve"' if deger != deger.strip() else ""
+    return (
+        f'<c r="{hucre}"{attrs} t="inlineStr"><is>'
+        f"<t{bosluk}>{escape(deger)}</t></is></c>"
+    )
@@ -313,6 +313,67 @@ BRUT_UCRET_HARITASI: dict[str, float] = {
     "A-6/1": 135666.93,
 }
 
+#: Hizmet grubu türü ``"AG"`` iken ünvanlara eklenen ek.
+UNVAN_AG_EKI = " Araştırmacı"
+
+#: Ünvan eşikleri: ``(en az tecrübe yılı, ünvan)``, büyükten küçüğe.
+UNVAN_ESIKLERI: tuple[tuple[int, str], ...] = (
+    (16, "Kıdemli Başuzman"),
+    (12, "Başuzman"),
+    (8, "Kıdemli Uzman"),
+    (3, "Uzman"),
+)
+
+#: Eşiklerin hiçbiri tutmadığında AG ve A türleri için ünvanlar.
+UNVAN_AG_VARSAYILAN = "Araştırmacı"
+UNVAN_A_VARSAYILAN = "Uzman Yardımcısı"
+
+#: Hizmet grubu eşikleri: ``(en az tecrübe yılı, derece)``, büyükten küçüğe.
+HIZMET_GRUBU_ESIKLERI: tuple[tuple[int, str], ...] = (
+    (16, "2"),
+    (12, "3"),
+    (8, "4"),
+    (3, "5"),
+)
+HIZMET_GRUBU_VARSAYILAN_DERECE = "6"
+
+#: Kademe tabloları: ``(en az tecrübe yılı, (Lisans, Tezsiz YL, Tezli YL,
+#: Doktora))``, büyükten küçüğe. Son satırın eşiği 0'dır ve diğerleri
+#: tutmadığında kullanılır. Öğrenim eşleşmezse Doktora sütunu seçilir.
+KADEME_TABLOSU: tuple[tuple[int, tuple[str, str, str, str]], ...] = (
+    (16, ("3", "3", "2", "2")),
+    (15, ("3", "3", "2", "2")),
+    (12, ("5", "5", "4", "2")),
+    (10, ("3", "3", "2", "2")),
+    (8, ("5", "5", "4", "2")),
+    (6, ("3", "3", "2", "2")),
+    (3, ("5", "5", "4", "2")),
+    (2, ("3", "3", "2", "2")),
+    (0, ("5", "4", "3", "2")),
+)
+KADEME_BASLANGIC_TABLOSU: tuple[tuple[int, tuple[int, int, int, int]], ...] = (
+    (16, (6, 6, 5, 4)),
+    (15, (4, 4, 3, 4)),
+    (12, (6, 6, 5, 4)),
+    (10, (4, 4, 3, 4)),
+    (8, (6, 6, 5, 4)),
+    (6, (4, 4, 3, 4)),
+    (3, (6, 6, 5, 4)),
+    (2, (4, 4, 2, 2)),
+    (0, (6, 5, 4, 4)),
+)
+KADEME_BITIS_TABLOSU: tuple[tuple[int, tuple[int, int, int, int]], ...] = (
+    (16, (3, 3, 2, 2)),
+    (15, (3, 3, 2, 2)),
+    (12, (5, 5, 4, 2)),
+    (10, (3, 3, 2, 2)),
+    (8, (5, 5, 4, 2)),
+    (6, (3, 3, 2, 2)),
+    (3, (5, 5, 4, 2)),
+    (2, (3, 3, 2, 2)),
+    (0, (5, 4, 3, 3)),
+)
+
 
 def brut_ucret_formulu(kademe_hucre: str, tablo_araligi: str | None = None) -> str:
     """
@@ -350,14 +411,12 @@ def unvan_formulu(
     g = hizmet_grubu_turu_hucre
 
     def varyant(unvan: str) -> str:
-        return f'IF({g}="AG","{unvan} Araştırmacı","{unvan}")'
+        return f'IF({g}="AG","{unvan}{UNVAN_AG_EKI}","{unvan}")'
 
-    return (
-        f'=IF({t}>=16,{varyant("Kıdemli Başuzman")},'
-        f'IF({t}>=12,{varyant("Başuzman")},'
-        f'IF({t}>=8,{varyant("Kıdemli Uzman")},'
-        f'IF({t}>=3,{varyant("Uzman")},IF({g}="AG","Araştırmacı","Uzman Yardımcısı")))))'
-    )
+    ifade = f'IF({g}="AG","{UNVAN_AG_VARSAYILAN}","{UNVAN_A_VARSAYILAN}")'
+    for esik, unvan in reversed(UNVAN_ESIKLERI):
+        ifade = f"IF({t}>={esik},{varyant(unvan)},{ifade})"
+    return f"={ifade}"
 
 
 def hizmet_grubu_formulu(
@@ -374,15 +433,10 @@ def hizmet_grubu_formulu(
     """
     t = tecrube_yili_hucre
     g = hizmet_grubu_turu_hucre
-    return (
-        f'=IF(OR({g}="A",{g}="AG"),'
-        f'IF({t}>=16,{g}&"-2",'
-        f'IF({t}>=12,{g}&"-3",'
-        f'IF({t}>=8,{g}&"-4",'
-        f'IF({t}>=3,{g}&"-5",{g}&"-6")))),'
-        f'""'
-        f")"
-    )
+    ifade = f'{g}&"-{HIZMET_GRUBU_VARSAYILAN_DERECE}"'
+    for esik, derece in reversed(HIZMET_GRUBU_ESIKLERI):
+        ifade = f'IF({t}>={esik},{g}&"-{derece}",{ifade})'
+    return f'=IF(OR({g}="A",{g}="AG"),{ifade},"")'
 
 
 def kademe_formulu(
@@ -401,36 +455,30 @@ def kademe_formulu(
     """
     t = tecrube_yili_hucre
     o = ogrenim_hucre
+    kademeler = dict(KADEME_TABLOSU)
 
-    def branch(lisans: str, tezsiz: str, tezli: str, doktora: str) -> str:
+    def branch(esik: int) -> str:
+        lisans, tezsiz, tezli, doktora = kademeler[esik]
         return (
-            f'IF({o}="Lisans","{lisans}",'
-            f'IF({o}="Tezsiz Yüksek Lisans","{tezsiz}",'
-            f'IF({o}="Tezli Yüksek Lisans","{tezli}","{doktora}")))'
+            f'IF({o}="{OGRENIM_LISANS}","{lisans}",'
+            f'IF({o}="{OGRENIM_TEZSIZ_YL}","{tezsiz}",'
+            f'IF({o}="{OGRENIM_TEZLI_YL}","{tezli}","{doktora}")))'
         )
 
     # A/AG-2 (16+)
-    ag2 = branch("3", "3", "2", "2")
+    ag2 = branch(16)
 
     # A/AG-3 (12-16)
-    ag3_low = branch("5", "5", "4", "2")
-    ag3_high = branch("3", "3", "2", "2")
-    ag3 = f"IF({t}<15,{ag3_low},{ag3_high})"
+    ag3 = f"IF({t}<15,{branch(12)},{branch(15)})"
 
     # A/AG-4 (8-12)
-    ag4_low = branch("5", "5", "4", "2")
-    ag4_high = branch("3", "3", "2", "2")
-    ag4 = f"IF({t}<10,{ag4_low},{ag4_high})"
+    ag4 = f"IF({t}<10,{branch(8)},{branch(10)})"
 
     # A/AG-5 (3-8)
-    ag5_low = branch("5", "5", "4", "2")
-    ag5_high = branch("3", "3", "2", "2")
-    ag5 = f"IF({t}<6,{ag5_low},{ag5_high})"
+    ag5 = f"IF({t}<6,{branch(3)},{branch(6)})"
 
     # A/AG-6 (0-3)
-    ag6_low = branch("5", "4", "3", "2")
-    ag6_high = branch("3", "3", "2", "2")
-    ag6 = f"IF({t}<2,{ag6_low},{ag6_high})"
+    ag6 = f"IF({t}<2,{branch(0)},{branch(2)})"
 
     return (
         f"=IF({t}>=16,{ag2},"
@@ -457,52 +505,8 @@ def kademe_baslangic_formulu(
         sayısal kademeyle birleştirir.
     :returns: Kademe başlangıcı formülü string'i.
     """
-    t = tecrube_yili_hucre
-    o = ogrenim_hucre
-
-    def branch(lisans: str, tezsiz: str, tezli: str, doktora: str) -> str:
-        return (
-            f'IF({o}="Lisans",{lisans},'
-            f'IF({o}="Tezsiz Yüksek Lisans",{tezsiz},'
-            f'IF({o}="Tezli Yüksek Lisans",{tezli},{doktora})))'
-        )
-
-    # 16+ yıl
-    ag2 = branch("6", "6", "5", "4")
-
-    # 15-16 yıl
-    ag3_15_16 = branch("4", "4", "3", "4")
-
-    # 12-15 yıl
-    ag3_12_15 = branch("6", "6", "5", "4")
-
-    # 10-12 yıl
-    ag4_10_12 = branch("4", "4", "3", "4")
-
-    # 8-10 yıl
-    ag4_8_10 = branch("6", "6", "5", "4")
-
-    # 6-8 yıl
-    ag5_6_8 = branch("4", "4", "3", "4")
-
-    # 3-6 yıl
-    ag5_3_6 = branch("6", "6", "5", "4")
-
-    # 2-3 yıl
-    ag6_2_3 = branch("4", "4", "2", "2")
-
-    # 0-2 yıl
-    ag6_0_2 = branch("6", "5", "4", "4")
-
-    kademe_ifadesi = (
-        f"IF({t}>=16,{ag2},"
-        f"IF({t}>=15,{ag3_15_16},"
-        f"IF({t}>=12,{ag3_12_15},"
-        f"IF({t}>=10,{ag4_10_12},"
-        f"IF({t}>=8,{ag4_8_10},"
-        f"IF({t}>=6,{ag5_6_8},"
-        f"IF({t}>=3,{ag5_3_6},"
-        f"IF({t}>=2,{ag6_2_3},{ag6_0_2}))))))))"
+    kademe_ifadesi = _kademe_tablosu_ifadesi(
+        tecrube_yili_hucre, ogrenim_hucre, KADEME_BASLANGIC_TABLOSU
     )
     if not derece_kademe_hucre:
         return f"={kademe_ifadesi}"
@@ -528,52 +532,8 @@ def kademe_bitis_formulu(
         sayısal kademeyle birleştirir.
     :returns: İç içe IF formülü string'i.
     """
-    t = tecrube_yili_hucre
-    o = ogrenim_hucre
-
-    def branch(lisans: str, tezsiz: str, tezli: str, doktora: str) -> str:
-        return (
-            f'IF({o}="Lisans",{lisans},'
-            f'IF({o}="Tezsiz Yüksek Lisans",{tezsiz},'
-            f'IF({o}="Tezli Yüksek Lisans",{tezli},{doktora})))'
-        )
-
-    # 16+ yıl
-    ag2 = branch("3", "3", "2", "2")
-
-    # 15-16 yıl
-    ag3_15_16 = branch("3", "3", "2", "2")
-
-    # 12-15 yıl
-    ag3_12_15 = branch("5", "5", "4", "2")
-
-    # 10-12 yıl
-    ag4_10_12 = branch("3", "3", "2", "2")
-
-    # 8-10 yıl
-    ag4_8_10 = branch("5", "5", "4", "2")
-
-    # 6-8 yıl
-    ag5_6_8 = branch("3", "3", "2", "2")
-
-    # 3-6 yıl
-    ag5_3_6 = branch("5", "5", "4", "2")
-
-    # 2-3 yıl
-    ag6_2_3 = branch("3", "3", "2", "2")
-
-    # 0-2 yıl
-    ag6_0_2 = branch("5", "4", "3", "3")
-
-    kademe_ifadesi = (
-        f"IF({t}>=16,{ag2},"
-        f"IF({t}>=15,{ag3_15_16},"
-        f"IF({t}>=12,{ag3_12_15},"
-        f"IF({t}>=10,{ag4_10_12},"
-        f"IF({t}>=8,{ag4_8_10},"
-        f"IF({t}>=6,{ag5_6_8},"
-        f"IF({t}>=3,{ag5_3_6},"
-        f"IF({t}>=2,{ag6_2_3},{ag6_0_2}))))))))"
+    kademe_ifadesi = _kademe_tablosu_ifadesi(
+        tecrube_yili_hucre, ogrenim_hucre, KADEME_BITIS_TABLOSU
     )
     if not derece_kademe_hucre:
         return f"={kademe_ifadesi}"
@@ -581,3 +541,26 @@ def kademe_bitis_formulu(
     dk = derece_kademe_hucre
     on_ek = f'IFERROR(LEFT({dk},FIND("/",{dk})),"")'
     return f'=IF({dk}="",{kademe_ifadesi},{on_ek}&{kademe_ifadesi})'
+
+
+def _kademe_tablosu_ifadesi(
+    tecrube_yili_hucre: str,
+    ogrenim_hucre: str,
+    tablo: tuple[tuple[int, tuple[int, int, int, int]], ...],
+) -> str:
+    """Kademe tablosunu eşik sırasıyla iç içe IF ifadesine çevirir."""
+    t = tecrube_yili_hucre
+    o = ogrenim_hucre
+
+    def branch(lisans: int, tezsiz: int, tezli: int, doktora: int) -> str:
+        return (
+            f'IF({o}="{OGRENIM_LISANS}",{lisans},'
+            f'IF({o}="{OGRENIM_TEZSIZ_YL}",{tezsiz},'
+            f'IF({o}="{OGRENIM_TEZLI_YL}",{tezli},{doktora})))'
+        )
+
+    *esikli, (_, varsayilan) = tablo
+    ifade = branch(*varsayilan)
+    for esik, degerler in reversed(esikli):
+        ifade = f"IF({t}>={esik},{branch(*degerler)},{ifade})"
+    return ifade
@@ -0,0 +1,392 @@
+"""
+D-K formüllerinin Python karşılıkları.
+
+:mod:`src.core.formula_builder` tarafından üretilen her formül için aynı
+kuralları aynı eşik tablolarından uygulayan bir hesaplama fonksiyonu içerir.
+Sonuçlar üretilen dosyalara formüllerin önbellek değerleri olarak yazılır;
+böylece ``data_only=True`` ile okuyan araçlar da hesaplanmış sonucu görür.
+
+Fonksiyonlar Excel'in değerlendirme kurallarını izler:
+
+- Boş hücre (``None``) metin karşılaştırmalarında ``""``, sayısal
+  karşılaştırmalarda ``0`` gibi davranır.
+- Metin karşılaştırmaları büyük/küçük harf duyarsızdır.
+- Metin her sayıdan büyüktür; ``J29`` boş metin döndürdüğünde
+  ``J29>=16`` doğrudur.
+- ``IF`` yalnızca seçilen dalı, ``AND``/``OR``/``SUM`` ise tüm
+  argümanlarını değerlendirir.
+
+Sonucun Excel ile birebir aynı olacağı garanti edilemiyorsa (formül içeren
+girdi, metin olarak yazılmış tarih vb.) :class:`HesaplanamazHatasi`
+fırlatılır; bu hücreler önbellek değeri olmadan bırakılır ve Excel
+tarafından hesaplanır.
+"""
+
+from __future__ import annotations
+
+import calendar
+import math
+from datetime import date, datetime, timedelta
+from typing import Iterable, Mapping
+
+from src.config.constants import (
+    GUN_PER_YIL,
+    OGRENIM_DOKTORA,
+    OGRENIM_LISANS,
+    OGRENIM_TEZLI_YL,
+    OGRENIM_TEZSIZ_YL,
+)
+from src.core.formula_builder import (
+    BRUT_UCRET_HARITASI,
+    HIZMET_GRUBU_ESIKLERI,
+    HIZMET_GRUBU_VARSAYILAN_DERECE,
+    KADEME_BASLANGIC_TABLOSU,
+    KADEME_BITIS_TABLOSU,
+    KADEME_TABLOSU,
+    UNVAN_A_VARSAYILAN,
+    UNVAN_AG_EKI,
+    UNVAN_AG_VARSAYILAN,
+    UNVAN_ESIKLERI,
+)
+
+#: Değeri Python tarafında bilinmeyen hücreler (formül, hata değeri vb.).
+BILINMEYEN = object()
+
+#: Excel seri tarihlerinin başlangıcı (1900 tarih sistemi).
+_EXCEL_EPOCH = date(1899, 12, 30)
+
+#: 1900 artık yıl hatası nedeniyle bu seri numarasından küçük tarihler
+#: Python takvimiyle uyuşmaz.
+_ILK_GUVENLI_SERI = 61
+
+#: Büyük/küçük harf dönüşümü yerel ayara bağlı olan karakterler.
+_YERELE_BAGLI_HARFLER = frozenset("ıİ")
+
+#: Öğrenim dallarının tablo sütun sırası (Doktora varsayılandır).
+_OGRENIM_SIRASI = (OGRENIM_LISANS, OGRENIM_TEZSIZ_YL, OGRENIM_TEZLI_YL)
+
+
+class HesaplanamazHatasi(ValueError):
+    """Formül sonucu Python tarafında kesin olarak belirlenemediğinde fırlatılır."""
+
+
+# ---------------------------------------------------------------------------
+# Excel değerlendirme kuralları
+# ---------------------------------------------------------------------------
+
+
+def _bilinen(deger: object) -> object:
+    """Değeri bilinmiyorsa :class:`HesaplanamazHatasi` fırlatır."""
+    if deger is BILINMEYEN:
+        raise HesaplanamazHatasi("Girdi hücresinin değeri bilinmiyor.")
+    return deger
+
+
+def _bos_degil(deger: object) -> bool:
+    """Excel ``x<>""`` karşılaştırması."""
+    deger = _bilinen(deger)
+    if deger is None:
+        return False
+    if isinstance(deger, str):
+        return deger != ""
+    return True
+
+
+def _metne_esit(deger: object, metin: str) -> bool:
+    """Excel ``x="metin"`` karşılaştırması (büyük/küçük harf duyarsız)."""
+    deger = _bilinen(deger)
+    if deger is None:
+        return metin == ""
+    if not isinstance(deger, str):
+        return False
+    if deger == metin:
+        return True
+    if _YERELE_BAGLI_HARFLER & set(deger + metin):
+        raise HesaplanamazHatasi(
+            f"'{deger}' karşılaştırması yerel ayara bağlı harf içeriyor."
+        )
+    return deger.casefold() == metin.casefold()
+
+
+def _buyuk_esit(deger: object, esik: float) -> bool:
+    """Excel ``x>=esik`` karşılaştırması; metin ve mantıksal değerler büyük sayılır."""
+    deger = _bilinen(deger)
+    if deger is None:
+        return 0 >= esik
+    if isinstance(deger, (str, bool)):
+        return True
+    return deger >= esik
+
+
+def _sayi(deger: object) -> float:
+    """Aritmetik işlemde kullanılacak sayısal değeri döndürür."""
+    deger = _bilinen(deger)
+    if deger is None:
+        return 0
+    if isinstance(deger, bool) or not isinstance(deger, (int, float)):
+        raise HesaplanamazHatasi(f"Sayısal olmayan değer: {deger!r}")
+    return deger
+
+
+def _metin(deger: object) -> str:
+    """Excel ``&`` birleştirmesinde kullanılacak metin karşılığını döndürür."""
+    deger = _bilinen(deger)
+    if deger is None:
+        return ""
+    if isinstance(deger, str):
+        return deger
+    if isinstance(deger, int) and not isinstance(deger, bool):
+        return str(deger)
+    raise HesaplanamazHatasi(f"Metne çevrilemeyen değer: {deger!r}")
+
+
+def _tarih(deger: object) -> date:
+    """Hücre değerini ``DAY``/``MONTH``/``YEAR`` için tarihe çevirir."""
+    deger = _bilinen(deger)
+    if isinstance(deger, datetime):
+        deger = deger.date()
+    if isinstance(deger, date):
+        seri = (deger - _EXCEL_EPOCH).days
+    elif isinstance(deger, (int, float)) and not isinstance(deger, bool):
+        seri = math.floor(deger)
+    else:
+        raise HesaplanamazHatasi(f"Tarih olarak yorumlanamayan değer: {deger!r}")
+    if seri < _ILK_GUVENLI_SERI:
+        raise HesaplanamazHatasi(f"Desteklenmeyen tarih: {deger!r}")
+    return _EXCEL_EPOCH + timedelta(days=seri)
+
+
+def _ay_sonu(gun: date) -> int:
+    """``DAY(EOMONTH(gun,0))`` karşılığı."""
+    return calendar.monthrange(gun.year, gun.month)[1]
+
+
+def _excel_mod(sayi: float, bolen: float) -> float:
+    """Excel ``MOD``: sonuç bölenin işaretini taşır."""
+    return sayi - bolen * math.floor(sayi / bolen)
+
+
+def _topla(degerler: Iterable[object]) -> float:
+    """Excel ``SUM``: yalnızca sayıları toplar; metin ve boşlukları atlar."""
+    toplam: float = 0
+    for deger in degerler:
+        deger = _bilinen(deger)
+        if isinstance(deger, (int, float)) and not isinstance(deger, bool):
+            toplam += deger
+    return toplam
+
+
+# ---------------------------------------------------------------------------
+# Formül karşılıkları
+# ---------------------------------------------------------------------------
+
+
+def prim_gunu_hesapla(baslangic: object, bitis: object) -> int | str:
+    """:func:`~src.core.formula_builder.prim_gunu_formulu` karşılığı.
+
+    :param baslangic: Başlangıç tarihi hücresinin değeri.
+    :param bitis: Bitiş tarihi hücresinin değeri.
+    :returns: Prim günü; tarihlerden biri boşsa ``""``.
+    """
+    bas_dolu = _bos_degil(baslangic)
+    bit_dolu = _bos_degil(bitis)
+    if not (bas_dolu and bit_dolu):
+        return ""
+
+    d = _tarih(baslangic)
+    e = _tarih(bitis)
+    d_ay = d.year * 12 + d.month
+    e_ay = e.year * 12 + e.month
+    bitis_ay_sonu = e.day == _ay_sonu(e)
+    if d_ay == e_ay:
+        return 30 - d.day + 1 if bitis_ay_sonu else e.day - d.day + 1
+
+    bas_katki = 30 if d.day == 1 else _ay_sonu(d) - d.day + 1
+    bit_katki = 30 if bitis_ay_sonu else e.day
+    return bas_katki + max(0, e_ay - d_ay - 1) * 30 + bit_katki
+
+
+def alanda_prim_hesapla(alaninda: object, prim_gunu: object) -> object:
+    """:func:`~src.core.formula_builder.alanda_prim_formulu` karşılığı."""
+    if _metne_esit(alaninda, "E"):
+        return _bilinen(prim_gunu)
+    return ""
+
+
+def toplam_prim_hesapla(prim_gunleri: Iterable[object]) -> float:
+    """:func:`~src.core.formula_builder.toplam_prim_formulu` karşılığı."""
+    return _topla(prim_gunleri)
+
+
+def toplam_alanda_prim_hesapla(
+    alanda_prim_gunleri: Iterable[object], eksik_gunler: Iterable[object]
+) -> float:
+    """:func:`~src.core.formula_builder.toplam_alanda_prim_formulu` karşılığı."""
+    return _topla(alanda_prim_gunleri) - _topla(eksik_gunler)
+
+
+def tecrube_360_yil_hesapla(toplam_gun: object) -> int | str:
+    """:func:`~src.core.formula_builder.tecrube_360_yil_formulu` karşılığı."""
+    toplam = _sayi(toplam_gun)
+    if toplam == 0:
+        return ""
+    return math.floor(toplam / GUN_PER_YIL)
+
+
+def tecrube_360_ay_hesapla(toplam_gun: object) -> int | str:
+    """:func:`~src.core.formula_builder.tecrube_360_ay_formulu` karşılığı."""
+    toplam = _sayi(toplam_gun)
+    if toplam == 0:
+        return ""
+    return math.floor(_excel_mod(toplam, 360) / 30)
+
+
+def tecrube_360_gun_hesapla(toplam_gun: object) -> float | str:
+    """:func:`~src.core.formula_builder.tecrube_360_gun_formulu` karşılığı."""
+    toplam = _sayi(toplam_gun)
+    if toplam == 0:
+        return ""
+    return _excel_mod(toplam, 30)
+
+
+def en_yuksek_ogrenim_hesapla(
+    ogrenimler: Iterable[tuple[object, object, object]],
+) -> str:
+    """:func:`~src.core.formula_builder.en_yuksek_ogrenim_formulu` karşılığı.
+
+    :param ogrenimler: Her öğrenim satırı için ``(ad, okul, alanında)``.
+    :returns: Alanında okunan en yüksek öğrenimin adı ya da ``""``.
+    """
+    satirlar = list(ogrenimler)
+    for seviye in (OGRENIM_DOKTORA, *reversed(_OGRENIM_SIRASI)):
+        # OR/AND tüm argümanlarını değerlendirir; kısa devre yapılmaz.
+        kosullar = [
+            all(
+                [
+                    _metne_esit(ad, seviye),
+                    _bos_degil(okul),
+                    _metne_esit(alaninda, "E"),
+                ]
+            )
+            for ad, okul, alaninda in satirlar
+        ]
+        if any(kosullar):
+            return seviye
+    return ""
+
+
+def hizmet_grubu_hesapla(tecrube_yili: object, hizmet_grubu_turu: object) -> str:
+    """:func:`~src.core.formula_builder.hizmet_grubu_formulu` karşılığı."""
+    turu_gecerli = [
+        _metne_esit(hizmet_grubu_turu, "A"),
+        _metne_esit(hizmet_grubu_turu, "AG"),
+    ]
+    if not any(turu_gecerli):
+        return ""
+    derece = HIZMET_GRUBU_VARSAYILAN_DERECE
+    for esik, esik_derecesi in HIZMET_GRUBU_ESIKLERI:
+        if _buyuk_esit(tecrube_yili, esik):
+            derece = esik_derecesi
+            break
+    return f"{_metin(hizmet_grubu_turu)}-{derece}"
+
+
+def unvan_hesapla(tecrube_yili: object, hizmet_grubu_turu: object) -> str:
+    """:func:`~src.core.formula_builder.unvan_formulu` karşılığı."""
+    for esik, unvan in UNVAN_ESIKLERI:
+        if _buyuk_esit(tecrube_yili, esik):
+            if _metne_esit(hizmet_grubu_turu, "AG"):
+                return f"{unvan}{UNVAN_AG_EKI}"
+            return unvan
+    if _metne_esit(hizmet_grubu_turu, "AG"):
+        return UNVAN_AG_VARSAYILAN
+    return UNVAN_A_VARSAYILAN
+
+
+def _tablo_degeri(
+    tecrube_yili: object,
+    ogrenim: object,
+    tablo: tuple[tuple[int, tuple[object, object, object, object]], ...],
+) -> object:
+    """Eşik zincirinde ilk tutan satırdan öğrenime göre değeri seçer."""
+    *esikli, (_, degerler) = tablo
+    for esik, esik_degerleri in esikli:
+        if _buyuk_esit(tecrube_yili, esik):
+            degerler = esik_degerleri
+            break
+    for sira, seviye in enumerate(_OGRENIM_SIRASI):
+        if _metne_esit(ogrenim, seviye):
+            return degerler[sira]
+    return degerler[-1]
+
+
+def kademe_hesapla(tecrube_yili: object, ogrenim: object) -> str:
+    """:func:`~src.core.formula_builder.kademe_formulu` karşılığı."""
+    return _tablo_degeri(tecrube_yili, ogrenim, KADEME_TABLOSU)
+
+
+def derece_kademe_hesapla(hizmet_grubu: object, kademe: object) -> str:
+    """``=IF(Z3="", Z2, Z2 & "/" & Z3)`` karşılığı."""
+    if _metne_esit(kademe, ""):
+        return _metin(hizmet_grubu)
+    return f"{_metin(hizmet_grubu)}/{_metin(kademe)}"
+
+
+def brut_ucret_hesapla(
+    derece_kademe: object,
+    ucret_tablosu: Mapping[str, float] = BRUT_UCRET_HARITASI,
+) -> float | str:
+    """:func:`~src.core.formula_builder.brut_ucret_formulu` karşılığı.
+
+    ``VLOOKUP(...,FALSE)`` büyük/küçük harf duyarsız ilk eşleşmeyi döndürür;
+    eşleşme yoksa ``IFERROR`` boş metin verir.
+    """
+    if not ucret_tablosu:
+        return ""
+    anahtar = _bilinen(derece_kademe)
+    if not isinstance(anahtar, str) or not anahtar:
+        return ""
+    if any(karakter in anahtar for karakter in "*?~"):
+        raise HesaplanamazHatasi("VLOOKUP joker karakterleri desteklenmiyor.")
+    for tablo_anahtari, deger in ucret_tablosu.items():
+        if _metne_esit(anahtar, tablo_anahtari):
+            return deger
+    return ""
+
+
+def _kademe_araligi_hesapla(
+    tecrube_yili: object,
+    ogrenim: object,
+    derece_kademe: object,
+    tablo: tuple[tuple[int, tuple[int, int, int, int]], ...],
+) -> int | str:
+    """Kademe başlangıç/bitiş formüllerinin ortak ön ek mantığı."""
+    if _metne_esit(derece_kademe, ""):
+        return _tablo_degeri(tecrube_yili, ogrenim, tablo)
+
+    metin = _metin(derece_kademe)
+    konum = metin.find("/")
+    on_ek = metin[: konum + 1] if konum >= 0 else ""
+    return f"{on_ek}{_tablo_degeri(tecrube_yili, ogrenim, tablo)}"
+
+
+def kademe_baslangic_hesapla(
+    tecrube_yili: object, ogrenim: object, derece_kademe: object = None
+) -> int | str:
+    """:func:`~src.core.formula_builder.kademe_baslangic_formulu` karşılığı.
+
+    :param derece_kademe: Derece/kademe hücresinin değeri; ``None`` ise
+        formülün hücresiz biçimi (yalnızca sayısal kademe) hesaplanır.
+    """
+    return _kademe_araligi_hesapla(
+        tecrube_yili, ogrenim, derece_kademe, KADEME_BASLANGIC_TABLOSU
+    )
+
+
+def kademe_bitis_hesapla(
+    tecrube_yili: object, ogrenim: object, derece_kademe: object = None
+) -> int | str:
+    """:func:`~src.core.formula_builder.kademe_bitis_formulu` karşılığı."""
+    return _kademe_araligi_hesapla(
+        tecrube_yili, ogrenim, derece_kademe, KADEME_BITIS_TABLOSU
+    )
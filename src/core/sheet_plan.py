@@ -0,0 +1,96 @@
+"""
+Derlenmiş sayfa planı.
+
+Bir yazma stratejisinin her personel için birebir aynı tekrarladığı işleri
+(formül metinleri, sabit değerler, stil kopyaları, sayı biçimleri, sütun
+boyutları ve veri doğrulamaları) tek seferde üretilmiş değişmez bir listede
+toplar. Plan her sayfaya uygulanırken yalnızca personele özel birkaç hücre
+yazılır; formül metinleri ve tablolar yeniden oluşturulmaz.
+"""
+
+from __future__ import annotations
+
+from copy import copy
+from dataclasses import dataclass
+
+import openpyxl.worksheet.worksheet
+from openpyxl.worksheet.datavalidation import DataValidation
+
+from src.core.excel_reader import Personel
+
+
+@dataclass(frozen=True)
+class DogrulamaPlani:
+    """Sayfaya eklenecek tek bir açılır liste doğrulamasını tanımlar."""
+
+    formul: str
+    hucreler: tuple[str, ...]
+    bos_birakilabilir: bool = True
+
+
+@dataclass(frozen=True)
+class SayfaPlani:
+    """Bir şablon düzeni için derlenmiş, değişmez sayfa doldurma planı.
+
+    Adımlar :meth:`uygula` içinde şu sırayla uygulanır: personel hücreleri,
+    sabit değerler, stil kopyaları, sayı biçimleri, sütun boyutları ve
+    veri doğrulamaları. Stil kopyalarının kaynak hücreleri plan tarafından
+    yazılmadığından bu sıra, adımların tek tek yürütülmesiyle aynı sonucu
+    verir.
+
+    :param personel_hucreleri: ``(hücre, Personel alan adı)`` çiftleri.
+    :param degerler: ``(hücre, değer)`` çiftleri; formüller ``=`` ile başlar.
+    :param stil_kopyalari: ``(kaynak hücre, hedef hücre)`` çiftleri.
+    :param sayi_bicimleri: ``(hücre, sayı biçimi)`` çiftleri.
+    :param sutun_genislikleri: ``(sütun harfi, genişlik)`` çiftleri.
+    :param gizli_sutunlar: Gizlenecek sütun harfleri.
+    :param kaldirilan_dogrulamalar: Şablondan silinecek doğrulamaların
+        ``sqref`` değerleri.
+    :param dogrulamalar: Eklenecek doğrulamalar.
+    """
+
+    personel_hucreleri: tuple[tuple[str, str], ...] = ()
+    degerler: tuple[tuple[str, object], ...] = ()
+    stil_kopyalari: tuple[tuple[str, str], ...] = ()
+    sayi_bicimleri: tuple[tuple[str, str], ...] = ()
+    sutun_genislikleri: tuple[tuple[str, float], ...] = ()
+    gizli_sutunlar: tuple[str, ...] = ()
+    kaldirilan_dogrulamalar: tuple[str, ...] = ()
+    dogrulamalar: tuple[DogrulamaPlani, ...] = ()
+
+    def uygula(
+        self, ws: openpyxl.worksheet.worksheet.Worksheet, personel: Personel
+    ) -> None:
+        """Planı şablondan kopyalanmış sayfaya uygular.
+
+        :param ws: Şablon içeriği kopyalanmış çalışma sayfası.
+        :param personel: Kişiye özel hücrelere yazılacak personel.
+        """
+        for hucre, alan in self.personel_hucreleri:
+            ws[hucre].value = getattr(personel, alan)
+        for hucre, deger in self.degerler:
+            ws[hucre].value = deger
+        for kaynak, hedef in self.stil_kopyalari:
+            ws[hedef]._style = copy(ws[kaynak]._style)
+        for hucre, bicim in self.sayi_bicimleri:
+            ws[hucre].number_format = bicim
+        for sutun, genislik in self.sutun_genislikleri:
+            ws.column_dimensions[sutun].width = genislik
+        for sutun in self.gizli_sutunlar:
+            ws.column_dimensions[sutun].hidden = True
+
+        if self.kaldirilan_dogrulamalar:
+            ws.data_validations.dataValidation = [
+                dv
+                for dv in ws.data_validations.dataValidation
+                if str(dv.sqref) not in self.kaldirilan_dogrulamalar
+            ]
+        for dogrulama in self.dogrulamalar:
+            dv = DataValidation(
+                type="list",
+                formula1=dogrulama.formul,
+                allow_blank=dogrulama.bos_birakilabilir,
+            )
+            ws.add_data_validation(dv)
+            for hucre in dogrulama.hucreler:
+                dv.add(hucre)
@@ -0,0 +1,178 @@
+"""
+Mezuniyet aktarımı için hedef klasördeki workbook'ların sayfa adı önbelleği.
+
+Sayfa adları xlsx arşivindeki ``workbook.xml`` parçasından okunur; workbook
+openpyxl ile yüklenmez. Okunan adlar hedef klasördeki gizli bir JSON
+dosyasında, dosyanın boyutu ve değiştirilme zamanıyla birlikte saklanır.
+Dosya değişmedikçe sonraki aktarımlar arşivi yeniden açmaz.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import zipfile
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from xml.etree import ElementTree
+
+from src.config.constants import TARGET_INDEX_FILENAME
+
+_DIZIN_SURUMU = 1
+
+_VARSAYILAN_WORKBOOK_PARCASI = "xl/workbook.xml"
+_OFFICE_DOCUMENT_ILISKISI = (
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships/"
+    "officeDocument"
+)
+_PAKET_ILISKILERI_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+_SPREADSHEETML_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+
+
+@dataclass(frozen=True)
+class _DizinKaydi:
+    """Önbellekteki tek bir workbook'un sayfa adları ve disk durumu."""
+
+    sayfalar: list[str]
+    mtime_ns: int
+    boyut: int
+
+
+class HedefSayfaDizini:
+    """Hedef klasördeki workbook'ların sayfa adlarını önbellekli olarak sunar.
+
+    :param klasor: Hedef tutanak klasörü.
+    """
+
+    def __init__(self, klasor: Path) -> None:
+        self._klasor = Path(klasor)
+        self._kayitlar: dict[str, _DizinKaydi] = {}
+        self._kullanilanlar: set[str] = set()
+        self._degisti = False
+
+    @classmethod
+    def yukle(cls, klasor: str | Path) -> HedefSayfaDizini:
+        """Klasördeki önbelleği okur; yoksa ya da bozuksa boş başlar."""
+        dizin = cls(Path(klasor))
+        try:
+            veri = json.loads(dizin.yol.read_text(encoding="utf-8"))
+            if veri.get("surum") == _DIZIN_SURUMU:
+                dizin._kayitlar = {
+                    ad: _DizinKaydi(**kayit)
+                    for ad, kayit in veri.get("dosyalar", {}).items()
+                }
+        except (OSError, ValueError, TypeError, AttributeError):
+            dizin._kayitlar = {}
+        return dizin
+
+    @property
+    def yol(self) -> Path:
+        """Önbellek dosyasının yolu."""
+        return self._klasor / TARGET_INDEX_FILENAME
+
+    def sayfa_adlari(self, yol: Path) -> list[str] | None:
+        """Workbook'un sayfa adlarını döndürür.
+
+        Önbellekteki kayıt dosyanın boyutu ve değiştirilme zamanıyla
+        eşleşiyorsa arşiv açılmaz.
+
+        :returns: Sayfa adları; arşiv okunamazsa ``None``.
+        """
+        durum = yol.stat()
+        self._kullanilanlar.add(yol.name)
+        kayit = self._kayitlar.get(yol.name)
+        if (
+            kayit is not None
+            and kayit.mtime_ns == durum.st_mtime_ns
+            and kayit.boyut == durum.st_size
+        ):
+            return list(kayit.sayfalar)
+
+        sayfalar = workbook_sayfa_adlari(yol)
+        if sayfalar is None:
+            self._kayitlar.pop(yol.name, None)
+        else:
+            self._kayitlar[yol.name] = _DizinKaydi(
+                sayfalar, durum.st_mtime_ns, durum.st_size
+            )
+        self._degisti = True
+        return sayfalar
+
+    def dosyayi_yenile(self, yol: Path) -> None:
+        """Aktarımla yeniden kaydedilen dosyanın disk durumunu günceller.
+
+        Mezuniyet aktarımı sayfa adlarını değiştirmez; kayıt yeniden
+        okunmadan geçerli tutulur.
+        """
+        kayit = self._kayitlar.get(yol.name)
+        if kayit is None:
+            return
+        durum = yol.stat()
+        self._kayitlar[yol.name] = _DizinKaydi(
+            kayit.sayfalar, durum.st_mtime_ns, durum.st_size
+        )
+        self._degisti = True
+
+    def kaydet(self) -> None:
+        """Bu çalıştırmada sorgulanan dosyaların kayıtlarını atomik olarak yazar.
+
+        Klasörden silinmiş dosyaların kayıtları atılır. Yazılamayan önbellek
+        (ör. salt okunur klasör) aktarımı engellemez.
+        """
+        kayitlar = {
+            ad: kayit
+            for ad, kayit in self._kayitlar.items()
+            if ad in self._kullanilanlar
+        }
+        if not self._degisti and len(kayitlar) == len(self._kayitlar):
+            return
+        veri = {
+            "surum": _DIZIN_SURUMU,
+            "dosyalar": {ad: asdict(kayit) for ad, kayit in sorted(kayitlar.items())},
+        }
+        try:
+            tanimlayici, gecici_yol = tempfile.mkstemp(
+                dir=self._klasor, prefix=f"{TARGET_INDEX_FILENAME}-", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(tanimlayici, "w", encoding="utf-8") as dosya:
+                    json.dump(veri, dosya, ensure_ascii=False, indent=1)
+                os.replace(gecici_yol, self.yol)
+            except BaseException:
+                Path(gecici_yol).unlink(missing_ok=True)
+                raise
+        except OSError:
+            return
+        self._kayitlar = kayitlar
+        self._degisti = False
+
+
+def workbook_sayfa_adlari(yol: str | Path) -> list[str] | None:
+    """xlsx arşivindeki ``workbook.xml`` parçasından sayfa adlarını okur.
+
+    :returns: Workbook'taki sırasıyla sayfa adları; dosya geçerli bir xlsx
+        arşivi değilse ``None``.
+    """
+    try:
+        with zipfile.ZipFile(yol) as arsiv:
+            with arsiv.open(_workbook_parcasi(arsiv)) as parca:
+                return [
+                    eleman.get("name", "")
+                    for _, eleman in ElementTree.iterparse(parca)
+                    if eleman.tag == f"{_SPREADSHEETML_NS}sheet"
+                ]
+    except (OSError, KeyError, zipfile.BadZipFile, ElementTree.ParseError):
+        return None
+
+
+def _workbook_parcasi(arsiv: zipfile.ZipFile) -> str:
+    """Paket ilişkilerinden ana workbook parçasının arşiv içi yolunu bulur."""
+    try:
+        iliskiler = ElementTree.fromstring(arsiv.read("_rels/.rels"))
+    except (KeyError, ElementTree.ParseError):
+        return _VARSAYILAN_WORKBOOK_PARCASI
+    for iliski in iliskiler.iter(f"{_PAKET_ILISKILERI_NS}Relationship"):
+        if iliski.get("Type") == _OFFICE_DOCUMENT_ILISKISI:
+            return iliski.get("Target", "").lstrip("/")
+    return _VARSAYILAN_WORKBOOK_PARCASI
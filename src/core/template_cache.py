@@ -0,0 +1,109 @@
+"""
+Çıktı şablonu için bellek içi önbellek.
+
+Şablon xlsx dosyası openpyxl ile bir kez ayrıştırılır ve çözümlenmiş yol,
+değiştirilme zamanı ve boyut anahtarıyla saklanır. Dosya diskte
+değişmedikçe sonraki çağrılar aynı ayrıştırılmış şablon sayfasını
+(hücreler, stiller, boyutlar, birleşik hücreler ve yazdırma ayarları)
+yeniden kullanır.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+import openpyxl
+import openpyxl.worksheet.worksheet
+from openpyxl import Workbook
+
+from src.config.constants import TEMPLATE_PATH
+from src.core.zamanlama import asama
+
+
+@dataclass(frozen=True)
+class _SablonKaydi:
+    """Önbellekteki tek bir şablonun anahtarını ve workbook'unu taşır."""
+
+    mtime_ns: int
+    boyut: int
+    workbook: Workbook
+
+
+class SablonOnbellegi:
+    """Şablon workbook'larını yol/mtime/boyut anahtarıyla bellekte tutar.
+
+    Uzun ömürlü bir nesnede (ör. ``TutanakService``) saklandığında ardışık
+    çalıştırmalar şablonu diskten yeniden ayrıştırmaz. Şablon dosyası
+    değişirse (mtime veya boyut farklıysa) kayıt otomatik yenilenir.
+    """
+
+    def __init__(self) -> None:
+        self._kayitlar: dict[Path, _SablonKaydi] = {}
+        self._kilit = threading.Lock()
+
+    def sablon_sayfasi(
+        self, template_path: str | Path | None = None
+    ) -> openpyxl.worksheet.worksheet.Worksheet:
+        """Şablonun aktif sayfasını döndürür; gerekirse dosyayı ayrıştırır.
+
+        :param template_path: Şablon yolu; ``None`` ise varsayılan şablon.
+        :returns: Salt okunur kabul edilmesi gereken şablon sayfası.
+        :raises FileNotFoundError: Şablon dosyası yoksa.
+        :raises ValueError: Şablonda hiç sayfa yoksa.
+        """
+        return self.sablon_workbooku(template_path).active
+
+    def sablon_workbooku(self, template_path: str | Path | None = None) -> Workbook:
+        """Şablon workbook'unu önbellekten ya da diskten döndürür."""
+        yol = _template_yolunu_coz(template_path).resolve()
+        durum = yol.stat()
+
+        with self._kilit:
+            kayit = self._kayitlar.get(yol)
+            if (
+                kayit is not None
+                and kayit.mtime_ns == durum.st_mtime_ns
+                and kayit.boyut == durum.st_size
+            ):
+                return kayit.workbook
+
+            with asama("sablon.yukle"):
+                workbook = openpyxl.load_workbook(yol)
+            if not workbook.sheetnames:
+                workbook.close()
+                raise ValueError("Şablon workbook içinde hiç sayfa yok.")
+
+            if kayit is not None:
+                kayit.workbook.close()
+            self._kayitlar[yol] = _SablonKaydi(
+                mtime_ns=durum.st_mtime_ns,
+                boyut=durum.st_size,
+                workbook=workbook,
+            )
+            return workbook
+
+    def temizle(self) -> None:
+        """Önbellekteki tüm şablonları kapatır ve bırakır."""
+        with self._kilit:
+            for kayit in self._kayitlar.values():
+                kayit.workbook.close()
+            self._kayitlar.clear()
+
+    def __len__(self) -> int:
+        return len(self._kayitlar)
+
+
+def _template_yolunu_coz(template_path: str | Path | None = None) -> Path:
+    """Şablon dosya yolunu çözümler ve dosyanın varlığını doğrular."""
+    if template_path is None:
+        project_root = Path(__file__).resolve().parent.parent.parent
+        t_path = project_root / TEMPLATE_PATH
+    else:
+        t_path = Path(template_path)
+
+    if not t_path.exists():
+        raise FileNotFoundError(f"Excel şablonu bulunamadı: {t_path}")
+
+    return t_path
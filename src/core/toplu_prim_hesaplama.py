@@ -0,0 +1,234 @@
+"""
+Toplu prim günü ve 360 günlük tecrübe hesaplaması.
+
+:mod:`src.core.formula_builder` içindeki prim günü (K sütunu), alanında prim
+(L sütunu), toplam (K28/L28) ve yıl/ay/gün (J29/K29/L29) formüllerinin
+NumPy ile vektörleştirilmiş karşılıklarını içerir. Girdiler
+``(personel sayısı, tecrübe satırı sayısı)`` boyutlu dizilerdir; tüm kadro
+Excel dosyası açılmadan birkaç dizi işlemiyle yeniden hesaplanabilir.
+
+Tek bir hücrenin Excel kurallarıyla birebir hesabı için
+:mod:`src.core.formula_evaluator` kullanılır; buradaki fonksiyonlar aynı
+kuralları toplu olarak uygular. Boş hücreler sonuç dizilerinde ``0`` olarak
+tutulur; hangi satırların dolu olduğu ayrıca döndürülür.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from src.config.constants import (
+    GUN_PER_YIL,
+    TECRUBE_BASLANGIC_SATIR,
+    TECRUBE_BITIS_SATIR,
+)
+
+#: Şablondaki tecrübe satırı sayısı (13..27).
+TECRUBE_SATIR_SAYISI: int = TECRUBE_BITIS_SATIR - TECRUBE_BASLANGIC_SATIR + 1
+
+#: Artık olmayan yıllarda ayların gün sayıları.
+_AY_UZUNLUKLARI = np.array([31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])
+
+
+@dataclass(frozen=True)
+class TopluPrimSonucu:
+    """Bir kadro için toplu prim hesabının sonuçları.
+
+    İki boyutlu diziler ``(personel, satır)``, tek boyutlu diziler
+    ``(personel,)`` boyutludur.
+
+    :param prim_gunleri: Satır bazında prim günü (K13..K27); boş satırlarda 0.
+    :param alanda_prim_gunleri: Alanında sayılan prim günü (L13..L27).
+    :param dolu: Başlangıç ve bitiş tarihi dolu olan satırlar.
+    :param toplam_prim: Toplam prim günü (K28).
+    :param toplam_alanda_prim: Eksik günler düşülmüş alanında toplam (L28).
+    :param yil: 360 günlük yıl (J29).
+    :param ay: 360 günlük ay (K29).
+    :param gun: 360 günlük gün (L29).
+    """
+
+    prim_gunleri: np.ndarray
+    alanda_prim_gunleri: np.ndarray
+    dolu: np.ndarray
+    toplam_prim: np.ndarray
+    toplam_alanda_prim: np.ndarray
+    yil: np.ndarray
+    ay: np.ndarray
+    gun: np.ndarray
+
+
+def tarih_dizisi(degerler: object) -> np.ndarray:
+    """Tarih değerlerini ``datetime64[D]`` dizisine çevirir.
+
+    ``date``, ``datetime``, ``pandas.Timestamp`` ve ISO metinleri kabul
+    edilir; ``None`` ve ``NaT`` boş hücre olarak ``NaT`` olur. Saat kısmı
+    Excel'in ``DAY``/``MONTH``/``YEAR`` fonksiyonlarında olduğu gibi atılır.
+
+    :param degerler: İç içe liste ya da dizi.
+    :returns: Aynı boyutlu ``datetime64[D]`` dizisi.
+    """
+    dizi = np.asarray(degerler)
+    if dizi.dtype.kind == "M":
+        return dizi.astype("datetime64[D]")
+    try:
+        # pandas nesne dizilerini NumPy'nin eleman eleman dönüşümünden
+        # çok daha hızlı çevirir.
+        tarihler = pd.to_datetime(dizi.ravel()).to_numpy()
+    except (TypeError, ValueError, OverflowError):
+        # Örneğin nanosaniye aralığı dışındaki (2262 sonrası) tarihler
+        return np.asarray(dizi, dtype="datetime64[D]")
+    return tarihler.astype("datetime64[D]").reshape(dizi.shape)
+
+
+def _dolu_tarihler(
+    baslangic: object, bitis: object
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Tarih dizilerini ve iki ucu da dolu satırların maskesini döndürür.
+
+    Boş satırlardaki ``NaT`` değerleri hesaplara karışmasın diye sabit bir
+    tarihle değiştirilir; bu satırların sonucu maske ile sıfırlanır.
+    """
+    d = tarih_dizisi(baslangic)
+    e = tarih_dizisi(bitis)
+    if d.shape != e.shape:
+        raise ValueError(
+            f"Başlangıç ve bitiş dizileri aynı boyutta olmalı: {d.shape} != {e.shape}"
+        )
+    dolu = ~(np.isnat(d) | np.isnat(e))
+    yer_tutucu = np.datetime64("2000-01-01")
+    return np.where(dolu, d, yer_tutucu), np.where(dolu, e, yer_tutucu), dolu
+
+
+def _tarih_parcalari(
+    tarihler: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Ay numarası (``YEAR*12+MONTH``), gün ve ay sonu gününü döndürür.
+
+    ``datetime64[M]`` dönüşümleri yerine gün sayısından miladi takvim
+    tarihini veren tamsayı aritmetiği kullanılır (1970-01-01 = 0. gün).
+    """
+    z = tarihler.astype("datetime64[D]").view(np.int64) + 719_468
+    dort_yuzyil = np.floor_divide(z, 146_097)
+    doe = z - dort_yuzyil * 146_097
+    yoe = (doe - doe // 1_460 + doe // 36_524 - doe // 146_096) // 365
+    doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+    mp = (5 * doy + 2) // 153
+    gun = doy - (153 * mp + 2) // 5 + 1
+    ay = np.where(mp < 10, mp + 3, mp - 9)
+    yil = yoe + dort_yuzyil * 400 + (ay <= 2)
+
+    artik = (yil % 4 == 0) & ((yil % 100 != 0) | (yil % 400 == 0))
+    ay_sonu = _AY_UZUNLUKLARI[ay - 1] + (artik & (ay == 2))
+    return yil * 12 + ay, gun, ay_sonu
+
+
+def _alaninda_maskesi(alaninda: object) -> np.ndarray:
+    """``J="E"`` karşılaştırmasını (büyük/küçük harf duyarsız) uygular."""
+    dizi = np.asarray(alaninda)
+    if dizi.dtype == np.bool_:
+        return dizi
+    # Büyük harfi "E" olan tek karakterler "E" ve "e"dir.
+    return (dizi == "E") | (dizi == "e")
+
+
+def prim_gunleri_hesapla(baslangic: object, bitis: object) -> np.ndarray:
+    """:func:`~src.core.formula_builder.prim_gunu_formulu` karşılığı.
+
+    :param baslangic: Başlangıç tarihleri (``datetime64`` ya da
+        :func:`tarih_dizisi` ile çevrilebilir değerler).
+    :param bitis: Bitiş tarihleri; ``baslangic`` ile aynı boyutta.
+    :returns: Prim günleri; tarihlerden biri boş olan satırlarda 0.
+    """
+    d, e, dolu = _dolu_tarihler(baslangic, bitis)
+
+    d_ay, d_gun, d_ay_sonu = _tarih_parcalari(d)
+    e_ay, e_gun, e_ay_sonu = _tarih_parcalari(e)
+    bitis_ay_sonu = e_gun == e_ay_sonu
+
+    ayni_ay = np.where(bitis_ay_sonu, 30 - d_gun + 1, e_gun - d_gun + 1)
+    bas_katki = np.where(d_gun == 1, 30, d_ay_sonu - d_gun + 1)
+    bit_katki = np.where(bitis_ay_sonu, 30, e_gun)
+    farkli_ay = bas_katki + np.maximum(0, e_ay - d_ay - 1) * 30 + bit_katki
+
+    gunler = np.where(d_ay == e_ay, ayni_ay, farkli_ay)
+    return np.where(dolu, gunler, 0)
+
+
+def days360_hesapla(baslangic: object, bitis: object) -> np.ndarray:
+    """Excel ``DAYS360(baslangic, bitis, FALSE)`` (ABD yöntemi) karşılığı.
+
+    Başlangıç ayın son günüyse 30 kabul edilir; bitiş 31 ve başlangıç
+    30 ise bitiş de 30 kabul edilir. Boş tarihli satırlarda sonuç 0'dır.
+
+    :param baslangic: Başlangıç tarihleri.
+    :param bitis: Bitiş tarihleri; ``baslangic`` ile aynı boyutta.
+    :returns: 360 günlük takvime göre gün farkları.
+    """
+    d, e, dolu = _dolu_tarihler(baslangic, bitis)
+
+    d_ay, d_gun, d_ay_sonu = _tarih_parcalari(d)
+    e_ay, e_gun, _ = _tarih_parcalari(e)
+    d_gun = np.where(d_gun == d_ay_sonu, 30, d_gun)
+    e_gun = np.where((e_gun == 31) & (d_gun == 30), 30, e_gun)
+
+    gunler = (e_ay - d_ay) * 30 + (e_gun - d_gun)
+    return np.where(dolu, gunler, 0)
+
+
+def toplu_prim_hesapla(
+    baslangic: object,
+    bitis: object,
+    alaninda: object,
+    eksik_gunler: object | None = None,
+) -> TopluPrimSonucu:
+    """Tüm kadro için prim günlerini, toplamları ve 360 günlük tecrübeyi hesaplar.
+
+    Tek personelin sayfası için sonuçlar K13..K27, L13..L27, K28, L28 ve
+    J29..L29 hücrelerindeki formüllerle aynıdır (J29..L29 toplam sıfırken
+    Excel'de boş metin, burada 0'dır).
+
+    :param baslangic: ``(personel, satır)`` boyutlu başlangıç tarihleri.
+    :param bitis: Aynı boyutta bitiş tarihleri.
+    :param alaninda: Aynı boyutta ``"E"``/``"H"`` değerleri ya da mantıksal dizi.
+    :param eksik_gunler: Aynı boyutta eksik gün sayıları (M sütunu);
+        verilmezse sıfır kabul edilir. ``NaN`` değerleri boş hücre sayılır.
+    :returns: Hesaplama sonuçları.
+    :raises ValueError: Dizi boyutları uyuşmuyorsa.
+    """
+    d, e, dolu = _dolu_tarihler(baslangic, bitis)
+    alan = _alaninda_maskesi(alaninda)
+    if d.ndim != 2 or alan.shape != d.shape:
+        raise ValueError(
+            "Girdiler (personel, satır) boyutlu ve aynı boyutta olmalı: "
+            f"{d.shape}, {alan.shape}"
+        )
+
+    prim = np.where(dolu, prim_gunleri_hesapla(d, e), 0)
+    alanda = np.where(alan, prim, 0)
+
+    toplam_prim = prim.sum(axis=1)
+    toplam_alanda = alanda.sum(axis=1)
+    if eksik_gunler is not None:
+        eksik = np.asarray(eksik_gunler, dtype=float)
+        if eksik.shape != d.shape:
+            raise ValueError(
+                f"Eksik gün dizisi {d.shape} boyutunda olmalı: {eksik.shape}"
+            )
+        eksik_toplam = np.nansum(eksik, axis=1)
+        if np.all(eksik_toplam == np.round(eksik_toplam)):
+            eksik_toplam = eksik_toplam.astype(np.int64)
+        toplam_alanda = toplam_alanda - eksik_toplam
+
+    return TopluPrimSonucu(
+        prim_gunleri=prim,
+        alanda_prim_gunleri=alanda,
+        dolu=dolu,
+        toplam_prim=toplam_prim,
+        toplam_alanda_prim=toplam_alanda,
+        yil=np.floor_divide(toplam_alanda, GUN_PER_YIL),
+        ay=np.floor_divide(np.mod(toplam_alanda, 360), 30),
+        gun=np.mod(toplam_alanda, 30),
+    )
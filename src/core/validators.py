@@ -7,6 +7,26 @@ doğrulanması için kullanılan fonksiyonları içerir.
 
 from __future__ import annotations
 
+from enum import IntEnum
+from typing import Iterable
+
+import numpy as np
+
+
+class TcknRedNedeni(IntEnum):
+    """Toplu TCKN doğrulamasında eleman başına döndürülen neden kodu.
+
+    Kodlar :func:`validate_tckn` içindeki kontrol sırasını izler; bir aday
+    birden fazla kuralı ihlal ediyorsa ilk ihlal edilen kural döner.
+    """
+
+    GECERLI = 0
+    UZUNLUK = 1
+    RAKAM_DISI = 2
+    ILK_HANE_SIFIR = 3
+    ONUNCU_HANE = 4
+    ON_BIRINCI_HANE = 5
+
 
 def validate_tckn(tckn: str) -> bool:
     """
@@ -73,3 +93,101 @@ def normalize_tckn(tckn: object) -> str:
     if isinstance(tckn, float):
         tckn = int(tckn)
     return str(tckn).strip().zfill(11)
+
+
+def normalize_tckn_batch(values: Iterable[object]) -> np.ndarray:
+    """
+    :func:`normalize_tckn` işlemini bir dizi değere uygular.
+
+    Tamsayı ve ondalık NumPy dizileri doğrudan metne çevrilir; diğer
+    girdiler (ör. Excel'den gelen karışık ``object`` sütunları) eleman
+    bazında normalize edilir.
+
+    :param values: Dönüştürülecek TCKN değerleri.
+    :returns: Normalize edilmiş TCKN'leri içeren tek boyutlu ``object`` dizisi.
+    """
+    if isinstance(values, np.ndarray) and values.dtype.kind in "iuf":
+        tamsayilar = values.ravel().astype(np.int64)
+        return np.char.zfill(tamsayilar.astype(str), 11).astype(object)
+    return np.array(
+        [normalize_tckn(value) for value in np.asarray(values, dtype=object).ravel()],
+        dtype=object,
+    )
+
+
+def validate_tckn_batch(values: Iterable[object]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    :func:`validate_tckn` işlemini bir dizi değere tek seferde uygular.
+
+    11 karakterlik adaylar ``(N, 11)`` boyutlu bir rakam matrisine çevrilir;
+    uzunluk, ilk hane ve iki kontrol hanesi kuralları bu matris üzerinde
+    vektörel olarak uygulanır. ``str.isdigit`` ile rakam sayılan ASCII dışı
+    karakterler içeren (nadir) adaylar tekil yoldan doğrulanır; sonuç her
+    eleman için :func:`validate_tckn` ile aynıdır.
+
+    :param values: Doğrulanacak TCKN değerleri.
+    :returns: ``(geçerlilik maskesi, neden kodları)``; neden kodları
+        :class:`TcknRedNedeni` değerleridir (``uint8``).
+    """
+    metinler = [
+        (value if isinstance(value, str) else str(value)).strip()
+        for value in np.asarray(values, dtype=object).ravel()
+    ]
+    nedenler = np.full(len(metinler), TcknRedNedeni.UZUNLUK, dtype=np.uint8)
+    uzunluklar = np.fromiter(map(len, metinler), dtype=np.int64, count=len(metinler))
+    aday = np.flatnonzero(uzunluklar == 11)
+
+    if aday.size:
+        # Her karakterin kod noktası: (N, 11) matris.
+        kodlar = (
+            np.array([metinler[index] for index in aday], dtype="<U11")
+            .view(np.uint32)
+            .reshape(-1, 11)
+        )
+        ascii_rakam = (kodlar >= ord("0")) & (kodlar <= ord("9"))
+        tamami_ascii_rakam = ascii_rakam.all(axis=1)
+        haneler = np.where(ascii_rakam, kodlar - ord("0"), 0).astype(np.uint8)
+
+        tek = haneler[:, 0:9:2].sum(axis=1, dtype=np.int64)
+        cift = haneler[:, 1:8:2].sum(axis=1, dtype=np.int64)
+        onuncu_dogru = (tek * 7 - cift) % 10 == haneler[:, 9]
+        on_birinci_dogru = haneler[:, :10].sum(axis=1, dtype=np.int64) % 10 == (
+            haneler[:, 10]
+        )
+
+        aday_nedenleri = np.select(
+            [
+                ~tamami_ascii_rakam,
+                haneler[:, 0] == 0,
+                ~onuncu_dogru,
+                ~on_birinci_dogru,
+            ],
+            [
+                TcknRedNedeni.RAKAM_DISI,
+                TcknRedNedeni.ILK_HANE_SIFIR,
+                TcknRedNedeni.ONUNCU_HANE,
+                TcknRedNedeni.ON_BIRINCI_HANE,
+            ],
+            default=TcknRedNedeni.GECERLI,
+        ).astype(np.uint8)
+
+        ascii_disi = np.flatnonzero((kodlar > 127).any(axis=1))
+        for sira in ascii_disi:
+            aday_nedenleri[sira] = _tckn_red_nedeni(metinler[aday[sira]])
+        nedenler[aday] = aday_nedenleri
+
+    return nedenler == TcknRedNedeni.GECERLI, nedenler
+
+
+def _tckn_red_nedeni(tckn: str) -> TcknRedNedeni:
+    """Kırpılmış 11 karakterlik aday için :func:`validate_tckn` ile aynı kararı verir."""
+    if not tckn.isdigit():
+        return TcknRedNedeni.RAKAM_DISI
+    if tckn[0] == "0":
+        return TcknRedNedeni.ILK_HANE_SIFIR
+    digits = [int(d) for d in tckn]
+    if (sum(digits[0:9:2]) * 7 - sum(digits[1:8:2])) % 10 != digits[9]:
+        return TcknRedNedeni.ONUNCU_HANE
+    if sum(digits[:10]) % 10 != digits[10]:
+        return TcknRedNedeni.ON_BIRINCI_HANE
+    return TcknRedNedeni.GECERLI
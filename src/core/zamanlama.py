@@ -0,0 +1,196 @@
+"""
+Aşama bazlı süre ölçümü.
+
+Ölçülecek kod bölümleri ``with asama("ad"):`` ile işaretlenir. Etkin bir
+:class:`Zamanlayici` yoksa :func:`asama` paylaşılan, hiçbir şey yapmayan bir
+bağlam yöneticisi döndürür; ölçüm kapalıyken maliyet tek bir global okumadır.
+
+Zamanlayıcı :func:`zamanlama_olc` ile etkinleştirilir. Etkin zamanlayıcı
+süreç genelindedir; boru hattı gibi yardımcı iş parçacıklarındaki aşamalar
+da aynı zamanlayıcıya kaydedilir. İç içe ölçümlerde iç zamanlayıcının
+kayıtları dıştakine de iletilir.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Iterable, Iterator
+
+#: Bir aşama kaydı: ``(ad, başlangıç zamanı (epoch sn), süre (sn))``.
+AsamaKaydi = tuple[str, float, float]
+
+_BOS_ASAMA = nullcontext()
+_aktif: Zamanlayici | None = None
+
+
+@dataclass(frozen=True)
+class AsamaOzeti:
+    """Bir aşamanın toplanmış süre bilgisi.
+
+    :param ad: Aşama adı (ör. ``"yazici.kaydet"``).
+    :param adet: Aşamanın kaç kez çalıştığı.
+    :param toplam_sn: Toplam süre.
+    :param p95_sn: Tek çalıştırma sürelerinin 95. yüzdeliği.
+    """
+
+    ad: str
+    adet: int
+    toplam_sn: float
+    p95_sn: float
+
+    @property
+    def log_metni(self) -> str:
+        """GUI özetinde gösterilecek kısa metin."""
+        return f"{self.ad} {self.toplam_sn:.2f} sn ({self.adet}×)"
+
+
+class Zamanlayici:
+    """Aşama sürelerini toplar; istenirse her kaydı JSONL dosyasına yazar.
+
+    :param iz_dosyasi: Verilirse her aşama kaydı bu dosyaya bir JSON satırı
+        olarak eklenir.
+    :param ust: Kayıtların ayrıca iletileceği dış zamanlayıcı.
+    """
+
+    def __init__(
+        self,
+        iz_dosyasi: str | Path | None = None,
+        ust: Zamanlayici | None = None,
+    ) -> None:
+        self._kayitlar: list[AsamaKaydi] = []
+        self._kilit = threading.Lock()
+        self._ust = ust
+        self._iz: IO[str] | None = (
+            open(iz_dosyasi, "a", encoding="utf-8") if iz_dosyasi else None
+        )
+
+    def kaydet(self, ad: str, baslangic: float, sure: float) -> None:
+        """Tek bir aşama çalıştırmasını kaydeder."""
+        with self._kilit:
+            self._kayitlar.append((ad, baslangic, sure))
+            if self._iz is not None:
+                self._iz.write(
+                    json.dumps(
+                        {
+                            "asama": ad,
+                            "baslangic": round(baslangic, 6),
+                            "sure_sn": round(sure, 6),
+                            "is_parcacigi": threading.current_thread().name,
+                        },
+                        ensure_ascii=False,
+                    )
+                    + "\n"
+                )
+        if self._ust is not None:
+            self._ust.kaydet(ad, baslangic, sure)
+
+    def ekle(self, kayitlar: Iterable[AsamaKaydi]) -> None:
+        """Başka bir süreçte toplanmış kayıtları ekler."""
+        for ad, baslangic, sure in kayitlar:
+            self.kaydet(ad, baslangic, sure)
+
+    @property
+    def kayitlar(self) -> list[AsamaKaydi]:
+        """Kayıtların kopyası (süreçler arası aktarım için)."""
+        with self._kilit:
+            return list(self._kayitlar)
+
+    def ozet(self) -> list[AsamaOzeti]:
+        """Aşamaları toplam süreye göre azalan sırada özetler."""
+        sureler: dict[str, list[float]] = {}
+        for ad, _, sure in self.kayitlar:
+            sureler.setdefault(ad, []).append(sure)
+
+        ozetler = []
+        for ad, liste in sureler.items():
+            liste.sort()
+            p95 = liste[max(0, math.ceil(0.95 * len(liste)) - 1)]
+            ozetler.append(AsamaOzeti(ad, len(liste), sum(liste), p95))
+        return sorted(ozetler, key=lambda ozet: ozet.toplam_sn, reverse=True)
+
+    def kapat(self) -> None:
+        """İz dosyasını kapatır."""
+        if self._iz is not None:
+            self._iz.close()
+            self._iz = None
+
+
+class _Asama:
+    """Etkin zamanlayıcıya süre kaydeden bağlam yöneticisi."""
+
+    __slots__ = ("_zamanlayici", "_ad", "_baslangic", "_sayac")
+
+    def __init__(self, zamanlayici: Zamanlayici, ad: str) -> None:
+        self._zamanlayici = zamanlayici
+        self._ad = ad
+
+    def __enter__(self) -> None:
+        self._baslangic = time.time()
+        self._sayac = time.perf_counter()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._zamanlayici.kaydet(
+            self._ad, self._baslangic, time.perf_counter() - self._sayac
+        )
+
+
+def asama(ad: str) -> _Asama | nullcontext:
+    """``ad`` adlı aşamanın süresini etkin zamanlayıcıya kaydeder.
+
+    Etkin zamanlayıcı yoksa hiçbir şey yapmayan paylaşılan bir bağlam
+    yöneticisi döndürür.
+    """
+    zamanlayici = _aktif
+    if zamanlayici is None:
+        return _BOS_ASAMA
+    return _Asama(zamanlayici, ad)
+
+
+def en_uzun_asamalar_metni(ozetler: object, adet: int = 3) -> str | None:
+    """En uzun süren ``adet`` aşamayı tek satırlık özet metnine çevirir.
+
+    :param ozetler: :meth:`Zamanlayici.ozet` çıktısı; liste değilse ya da
+        boşsa ``None`` döner (ölçüm yapılmamış raporlar için).
+    """
+    if not isinstance(ozetler, list):
+        return None
+    metinler = [ozet.log_metni for ozet in ozetler if isinstance(ozet, AsamaOzeti)]
+    return ", ".join(metinler[:adet]) or None
+
+
+def aktif_zamanlayici() -> Zamanlayici | None:
+    """Etkin zamanlayıcıyı döndürür."""
+    return _aktif
+
+
+@contextmanager
+def zamanlama_olc(
+    etkin: bool = True, iz_dosyasi: str | Path | None = None
+) -> Iterator[Zamanlayici | None]:
+    """Blok süresince aşama ölçümünü etkinleştirir.
+
+    :param etkin: ``False`` ise ölçüm açılmaz ve ``None`` verilir; çağıranın
+        koşullu ``with`` yazmasına gerek kalmaz. Dışarıda etkin bir
+        zamanlayıcı varsa aşamalar yine ona kaydedilir.
+    :param iz_dosyasi: Her aşama kaydının ekleneceği JSONL dosyası.
+    :returns: Bloğa özel zamanlayıcı.
+    """
+    global _aktif
+    if not etkin and iz_dosyasi is None:
+        yield None
+        return
+
+    onceki = _aktif
+    zamanlayici = Zamanlayici(iz_dosyasi, ust=onceki)
+    _aktif = zamanlayici
+    try:
+        yield zamanlayici
+    finally:
+        _aktif = onceki
+        zamanlayici.kapat()
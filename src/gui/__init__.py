@@ -1,22 +1,45 @@
-"""Grafik kullanıcı arayüzü modülleri."""
-
-from src.gui.file_selection_widget import DialogType, FileSelectionWidget
-from src.gui.education_import_window import EducationImportWindow
-from src.gui.log_widget import LogWidget
-from src.gui.main_menu_window import MainMenuWindow
-from src.gui.tutanak_window import TutanakWindow
-from src.gui.education_import_service import EducationImportService
-from src.gui.settings_manager import SettingsManager
-from src.gui.tutanak_service import TutanakService
-
-__all__ = [
-    "DialogType",
-    "EducationImportService",
-    "EducationImportWindow",
-    "FileSelectionWidget",
-    "LogWidget",
-    "MainMenuWindow",
-    "TutanakWindow",
-    "SettingsManager",
-    "TutanakService",
-]
+"""Grafik kullanıcı arayüzü modülleri.
+
+Dışa açılan adlar ilk erişimde yüklenir (PEP 562). Böylece
+``src.gui.main_menu_window`` içe aktarılırken iş akışı pencereleri, servis
+katmanı ve onların getirdiği pandas/openpyxl yüklenmez; ana menü bunları
+ancak ilgili pencere açılırken içe aktarır.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.gui.education_import_service import EducationImportService
+    from src.gui.education_import_window import EducationImportWindow
+    from src.gui.file_selection_widget import DialogType, FileSelectionWidget
+    from src.gui.log_widget import LogWidget
+    from src.gui.main_menu_window import MainMenuWindow
+    from src.gui.settings_manager import SettingsManager
+    from src.gui.tutanak_service import TutanakService
+    from src.gui.tutanak_window import TutanakWindow
+
+_AD_MODULLERI: dict[str, str] = {
+    "DialogType": "src.gui.file_selection_widget",
+    "EducationImportService": "src.gui.education_import_service",
+    "EducationImportWindow": "src.gui.education_import_window",
+    "FileSelectionWidget": "src.gui.file_selection_widget",
+    "LogWidget": "src.gui.log_widget",
+    "MainMenuWindow": "src.gui.main_menu_window",
+    "TutanakWindow": "src.gui.tutanak_window",
+    "SettingsManager": "src.gui.settings_manager",
+    "TutanakService": "src.gui.tutanak_service",
+}
+
+__all__ = list(_AD_MODULLERI)
+
+
+def __getattr__(name: str) -> object:
+    modul_adi = _AD_MODULLERI.get(name)
+    if modul_adi is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    deger = getattr(importlib.import_module(modul_adi), name)
+    globals()[name] = deger
+    return deger
@@ -23,6 +23,7 @@ class EducationImportService:
         return self._importer.import_education(
             source_path=source_path,
             target_dir=target_dir,
+            timing=True,
         )
 
     def son_import_uyarilari(self) -> list[str]:
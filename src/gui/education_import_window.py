@@ -16,6 +16,7 @@ from PyQt6.QtWidgets import (
 )
 
 from src.core.education_importer import EducationImportResult
+from src.core.zamanlama import en_uzun_asamalar_metni
 from src.gui.education_import_service import EducationImportService
 from src.gui.file_selection_widget import DialogType, FileSelectionWidget
 from src.gui.log_widget import LogWidget
@@ -230,6 +231,9 @@ class EducationImportWindow(QMainWindow):
             if result.unmatched_tckns:
                 joined_tckns = ", ".join(result.unmatched_tckns)
                 rows.append(("Hedefte bulunamayan TCKN'ler", joined_tckns))
+            rows.append(
+                ("En uzun aşamalar", en_uzun_asamalar_metni(result.phase_timings))
+            )
         if error_message:
             rows.append(("Hata", error_message))
         self._log_widget.log_summary_block(rows)
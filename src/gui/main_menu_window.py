@@ -1,4 +1,8 @@
-"""Uygulama açılışındaki ana menü penceresi."""
+"""Uygulama açılışındaki ana menü penceresi.
+
+İş akışı pencereleri (ve dolayısıyla pandas, openpyxl ve çekirdek modüller)
+ana menü açılırken değil, ilgili pencere ilk açıldığında içe aktarılır.
+"""
 
 from __future__ import annotations
 
@@ -15,8 +19,6 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
-from src.gui.education_import_window import EducationImportWindow
-from src.gui.tutanak_window import TutanakWindow
 from src.main import get_logo_path
 
 
@@ -187,10 +189,14 @@ class MainMenuWindow(QMainWindow):
 
     def _open_tutanak_window(self) -> None:
         """Tutanak oluşturma ekranını açar."""
+        from src.gui.tutanak_window import TutanakWindow
+
         self._open_child_window(TutanakWindow())
 
     def _open_education_import_window(self) -> None:
         """Mezuniyet içe aktarma ekranını açar."""
+        from src.gui.education_import_window import EducationImportWindow
+
         self._open_child_window(EducationImportWindow())
 
     def _open_child_window(self, window: QMainWindow) -> None:
@@ -8,7 +8,7 @@ DIP: TutanakWindow artık doğrudan core fonksiyonlarına bağımlı değildir.
 from __future__ import annotations
 
 from pathlib import Path
-from typing import List
+from typing import Callable, List
 
 from src.config.constants import DEFAULT_VERSION
 from src.core.excel_reader import (
@@ -17,21 +17,27 @@ from src.core.excel_reader import (
     oku_personel_listesi_raporlu,
 )
 from src.core.excel_writer import (
+    IlerlemeBildirimi,
     TutanakOlusturmaRaporu,
     olustur_dk_klasoru_raporlu,
 )
+from src.core.template_cache import SablonOnbellegi
 
 
 class TutanakService:
     """Tutanak oluşturma iş mantığı Facade'ı.
 
     Core katmanındaki ``excel_reader`` ve ``excel_writer`` modüllerini
-    GUI katmanından soyutlar.
+    GUI katmanından soyutlar. Şablon önbelleği servis ömrü boyunca
+    tutulur; aynı şablonla yapılan ardışık çalıştırmalar dosyayı yeniden
+    ayrıştırmaz. Üretim artımlıdır: çıktı klasöründeki manifestoya göre
+    değişmemiş tutanaklar atlanır, eskimiş olanlar yeniden üretilir.
     """
 
     def __init__(self) -> None:
         self._son_personel_okuma_raporu: PersonelOkumaRaporu | None = None
         self._son_tutanak_olusturma_raporu: TutanakOlusturmaRaporu | None = None
+        self._sablon_onbellegi = SablonOnbellegi()
 
     def personel_oku(self, input_path: str) -> List[Personel]:
         """Kaynak Excel dosyasından personel listesini okur.
@@ -63,6 +69,7 @@ class TutanakService:
         template_path: str,
         output_dir: str,
         version: str = DEFAULT_VERSION,
+        ilerleme: Callable[[int, int], None] | None = None,
     ) -> Path:
         """Her personel için ayrı DK tutanak dosyası oluşturur.
 
@@ -70,14 +77,30 @@ class TutanakService:
         :param template_path: Çıktı taslağı dosya yolu.
         :param output_dir: Çıktı klasörü yolu.
         :param version: Çıktı versiyonu (ör. ``"v1"``).
+        :param ilerleme: Her personel tamamlandıkça ``(tamamlanan, toplam)``
+            ile çağrılır.
         :returns: Çıktı klasörünün tam yolu.
         """
         output_dir_obj = Path(output_dir)
+        bildirim: IlerlemeBildirimi | None = None
+        if ilerleme is not None:
+            toplam = len(personeller)
+            tamamlanan = 0
+
+            def bildirim(*_: object) -> None:
+                nonlocal tamamlanan
+                tamamlanan += 1
+                ilerleme(tamamlanan, toplam)
+
         self._son_tutanak_olusturma_raporu = olustur_dk_klasoru_raporlu(
             personeller=personeller,
             cikti_klasoru=output_dir_obj,
             template_path=template_path,
             version=version,
+            sablon_onbellegi=self._sablon_onbellegi,
+            artimli=True,
+            zamanlama=True,
+            ilerleme=bildirim,
         )
         return self._son_tutanak_olusturma_raporu.output_path
 
@@ -25,6 +25,7 @@ from PyQt6.QtWidgets import (
 )
 
 from src.config.constants import DEFAULT_VERSION, SUPPORTED_VERSIONS, make_tubitak_title
+from src.core.zamanlama import en_uzun_asamalar_metni
 
 from src.gui.file_selection_widget import DialogType, FileSelectionWidget
 from src.gui.log_widget import LogWidget
@@ -60,6 +61,7 @@ class _TutanakOlusturWorker(QThread):
 
     finished = pyqtSignal(object)  # Path
     error = pyqtSignal(str)
+    progress = pyqtSignal(int, int)  # tamamlanan, toplam
 
     def __init__(
         self,
@@ -83,6 +85,7 @@ class _TutanakOlusturWorker(QThread):
                 template_path=self._template_path,
                 output_dir=self._output_dir,
                 version=self._version,
+                ilerleme=self.progress.emit,
             )
             self.finished.emit(result_path)
         except Exception as exc:  # noqa: BLE001
@@ -378,6 +381,12 @@ class TutanakWindow(QMainWindow):
             added_file_count = None
         if not isinstance(skipped_existing_count, int):
             skipped_existing_count = len(tutanak_warnings)
+        up_to_date_count = getattr(tutanak_report, "up_to_date_file_count", None)
+        rebuilt_count = getattr(tutanak_report, "rebuilt_file_count", None)
+        if not isinstance(up_to_date_count, int):
+            up_to_date_count = None
+        if not isinstance(rebuilt_count, int):
+            rebuilt_count = None
 
         self._log_widget.log_summary_block(
             [
@@ -387,6 +396,14 @@ class TutanakWindow(QMainWindow):
                 ("Çıktı versiyonu", version),
                 ("Yeni oluşturulan dosya", added_file_count),
                 ("Mevcut olduğu için atlanan kayıt", skipped_existing_count),
+                ("Güncel olduğu için atlanan dosya", up_to_date_count),
+                ("Yeniden oluşturulan dosya", rebuilt_count),
+                (
+                    "En uzun aşamalar",
+                    en_uzun_asamalar_metni(
+                        getattr(tutanak_report, "phase_timings", None)
+                    ),
+                ),
                 ("Çıktı klasörü", result_path),
                 ("Hata", error_message),
             ]
@@ -399,8 +416,15 @@ class TutanakWindow(QMainWindow):
     def _set_busy(self, busy: bool) -> None:
         """İşlem süresince butonu devre dışı bırakır ve progress bar'ı gösterir."""
         self._start_button.setEnabled(not busy)
+        if busy:
+            self._progress_bar.setRange(0, 0)
         self._progress_bar.setVisible(busy)
 
+    def _on_tutanak_progress(self, done: int, total: int) -> None:
+        """Tutanak üretiminde ilerleme çubuğunu belirli moda geçirir."""
+        self._progress_bar.setRange(0, total)
+        self._progress_bar.setValue(done)
+
     # ------------------------------------------------------------------
     # İş mantığı orkestresyonu – personel okuma aşaması
     # ------------------------------------------------------------------
@@ -498,6 +522,7 @@ class TutanakWindow(QMainWindow):
             self._process_state.pending_output_dir,
             self._process_state.selected_version,
         )
+        self._olusturma_worker.progress.connect(self._on_tutanak_progress)
         self._olusturma_worker.finished.connect(self._on_tutanak_olustur_finished)
         self._olusturma_worker.error.connect(self._on_tutanak_olustur_error)
         # Run synchronously under pytest for deterministic tests.
@@ -2,9 +2,21 @@
 
 from __future__ import annotations
 
+import importlib
+import multiprocessing
 import sys
+import threading
 from pathlib import Path
-from typing import MutableSequence
+from typing import MutableSequence, Sequence
+
+#: Ana menu cizildikten sonra arka planda yuklenecek agir moduller. Is akisi
+#: pencereleri bunlari kendileri de ice aktarir; on yukleme yalnizca ilk
+#: pencerenin acilisini hizlandirir.
+_PREWARM_MODULES = (
+    "src.core.excel_reader",
+    "src.core.excel_writer",
+    "src.core.education_importer",
+)
 
 
 def _is_direct_script_execution(package_name: str | None) -> bool:
@@ -87,16 +99,52 @@ def _create_main_menu_window() -> "MainMenuWindow":
     return MainMenuWindow()
 
 
+def _prewarm_modules(module_names: Sequence[str] = _PREWARM_MODULES) -> None:
+    """Modulleri sirayla ice aktarir; yuklenemeyenler atlanir.
+
+    Yuklenemeyen modul ilgili pencere acilirken yeniden denenir ve hata
+    orada kullaniciya gosterilir.
+    """
+    for module_name in module_names:
+        try:
+            importlib.import_module(module_name)
+        except ImportError:
+            continue
+
+
+def _schedule_prewarm() -> None:
+    """Agir modullerin arka planda on yuklenmesini ilk cizimden sonra baslatir."""
+    from PyQt6.QtCore import QTimer
+
+    QTimer.singleShot(
+        0,
+        lambda: threading.Thread(
+            target=_prewarm_modules, name="on-yukleme", daemon=True
+        ).start(),
+    )
+
+
 bootstrap_local_package_resolution(__package__, __file__, sys.path)
 
 
 def main() -> None:
     """Uygulamayi baslatir."""
+    # PyInstaller onefile paketinde surec havuzu iscilerinin GUI'yi yeniden
+    # acmasini engeller; normal calismada etkisizdir.
+    multiprocessing.freeze_support()
+
+    if sys.argv[1:2] == ["batch"]:
+        # GUI'siz toplu calistirma; Qt hic ice aktarilmaz.
+        from src.cli import main as batch_main
+
+        sys.exit(batch_main(sys.argv[2:]))
+
     app = _create_application(sys.argv)
     _apply_stylesheet(app)
 
     window = _create_main_menu_window()
     window.show()
+    _schedule_prewarm()
 
     sys.exit(app.exec())
 
@@ -0,0 +1,75 @@
+"""scripts.benchmark yardımcıları için testler."""
+
+from __future__ import annotations
+
+import pytest
+
+from scripts.benchmark import (
+    Gerileme,
+    girdileri_olustur,
+    karsilastir,
+    sentetik_tckn,
+)
+from src.core.education_importer import EducationImporter
+from src.core.excel_reader import oku_personel_listesi_raporlu
+from src.core.validators import validate_tckn
+
+
+def _sonuc(**olcumler) -> dict:
+    return {"sonuclar": olcumler}
+
+
+class TestSentetikGirdiler:
+    """Sentetik girdi üretimi testleri."""
+
+    def test_tckn_gecerli(self):
+        """Üretilen TCKN'ler doğrulamadan geçmeli ve tekil olmalı."""
+        tcknler = [sentetik_tckn(sira) for sira in range(500)]
+        assert all(validate_tckn(tckn) for tckn in tcknler)
+        assert len(set(tcknler)) == len(tcknler)
+
+    def test_girdiler_okunabilir(self, tmp_path):
+        """Personel ve mezuniyet dosyaları uygulama okuyucularıyla okunmalı."""
+        girdiler = girdileri_olustur(tmp_path, 100)
+
+        rapor = oku_personel_listesi_raporlu(girdiler.personel_dosyasi)
+        assert 90 <= len(rapor.personeller) < 100
+        assert rapor.reddedilen_satirlar
+
+        kayitlar = EducationImporter()._read_source_records(girdiler.mezuniyet_dosyasi)
+        assert set(kayitlar) <= {p.tckn for p in rapor.personeller}
+
+
+class TestKarsilastir:
+    """Taban çizgisi karşılaştırma testleri."""
+
+    def test_esik_asilirsa_gerileme(self):
+        """Eşiği aşan süre ve bellek artışları raporlanmalı."""
+        taban = _sonuc(**{"okuyucu/10": {"sure_sn": 1.0, "rss_tepe_mb": 100.0}})
+        simdi = _sonuc(**{"okuyucu/10": {"sure_sn": 1.5, "rss_tepe_mb": 110.0}})
+
+        assert karsilastir(simdi, taban, sure_esigi=0.2, bellek_esigi=0.2) == [
+            Gerileme("okuyucu/10", "sure_sn", 1.0, 1.5)
+        ]
+        assert len(karsilastir(simdi, taban, bellek_esigi=0.05)) == 2
+
+    def test_esik_icinde_gerileme_yok(self):
+        """Eşik içindeki artışlar ve tabanda olmayan ölçümler yok sayılmalı."""
+        taban = _sonuc(**{"okuyucu/10": {"sure_sn": 1.0}})
+        simdi = _sonuc(
+            **{"okuyucu/10": {"sure_sn": 1.1}, "okuyucu/1000": {"sure_sn": 9.0}}
+        )
+        assert karsilastir(simdi, taban) == []
+
+    def test_kisa_sureler_karsilastirilmaz(self):
+        """Gürültü düzeyindeki kısa süreler gerileme sayılmamalı."""
+        taban = _sonuc(**{"okuyucu/10": {"sure_sn": 0.01}})
+        simdi = _sonuc(**{"okuyucu/10": {"sure_sn": 0.03}})
+        assert karsilastir(simdi, taban) == []
+
+    @pytest.mark.parametrize("metrik", ["rss_tepe_mb", "tracemalloc_tepe_mb"])
+    def test_eksik_metrik_atlanir(self, metrik):
+        """Platformda ölçülemeyen (None) metrikler karşılaştırılmamalı."""
+        taban = _sonuc(**{"okuyucu/10": {metrik: 50.0}})
+        simdi = _sonuc(**{"okuyucu/10": {metrik: None}})
+        assert karsilastir(simdi, taban) == []
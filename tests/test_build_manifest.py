@@ -0,0 +1,225 @@
+"""build_manifest modülü ve artımlı klasör üretimi testleri."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+
+import openpyxl
+import pytest
+
+from src.config.constants import MANIFEST_FILENAME
+from src.core import build_manifest
+from src.core.build_manifest import UretimKarari, UretimManifestosu
+from src.core.excel_reader import Personel
+from src.core.excel_writer import olustur_dk_klasoru_raporlu
+from src.core.template_cache import _template_yolunu_coz
+
+
+@pytest.fixture()
+def personeller() -> list[Personel]:
+    return [
+        Personel(tckn="10000000146", ad_soyad="Fatma KARACA", birim="Marmara"),
+        Personel(tckn="10000000078", ad_soyad="Ali YILMAZ", birim="Gebze"),
+    ]
+
+
+@pytest.fixture()
+def sablon(tmp_path) -> Path:
+    """Değiştirilebilir olması için varsayılan şablonun bir kopyası."""
+    yol = tmp_path / "sablon.xlsx"
+    shutil.copy(_template_yolunu_coz(), yol)
+    return yol
+
+
+def _dosyayi_degistir(yol: Path) -> None:
+    """Dosyayı harici bir aracın değiştirmiş gibi göstermek için günceller."""
+    with open(yol, "ab") as dosya:
+        dosya.write(b"\0")
+    durum = yol.stat()
+    os.utime(yol, ns=(durum.st_atime_ns, durum.st_mtime_ns + 10**9))
+
+
+class TestUretimManifestosu:
+    """UretimManifestosu karar testleri."""
+
+    def test_karar_matrisi(self, tmp_path, sablon, personeller):
+        """Kayıt, dosya durumu ve girdilere göre doğru karar verilmeli."""
+        personel = personeller[0]
+        cikti = tmp_path / "dosya.xlsx"
+        manifesto = UretimManifestosu.yukle(tmp_path, sablon, "v1")
+        assert manifesto.karar_ver(personel, cikti) is UretimKarari.YENI
+
+        cikti.write_bytes(b"icerik")
+        assert manifesto.karar_ver(personel, cikti) is UretimKarari.DENETLENEMEZ
+
+        manifesto.dosyayi_kaydet(personel, cikti)
+        assert manifesto.karar_ver(personel, cikti) is UretimKarari.GUNCEL
+
+        degismis = Personel(tckn=personel.tckn, ad_soyad=personel.ad_soyad, birim="X")
+        assert manifesto.karar_ver(degismis, cikti) is UretimKarari.ESKIMIS
+
+        _dosyayi_degistir(cikti)
+        assert manifesto.karar_ver(degismis, cikti) is UretimKarari.DENETLENEMEZ
+
+    def test_kaydedilen_manifesto_yeniden_yuklenir(self, tmp_path, sablon, personeller):
+        """Kaydedilip yeniden yüklenen manifesto aynı kararı vermeli."""
+        cikti = tmp_path / "dosya.xlsx"
+        cikti.write_bytes(b"icerik")
+        manifesto = UretimManifestosu.yukle(tmp_path, sablon, "v1")
+        manifesto.dosyayi_kaydet(personeller[0], cikti)
+        manifesto.kaydet()
+
+        yeniden = UretimManifestosu.yukle(tmp_path, sablon, "v1")
+        assert len(yeniden) == 1
+        assert yeniden.karar_ver(personeller[0], cikti) is UretimKarari.GUNCEL
+        assert (
+            UretimManifestosu.yukle(tmp_path, sablon, "v2").karar_ver(
+                personeller[0], cikti
+            )
+            is UretimKarari.ESKIMIS
+        )
+
+    def test_cikti_bicimi_degisince_eskimis(
+        self, tmp_path, sablon, personeller, monkeypatch
+    ):
+        """Çıktı biçimi sürümü artınca değişmemiş dosyalar yeniden üretilmeli."""
+        cikti = tmp_path / "dosya.xlsx"
+        cikti.write_bytes(b"icerik")
+        manifesto = UretimManifestosu.yukle(tmp_path, sablon, "v1")
+        manifesto.dosyayi_kaydet(personeller[0], cikti)
+        manifesto.kaydet()
+
+        monkeypatch.setattr(
+            build_manifest,
+            "CIKTI_BICIMI_SURUMU",
+            build_manifest.CIKTI_BICIMI_SURUMU + 1,
+        )
+
+        yeniden = UretimManifestosu.yukle(tmp_path, sablon, "v1")
+        assert yeniden.karar_ver(personeller[0], cikti) is UretimKarari.ESKIMIS
+
+    def test_cikti_bicimi_olmayan_kayit_eskimis(self, tmp_path, sablon, personeller):
+        """Çıktı biçimi alanı olmayan eski kayıtlar ilk biçim sayılmalı."""
+        cikti = tmp_path / "dosya.xlsx"
+        cikti.write_bytes(b"icerik")
+        manifesto = UretimManifestosu.yukle(tmp_path, sablon, "v1")
+        manifesto.dosyayi_kaydet(personeller[0], cikti)
+        manifesto.kaydet()
+        veri = json.loads((tmp_path / MANIFEST_FILENAME).read_text("utf-8"))
+        del veri["dosyalar"]["dosya.xlsx"]["cikti_bicimi"]
+        (tmp_path / MANIFEST_FILENAME).write_text(json.dumps(veri), "utf-8")
+
+        yeniden = UretimManifestosu.yukle(tmp_path, sablon, "v1")
+        assert len(yeniden) == 1
+        assert yeniden.karar_ver(personeller[0], cikti) is UretimKarari.ESKIMIS
+
+    def test_yazilamayan_manifesto_uretimi_durdurmaz(
+        self, tmp_path, sablon, personeller, caplog
+    ):
+        """Manifesto yazılamazsa hata günlüğe yazılmalı, üretim tamamlanmalı."""
+        with patch(
+            "src.core.build_manifest.tempfile.mkstemp",
+            side_effect=PermissionError("salt okunur"),
+        ):
+            with caplog.at_level(logging.WARNING, logger=build_manifest.__name__):
+                rapor = olustur_dk_klasoru_raporlu(
+                    personeller, tmp_path / "cikti", sablon, artimli=True
+                )
+
+        assert rapor.new_file_count == 2
+        assert all(yol.exists() for yol in rapor.generated_files)
+        assert not (tmp_path / "cikti" / MANIFEST_FILENAME).exists()
+        assert "manifestosu kaydedilemedi" in caplog.text
+
+    def test_bozuk_manifesto_bos_baslar(self, tmp_path, sablon):
+        """Okunamayan manifesto hata vermeden boş kabul edilmeli."""
+        (tmp_path / MANIFEST_FILENAME).write_text("{bozuk", encoding="utf-8")
+
+        assert len(UretimManifestosu.yukle(tmp_path, sablon, "v1")) == 0
+
+
+class TestArtimliKlasorUretimi:
+    """olustur_dk_klasoru_raporlu(artimli=True) testleri."""
+
+    def test_degismeyen_personel_dosya_acilmadan_atlanir(
+        self, tmp_path, sablon, personeller
+    ):
+        """İkinci çalıştırma hiçbir xlsx dosyasını açmamalı."""
+        ilk = olustur_dk_klasoru_raporlu(
+            personeller, tmp_path / "cikti", sablon, artimli=True
+        )
+        assert ilk.new_file_count == 2
+        assert (tmp_path / "cikti" / MANIFEST_FILENAME).exists()
+
+        with patch(
+            "src.core.excel_writer.openpyxl.load_workbook",
+            side_effect=AssertionError("xlsx açılmamalı"),
+        ):
+            rapor = olustur_dk_klasoru_raporlu(
+                personeller, tmp_path / "cikti", sablon, artimli=True
+            )
+
+        assert rapor.up_to_date_file_count == 2
+        assert rapor.added_file_count == 0
+        assert rapor.skipped_existing_file_count == 2
+        assert len(rapor.warning_messages) == 2
+
+    def test_degisen_personel_ve_sablon_yeniden_uretilir(
+        self, tmp_path, sablon, personeller
+    ):
+        """Birim ya da şablon değişince yalnızca eskimiş dosyalar yenilenmeli."""
+        cikti = tmp_path / "cikti"
+        olustur_dk_klasoru_raporlu(personeller, cikti, sablon, artimli=True)
+
+        degismis = [
+            Personel(tckn="10000000146", ad_soyad="Fatma KARACA", birim="Ankara"),
+            personeller[1],
+        ]
+        rapor = olustur_dk_klasoru_raporlu(degismis, cikti, sablon, artimli=True)
+
+        assert rapor.rebuilt_file_count == 1
+        assert rapor.up_to_date_file_count == 1
+        wb = openpyxl.load_workbook(rapor.generated_files[0])
+        assert wb.worksheets[0]["D3"].value == "Ankara"
+        wb.close()
+
+        wb = openpyxl.load_workbook(sablon)
+        wb.active["A1"] = "yeni şablon"
+        wb.save(sablon)
+        wb.close()
+        rapor = olustur_dk_klasoru_raporlu(
+            degismis, cikti, sablon, jobs=2, artimli=True
+        )
+
+        assert rapor.rebuilt_file_count == 2
+        assert rapor.up_to_date_file_count == 0
+
+    def test_harici_degisen_dosya_yeniden_uretilmez(
+        self, tmp_path, sablon, personeller
+    ):
+        """Üretimden sonra değiştirilen dosya korunmalı ve eski akışla atlanmalı."""
+        cikti = tmp_path / "cikti"
+        ilk = olustur_dk_klasoru_raporlu(personeller, cikti, sablon, artimli=True)
+        hedef = ilk.generated_files[0]
+        wb = openpyxl.load_workbook(hedef)
+        wb.worksheets[0]["A40"] = "kullanıcı verisi"
+        wb.save(hedef)
+        wb.close()
+        durum = hedef.stat()
+        os.utime(hedef, ns=(durum.st_atime_ns, durum.st_mtime_ns + 10**9))
+
+        degismis = [
+            Personel(tckn="10000000146", ad_soyad="Fatma KARACA", birim="Ankara"),
+        ]
+        rapor = olustur_dk_klasoru_raporlu(degismis, cikti, sablon, artimli=True)
+
+        assert rapor.rebuilt_file_count == 0
+        assert rapor.skipped_existing_file_count == 1
+        wb = openpyxl.load_workbook(hedef)
+        assert wb.worksheets[0]["A40"].value == "kullanıcı verisi"
+        wb.close()
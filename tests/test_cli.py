@@ -0,0 +1,186 @@
+"""src.cli (GUI'siz toplu çalıştırma) testleri."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from src import cli
+
+_PERSONELLER = [
+    {"TCKN": "10000000146", "AD SOYAD": "Fatma KARACA", "BİRİMİ": "Marmara"},
+    {"TCKN": "10000000078", "AD SOYAD": "Ali YILMAZ", "BİRİMİ": "Gebze"},
+    {"TCKN": "12345", "AD SOYAD": "Hatalı KAYIT", "BİRİMİ": "Gebze"},
+    {"TCKN": "10000050028", "AD SOYAD": "Ayşe DEMİR", "BİRİMİ": "Kocaeli"},
+]
+
+
+@pytest.fixture()
+def personel_xlsx(tmp_path: Path) -> Path:
+    """Bir geçersiz satır içeren personel listesi oluşturur."""
+    dosya = tmp_path / "personel.xlsx"
+    pd.DataFrame(_PERSONELLER).to_excel(dosya, index=False)
+    return dosya
+
+
+def _olaylar(capsys) -> list[dict]:
+    return [json.loads(satir) for satir in capsys.readouterr().out.splitlines()]
+
+
+class TestTutanakKomutu:
+    """``batch tutanak`` komutu testleri."""
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_personel_basina_ilerleme_ve_ozet(
+        self, tmp_path, personel_xlsx, capsys, jobs
+    ):
+        """Her personel için bir ilerleme satırı ve son bir özet yazılmalı."""
+        cikti = tmp_path / "cikti"
+        kod = cli.main(
+            [
+                "tutanak",
+                "--girdi",
+                str(personel_xlsx),
+                "--cikti",
+                str(cikti),
+                "--jobs",
+                str(jobs),
+            ]
+        )
+
+        assert kod == 0
+        olaylar = _olaylar(capsys)
+        assert [olay["olay"] for olay in olaylar] == ["red"] + ["personel"] * 3 + [
+            "ozet"
+        ]
+        personel_olaylari = olaylar[1:4]
+        assert [olay["sira"] for olay in personel_olaylari] == [1, 2, 3]
+        assert {olay["durum"] for olay in personel_olaylari} == {"olusturuldu"}
+        assert all(Path(olay["dosya"]).exists() for olay in personel_olaylari)
+
+        ozet = olaylar[-1]
+        assert ozet["gecerli_personel"] == 3
+        assert ozet["reddedilen_satir"] == 1
+        assert ozet["rapor"]["added_file_count"] == 3
+        assert ozet["rapor"]["output_path"] == str(cikti)
+
+    def test_ikinci_calistirma_guncel_bildirir(self, tmp_path, personel_xlsx, capsys):
+        """Manifestoya göre değişmemiş dosyalar ``guncel`` olarak bildirilmeli."""
+        argv = ["tutanak", "--girdi", str(personel_xlsx), "--cikti", str(tmp_path)]
+        cli.main(argv)
+        capsys.readouterr()
+
+        assert cli.main(argv + ["--zamanlama"]) == 0
+        olaylar = _olaylar(capsys)
+        assert [o["durum"] for o in olaylar if o["olay"] == "personel"] == [
+            "guncel"
+        ] * 3
+        assert olaylar[-1]["rapor"]["up_to_date_file_count"] == 3
+        assert olaylar[-1]["rapor"]["phase_timings"]
+
+    def test_hata_json_olarak_bildirilir(self, tmp_path, capsys):
+        """Eksik kaynak dosya çıkış kodu 1 ve ``hata`` satırı üretmeli."""
+        kod = cli.main(
+            ["tutanak", "--girdi", str(tmp_path / "yok.xlsx"), "--cikti", "x"]
+        )
+
+        assert kod == 1
+        olaylar = _olaylar(capsys)
+        assert olaylar[-1]["olay"] == "hata"
+        assert "yok.xlsx" in olaylar[-1]["mesaj"]
+
+    def test_gecersiz_jobs(self, personel_xlsx, capsys):
+        """jobs 1'den küçükse iş başlamadan hata verilmeli."""
+        kod = cli.main(
+            ["tutanak", "--girdi", str(personel_xlsx), "--cikti", "x", "--jobs", "0"]
+        )
+        assert kod == 1
+        assert _olaylar(capsys)[-1]["olay"] == "hata"
+
+
+class TestMezuniyetKomutu:
+    """``batch mezuniyet`` komutu testleri."""
+
+    def test_ozet_ve_iz_dosyasi(self, tmp_path, personel_xlsx, capsys):
+        """Aktarım özeti yazılmalı ve aşamalar iz dosyasına eklenmeli."""
+        hedef = tmp_path / "tutanaklar"
+        bos_sablon = Path(__file__).resolve().parent.parent / "docs/cikti_taslagi.xlsx"
+        cli.main(
+            [
+                "tutanak",
+                "--girdi",
+                str(personel_xlsx),
+                "--cikti",
+                str(hedef),
+                "--sablon",
+                str(bos_sablon),
+            ]
+        )
+        kaynak = tmp_path / "mezuniyet.xlsx"
+        pd.DataFrame(
+            [
+                {
+                    "TC KIMLIK NO": "10000000146",
+                    "AD": "FATMA",
+                    "SOYAD": "KARACA",
+                    "MEZUNIYET TARIHI": "03/01/2022",
+                    "UNIVERSITE": "İSTANBUL TEKNİK ÜNİVERSİTESİ",
+                    "ENSMYOFAK": "FEN BİLİMLERİ ENSTİTÜSÜ",
+                    "PROGRAM": "DOKTORA FİZİK",
+                }
+            ]
+        ).to_excel(kaynak, index=False)
+        capsys.readouterr()
+        iz = tmp_path / "iz.jsonl"
+
+        kod = cli.main(
+            [
+                "mezuniyet",
+                "--kaynak",
+                str(kaynak),
+                "--hedef",
+                str(hedef),
+                "--iz-dosyasi",
+                str(iz),
+            ]
+        )
+
+        assert kod == 0
+        olaylar = _olaylar(capsys)
+        ozet = olaylar[-1]
+        assert ozet["olay"] == "ozet"
+        assert ozet["rapor"]["appended_record_count"] == 1
+        dosyalar = [olay for olay in olaylar if olay["olay"] == "dosya"]
+        assert dosyalar
+        assert [olay["sira"] for olay in dosyalar] == list(
+            range(1, dosyalar[0]["toplam"] + 1)
+        )
+        assert sum(olay["eklenen_kayit"] for olay in dosyalar) == 1
+        assert ozet["rapor"]["matched_sheet_count"] == 1
+        asamalar = {json.loads(satir)["asama"] for satir in iz.read_text().splitlines()}
+        assert "mezuniyet.kaydet" in asamalar
+
+
+class TestAgirIceAktarmalar:
+    """Başlangıç maliyeti testleri."""
+
+    def test_qt_ve_agir_kutuphaneler_yuklenmez(self):
+        """CLI modülü yüklenirken Qt, pandas ve openpyxl içe aktarılmamalı."""
+        kod = (
+            "import sys, src.cli; "
+            "print([m for m in ('PyQt6', 'pandas', 'openpyxl', 'numpy') "
+            "if m in sys.modules])"
+        )
+        cikti = subprocess.run(
+            [sys.executable, "-c", kod],
+            cwd=Path(__file__).resolve().parent.parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert cikti.stdout.strip() == "[]"
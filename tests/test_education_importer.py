@@ -2,12 +2,21 @@
 
 from __future__ import annotations
 
+import datetime
 from pathlib import Path
 
 import openpyxl
 import pandas as pd
 import pytest
 
+from src.config.constants import (
+    OGRENIM_DOKTORA,
+    OGRENIM_LISANS,
+    OGRENIM_TEZLI_YL,
+    OGRENIM_TEZSIZ_YL,
+    TARGET_INDEX_FILENAME,
+)
+from src.core import target_index
 from src.core.education_importer import EducationImporter
 
 
@@ -265,3 +274,467 @@ class TestEducationImporter:
             importer.import_education(source_path, tmp_path)
 
         assert not list((tmp_path / "eski").glob("*_eski_*.xlsx"))
+
+    def test_import_education_timing_reports_phases(
+        self,
+        importer: EducationImporter,
+        tmp_path: Path,
+    ):
+        """timing=True ile aşama süreleri sonuca eklenmeli; varsayılan boş."""
+        source_path = tmp_path / "mezuniyet.xlsx"
+        _write_source_xlsx(
+            [
+                {
+                    "TC KIMLIK NO": "10000000146",
+                    "AD": "ALİ",
+                    "SOYAD": "YILMAZ",
+                    "MEZUNIYET TARIHI": "03/01/2022",
+                    "UNIVERSITE": "İSTANBUL TEKNİK ÜNİVERSİTESİ",
+                    "ENSMYOFAK": "ELEKTRİK-ELEKTRONİK FAKÜLTESİ",
+                    "PROGRAM": "ELEKTRONİK VE HABERLEŞME MÜHENDİSLİĞİ",
+                },
+            ],
+            source_path,
+        )
+        _create_target_workbook(tmp_path / "tutanak.xlsx")
+
+        result = importer.import_education(source_path, tmp_path, timing=True)
+
+        assert {timing.ad for timing in result.phase_timings} == {
+            "mezuniyet.kaynak_oku",
+            "mezuniyet.hedef_dizini",
+            "mezuniyet.hedef_tara",
+            "mezuniyet.hedef_yukle",
+            "mezuniyet.kayit_isle",
+            "mezuniyet.yedek",
+            "mezuniyet.kaydet",
+        }
+        assert importer.import_education(source_path, tmp_path).phase_timings == []
+
+
+class TestTargetIndex:
+    """Hedef dosyaların açılmadan elenmesi testleri."""
+
+    @pytest.fixture()
+    def source_path(self, tmp_path: Path) -> Path:
+        path = tmp_path / "kaynak" / "mezuniyet.xlsx"
+        path.parent.mkdir()
+        _write_source_xlsx(
+            [
+                {
+                    "TC KIMLIK NO": "10000000146",
+                    "AD": "ALİ",
+                    "SOYAD": "YILMAZ",
+                    "MEZUNIYET TARIHI": "03/01/2022",
+                    "UNIVERSITE": "İSTANBUL TEKNİK ÜNİVERSİTESİ",
+                    "ENSMYOFAK": "ELEKTRİK-ELEKTRONİK FAKÜLTESİ",
+                    "PROGRAM": "ELEKTRONİK VE HABERLEŞME MÜHENDİSLİĞİ",
+                },
+            ],
+            path,
+        )
+        return path
+
+    @pytest.fixture()
+    def opened_targets(self, monkeypatch) -> list[str]:
+        """openpyxl ile tam yüklenen hedef dosyaların adlarını toplar."""
+        opened: list[str] = []
+        load_workbook = openpyxl.load_workbook
+
+        def spy(path, *args, **kwargs):
+            if not kwargs.get("read_only"):
+                opened.append(Path(path).name)
+            return load_workbook(path, *args, **kwargs)
+
+        monkeypatch.setattr("src.core.education_importer.openpyxl.load_workbook", spy)
+        return opened
+
+    def test_only_matching_files_are_opened(
+        self, tmp_path: Path, source_path: Path, opened_targets: list[str]
+    ):
+        """Dosya adı ya da sayfa adları eşleşmeyen workbook'lar açılmamalı."""
+        target_dir = tmp_path / "tutanaklar"
+        target_dir.mkdir()
+        _create_target_workbook(target_dir / "Ali YILMAZ - 10000000146.xlsx")
+        _create_target_workbook(
+            target_dir / "Veli DEMİR - 10000000078.xlsx",
+            sheet_title="Veli DEMİR - 10000000078",
+        )
+        _create_target_workbook(
+            target_dir / "birlesik.xlsx", sheet_title="Veli DEMİR - 10000000078"
+        )
+        _create_target_workbook(target_dir / "birlesik_eslesen.xlsx")
+
+        result = EducationImporter().import_education(source_path, target_dir)
+
+        assert sorted(opened_targets) == [
+            "Ali YILMAZ - 10000000146.xlsx",
+            "birlesik_eslesen.xlsx",
+        ]
+        assert result.appended_record_count == 2
+        assert result.processed_file_count == 2
+
+    def test_rerun_does_not_rewrite_up_to_date_files(
+        self, tmp_path: Path, source_path: Path, opened_targets: list[str]
+    ):
+        """Kayıtları zaten yazılmış dosyalar yazma için açılmamalı ve değişmemeli."""
+        target_dir = tmp_path / "tutanaklar"
+        target_dir.mkdir()
+        target_path = target_dir / "birlesik.xlsx"
+        _create_target_workbook(target_path)
+        importer = EducationImporter()
+        importer.import_education(source_path, target_dir)
+        opened_targets.clear()
+        mtime_ns = target_path.stat().st_mtime_ns
+
+        result = importer.import_education(source_path, target_dir)
+
+        assert opened_targets == []
+        assert target_path.stat().st_mtime_ns == mtime_ns
+        assert result.backup_paths == []
+        assert result.matched_sheet_count == 1
+        assert result.skipped_record_count == 1
+        assert result.processed_file_count == 1
+
+    def test_cached_sheet_names_are_reused_until_file_changes(
+        self, tmp_path: Path, source_path: Path, monkeypatch
+    ):
+        """Değişmeyen birleşik dosyanın sayfa adları yeniden okunmamalı."""
+        target_dir = tmp_path / "tutanaklar"
+        target_dir.mkdir()
+        combined = target_dir / "birlesik.xlsx"
+        _create_target_workbook(combined, sheet_title="Veli DEMİR - 10000000078")
+
+        peeked: list[str] = []
+        peek = target_index.workbook_sayfa_adlari
+
+        def spy(path):
+            peeked.append(Path(path).name)
+            return peek(path)
+
+        monkeypatch.setattr(target_index, "workbook_sayfa_adlari", spy)
+        importer = EducationImporter()
+
+        importer.import_education(source_path, target_dir)
+        assert (target_dir / TARGET_INDEX_FILENAME).exists()
+        importer.import_education(source_path, target_dir)
+        assert peeked == ["birlesik.xlsx"]
+
+        _create_target_workbook(combined)
+        result = importer.import_education(source_path, target_dir)
+        assert peeked == ["birlesik.xlsx", "birlesik.xlsx"]
+        assert result.appended_record_count == 1
+
+
+_PARALLEL_TCKNS = ["10000000146", "10000000078", "10000050028"]
+
+
+def _create_parallel_fixture(root: Path) -> tuple[Path, Path]:
+    """Kişi başına bir tutanak ve üç kişilik kaynak dosya oluşturur."""
+    target_dir = root / "tutanaklar"
+    target_dir.mkdir(parents=True)
+    source_path = root / "mezuniyet.xlsx"
+    rows = []
+    for index, tckn in enumerate(_PARALLEL_TCKNS):
+        _create_target_workbook(
+            target_dir / f"Kisi {index} - {tckn}.xlsx",
+            sheet_title=f"Kisi {index} - {tckn}",
+        )
+        rows.append(
+            {
+                "TC KIMLIK NO": tckn,
+                "AD": "KİŞİ",
+                "SOYAD": str(index),
+                "MEZUNIYET TARIHI": "03/01/2022",
+                "UNIVERSITE": "İSTANBUL TEKNİK ÜNİVERSİTESİ",
+                "ENSMYOFAK": "FEN BİLİMLERİ ENSTİTÜSÜ",
+                "PROGRAM": "DOKTORA FİZİK",
+            }
+        )
+    _write_source_xlsx(rows, source_path)
+    return source_path, target_dir
+
+
+def _comparable(result, target_dir: Path) -> dict[str, object]:
+    """Sonuç alanlarını yedek yolları klasöre göreli olacak şekilde döndürür."""
+    fields = dict(vars(result))
+    fields["backup_paths"] = [
+        path.relative_to(target_dir) for path in result.backup_paths
+    ]
+    return fields
+
+
+class TestParallelImport:
+    """jobs > 1 ile süreç havuzunda aktarım testleri."""
+
+    def test_parallel_matches_serial(self, tmp_path: Path):
+        """Paralel aktarım seri aktarımla aynı sonuç ve uyarı sırasını vermeli."""
+        serial_source, serial_dir = _create_parallel_fixture(tmp_path / "seri")
+        parallel_source, parallel_dir = _create_parallel_fixture(tmp_path / "paralel")
+
+        for _ in range(2):
+            serial = EducationImporter().import_education(serial_source, serial_dir)
+            parallel_importer = EducationImporter()
+            parallel = parallel_importer.import_education(
+                parallel_source, parallel_dir, jobs=3
+            )
+            assert _comparable(parallel, parallel_dir) == _comparable(
+                serial, serial_dir
+            )
+            assert parallel_importer.last_warning_messages() == (
+                parallel.warning_messages
+            )
+
+        # İkinci çalıştırmada her dosya, dosya sırasıyla bir tekrar uyarısı verir.
+        assert parallel.appended_record_count == 0
+        assert [message.split("'")[1] for message in parallel.warning_messages] == [
+            f"Kisi {index} - {tckn}" for index, tckn in enumerate(_PARALLEL_TCKNS)
+        ]
+
+    def test_parallel_timing_includes_worker_phases(self, tmp_path: Path):
+        """İşçi süreçlerdeki aşama süreleri ana sonuca eklenmeli."""
+        source_path, target_dir = _create_parallel_fixture(tmp_path)
+
+        result = EducationImporter().import_education(
+            source_path, target_dir, timing=True, jobs=2
+        )
+
+        counts = {timing.ad: timing.adet for timing in result.phase_timings}
+        assert counts["mezuniyet.hedef_yukle"] == len(_PARALLEL_TCKNS)
+        assert counts["mezuniyet.kaydet"] == len(_PARALLEL_TCKNS)
+
+    def test_progress_reports_each_file_in_order(self, tmp_path: Path):
+        """Her hedef dosya birleştirildiğinde dosya sırasıyla bildirilmeli."""
+        source_path, target_dir = _create_parallel_fixture(tmp_path)
+        progress = []
+
+        result = EducationImporter().import_education(
+            source_path, target_dir, jobs=2, progress=progress.append
+        )
+
+        assert [item.index for item in progress] == list(
+            range(1, len(_PARALLEL_TCKNS) + 1)
+        )
+        assert {item.total for item in progress} == {len(_PARALLEL_TCKNS)}
+        assert [item.target_path.stem.split(" - ")[1] for item in progress] == list(
+            _PARALLEL_TCKNS
+        )
+        assert sum(item.appended_record_count for item in progress) == (
+            result.appended_record_count
+        )
+        assert [item.backup_path for item in progress] == result.backup_paths
+
+    def test_invalid_jobs(self, tmp_path: Path):
+        """jobs 1'den küçükse aktarım başlamadan hata verilmeli."""
+        source_path, target_dir = _create_parallel_fixture(tmp_path)
+
+        with pytest.raises(ValueError):
+            EducationImporter().import_education(source_path, target_dir, jobs=0)
+
+
+class _ScanGuard(dict):
+    """Tarandığında hata veren kayıt sözlüğü; yalnızca anahtar aramasına izin verir."""
+
+    def __iter__(self):
+        raise AssertionError("records_by_tckn taranmamalı")
+
+
+class TestMatchTckn:
+    """EducationImporter._match_tckn testleri."""
+
+    @pytest.mark.parametrize(
+        "sheet_title",
+        [
+            "Fatma KARACA - 10000000146",
+            "Fatma KARACA UZUNAD.. - 10000000146",
+            "10000000146",
+        ],
+    )
+    def test_convention_titles_use_lookup(self, sheet_title):
+        """Kurala uyan sayfa adları sözlük aramasıyla eşleşmeli."""
+        records = _ScanGuard({"10000000078": [], "10000000146": []})
+        assert EducationImporter._match_tckn(sheet_title, records) == "10000000146"
+
+    def test_convention_title_without_source_record(self):
+        """Kaynakta olmayan TCKN için tarama yapılmadan None dönmeli."""
+        records = _ScanGuard({"10000000146": []})
+        assert (
+            EducationImporter._match_tckn("Ali YILMAZ - 10000000078", records) is None
+        )
+
+    @pytest.mark.parametrize(
+        "sheet_title",
+        ["Rapor 10000000146 eski", "Fatma-10000000146", "Fatma - 10000000146 (2)"],
+    )
+    def test_other_titles_fall_back_to_scan(self, sheet_title):
+        """Kurala uymayan adlarda TCKN sayfa adı içinde aranmalı."""
+        records = {"10000000078": [], "10000000146": []}
+        assert EducationImporter._match_tckn(sheet_title, records) == "10000000146"
+        assert EducationImporter._match_tckn("Özet", records) is None
+
+
+def _source_row(
+    tckn: str | None = "10000000146",
+    name: str | None = "ALİ",
+    graduation_date: str | None = "03/01/2022",
+    university: str | None = "İSTANBUL TEKNİK ÜNİVERSİTESİ",
+    faculty: str | None = "FEN BİLİMLERİ ENSTİTÜSÜ",
+    program: str | None = "FİZİK",
+) -> tuple[str | None, ...]:
+    """_SOURCE_COLUMNS sırasıyla tek kaynak satırı değerleri üretir."""
+    return (tckn, name, graduation_date, university, faculty, program)
+
+
+def _parse(*values: tuple[str | None, ...]):
+    """Satırları 2. Excel satırından başlayarak sütun bazlı ayrıştırır."""
+    return EducationImporter()._parse_source_rows(
+        [(row_no, row) for row_no, row in enumerate(values, start=2)]
+    )
+
+
+class TestParseSourceRows:
+    """EducationImporter._parse_source_rows testleri (satır bazlı sonuçlarla aynı)."""
+
+    @pytest.mark.parametrize(
+        ("row", "reason"),
+        [
+            (_source_row(tckn=None, name=None), "TC KIMLIK NO boş"),
+            (_source_row(tckn="12345", name="  "), "AD alanı boş"),
+            (
+                _source_row(tckn="12345", name="Mezun kaydı bulunamadı"),
+                "Kayıtta mezun kaydı bulunamadı ibaresi var",
+            ),
+            (_source_row(tckn="12345", university=None), "Geçersiz TCKN: 00000012345"),
+            (_source_row(university=" "), "Okul bilgisi üretilemedi"),
+        ],
+    )
+    def test_first_failing_rule_is_reported(self, row, reason):
+        """Birden fazla kurala takılan satırda ilk kuralın nedeni yazılmalı."""
+        records, warnings = _parse(row)
+
+        assert records == []
+        assert len(warnings) == 1
+        assert warnings[0].startswith(f"Kaynak satır 2 atlandı: {reason}. ")
+
+    def test_invalid_tckn_message_uses_normalized_tckn(self):
+        """Geçersiz TCKN uyarısı TCKN'yi 11 haneye tamamlanmış göstermeli."""
+        _, warnings = _parse(
+            _source_row(tckn=" 12345 ", name="  Ali   YILMAZ ", program=None)
+        )
+
+        assert warnings == [
+            "Kaynak satır 2 atlandı: Geçersiz TCKN: 00000012345. "
+            "TCKN='00000012345', AD='Ali YILMAZ', "
+            "ÜNİVERSİTE='İSTANBUL TEKNİK ÜNİVERSİTESİ', PROGRAM='-'"
+        ]
+
+    def test_blank_rows_are_skipped_silently(self):
+        """Tamamen boş satırlar uyarı üretmemeli; kayıt sırası korunmalı."""
+        records, warnings = _parse(
+            _source_row(tckn="10000000146"),
+            _source_row(None, None, None, None, None, " "),
+            _source_row(tckn="10000000078"),
+        )
+
+        assert warnings == []
+        assert [record.tckn for record in records] == ["10000000146", "10000000078"]
+
+    def test_dates_are_parsed_per_cell(self):
+        """Farklı biçimlerdeki tarihler hücre hücre çözülmeli; okunamayan kalmalı."""
+        values = [
+            "03/01/2022",
+            "13/01/2022",
+            "01/13/2022",
+            " 15/07/2024 ",
+            # Tarih hücreleri metne ``YYYY-MM-DD HH:MM:SS`` olarak çevrilir;
+            # dayfirst=True bu metinde de gün/ay yer değiştirir.
+            str(datetime.datetime(2022, 1, 3)),
+            "31/02/2022",
+            "abc",
+            None,
+            "03/01/2022",
+        ]
+        records, _ = _parse(*(_source_row(graduation_date=value) for value in values))
+
+        assert [record.graduation_date for record in records] == [
+            "03.01.2022",
+            "13.01.2022",
+            "13.01.2022",
+            "15.07.2024",
+            "01.03.2022",
+            "31/02/2022",
+            "abc",
+            "",
+            "03.01.2022",
+        ]
+
+    def test_date_cells_from_xlsx(self, tmp_path: Path):
+        """xlsx'teki tarih, metin ve boş hücreler aynı kurallarla çevrilmeli."""
+        source_path = tmp_path / "mezuniyet.xlsx"
+        dates = [datetime.datetime(2022, 1, 15), "15/07/2024", float("nan")]
+        _write_source_xlsx(
+            [
+                {
+                    "TC KIMLIK NO": tckn,
+                    "AD": "ALİ",
+                    "SOYAD": "YILMAZ",
+                    "MEZUNIYET TARIHI": graduation_date,
+                    "UNIVERSITE": "İSTANBUL TEKNİK ÜNİVERSİTESİ",
+                    "ENSMYOFAK": "FEN BİLİMLERİ ENSTİTÜSÜ",
+                    "PROGRAM": "FİZİK",
+                }
+                for tckn, graduation_date in zip(
+                    ["10000000146", "10000000078", "10000050028"], dates
+                )
+            ],
+            source_path,
+        )
+
+        records_by_tckn = EducationImporter()._read_source_records(source_path)
+
+        assert {
+            tckn: records[0].graduation_date
+            for tckn, records in records_by_tckn.items()
+        } == {
+            "10000000146": "15.01.2022",
+            "10000000078": "15.07.2024",
+            "10000050028": "",
+        }
+
+    @pytest.mark.parametrize(
+        ("program", "faculty", "level"),
+        [
+            ("TEZSİZ YÜKSEK LİSANS DOKTORA", "", OGRENIM_DOKTORA),
+            ("FİZİK (DR)", "", OGRENIM_DOKTORA),
+            ("RESİM", "SANATTA YETERLİK", OGRENIM_DOKTORA),
+            ("TEZSİZ YÜKSEK LİSANS İŞLETME", None, OGRENIM_TEZSIZ_YL),
+            ("tezsiz yuksek lisans", "", OGRENIM_TEZSIZ_YL),
+            ("İŞLETME", "SOSYAL BİLİMLER - TEZSİZ YÜKSEK LİSANS", OGRENIM_TEZSIZ_YL),
+            ("YÜKSEK LİSANS FİZİK", "", OGRENIM_TEZLI_YL),
+            ("MASTER OF SCIENCE", None, OGRENIM_TEZLI_YL),
+            ("KİMYA (YL)", "", OGRENIM_TEZLI_YL),
+            ("BİLGİSAYAR MÜHENDİSLİĞİ", "MÜHENDİSLİK FAKÜLTESİ", OGRENIM_LISANS),
+            (None, None, OGRENIM_LISANS),
+        ],
+    )
+    def test_level_keyword_priority(self, program, faculty, level):
+        """Seviye, program ve fakülte metnindeki ilk öncelikli ibareden seçilmeli."""
+        records, _ = _parse(_source_row(program=program, faculty=faculty))
+
+        assert records[0].level == level
+
+    @pytest.mark.parametrize(
+        ("program", "faculty", "department_text"),
+        [
+            ("YÜKSEK LİSANS (YL) - ÖRGÜN ÖĞRETİM", "", "YÜKSEK LİSANS"),
+            ("(DR) KİMYA", "FEN BİLİMLERİ ENSTİTÜSÜ", "KİMYA"),
+            ("A - B - C", None, "A"),
+            (None, "MÜHENDİSLİK FAKÜLTESİ", ""),
+            ("  FİZİK  ", None, "FİZİK"),
+        ],
+    )
+    def test_department_text(self, program, faculty, department_text):
+        """Bölüm metni programdan üretilmeli; boş program boş bölüm vermeli."""
+        records, _ = _parse(_source_row(program=program, faculty=faculty))
+
+        assert records[0].department_text == department_text
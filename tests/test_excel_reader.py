@@ -16,8 +16,10 @@ import pytest
 
 from src.core.excel_reader import (
     Personel,
+    SatirReddi,
     oku_personel_listesi_raporlu,
 )
+from src.core.validators import normalize_tckn, validate_ad_soyad, validate_tckn
 
 # ---------------------------------------------------------------------------
 # Yardımcı: hafızada test xlsx oluşturucu
@@ -181,3 +183,86 @@ class TestOkuPersonelListesiRaporlu:
         rapor = oku_personel_listesi_raporlu(dosya)
         assert len(rapor.personeller) == 1
         assert rapor.personeller[0].tckn == "10000000146"
+
+
+# ---------------------------------------------------------------------------
+# Testler: sütun bazlı doğrulama
+# ---------------------------------------------------------------------------
+
+
+def _satir_satir_oku(dosya: Path) -> tuple[list[Personel], list[SatirReddi]]:
+    """Tekil doğrulayıcılarla satır satır beklenen sonucu üretir."""
+    personeller, redler = [], []
+    df = pd.read_excel(dosya, dtype=str)
+    for index, satir in df.iterrows():
+        ham_tckn = satir["TCKN"]
+        tckn = "" if pd.isna(ham_tckn) else normalize_tckn(str(ham_tckn).strip())
+        ad_soyad = "" if pd.isna(satir["AD SOYAD"]) else str(satir["AD SOYAD"]).strip()
+        birim = "" if pd.isna(satir["BİRİMİ"]) else str(satir["BİRİMİ"]).strip()
+        nedenler = []
+        if not tckn:
+            nedenler.append("TCKN boş")
+        elif not validate_tckn(tckn):
+            nedenler.append(f"Geçersiz TCKN: {tckn}")
+        if not validate_ad_soyad(ad_soyad):
+            nedenler.append("AD SOYAD boş")
+        if nedenler:
+            redler.append(
+                SatirReddi(int(index) + 2, "; ".join(nedenler), tckn, ad_soyad, birim)
+            )
+        else:
+            personeller.append(Personel(tckn, ad_soyad, birim))
+    return personeller, redler
+
+
+class TestSutunBazliDogrulama:
+    """Sütun bazlı okuma yolunun satır satır doğrulamayla eşdeğerliği."""
+
+    def test_satir_satir_dogrulamayla_ayni_rapor(self, tmp_path: Path):
+        """Karışık girdilerde rapor tekil doğrulayıcılarla birebir aynı olmalı."""
+        dosya = tmp_path / "karisik.xlsx"
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        ws.append(["TCKN", "AD SOYAD", "BİRİMİ"])
+        for satir in [
+            ["10000000146", " Fatma KARACA ", "Marmara"],
+            [10000000078, "Ali YILMAZ", None],
+            ["  10000050028\t", "Ayşe DEMİR", " Kocaeli "],
+            ["12345", "Kısa TCKN", "Gebze"],
+            ["01234567890", "Sıfırla Başlayan", "Gebze"],
+            ["10000000147", "Hatalı Kontrol", "Gebze"],
+            ["1000000014a", "Harfli", "Gebze"],
+            ["１００００００００７８", "Tam Genişlik", "Gebze"],
+            [None, None, "Boş"],
+            ["  ", "   ", None],
+            ["10000000146", "", "Ad yok"],
+            [None, None, None],
+            ["10000000078", "Ali YILMAZ", "Tekrar"],
+        ]:
+            ws.append(satir)
+        wb.save(dosya)
+
+        rapor = oku_personel_listesi_raporlu(dosya)
+        beklenen_personeller, beklenen_redler = _satir_satir_oku(dosya)
+
+        assert rapor.personeller == beklenen_personeller
+        assert rapor.reddedilen_satirlar == beklenen_redler
+        assert [p.tckn for p in rapor.personeller] == [
+            "10000000146",
+            "10000000078",
+            "10000050028",
+            "１００００００００７８",  # str.isdigit kabul ettiği için tekil yol da geçer
+            "10000000078",
+        ]
+
+    def test_bos_liste(self, tmp_path: Path):
+        """Yalnızca başlık içeren dosya boş rapor döndürmeli."""
+        dosya = tmp_path / "bos.xlsx"
+        pd.DataFrame(columns=["TCKN", "AD SOYAD", "BİRİMİ"]).to_excel(
+            dosya, index=False
+        )
+
+        rapor = oku_personel_listesi_raporlu(dosya)
+
+        assert rapor.personeller == []
+        assert rapor.reddedilen_satirlar == []
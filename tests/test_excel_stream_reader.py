@@ -0,0 +1,136 @@
+"""excel_stream_reader modülü için testler."""
+
+from __future__ import annotations
+
+import datetime
+import zipfile
+from pathlib import Path
+from unittest.mock import patch
+
+import openpyxl
+import pandas as pd
+import pytest
+
+from src.core.excel_stream_reader import XlsxSutunOkuyucu, hucre_metni
+
+
+def _xlsx_yaz(satirlar: list[list[object]], dosya_yolu: Path) -> Path:
+    """Satırları ilk sayfaya sırayla yazar."""
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    for satir in satirlar:
+        ws.append(satir)
+    wb.save(dosya_yolu)
+    return dosya_yolu
+
+
+@pytest.fixture()
+def karisik_xlsx(tmp_path: Path) -> Path:
+    """Farklı hücre türleri, boş satırlar ve fazladan sütunlar içeren dosya."""
+    return _xlsx_yaz(
+        [
+            ["TCKN", "NOT", "AD SOYAD", "BİRİMİ", "TCKN"],
+            [10000000146, "x", "Fatma KARACA", "Marmara", "ikinci"],
+            [1.0000000078e10, None, "  Ali  ", 1.5, None],
+            [None, None, None, None, None],
+            ["NA", "yalnız not", "", datetime.datetime(2022, 1, 3), None],
+            [None, "sadece fazladan sütun", None, None, None],
+            [" 10000050028 ", None, True, "#N/A", None],
+            [None, None, None, None, None],
+            [None, None, None, None, None],
+        ],
+        tmp_path / "karisik.xlsx",
+    )
+
+
+class TestHucreMetni:
+    """hucre_metni fonksiyonu testleri."""
+
+    @pytest.mark.parametrize(
+        ("deger", "beklenen"),
+        [
+            (None, None),
+            ("", None),
+            ("NA", None),
+            (" metin ", " metin "),
+            (10000000146, "10000000146"),
+            (10000000146.0, "10000000146"),
+            (1.5, "1.5"),
+            (True, "True"),
+            (datetime.datetime(2022, 1, 3), "2022-01-03 00:00:00"),
+        ],
+    )
+    def test_pandas_dtype_str_ile_ayni(self, deger, beklenen):
+        """Değerler pandas'ın dtype=str okumasıyla aynı metne çevrilmeli."""
+        assert hucre_metni(deger) == beklenen
+
+
+class TestXlsxSutunOkuyucu:
+    """XlsxSutunOkuyucu sınıfı testleri."""
+
+    def test_pandas_read_excel_ile_ayni_satirlar(self, karisik_xlsx: Path):
+        """İstenen sütunlar ve satır numaraları pandas okumasıyla örtüşmeli."""
+        sutunlar = ("TCKN", "AD SOYAD", "BİRİMİ")
+        df = pd.read_excel(karisik_xlsx, dtype=str)
+        beklenen = [
+            (int(index) + 2, tuple(None if pd.isna(v) else v for v in satir))
+            for index, satir in df[list(sutunlar)].iterrows()
+        ]
+
+        with XlsxSutunOkuyucu(karisik_xlsx) as okuyucu:
+            satirlar = list(okuyucu.satirlar(sutunlar))
+
+        assert satirlar == beklenen
+
+    def test_baslik_satiri_bos_satirlardan_sonra_bulunur(self, tmp_path: Path):
+        """Baştaki boş satırlar atlanmalı; satır numaraları Excel'deki gibi kalmalı."""
+        dosya = _xlsx_yaz(
+            [[None, None], [None, None], ["TCKN", "AD"], ["10000000146", "Fatma"]],
+            tmp_path / "bosluklu.xlsx",
+        )
+
+        with XlsxSutunOkuyucu(dosya) as okuyucu:
+            assert okuyucu.baslik_satir_no == 3
+            assert list(okuyucu.satirlar(("AD",))) == [(4, ("Fatma",))]
+
+    def test_eksik_sutun_hata(self, karisik_xlsx: Path):
+        """Başlıkta olmayan sütun istenirse ValueError fırlatılmalı."""
+        with XlsxSutunOkuyucu(karisik_xlsx) as okuyucu:
+            with pytest.raises(ValueError):
+                next(okuyucu.satirlar(("YOK",)))
+
+    def test_satirlar_tembel_uretilir(self, tmp_path: Path):
+        """Satırlar dosya tümüyle okunmadan birer birer üretilmeli."""
+        dosya = _xlsx_yaz(
+            [["TCKN"]] + [[str(10**10 + sira)] for sira in range(1000)],
+            tmp_path / "uzun.xlsx",
+        )
+
+        with XlsxSutunOkuyucu(dosya) as okuyucu:
+            satirlar = okuyucu.satirlar(("TCKN",))
+            assert next(satirlar) == (2, ("10000000000",))
+            assert next(satirlar) == (3, ("10000000001",))
+
+    def test_baslik_okunamazsa_dosya_kapatilir(self, tmp_path: Path):
+        """Başlık taraması hata verirse açılan workbook kapatılmalı."""
+        dosya = tmp_path / "bozuk.xlsx"
+        with zipfile.ZipFile(_xlsx_yaz([["TCKN"]], tmp_path / "kaynak.xlsx")) as kaynak:
+            with zipfile.ZipFile(dosya, "w") as hedef:
+                for oge in kaynak.infolist():
+                    veri = kaynak.read(oge)
+                    if oge.filename == "xl/worksheets/sheet1.xml":
+                        veri = veri[: len(veri) // 2]
+                    hedef.writestr(oge, veri)
+
+        load_workbook = openpyxl.load_workbook
+        acilanlar = []
+
+        def kaydeden(*args, **kwargs):
+            acilanlar.append(load_workbook(*args, **kwargs))
+            return acilanlar[-1]
+
+        with patch("src.core.excel_stream_reader.openpyxl.load_workbook", kaydeden):
+            with pytest.raises(Exception):
+                XlsxSutunOkuyucu(dosya)
+
+        assert acilanlar[0]._archive.fp is None
@@ -193,3 +193,76 @@ class TestExcelWriteStrategyV1:
     def test_is_abstract_strategy_subclass(self):
         """V1 stratejisi ExcelWriteStrategy alt sınıfı olmalı."""
         assert issubclass(ExcelWriteStrategyV1, ExcelWriteStrategy)
+
+    def test_sayfa_plani_ayni_duzen_icin_onbellekten_gelir(self, strategy):
+        """Aynı sütun düzenindeki sayfalar tek derlenmiş planı paylaşmalı."""
+        wb = openpyxl.Workbook()
+        ilk = wb.active
+        ikinci = wb.create_sheet()
+        assert strategy.sayfa_plani(ilk) is strategy.sayfa_plani(ikinci)
+
+        ikinci.column_dimensions["L"].width = 40
+        plan = strategy.sayfa_plani(ikinci)
+        assert plan is not strategy.sayfa_plani(ilk)
+        assert plan.sutun_genislikleri == (("M", 40),)
+
+    def test_sayfa_plani_personel_verisi_icermez(self, strategy, personel):
+        """Plan yalnızca kişiye özel hücre adreslerini tutmalı."""
+        plan = strategy.sayfa_plani(openpyxl.Workbook().active)
+        assert plan.personel_hucreleri == (
+            ("B3", "ad_soyad"),
+            ("C3", "tckn"),
+            ("D3", "birim"),
+        )
+        degerler = [deger for _hucre, deger in plan.degerler]
+        assert personel.ad_soyad not in degerler
+        assert personel.tckn not in degerler
+
+    def test_sayfa_plani_dogrulamalari_sayfalar_arasinda_paylasilmaz(
+        self, strategy, personel
+    ):
+        """Her sayfaya kendi veri doğrulama nesneleri eklenmeli."""
+        wb = openpyxl.Workbook()
+        ilk = wb.active
+        ikinci = wb.create_sheet()
+        strategy.sayfa_doldur(ilk, personel)
+        strategy.sayfa_doldur(ikinci, personel)
+
+        ilk_dv = ilk.data_validations.dataValidation
+        ikinci_dv = ikinci.data_validations.dataValidation
+        assert [str(dv.sqref) for dv in ilk_dv] == ["B6 B7 B8 B9 B10", "M3"]
+        assert all(a is not b for a, b in zip(ilk_dv, ikinci_dv))
+
+    def test_sayfa_doldur_m3_eski_dogrulamasini_degistirir(
+        self, strategy, personel, template_ws
+    ):
+        """Şablondaki M3 doğrulaması tek A/AG listesiyle değiştirilmeli."""
+        from openpyxl.worksheet.datavalidation import DataValidation
+
+        eski = DataValidation(type="list", formula1='"X,Y"')
+        template_ws.add_data_validation(eski)
+        eski.add("M3")
+
+        strategy.sayfa_doldur(template_ws, personel)
+
+        m3 = [
+            dv
+            for dv in template_ws.data_validations.dataValidation
+            if str(dv.sqref) == "M3"
+        ]
+        assert [dv.formula1 for dv in m3] == ['"A,AG"']
+
+    def test_ortak_tablolar_plani_ucret_tablosu_yazmaz(self, personel):
+        """Ortak tablo kipinde sayfa yalnızca tanımlı ada başvurmalı."""
+        strategy = ExcelWriterFactory.create("v1", ortak_tablolar=True)
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        strategy.sayfa_doldur(ws, personel)
+
+        assert ws["AA1"].value is None
+        assert ws["G3"].value == '=IFERROR(VLOOKUP(F3,BRUT_UCRET_TABLOSU,2,FALSE),"")'
+
+        strategy.ortak_sayfalari_ekle(wb)
+        strategy.ortak_sayfalari_ekle(wb)
+        assert len(wb.sheetnames) == 2
+        assert wb.worksheets[1]["A1"].value is not None
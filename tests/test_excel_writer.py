@@ -7,16 +7,21 @@ sayfa sayısı, sayfa adları ve hücre değerleri doğrulanır.
 
 from __future__ import annotations
 
+from pathlib import Path
+from unittest.mock import patch
+
 import openpyxl
 import pytest
 
 from src.core.excel_reader import Personel
 from src.core.excel_writer import (
     _sayfa_adi_olustur,
+    iter_dk_tutanaklari,
     olustur_dk_dosyasi_raporlu,
+    olustur_dk_klasoru_raporlu,
 )
 from src.core.excel_write_strategy_v1 import ExcelWriteStrategyV1
-from src.config.constants import TECRUBE_BASLANGIC_SATIR
+from src.config.constants import MANIFEST_FILENAME, TECRUBE_BASLANGIC_SATIR
 
 _HUCRE_UNVAN = ExcelWriteStrategyV1.HUCRE_UNVAN
 
@@ -282,3 +287,220 @@ class TestOlusturDkDosyasiRaporlu:
         assert rapor.skipped_existing_count == 1
         assert len(rapor.warning_messages) == 1
         assert "hedef dosyada zaten mevcut" in rapor.warning_messages[0]
+
+    def test_sayfalar_stil_kayitlarini_paylasir(self, tmp_path, uc_personel):
+        """Tekrarlanan sayfalar aynı stil kayıtlarını kullanmalı."""
+        olustur_dk_dosyasi_raporlu(uc_personel, tmp_path, dosya_adi="test.xlsx")
+        wb = openpyxl.load_workbook(tmp_path / "test.xlsx")
+        ilk, ikinci = wb.worksheets[0], wb.worksheets[1]
+
+        for koordinat in ("B2", "B3", "K13", "L30"):
+            assert tuple(ilk[koordinat]._style) == tuple(ikinci[koordinat]._style)
+        wb.close()
+
+    def test_ortak_tablolar_tek_gizli_sayfa_kullanir(self, tmp_path, uc_personel):
+        """Ücret tablosu tek gizli sayfada olmalı, G3 tanımlı ada bakmalı."""
+        olustur_dk_dosyasi_raporlu(
+            uc_personel, tmp_path, dosya_adi="test.xlsx", ortak_tablolar=True
+        )
+        wb = openpyxl.load_workbook(tmp_path / "test.xlsx")
+
+        tablo_sayfasi = wb.worksheets[-1]
+        assert len(wb.sheetnames) == 4
+        assert tablo_sayfasi.sheet_state == "hidden"
+        assert wb.defined_names["BRUT_UCRET_TABLOSU"].attr_text == (
+            f"'{tablo_sayfasi.title}'!$A$1:$B${tablo_sayfasi.max_row}"
+        )
+        for ws in wb.worksheets[:3]:
+            assert "BRUT_UCRET_TABLOSU" in ws["G3"].value
+            assert ws["AA1"].value is None
+            assert not ws.column_dimensions["AA"].hidden
+        wb.close()
+
+    def test_ortak_tablolar_eklemede_tekrarlanmaz(self, tmp_path, uc_personel):
+        """Mevcut dosyaya eklemede gizli tablo sayfası yeniden eklenmemeli."""
+        olustur_dk_dosyasi_raporlu(
+            uc_personel[:2], tmp_path, dosya_adi="test.xlsx", ortak_tablolar=True
+        )
+        rapor = olustur_dk_dosyasi_raporlu(
+            uc_personel, tmp_path, dosya_adi="test.xlsx", ortak_tablolar=True
+        )
+        wb = openpyxl.load_workbook(tmp_path / "test.xlsx")
+
+        assert rapor.added_sheet_count == 1
+        assert len(wb.sheetnames) == 4
+        assert list(wb.defined_names) == ["BRUT_UCRET_TABLOSU"]
+        assert "BRUT_UCRET_TABLOSU" in wb.worksheets[-1]["G3"].value
+        wb.close()
+
+    def test_formul_onbellek_degerleri_yazilir(self, tmp_path, tek_personel):
+        """data_only ile okunduğunda formüllerin hesaplanmış değeri görünmeli."""
+        olustur_dk_dosyasi_raporlu(tek_personel, tmp_path, dosya_adi="test.xlsx")
+        wb = openpyxl.load_workbook(tmp_path / "test.xlsx", data_only=True)
+        ws = wb.worksheets[0]
+
+        # Varsayılan şablondaki örnek tecrübe ve öğrenim satırlarına göre
+        assert [ws[f"K{satir}"].value for satir in (13, 14, 15)] == [365, 358, 690]
+        assert ws["L28"].value == 723
+        assert (ws["J29"].value, ws["K29"].value, ws["L29"].value) == (2, 0, 3)
+        assert ws["Z4"].value == "Doktora"
+        assert ws["F3"].value == "AG-6/2"
+        assert ws["G3"].value == 154573.14
+        assert ws[_HUCRE_UNVAN].value == "Araştırmacı"
+        wb.close()
+
+        wb = openpyxl.load_workbook(tmp_path / "test.xlsx")
+        assert wb.worksheets[0]["G3"].value.startswith("=")
+        wb.close()
+
+
+# ---------------------------------------------------------------------------
+# olustur_dk_klasoru_raporlu testleri
+# ---------------------------------------------------------------------------
+
+
+class TestOlusturDkKlasoruRaporlu:
+    """Personel başına dosya üreten klasör modu için testler."""
+
+    def test_seri_ve_paralel_ayni_raporu_uretir(self, tmp_path, uc_personel):
+        """jobs>1 ile dosyalar ve sıra seri üretimle aynı olmalı."""
+        seri = olustur_dk_klasoru_raporlu(uc_personel, tmp_path / "seri")
+        paralel = olustur_dk_klasoru_raporlu(uc_personel, tmp_path / "paralel", jobs=2)
+
+        assert paralel.added_file_count == seri.added_file_count == 3
+        assert [p.name for p in paralel.generated_files] == [
+            p.name for p in seri.generated_files
+        ]
+        for dosya in paralel.generated_files:
+            wb = openpyxl.load_workbook(dosya)
+            assert wb.worksheets[0]["C3"].value in dosya.stem
+            wb.close()
+
+    def test_paralel_tekrarlanan_personel_atlanir(self, tmp_path, uc_personel):
+        """Aynı dosyaya düşen kayıtlar paralel modda da sırayla atlanmalı."""
+        personeller = [uc_personel[0], uc_personel[1], uc_personel[0]]
+
+        rapor = olustur_dk_klasoru_raporlu(personeller, tmp_path, jobs=3)
+
+        assert rapor.added_file_count == 2
+        assert rapor.skipped_existing_file_count == 1
+        assert len(rapor.warning_messages) == 1
+        assert uc_personel[0].tckn in rapor.warning_messages[0]
+
+    @pytest.mark.parametrize("hizli_klon", [False, True])
+    def test_boru_hatti_seri_raporla_ayni(self, tmp_path, uc_personel, hizli_klon):
+        """Boru hattı modu aynı dosyaları, sırayı ve atlamaları üretmeli."""
+        personeller = uc_personel + [uc_personel[0]]
+        seri = olustur_dk_klasoru_raporlu(personeller, tmp_path / "seri")
+        boru = olustur_dk_klasoru_raporlu(
+            personeller, tmp_path / "boru", hizli_klon=hizli_klon, boru_hatti=True
+        )
+
+        assert boru.added_file_count == seri.added_file_count == 3
+        assert boru.skipped_existing_file_count == seri.skipped_existing_file_count
+        assert boru.warning_messages == seri.warning_messages
+        assert [p.name for p in boru.generated_files] == [
+            p.name for p in seri.generated_files
+        ]
+        for dosya in boru.generated_files:
+            wb = openpyxl.load_workbook(dosya)
+            assert wb.worksheets[0]["C3"].value in dosya.stem
+            wb.close()
+
+    def test_boru_hatti_yazma_hatasi_iletilir(self, tmp_path, uc_personel):
+        """Yazma aşamasındaki hata çağırana aynen iletilmeli."""
+        with patch.object(
+            Path, "write_bytes", side_effect=PermissionError("dosya kilitli")
+        ):
+            with pytest.raises(PermissionError, match="dosya kilitli"):
+                olustur_dk_klasoru_raporlu(uc_personel, tmp_path, boru_hatti=True)
+
+    def test_gecersiz_jobs_hata_verir(self, tmp_path, tek_personel):
+        """jobs 1'den küçükse ValueError fırlatılmalı."""
+        with pytest.raises(ValueError, match="jobs"):
+            olustur_dk_klasoru_raporlu(tek_personel, tmp_path, jobs=0)
+
+    def test_zamanlama_asama_surelerini_raporlar(self, tmp_path, uc_personel):
+        """zamanlama=True ile aşama süreleri rapora eklenmeli; varsayılan boş."""
+        rapor = olustur_dk_klasoru_raporlu(uc_personel, tmp_path / "a", zamanlama=True)
+        adetler = {ozet.ad: ozet.adet for ozet in rapor.phase_timings}
+
+        assert adetler["sablon.yukle"] == 1
+        assert adetler["yazici.sayfa_kopyala"] == 3
+        assert adetler["strateji.sayfa_doldur"] == 3
+        assert adetler["yazici.kaydet"] == 3
+        toplamlar = [ozet.toplam_sn for ozet in rapor.phase_timings]
+        assert toplamlar == sorted(toplamlar, reverse=True)
+
+        assert (
+            olustur_dk_klasoru_raporlu(uc_personel, tmp_path / "b").phase_timings == []
+        )
+
+    def test_zamanlama_paralel_isci_asamalarini_toplar(self, tmp_path, uc_personel):
+        """jobs>1 iken işçi süreçlerin aşamaları da rapora eklenmeli."""
+        rapor = olustur_dk_klasoru_raporlu(
+            uc_personel, tmp_path, jobs=2, zamanlama=True
+        )
+        adetler = {ozet.ad: ozet.adet for ozet in rapor.phase_timings}
+        assert adetler["yazici.kaydet"] == 3
+        assert adetler["strateji.sayfa_doldur"] == 3
+
+
+class TestIterDkTutanaklari:
+    """Personel sonuçlarını akıtan üretici testleri."""
+
+    @pytest.mark.parametrize(
+        "ayarlar",
+        [{}, {"jobs": 2}, {"boru_hatti": True}],
+        ids=["seri", "paralel", "boru"],
+    )
+    def test_sonuclar_girdi_sirasiyla_uretilir(self, tmp_path, uc_personel, ayarlar):
+        """Her personel için bir sonuç girdi sırasıyla üretilmeli."""
+        personeller = uc_personel + [uc_personel[0]]
+
+        sonuclar = list(iter_dk_tutanaklari(personeller, tmp_path, **ayarlar))
+
+        assert [s.personel for s in sonuclar] == personeller
+        assert [s.durum for s in sonuclar] == ["olusturuldu"] * 3 + ["atlandi"]
+        assert [s.dosyaya_yazildi for s in sonuclar] == [True] * 3 + [False]
+        assert all(s.output_path.exists() for s in sonuclar)
+        assert all(s.sure_sn >= 0 for s in sonuclar)
+        assert sonuclar[-1].warning_messages
+
+    def test_erken_birakilirsa_kalanlar_yazilmaz(self, tmp_path, uc_personel):
+        """Üretici kapatıldığında sonraki personellerin dosyası oluşmamalı."""
+        sonuclar = iter_dk_tutanaklari(uc_personel, tmp_path, artimli=True)
+
+        ilk = next(sonuclar)
+        sonuclar.close()
+
+        assert ilk.output_path.exists()
+        assert sorted(tmp_path.glob("*.xlsx")) == [ilk.output_path]
+        # Yazılan dosya manifestoya işlenir; sonraki çalıştırma onu atlar.
+        assert (tmp_path / MANIFEST_FILENAME).exists()
+        durumlar = [
+            s.durum for s in iter_dk_tutanaklari(uc_personel, tmp_path, artimli=True)
+        ]
+        assert durumlar == ["guncel", "olusturuldu", "olusturuldu"]
+
+    def test_gecersiz_jobs_hemen_hata_verir(self, tmp_path, tek_personel):
+        """jobs doğrulaması üretici tüketilmeden yapılmalı."""
+        with pytest.raises(ValueError, match="jobs"):
+            iter_dk_tutanaklari(tek_personel, tmp_path, jobs=0)
+
+    def test_ilerleme_sonuclarla_ayni_sirada(self, tmp_path, uc_personel):
+        """Rapor fonksiyonunun ilerleme bildirimleri sonuç sırasını izlemeli."""
+        bildirimler = []
+
+        rapor = olustur_dk_klasoru_raporlu(
+            uc_personel,
+            tmp_path,
+            jobs=2,
+            ilerleme=lambda personel, yol, durum: bildirimler.append(
+                (personel, yol, durum)
+            ),
+        )
+
+        assert [b[0] for b in bildirimler] == uc_personel
+        assert [b[1] for b in bildirimler] == rapor.generated_files
+        assert {b[2] for b in bildirimler} == {"olusturuldu"}
@@ -0,0 +1,254 @@
+"""excel_zip_writer modülü ve hızlı klon yazım yolu testleri."""
+
+from __future__ import annotations
+
+import zipfile
+
+import openpyxl
+import pytest
+
+from src.core.excel_reader import Personel
+from src.core.excel_writer import (
+    olustur_dk_dosyasi_raporlu,
+    olustur_dk_klasoru_raporlu,
+)
+from src.core.excel_zip_writer import (
+    ZipKlonYazici,
+    formul_onbellegini_yaz,
+    sayfa_adlarini_oku,
+)
+
+
+@pytest.fixture()
+def personeller() -> list[Personel]:
+    return [
+        Personel(tckn="10000000146", ad_soyad="Fatma O'KARA & Co", birim='"Birim"'),
+        Personel(tckn="10000000078", ad_soyad="Ali YILMAZ", birim=""),
+    ]
+
+
+class TestHizliKlon:
+    """hizli_klon=True çıktısının openpyxl yoluyla eşdeğerliği."""
+
+    def test_parcalar_openpyxl_ciktisiyla_ayni(self, tmp_path, personeller):
+        """Zaman damgası dışındaki tüm zip parçaları birebir aynı olmalı."""
+        normal = olustur_dk_klasoru_raporlu(personeller, tmp_path / "normal")
+        klon = olustur_dk_klasoru_raporlu(
+            personeller, tmp_path / "klon", hizli_klon=True
+        )
+
+        assert [p.name for p in klon.generated_files] == [
+            p.name for p in normal.generated_files
+        ]
+        for normal_yol, klon_yol in zip(normal.generated_files, klon.generated_files):
+            with zipfile.ZipFile(normal_yol) as a, zipfile.ZipFile(klon_yol) as b:
+                assert a.namelist() == b.namelist()
+                for ad in a.namelist():
+                    if ad == "docProps/core.xml":
+                        continue
+                    assert a.read(ad) == b.read(ad), ad
+
+    def test_ozel_karakterler_korunur(self, tmp_path, personeller):
+        """Ad, birim ve yazdırma alanı kaçış karakterleriyle doğru okunmalı."""
+        rapor = olustur_dk_klasoru_raporlu(personeller, tmp_path, hizli_klon=True)
+
+        wb = openpyxl.load_workbook(rapor.generated_files[0])
+        ws = wb.worksheets[0]
+        assert ws["B3"].value == "Fatma O'KARA & Co"
+        assert ws["C3"].value == "10000000146"
+        assert ws["D3"].value == '"Birim"'
+        assert ws.print_area.startswith("'Fatma O''KARA & Co - 10000000146'!")
+        wb.close()
+
+    def test_mevcut_dosya_openpyxl_ile_atlanir(self, tmp_path, personeller):
+        """Var olan dosyalar için normal atlama akışı çalışmalı."""
+        olustur_dk_klasoru_raporlu(personeller, tmp_path, hizli_klon=True)
+
+        rapor = olustur_dk_klasoru_raporlu(personeller, tmp_path, hizli_klon=True)
+
+        assert rapor.added_file_count == 0
+        assert rapor.skipped_existing_file_count == 2
+
+    def test_paralel_hizli_klon(self, tmp_path, personeller):
+        """jobs>1 ile hızlı klon aynı dosyaları üretmeli."""
+        rapor = olustur_dk_klasoru_raporlu(
+            personeller, tmp_path, jobs=2, hizli_klon=True
+        )
+
+        assert rapor.added_file_count == 2
+        wb = openpyxl.load_workbook(rapor.generated_files[1])
+        assert wb.worksheets[0]["B3"].value == "Ali YILMAZ"
+        wb.close()
+
+
+class TestAkisliBirlesikDosya:
+    """akisli=True birleşik dosya çıktısının openpyxl yoluyla eşdeğerliği."""
+
+    def test_parcalar_openpyxl_ciktisiyla_ayni(self, tmp_path, personeller):
+        """Tekrarlanan kayıt ve büyük/küçük harf çakışması dahil aynı çıktı."""
+        girdiler = personeller + [
+            personeller[0],
+            Personel(tckn="10000000078", ad_soyad="ALI YILMAZ", birim="X"),
+        ]
+        normal = olustur_dk_dosyasi_raporlu(girdiler, tmp_path / "normal")
+        akisli = olustur_dk_dosyasi_raporlu(girdiler, tmp_path / "akisli", akisli=True)
+
+        assert akisli.added_sheet_count == normal.added_sheet_count == 3
+        assert akisli.skipped_existing_count == normal.skipped_existing_count == 1
+        assert akisli.warning_messages == normal.warning_messages
+        with (
+            zipfile.ZipFile(normal.output_path) as a,
+            zipfile.ZipFile(akisli.output_path) as b,
+        ):
+            assert a.namelist() == b.namelist()
+            for ad in a.namelist():
+                if ad == "docProps/core.xml":
+                    continue
+                assert a.read(ad) == b.read(ad), ad
+
+    def test_sayfalar_okunabilir(self, tmp_path, personeller):
+        """Her sayfa kendi personel değerlerini ve yazdırma alanını taşımalı."""
+        rapor = olustur_dk_dosyasi_raporlu(personeller, tmp_path, akisli=True)
+
+        wb = openpyxl.load_workbook(rapor.output_path)
+        assert wb.sheetnames == [
+            "Fatma O'KARA & Co - 10000000146",
+            "Ali YILMAZ - 10000000078",
+        ]
+        ikinci = wb.worksheets[1]
+        assert ikinci["B3"].value == "Ali YILMAZ"
+        assert ikinci["C3"].value == "10000000078"
+        assert ikinci.print_area.startswith("'Ali YILMAZ - 10000000078'!")
+        wb.close()
+
+    def test_mevcut_dosyaya_zip_seviyesinde_eklenir(self, tmp_path, personeller):
+        """Eski sayfa parçaları değişmeden kalmalı, yeni sayfa sona eklenmeli."""
+        ilk = olustur_dk_dosyasi_raporlu(personeller[:1], tmp_path, akisli=True)
+        with zipfile.ZipFile(ilk.output_path) as z:
+            eski_sayfa = z.read("xl/worksheets/sheet1.xml")
+
+        rapor = olustur_dk_dosyasi_raporlu(personeller, tmp_path, akisli=True)
+
+        assert rapor.added_sheet_count == 1
+        assert rapor.skipped_existing_count == 1
+        assert "hedef dosyada zaten mevcut" in rapor.warning_messages[0]
+        assert sayfa_adlarini_oku(rapor.output_path) == [
+            "Fatma O'KARA & Co - 10000000146",
+            "Ali YILMAZ - 10000000078",
+        ]
+        with zipfile.ZipFile(rapor.output_path) as z:
+            assert z.read("xl/worksheets/sheet1.xml") == eski_sayfa
+        wb = openpyxl.load_workbook(rapor.output_path)
+        ikinci = wb.worksheets[1]
+        assert ikinci["B3"].value == "Ali YILMAZ"
+        assert ikinci.print_area.startswith("'Ali YILMAZ - 10000000078'!")
+        wb.close()
+
+    def test_ekleme_openpyxl_eklemesiyle_esdeger(self, tmp_path, personeller):
+        """Zip seviyesinde ekleme, openpyxl ile eklemeyle aynı içeriği üretmeli."""
+        for klasor in ("normal", "akisli"):
+            olustur_dk_dosyasi_raporlu(personeller[:1], tmp_path / klasor, akisli=True)
+        normal = olustur_dk_dosyasi_raporlu(personeller, tmp_path / "normal")
+        akisli = olustur_dk_dosyasi_raporlu(
+            personeller, tmp_path / "akisli", akisli=True
+        )
+
+        wb_a = openpyxl.load_workbook(normal.output_path)
+        wb_b = openpyxl.load_workbook(akisli.output_path)
+        assert wb_a.sheetnames == wb_b.sheetnames
+        for ws_a, ws_b in zip(wb_a.worksheets, wb_b.worksheets):
+            assert ws_a.print_area == ws_b.print_area
+            for satir in ws_a.iter_rows():
+                for hucre in satir:
+                    assert hucre.value == ws_b[hucre.coordinate].value
+        wb_a.close()
+        wb_b.close()
+
+    def test_tum_kayitlar_varsa_dosyaya_dokunulmaz(self, tmp_path, personeller):
+        """Eklenecek sayfa yoksa dosya yeniden yazılmamalı."""
+        ilk = olustur_dk_dosyasi_raporlu(personeller, tmp_path, akisli=True)
+        onceki = ilk.output_path.read_bytes()
+
+        rapor = olustur_dk_dosyasi_raporlu(personeller, tmp_path, akisli=True)
+
+        assert rapor.added_sheet_count == 0
+        assert rapor.skipped_existing_count == 2
+        assert ilk.output_path.read_bytes() == onceki
+        assert [p.name for p in tmp_path.iterdir()] == [ilk.output_path.name]
+
+    def test_uyumsuz_stillerde_openpyxl_ile_eklenir(self, tmp_path, personeller):
+        """Stil tablosu prototiple uyuşmayan dosyada openpyxl yolu kullanılmalı."""
+        wb = openpyxl.Workbook()
+        wb.active.title = "Eski Sayfa"
+        wb.active["A1"] = "eski"
+        wb.save(tmp_path / "DK_cikti.xlsx")
+
+        rapor = olustur_dk_dosyasi_raporlu(personeller, tmp_path, akisli=True)
+
+        assert rapor.added_sheet_count == 2
+        wb = openpyxl.load_workbook(rapor.output_path)
+        assert wb.sheetnames[0] == "Eski Sayfa"
+        assert wb.worksheets[1]["B3"].value == "Fatma O'KARA & Co"
+        wb.close()
+
+
+class TestZipKlonYazici:
+    """ZipKlonYazici doğrulama testleri."""
+
+    def test_eksik_hucre_hata_verir(self, tmp_path):
+        """Prototipte olmayan hücre istenirse ValueError fırlatılmalı."""
+        wb = openpyxl.Workbook()
+        wb.active.title = "Yer Tutucu - 1"
+        yol = tmp_path / "prototip.xlsx"
+        wb.save(yol)
+
+        with pytest.raises(ValueError, match="B3"):
+            ZipKlonYazici(yol.read_bytes(), "Yer Tutucu - 1", ["B3"])
+
+    def test_birlesik_dosya_bos_sayfa_listesi_hata_verir(self, tmp_path):
+        """Sayfa verilmeden birleşik dosya yazılamamalı."""
+        wb = openpyxl.Workbook()
+        wb.active.title = "Yer Tutucu - 0"
+        wb.active["B3"] = ""
+        yol = tmp_path / "prototip.xlsx"
+        wb.save(yol)
+        yazici = ZipKlonYazici(yol.read_bytes(), "Yer Tutucu - 0", ["B3"])
+
+        with pytest.raises(ValueError, match="en az bir sayfa"):
+            yazici.birlesik_dosya_yaz(tmp_path / "bos.xlsx", [])
+
+
+class TestFormulOnbellegi:
+    """formul_onbellegini_yaz ve hızlı yolların önbellek değerleri."""
+
+    def test_deger_turleri(self):
+        """Sayı t'siz, metin t="str", mantıksal t="b" ile yazılmalı."""
+        xml = (
+            '<c r="A1" s="1"><f>1+1</f><v /></c>'
+            '<c r="B1"><f>"x"</f><v /></c>'
+            '<c r="C1"><f>TRUE</f><v /></c>'
+            '<c r="D1"><f>D2</f><v /></c>'
+        )
+        sonuc = formul_onbellegini_yaz(xml, {"A1": 2.0, "B1": "a<b", "C1": True})
+
+        assert '<c r="A1" s="1"><f>1+1</f><v>2</v></c>' in sonuc
+        assert '<c r="B1" t="str"><f>"x"</f><v>a&lt;b</v></c>' in sonuc
+        assert '<c r="C1" t="b"><f>TRUE</f><v>1</v></c>' in sonuc
+        assert '<c r="D1"><f>D2</f><v /></c>' in sonuc
+
+    @pytest.mark.parametrize("mod", ["hizli_klon", "akisli"])
+    def test_hizli_yollar_degerleri_tasir(self, tmp_path, personeller, mod):
+        """Zip seviyesinde üretilen sayfalar da önbellek değerlerini içermeli."""
+        if mod == "hizli_klon":
+            rapor = olustur_dk_klasoru_raporlu(personeller, tmp_path, hizli_klon=True)
+            yol = rapor.generated_files[-1]
+        else:
+            yol = olustur_dk_dosyasi_raporlu(
+                personeller, tmp_path, dosya_adi="test.xlsx", akisli=True
+            ).output_path
+
+        wb = openpyxl.load_workbook(yol, data_only=True)
+        for ws in wb.worksheets:
+            assert ws["F3"].value == "AG-6/2"
+            assert ws["G3"].value == 154573.14
+        wb.close()
@@ -0,0 +1,160 @@
+"""
+formula_evaluator modülü için testler.
+
+Hesaplama fonksiyonlarının Excel'in değerlendirme kurallarıyla (boş hücre,
+metin/sayı karşılaştırması, büyük/küçük harf duyarsızlığı) aynı sonucu
+verip vermediği kontrol edilir.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+
+import pytest
+
+from src.core.formula_evaluator import (
+    BILINMEYEN,
+    HesaplanamazHatasi,
+    alanda_prim_hesapla,
+    brut_ucret_hesapla,
+    derece_kademe_hesapla,
+    en_yuksek_ogrenim_hesapla,
+    hizmet_grubu_hesapla,
+    kademe_baslangic_hesapla,
+    kademe_bitis_hesapla,
+    kademe_hesapla,
+    prim_gunu_hesapla,
+    tecrube_360_ay_hesapla,
+    tecrube_360_gun_hesapla,
+    tecrube_360_yil_hesapla,
+    toplam_alanda_prim_hesapla,
+    toplam_prim_hesapla,
+    unvan_hesapla,
+)
+
+
+class TestPrimGunuHesapla:
+    """prim_gunu_hesapla testleri."""
+
+    def test_bos_tarih_bos_metin_dondurur(self):
+        """Tarihlerden biri boşsa sonuç boş metin olmalı."""
+        assert prim_gunu_hesapla(None, date(2024, 1, 1)) == ""
+        assert prim_gunu_hesapla(date(2024, 1, 1), "") == ""
+
+    def test_farkli_aylar(self):
+        """Başlangıç ayı kalan günleri + ara aylar × 30 + bitiş günü."""
+        assert prim_gunu_hesapla(date(2020, 2, 20), date(2021, 2, 25)) == 365
+
+    def test_ay_basi_ve_ay_sonu_30_sayilir(self):
+        """Ayın ilk günü başlangıç, son günü bitiş 30 gün sayılmalı."""
+        assert prim_gunu_hesapla(date(2023, 1, 1), date(2023, 2, 28)) == 60
+
+    def test_ayni_ay(self):
+        """Aynı ay içinde bitiş ay sonu değilse gün farkı + 1 alınmalı."""
+        assert prim_gunu_hesapla(date(2023, 3, 5), date(2023, 3, 10)) == 6
+        assert prim_gunu_hesapla(date(2023, 3, 5), date(2023, 3, 31)) == 26
+
+    def test_datetime_ve_seri_numarasi_kabul_edilir(self):
+        """datetime ve Excel seri numarası tarih olarak yorumlanmalı."""
+        # 45292 = 2024-01-01
+        assert prim_gunu_hesapla(datetime(2024, 1, 1, 12), 45292 + 9) == 10
+
+    def test_metin_tarih_hesaplanamaz(self):
+        """Metin olarak yazılmış tarih için sonuç belirlenmemeli."""
+        with pytest.raises(HesaplanamazHatasi):
+            prim_gunu_hesapla("01.01.2024", date(2024, 2, 1))
+
+    def test_bilinmeyen_girdi_hesaplanamaz(self):
+        """Formül içeren girdi hücresi hesaplamayı durdurmalı."""
+        with pytest.raises(HesaplanamazHatasi):
+            prim_gunu_hesapla(BILINMEYEN, date(2024, 2, 1))
+
+
+class TestToplamlar:
+    """Toplam ve 360 günlük tecrübe hesaplama testleri."""
+
+    def test_alanda_prim_buyuk_kucuk_harf_duyarsiz(self):
+        """'e' de 'E' gibi alanında sayılmalı."""
+        assert alanda_prim_hesapla("e", 120) == 120
+        assert alanda_prim_hesapla("H", 120) == ""
+
+    def test_toplam_metin_ve_bos_atlanir(self):
+        """SUM metin ve boş hücreleri atlamalı."""
+        assert toplam_prim_hesapla([365, "", None, 358]) == 723
+
+    def test_toplam_alanda_prim_eksik_gunler_dusulur(self):
+        """Eksik günler alanındaki toplamdan düşülmeli."""
+        assert toplam_alanda_prim_hesapla([365, 358], [None, 3]) == 720
+
+    def test_tecrube_parcalari(self):
+        """723 gün = 2 yıl 0 ay 3 gün."""
+        assert tecrube_360_yil_hesapla(723) == 2
+        assert tecrube_360_ay_hesapla(723) == 0
+        assert tecrube_360_gun_hesapla(723) == 3
+
+    def test_sifir_toplam_bos_metin(self):
+        """Toplam sıfırsa tecrübe hücreleri boş kalmalı."""
+        assert tecrube_360_yil_hesapla(0) == ""
+        assert tecrube_360_ay_hesapla(None) == ""
+
+
+class TestOgrenimVeUnvan:
+    """Öğrenim, hizmet grubu ve unvan hesaplama testleri."""
+
+    def test_en_yuksek_ogrenim(self):
+        """Alanında ve okulu dolu olan en yüksek öğrenim seçilmeli."""
+        satirlar = [
+            ("Lisans", "Okul", "E"),
+            ("Doktora", "", "E"),
+            ("Tezli Yüksek Lisans", "Okul", "E"),
+        ]
+        assert en_yuksek_ogrenim_hesapla(satirlar) == "Tezli Yüksek Lisans"
+
+    def test_ogrenim_yoksa_bos(self):
+        """Uygun öğrenim yoksa boş metin dönmeli."""
+        assert en_yuksek_ogrenim_hesapla([(None, None, None)]) == ""
+
+    def test_yerele_bagli_harf_hesaplanamaz(self):
+        """ı/İ içeren ve birebir eşleşmeyen metin Python'da kesinleştirilemez."""
+        with pytest.raises(HesaplanamazHatasi):
+            en_yuksek_ogrenim_hesapla([("LİSANS", "Okul", "E")])
+
+    def test_hizmet_grubu(self):
+        """Hizmet grubu türü ve tecrübe yılına göre derece eklenmeli."""
+        assert hizmet_grubu_hesapla(2, "AG") == "AG-6"
+        assert hizmet_grubu_hesapla(2, "X") == ""
+
+    def test_bos_tecrube_metin_olarak_buyuk_sayilir(self):
+        """J29 boş metinse J29>=eşik Excel'de doğrudur."""
+        assert hizmet_grubu_hesapla("", "A") == hizmet_grubu_hesapla(99, "A")
+        assert unvan_hesapla("", "A") == unvan_hesapla(99, "A")
+
+    def test_unvan_ag_eki(self):
+        """AG türünde unvana AG eki eklenmeli."""
+        assert unvan_hesapla(2, "AG") == "Araştırmacı"
+
+
+class TestKademeVeUcret:
+    """Kademe, derece/kademe ve brüt ücret hesaplama testleri."""
+
+    def test_kademe(self):
+        """Doktora ve 2 yıl tecrübe için kademe 2 olmalı."""
+        assert kademe_hesapla(2, "Doktora") == "2"
+
+    def test_derece_kademe(self):
+        """Kademe boşsa yalnızca hizmet grubu yazılmalı."""
+        assert derece_kademe_hesapla("AG-6", "2") == "AG-6/2"
+        assert derece_kademe_hesapla("AG-6", "") == "AG-6"
+
+    def test_brut_ucret(self):
+        """Derece/kademe tablodan büyük/küçük harf duyarsız bulunmalı."""
+        assert brut_ucret_hesapla("AG-6/2") == 154573.14
+        assert brut_ucret_hesapla("ag-6/2") == 154573.14
+        assert brut_ucret_hesapla("YOK") == ""
+        assert brut_ucret_hesapla("AG-6/2", {}) == ""
+
+    def test_kademe_araligi(self):
+        """Kademe aralığı derece/kademe ön ekini korumalı."""
+        assert kademe_baslangic_hesapla(2, "Doktora", "AG-6/2") == "AG-6/2"
+        assert kademe_bitis_hesapla(2, "Doktora", "AG-6/2") == "AG-6/2"
+        assert kademe_baslangic_hesapla(2, "Doktora") == 2
@@ -5,6 +5,8 @@ from __future__ import annotations
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from src import main
 from src.config.constants import APP_NAME, APP_ORGANIZATION_NAME
 
@@ -65,3 +67,32 @@ class TestMainApplication:
         app.setOrganizationName.assert_called_once_with(APP_ORGANIZATION_NAME)
         app.setApplicationName.assert_called_once_with(APP_NAME)
         app.setStyle.assert_called_once_with("Fusion")
+
+
+class TestMainBatch:
+    """GUI'siz batch alt komutu testleri."""
+
+    @patch("src.main._create_application")
+    @patch("src.cli.main", return_value=0)
+    def test_batch_argumani_cli_ye_yonlendirilir(self, mock_cli, mock_app):
+        """`batch` ile baslatildiginda QApplication olusturulmamali."""
+        with patch.object(main.sys, "argv", ["dk-tutanak", "batch", "tutanak"]):
+            with pytest.raises(SystemExit) as exc_info:
+                main.main()
+
+        assert exc_info.value.code == 0
+        mock_cli.assert_called_once_with(["tutanak"])
+        mock_app.assert_not_called()
+
+
+class TestMainPrewarm:
+    """Arka plan on yukleme testleri."""
+
+    def test_prewarm_modules_imports_and_skips_missing(self):
+        """Moduller yuklenmeli; bulunamayan modul hataya yol acmamali."""
+        with patch.object(main.importlib, "import_module") as mock_import:
+            mock_import.side_effect = [None, ImportError("yok"), None]
+
+            main._prewarm_modules(["a", "b", "c"])
+
+        assert [c.args[0] for c in mock_import.call_args_list] == ["a", "b", "c"]
@@ -1,6 +1,10 @@
 """MainMenuWindow birim testleri."""
 
+import json
 import os
+import subprocess
+import sys
+from pathlib import Path
 from unittest.mock import patch
 
 os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
@@ -50,3 +54,52 @@ class TestMainMenuWindow:
 
         mock_open.assert_called_once()
         window.close()
+
+
+_ACILIS_MODULLERI = """
+import json, sys
+from src import main as giris
+app = giris._create_application([])
+giris._apply_stylesheet(app)
+window = giris._create_main_menu_window()
+window.show()
+app.processEvents()
+agir = ("pandas", "openpyxl", "numpy", "src.core", "src.gui.tutanak_window")
+print(json.dumps(sorted(
+    m for m in sys.modules if m in agir or m.startswith("src.core.")
+)))
+"""
+
+
+def _acilista_yuklenen_agir_moduller() -> list[str]:
+    """Giriş noktası ana menüyü gösterene kadar yüklenen ağır modülleri döndürür."""
+    cikti = subprocess.run(
+        [sys.executable, "-c", _ACILIS_MODULLERI],
+        cwd=Path(__file__).resolve().parent.parent,
+        env={**os.environ, "QT_QPA_PLATFORM": "offscreen"},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(cikti.stdout.strip().splitlines()[-1])
+
+
+class TestAcilisModulleri:
+    """Ana menüye kadar yüklenen modüller testleri.
+
+    Açılış süresi bütçesi ``python -m scripts.benchmark --acilis`` ile ölçülür.
+    """
+
+    def test_ana_menu_agir_modulleri_yuklemez(self):
+        """Ana menü gösterilirken pandas, openpyxl ve çekirdek yüklenmemeli."""
+        assert _acilista_yuklenen_agir_moduller() == []
+
+    def test_pencere_modulu_ilk_acilista_yuklenir(self, qapp):
+        """Tutanak penceresi modülü menü butonuna basılınca yüklenmeli."""
+        window = MainMenuWindow()
+        with patch("src.gui.tutanak_window.TutanakWindow") as mock_window:
+            with patch.object(MainMenuWindow, "_open_child_window") as mock_open:
+                window._tutanak_button.click()
+
+        mock_open.assert_called_once_with(mock_window.return_value)
+        window.close()
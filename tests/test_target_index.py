@@ -0,0 +1,98 @@
+"""target_index modülü testleri."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import openpyxl
+import pytest
+
+from src.config.constants import TARGET_INDEX_FILENAME
+from src.core.target_index import HedefSayfaDizini, workbook_sayfa_adlari
+
+
+def _workbook_yaz(yol: Path, sayfa_adlari: list[str]) -> Path:
+    """Verilen adlarla sayfaları olan bir workbook kaydeder."""
+    wb = openpyxl.Workbook()
+    wb.active.title = sayfa_adlari[0]
+    for ad in sayfa_adlari[1:]:
+        wb.create_sheet(ad)
+    wb.save(yol)
+    wb.close()
+    return yol
+
+
+class TestWorkbookSayfaAdlari:
+    """workbook_sayfa_adlari fonksiyonu testleri."""
+
+    def test_openpyxl_ile_ayni_sira(self, tmp_path: Path):
+        """Sayfa adları workbook'taki sırayla okunmalı."""
+        adlar = ["Özet", "Ali YILMAZ - 10000000146", "Veli DEMİR - 10000000078"]
+        yol = _workbook_yaz(tmp_path / "birlesik.xlsx", adlar)
+
+        assert workbook_sayfa_adlari(yol) == adlar
+
+    def test_gecersiz_arsiv_none(self, tmp_path: Path):
+        """xlsx olmayan dosyada None dönmeli."""
+        yol = tmp_path / "bozuk.xlsx"
+        yol.write_bytes(b"xlsx degil")
+
+        assert workbook_sayfa_adlari(yol) is None
+
+
+class TestHedefSayfaDizini:
+    """HedefSayfaDizini sınıfı testleri."""
+
+    @pytest.fixture()
+    def workbook(self, tmp_path: Path) -> Path:
+        return _workbook_yaz(tmp_path / "birlesik.xlsx", ["Sayfa1"])
+
+    def test_kaydedilen_dizin_yeniden_yuklenir(self, tmp_path: Path, workbook: Path):
+        """Kaydedilen sayfa adları sonraki yüklemede arşiv açılmadan dönmeli."""
+        dizin = HedefSayfaDizini.yukle(tmp_path)
+        assert dizin.sayfa_adlari(workbook) == ["Sayfa1"]
+        dizin.kaydet()
+
+        veri = json.loads((tmp_path / TARGET_INDEX_FILENAME).read_text("utf-8"))
+        veri["dosyalar"]["birlesik.xlsx"]["sayfalar"] = ["Önbellekten"]
+        (tmp_path / TARGET_INDEX_FILENAME).write_text(json.dumps(veri), "utf-8")
+
+        assert HedefSayfaDizini.yukle(tmp_path).sayfa_adlari(workbook) == [
+            "Önbellekten"
+        ]
+
+    def test_degisen_dosya_yeniden_okunur(self, tmp_path: Path, workbook: Path):
+        """Değiştirilme zamanı farklıysa önbellek kaydı kullanılmamalı."""
+        dizin = HedefSayfaDizini.yukle(tmp_path)
+        dizin.sayfa_adlari(workbook)
+        dizin.kaydet()
+
+        _workbook_yaz(workbook, ["Yeni"])
+        durum = workbook.stat()
+        os.utime(workbook, ns=(durum.st_atime_ns, durum.st_mtime_ns + 10**9))
+
+        assert HedefSayfaDizini.yukle(tmp_path).sayfa_adlari(workbook) == ["Yeni"]
+
+    def test_sorgulanmayan_kayitlar_atilir(self, tmp_path: Path, workbook: Path):
+        """Bu çalıştırmada sorgulanmayan dosyaların kayıtları yazılmamalı."""
+        diger = _workbook_yaz(tmp_path / "diger.xlsx", ["Diger"])
+        dizin = HedefSayfaDizini.yukle(tmp_path)
+        dizin.sayfa_adlari(workbook)
+        dizin.sayfa_adlari(diger)
+        dizin.kaydet()
+
+        diger.unlink()
+        dizin = HedefSayfaDizini.yukle(tmp_path)
+        dizin.sayfa_adlari(workbook)
+        dizin.kaydet()
+
+        veri = json.loads((tmp_path / TARGET_INDEX_FILENAME).read_text("utf-8"))
+        assert list(veri["dosyalar"]) == ["birlesik.xlsx"]
+
+    def test_bozuk_dizin_bos_baslar(self, tmp_path: Path, workbook: Path):
+        """Okunamayan önbellek dosyası aktarımı engellememeli."""
+        (tmp_path / TARGET_INDEX_FILENAME).write_text("{bozuk", "utf-8")
+
+        assert HedefSayfaDizini.yukle(tmp_path).sayfa_adlari(workbook) == ["Sayfa1"]
@@ -0,0 +1,94 @@
+"""template_cache modülü testleri."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import openpyxl
+import pytest
+
+from src.core.excel_reader import Personel
+from src.core.excel_writer import olustur_dk_klasoru_raporlu
+from src.core.template_cache import SablonOnbellegi
+
+
+def _sablon_yaz(path: Path, deger: str) -> None:
+    """Tek hücreli küçük bir şablon dosyası üretir."""
+    wb = openpyxl.Workbook()
+    wb.active["A1"] = deger
+    wb.save(path)
+    wb.close()
+
+
+class TestSablonOnbellegi:
+    """SablonOnbellegi davranış testleri."""
+
+    def test_ayni_dosya_bir_kez_ayristirilir(self, tmp_path):
+        """Değişmeyen şablon için aynı sayfa nesnesi dönmeli."""
+        sablon = tmp_path / "sablon.xlsx"
+        _sablon_yaz(sablon, "ilk")
+        onbellek = SablonOnbellegi()
+
+        ilk = onbellek.sablon_sayfasi(sablon)
+        ikinci = onbellek.sablon_sayfasi(str(sablon))
+
+        assert ilk is ikinci
+        assert len(onbellek) == 1
+
+    def test_degisen_dosya_yeniden_yuklenir(self, tmp_path):
+        """mtime veya boyut değişince şablon yeniden ayrıştırılmalı."""
+        sablon = tmp_path / "sablon.xlsx"
+        _sablon_yaz(sablon, "ilk")
+        onbellek = SablonOnbellegi()
+        ilk = onbellek.sablon_sayfasi(sablon)
+
+        _sablon_yaz(sablon, "ikinci değer daha uzun")
+        durum = sablon.stat()
+        os.utime(sablon, ns=(durum.st_atime_ns, durum.st_mtime_ns + 10**9))
+        ikinci = onbellek.sablon_sayfasi(sablon)
+
+        assert ikinci is not ilk
+        assert ikinci["A1"].value == "ikinci değer daha uzun"
+
+    def test_olmayan_sablon_hata_verir(self, tmp_path):
+        """Şablon dosyası yoksa FileNotFoundError fırlatılmalı."""
+        with pytest.raises(FileNotFoundError):
+            SablonOnbellegi().sablon_sayfasi(tmp_path / "yok.xlsx")
+
+    def test_temizle_kayitlari_bosaltir(self, tmp_path):
+        """temizle() sonrasında önbellek boş olmalı."""
+        sablon = tmp_path / "sablon.xlsx"
+        _sablon_yaz(sablon, "ilk")
+        onbellek = SablonOnbellegi()
+        onbellek.sablon_sayfasi(sablon)
+
+        onbellek.temizle()
+
+        assert len(onbellek) == 0
+
+
+class TestSablonOnbellegiYazici:
+    """Yazıcının şablonu çalıştırma başına bir kez okuduğunu doğrular."""
+
+    def test_klasor_modu_sablonu_bir_kez_yukler(self, tmp_path):
+        """Çok personelli klasör üretiminde şablon tek kez ayrıştırılmalı."""
+        personeller = [
+            Personel(tckn="10000000146", ad_soyad="Fatma KARACA", birim="B"),
+            Personel(tckn="10000000078", ad_soyad="Ali YILMAZ", birim="B"),
+        ]
+        onbellek = SablonOnbellegi()
+
+        with patch(
+            "src.core.template_cache.openpyxl.load_workbook",
+            wraps=openpyxl.load_workbook,
+        ) as mock_yukle:
+            olustur_dk_klasoru_raporlu(
+                personeller, tmp_path / "ilk", sablon_onbellegi=onbellek
+            )
+            olustur_dk_klasoru_raporlu(
+                personeller, tmp_path / "ikinci", sablon_onbellegi=onbellek
+            )
+
+        assert mock_yukle.call_count == 1
@@ -0,0 +1,120 @@
+"""toplu_prim_hesaplama modülü için testler."""
+
+from __future__ import annotations
+
+from datetime import date
+
+import numpy as np
+import pytest
+
+from src.core import formula_evaluator as fe
+from src.core.toplu_prim_hesaplama import (
+    TECRUBE_SATIR_SAYISI,
+    days360_hesapla,
+    prim_gunleri_hesapla,
+    tarih_dizisi,
+    toplu_prim_hesapla,
+)
+
+
+def _bos_sifir(deger):
+    return 0 if deger == "" else deger
+
+
+@pytest.fixture()
+def rastgele_kadro():
+    """Boş hücreler içeren rastgele 200 × 15 tecrübe tablosu."""
+    rng = np.random.default_rng(7)
+    boyut = (200, TECRUBE_SATIR_SAYISI)
+    baslangic = np.datetime64("1995-01-01") + rng.integers(0, 11000, boyut)
+    bitis = baslangic + rng.integers(0, 4000, boyut)
+    baslangic = baslangic.astype("datetime64[D]").astype(object)
+    bitis = bitis.astype("datetime64[D]").astype(object)
+    baslangic[rng.random(boyut) < 0.4] = None
+    bitis[rng.random(boyut) < 0.1] = None
+    alaninda = rng.choice(np.array(["E", "H", "e", None], dtype=object), boyut)
+    eksik = rng.choice(np.array([np.nan, 0, 5]), boyut)
+    return baslangic, bitis, alaninda, eksik
+
+
+class TestPrimGunleriHesapla:
+    """prim_gunleri_hesapla ve days360_hesapla testleri."""
+
+    def test_ornek_satirlar(self):
+        """Ay başı, ay sonu, aynı ay ve boş satırlar formülle aynı olmalı."""
+        baslangic = tarih_dizisi(["2020-02-20", "2023-01-01", "2023-03-05", None])
+        bitis = tarih_dizisi(["2021-02-25", "2023-02-28", "2023-03-31", "2024-01-01"])
+
+        assert prim_gunleri_hesapla(baslangic, bitis).tolist() == [365, 60, 26, 0]
+
+    def test_tarih_nesneleri_kabul_edilir(self):
+        """date nesneleri ve None içeren listeler doğrudan verilebilmeli."""
+        sonuc = prim_gunleri_hesapla(
+            [[date(2024, 1, 1), None]], [[date(2024, 1, 10)] * 2]
+        )
+        assert sonuc.tolist() == [[10, 0]]
+
+    def test_boyut_uyusmazligi_hata_verir(self):
+        """Başlangıç ve bitiş dizileri farklı boyuttaysa ValueError fırlatmalı."""
+        with pytest.raises(ValueError):
+            prim_gunleri_hesapla(tarih_dizisi(["2024-01-01"]), tarih_dizisi([]))
+
+    def test_days360_abd_yontemi(self):
+        """Ay sonu başlangıç ve 31'inci gün bitiş ABD yöntemine göre ayarlanmalı."""
+        baslangic = tarih_dizisi(["2024-01-31", "2024-02-29", "2024-01-15", None])
+        bitis = tarih_dizisi(["2024-03-31", "2024-03-31", "2024-03-31", "2024-03-31"])
+
+        assert days360_hesapla(baslangic, bitis).tolist() == [60, 30, 76, 0]
+
+
+class TestTopluPrimHesapla:
+    """toplu_prim_hesapla testleri."""
+
+    def test_tek_personel_formullerle_ayni(self):
+        """Şablon örneği: K28=1413, L28=723, 2 yıl 0 ay 3 gün."""
+        sonuc = toplu_prim_hesapla(
+            [["2020-02-20", "2021-02-26", "2022-03-27"]],
+            [["2021-02-25", "2022-02-25", "2024-02-25"]],
+            [["E", "E", "H"]],
+        )
+
+        assert sonuc.prim_gunleri.tolist() == [[365, 358, 690]]
+        assert sonuc.alanda_prim_gunleri.tolist() == [[365, 358, 0]]
+        assert sonuc.toplam_prim.tolist() == [1413]
+        assert sonuc.toplam_alanda_prim.tolist() == [723]
+        assert (sonuc.yil[0], sonuc.ay[0], sonuc.gun[0]) == (2, 0, 3)
+
+    def test_hucre_hesaplayicisiyla_ayni(self, rastgele_kadro):
+        """Her personel için sonuçlar tek hücre hesaplayıcısıyla aynı olmalı."""
+        baslangic, bitis, alaninda, eksik = rastgele_kadro
+        sonuc = toplu_prim_hesapla(baslangic, bitis, alaninda, eksik)
+
+        for i in range(baslangic.shape[0]):
+            prim = [fe.prim_gunu_hesapla(b, e) for b, e in zip(baslangic[i], bitis[i])]
+            alanda = [fe.alanda_prim_hesapla(a, p) for a, p in zip(alaninda[i], prim)]
+            eksik_satir = [None if np.isnan(x) else x for x in eksik[i]]
+            toplam = fe.toplam_alanda_prim_hesapla(alanda, eksik_satir)
+
+            assert sonuc.prim_gunleri[i].tolist() == [_bos_sifir(p) for p in prim]
+            assert sonuc.alanda_prim_gunleri[i].tolist() == [
+                _bos_sifir(p) for p in alanda
+            ]
+            assert sonuc.toplam_prim[i] == fe.toplam_prim_hesapla(prim)
+            assert sonuc.toplam_alanda_prim[i] == toplam
+            assert sonuc.yil[i] == _bos_sifir(fe.tecrube_360_yil_hesapla(toplam))
+            assert sonuc.ay[i] == _bos_sifir(fe.tecrube_360_ay_hesapla(toplam))
+            assert sonuc.gun[i] == _bos_sifir(fe.tecrube_360_gun_hesapla(toplam))
+
+    def test_mantiksal_alaninda_kabul_edilir(self):
+        """Alanında bilgisi mantıksal dizi olarak da verilebilmeli."""
+        sonuc = toplu_prim_hesapla(
+            [["2024-01-01", "2024-01-01"]],
+            [["2024-01-10", "2024-01-10"]],
+            np.array([[True, False]]),
+        )
+        assert sonuc.alanda_prim_gunleri.tolist() == [[10, 0]]
+
+    def test_tek_boyutlu_girdi_hata_verir(self):
+        """Girdiler (personel, satır) boyutlu olmalı."""
+        with pytest.raises(ValueError):
+            toplu_prim_hesapla(["2024-01-01"], ["2024-01-10"], ["E"])
@@ -80,9 +80,34 @@ class TestTutanakService:
             cikti_klasoru=Path("/cikti"),
             template_path="/taslak/sablon.xlsx",
             version="v1",
+            sablon_onbellegi=service._sablon_onbellegi,
+            artimli=True,
+            zamanlama=True,
+            ilerleme=None,
         )
         assert result == expected_path
 
+    @patch("src.gui.tutanak_service.olustur_dk_klasoru_raporlu")
+    def test_tutanak_olustur_ilerleme_sayaci(self, mock_olustur, service):
+        """Çekirdek bildirimleri (tamamlanan, toplam) çiftine çevrilmeli."""
+
+        def olustur(personeller, **kwargs):
+            for personel in personeller:
+                kwargs["ilerleme"](personel, Path("/cikti/x.xlsx"), "olusturuldu")
+            return TutanakOlusturmaRaporu(output_path=Path("/cikti"))
+
+        mock_olustur.side_effect = olustur
+        bildirimler = []
+
+        service.tutanak_olustur(
+            personeller=[MagicMock(), MagicMock()],
+            template_path="/taslak.xlsx",
+            output_dir="/cikti",
+            ilerleme=lambda *args: bildirimler.append(args),
+        )
+
+        assert bildirimler == [(1, 2), (2, 2)]
+
     @patch("src.gui.tutanak_service.olustur_dk_klasoru_raporlu")
     def test_tutanak_olustur_hata(self, mock_olustur, service):
         """Core katmanıdaki hatalar yayılmalı."""
@@ -1,7 +1,7 @@
 """MainWindow birim testleri."""
 
 import os
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
 os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 
@@ -98,6 +98,7 @@ class TestTutanakWindow:
             template_path=str(template_path),
             output_dir=str(output_dir),
             version="v1",
+            ilerleme=ANY,
         )
         mock_open_generated_output.assert_called_once_with(result_path)
         log_lines = window._log_widget._text_edit.toPlainText().splitlines()
@@ -111,6 +112,17 @@ class TestTutanakWindow:
         assert log_lines[-1] == f"Çıktı klasörü: {result_path}"
         mock_information.assert_called_once()
 
+    def test_progress_bar_switches_to_determinate_mode(self, window):
+        """İlerleme bildirimi çubuğu belirli moda geçirmeli; yeni iş sıfırlamalı."""
+        window._set_busy(True)
+        window._on_tutanak_progress(2, 5)
+
+        assert window._progress_bar.maximum() == 5
+        assert window._progress_bar.value() == 2
+
+        window._set_busy(True)
+        assert window._progress_bar.maximum() == 0
+
     @patch("src.gui.tutanak_window.QMessageBox.information")
     def test_start_processing_logs_row_rejection_reasons_when_no_valid_personnel(
         self,
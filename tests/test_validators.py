@@ -2,8 +2,18 @@
 TCKN ve diğer validasyon fonksiyonları için testler.
 """
 
+import random
+
+import numpy as np
 import pytest
-from src.core.validators import validate_tckn, validate_ad_soyad, normalize_tckn
+from src.core.validators import (
+    TcknRedNedeni,
+    normalize_tckn,
+    normalize_tckn_batch,
+    validate_ad_soyad,
+    validate_tckn,
+    validate_tckn_batch,
+)
 
 
 class TestValidateTCKN:
@@ -101,3 +111,82 @@ class TestValidateAdSoyad:
 
     def test_none(self):
         assert validate_ad_soyad(None) is False
+
+
+_SINIR_DURUMLARI = [
+    "10000000146",
+    " 10000000078 ",
+    "01234567890",
+    "10000000136",
+    "10000000147",
+    "1000000014a",
+    "1000000014 ",
+    "1000000014\x00",
+    "１００００００００７８",
+    "٣٣٣٣٣٣٣٣٣٣٣",
+    "",
+    "123",
+    "123456789012",
+    None,
+    10000000146,
+    10000000146.0,
+]
+
+
+class TestValidateTcknBatch:
+    """validate_tckn_batch fonksiyonu için test sınıfı."""
+
+    def test_sinir_durumlarinda_tekil_ile_ayni(self):
+        """Her eleman için sonuç validate_tckn ile aynı olmalı."""
+        gecerli, _ = validate_tckn_batch(_SINIR_DURUMLARI)
+        assert gecerli.tolist() == [validate_tckn(d) for d in _SINIR_DURUMLARI]
+
+    def test_rastgele_adaylarda_tekil_ile_ayni(self):
+        """Rastgele adaylarda maske validate_tckn ile birebir örtüşmeli."""
+        rng = random.Random(0)
+        adaylar = [str(rng.randrange(10**9, 10**11)) for _ in range(20_000)]
+        gecerli, _ = validate_tckn_batch(adaylar)
+        assert gecerli.tolist() == [validate_tckn(a) for a in adaylar]
+        assert gecerli.any()
+
+    def test_neden_kodlari(self):
+        """İlk ihlal edilen kural neden kodu olarak dönmeli."""
+        adaylar = [
+            "10000000146",
+            "123",
+            "1000000014a",
+            "01234567890",
+            "10000000136",
+            "10000000147",
+        ]
+        _, nedenler = validate_tckn_batch(adaylar)
+        assert nedenler.dtype == np.uint8
+        assert [TcknRedNedeni(n) for n in nedenler] == [
+            TcknRedNedeni.GECERLI,
+            TcknRedNedeni.UZUNLUK,
+            TcknRedNedeni.RAKAM_DISI,
+            TcknRedNedeni.ILK_HANE_SIFIR,
+            TcknRedNedeni.ONUNCU_HANE,
+            TcknRedNedeni.ON_BIRINCI_HANE,
+        ]
+
+    def test_bos_girdi(self):
+        """Boş girdi boş diziler döndürmeli."""
+        gecerli, nedenler = validate_tckn_batch([])
+        assert gecerli.shape == nedenler.shape == (0,)
+
+
+class TestNormalizeTcknBatch:
+    """normalize_tckn_batch fonksiyonu için test sınıfı."""
+
+    def test_karisik_degerler_tekil_ile_ayni(self):
+        """Karışık değerler normalize_tckn ile aynı sonucu vermeli."""
+        degerler = [12345678901.0, 12345678901, " 10000000146 ", "123", 78.0]
+        assert normalize_tckn_batch(degerler).tolist() == [
+            normalize_tckn(d) for d in degerler
+        ]
+
+    def test_sayisal_dizi(self):
+        """Ondalık NumPy dizisi tamsayı metnine çevrilip doldurulmalı."""
+        sonuc = normalize_tckn_batch(np.array([10000000146.0, 78.0]))
+        assert sonuc.tolist() == ["10000000146", "00000000078"]
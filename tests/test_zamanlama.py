@@ -0,0 +1,122 @@
+"""zamanlama modülü testleri."""
+
+from __future__ import annotations
+
+import json
+import threading
+
+from src.core.zamanlama import (
+    AsamaOzeti,
+    Zamanlayici,
+    aktif_zamanlayici,
+    asama,
+    en_uzun_asamalar_metni,
+    zamanlama_olc,
+)
+
+
+class TestAsama:
+    """asama bağlam yöneticisi testleri."""
+
+    def test_etkin_zamanlayici_yoksa_kayit_yok(self):
+        """Ölçüm kapalıyken paylaşılan boş bağlam döndürülmeli."""
+        assert aktif_zamanlayici() is None
+        assert asama("a") is asama("b")
+        with asama("a"):
+            pass
+
+    def test_devre_disi_olcum_none_verir(self):
+        """etkin=False iken zamanlayıcı kurulmamalı."""
+        with zamanlama_olc(False) as zamanlayici:
+            assert zamanlayici is None
+            assert aktif_zamanlayici() is None
+
+    def test_asamalar_kaydedilir(self):
+        """Etkin zamanlayıcıda her aşama çalıştırması kaydedilmeli."""
+        with zamanlama_olc() as zamanlayici:
+            for _ in range(3):
+                with asama("kaydet"):
+                    pass
+            with asama("yukle"):
+                pass
+        assert aktif_zamanlayici() is None
+
+        adlar = [kayit[0] for kayit in zamanlayici.kayitlar]
+        assert adlar == ["kaydet", "kaydet", "kaydet", "yukle"]
+        assert all(sure >= 0 for _, _, sure in zamanlayici.kayitlar)
+
+    def test_hata_durumunda_da_kaydedilir(self):
+        """Aşama içinde hata oluşsa da süre kaydedilmeli."""
+        with zamanlama_olc() as zamanlayici:
+            try:
+                with asama("hatali"):
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+        assert [kayit[0] for kayit in zamanlayici.kayitlar] == ["hatali"]
+
+    def test_ic_ice_olcum_dis_zamanlayiciya_iletilir(self):
+        """İç ölçümün kayıtları dış zamanlayıcıda da görünmeli."""
+        with zamanlama_olc() as dis:
+            with zamanlama_olc() as ic:
+                with asama("ic"):
+                    pass
+            assert aktif_zamanlayici() is dis
+        assert len(ic.kayitlar) == len(dis.kayitlar) == 1
+
+    def test_is_parcaciklarindaki_asamalar(self):
+        """Yardımcı iş parçacıklarındaki aşamalar da toplanmalı."""
+
+        def calis():
+            with asama("is"):
+                pass
+
+        with zamanlama_olc() as zamanlayici:
+            threads = [threading.Thread(target=calis) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        assert len(zamanlayici.kayitlar) == 4
+
+
+class TestZamanlayici:
+    """Zamanlayici özet ve iz dosyası testleri."""
+
+    def test_ozet_toplama_gore_sirali(self):
+        """Özet toplam süreye göre azalan sırada ve doğru p95 ile dönmeli."""
+        zamanlayici = Zamanlayici()
+        zamanlayici.ekle([("a", 0.0, 1.0), ("b", 0.0, 0.5), ("a", 0.0, 2.0)])
+        zamanlayici.ekle((("b", 0.0, float(sure)) for sure in range(1, 21)))
+
+        ozet = zamanlayici.ozet()
+
+        assert [o.ad for o in ozet] == ["b", "a"]
+        assert ozet[0] == AsamaOzeti("b", 21, 210.5, 19.0)
+        assert ozet[1] == AsamaOzeti("a", 2, 3.0, 2.0)
+
+    def test_iz_dosyasi_jsonl(self, tmp_path):
+        """İz dosyasına her aşama bir JSON satırı olarak yazılmalı."""
+        iz = tmp_path / "iz.jsonl"
+        with zamanlama_olc(iz_dosyasi=iz):
+            with asama("yazici.kaydet"):
+                pass
+            with asama("sablon.yukle"):
+                pass
+
+        satirlar = [json.loads(satir) for satir in iz.read_text().splitlines()]
+        assert [satir["asama"] for satir in satirlar] == [
+            "yazici.kaydet",
+            "sablon.yukle",
+        ]
+        assert set(satirlar[0]) == {"asama", "baslangic", "sure_sn", "is_parcacigi"}
+
+    def test_en_uzun_asamalar_metni(self):
+        """İlk üç aşama tek satırda, ölçüm yoksa None dönmeli."""
+        ozetler = [AsamaOzeti(ad, 1, 3.0 - i, 3.0 - i) for i, ad in enumerate("abcd")]
+        assert (
+            en_uzun_asamalar_metni(ozetler)
+            == "a 3.00 sn (1×), b 2.00 sn (1×), c 1.00 sn (1×)"
+        )
+        assert en_uzun_asamalar_metni([]) is None
+        assert en_uzun_asamalar_metni(None) is None